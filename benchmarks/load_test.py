@@ -0,0 +1,560 @@
+#!/usr/bin/env python3
+"""
+Texas Grid Interconnect Reporter - Load Test
+Replays dashboard sessions (Quarter Report, Comparison) against a running backend with
+a fixed number of concurrent virtual users, stepping through concurrency levels, and
+reports throughput, latency percentiles and error rates per level as JSON.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import httpx
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+DEFAULT_URL = 'http://127.0.0.1:8000'
+DEFAULT_USERS = '1,4,16'
+DEFAULT_DURATION_S = 30.0
+DEFAULT_WARMUP_S = 5.0
+# Mean pause between a response and the user's next click (uniform, 0 to twice this)
+DEFAULT_THINK_S = 1.0
+DEFAULT_TIMEOUT_S = 30.0
+# A level is within the service objective while its p95 and error rate stay under these
+DEFAULT_SLO_P95_MS = 1000.0
+DEFAULT_SLO_ERROR_RATE = 0.01
+
+LATENCY_PERCENTILES = (50, 90, 95, 99)
+
+Params = List[Tuple[str, str]]
+
+
+class Sample(NamedTuple):
+    """One request as the client saw it."""
+    endpoint: str
+    status: int  # 0 when no response arrived (timeout, connection error)
+    seconds: float
+    error: Optional[str]
+    cache: Optional[str]  # X-Cache header (HIT, MISS, COALESCED)
+
+
+@dataclass
+class SessionResult:
+    """One replayed session."""
+    script: str
+    seconds: float
+    ok: bool
+
+
+@dataclass
+class VirtualUser:
+    """
+    One simulated browser: replays session scripts one after another and records
+    every request it sends.
+    """
+    client: httpx.AsyncClient
+    rng: random.Random
+    think_s: float
+    samples: List[Sample] = field(default_factory=list)
+    failed: bool = False
+
+    async def get(self, endpoint: str, params: Optional[Params] = None) -> Optional[Dict[str, Any]]:
+        """
+        GET /api/<endpoint>, returning the JSON body or None when the request failed.
+        """
+        start = time.perf_counter()
+        try:
+            response = await self.client.get(f"/api/{endpoint}", params=params)
+        except httpx.HTTPError as exc:
+            self.samples.append(Sample(endpoint, 0, time.perf_counter() - start, type(exc).__name__, None))
+            self.failed = True
+            return None
+        body = response.content
+        seconds = time.perf_counter() - start
+        error = None if response.status_code == 200 else f"HTTP {response.status_code}"
+        self.samples.append(Sample(endpoint, response.status_code, seconds, error, response.headers.get('x-cache')))
+        if error:
+            self.failed = True
+            return None
+        return json.loads(body)
+
+    async def think(self) -> None:
+        """Pause like a user reading the page before the next click."""
+        if self.think_s > 0:
+            await asyncio.sleep(self.rng.uniform(0, 2 * self.think_s))
+
+
+def month_params(value: str) -> Params:
+    """'2026-01' (a /api/months value) -> [('year', '2026'), ('month', '01')]."""
+    year, month = value.split('-')
+    return [('year', year), ('month', month)]
+
+
+def pick_quarters(rng: random.Random, quarters: Sequence[str], report_quarter: str) -> List[str]:
+    """
+    A quarter selection like the dashboard's: 1-4 consecutive quarters starting at, or
+    up to three quarters after, the report month's quarter.
+    """
+    upcoming = [q for q in sorted(quarters) if q >= report_quarter] or sorted(quarters)
+    if not upcoming:
+        return []
+    start = rng.randrange(min(4, len(upcoming)))
+    return upcoming[start:start + rng.randint(1, 4)]
+
+
+async def quarter_report_session(user: VirtualUser) -> None:
+    """
+    Quarter Report page as the frontend loads it: month list, the month's quarters, the
+    report (with its map) for a quarter selection, then one county's details.
+    """
+    months = await user.get('months')
+    if not months or not months['months']:
+        return
+    value = user.rng.choice(months['months'][:3])['value']
+    params = month_params(value)
+    quarters = await user.get('quarters', params)
+    if not quarters:
+        return
+    await user.think()
+
+    year, month = value.split('-')
+    selection = pick_quarters(user.rng, quarters['quarters'], f"{year}Q{(int(month) - 1) // 3 + 1}")
+    selected = [('quarters', q) for q in selection] + params
+    report = await user.get('quarter-report', selected)
+    if not report or not report.get('county_data'):
+        return
+    await user.think()
+
+    county = user.rng.choice(report['county_data'][:10])['county']
+    await user.get('quarter-report', selected + [('sections', 'county_details'), ('county', county)])
+
+
+async def quarter_endpoints_session(user: VirtualUser) -> None:
+    """
+    Quarter Report through its per-section endpoints (as API clients and older frontends
+    call them): months, quarters, quarter-data with county-map-data, then county-details.
+    """
+    months = await user.get('months')
+    if not months or not months['months']:
+        return
+    value = user.rng.choice(months['months'][:3])['value']
+    params = month_params(value)
+    quarters = await user.get('quarters', params)
+    if not quarters:
+        return
+    await user.think()
+
+    year, month = value.split('-')
+    selection = pick_quarters(user.rng, quarters['quarters'], f"{year}Q{(int(month) - 1) // 3 + 1}")
+    selected = [('quarters', q) for q in selection] + params
+    data, _ = await asyncio.gather(user.get('quarter-data', selected), user.get('county-map-data', selected))
+    if not data or not data.get('county_data'):
+        return
+    await user.think()
+
+    county = user.rng.choice(data['county_data'][:10])['county']
+    await user.get('county-details', selected + [('county', county)])
+
+
+async def comparison_session(user: VirtualUser) -> None:
+    """
+    Comparison view: years, each side's months, then the diff of two months (most often
+    the latest against the one before it).
+    """
+    years = await user.get('years')
+    if not years or not years['years']:
+        return
+    months: List[Tuple[str, str]] = []
+    for year in years['years'][:2]:
+        listed = await user.get('months', [('year', year)])
+        if listed:
+            months += [(year, m['value']) for m in listed['months']]
+    months.sort(reverse=True)
+    if len(months) < 2:
+        return
+    await user.think()
+
+    target = 0 if user.rng.random() < 0.7 else user.rng.randrange(len(months) - 1)
+    base = target + 1 if user.rng.random() < 0.7 else user.rng.randrange(target + 1, len(months))
+    (base_year, base_month), (target_year, target_month) = months[base], months[target]
+    await user.get('comparison-data', [('base_year', base_year), ('base_month', base_month),
+                                       ('target_year', target_year), ('target_month', target_month)])
+
+
+# Script name -> (session coroutine, relative frequency)
+SESSION_SCRIPTS: Dict[str, Tuple[Callable[[VirtualUser], Awaitable[None]], float]] = {
+    'quarter-report': (quarter_report_session, 3.0),
+    'quarter-endpoints': (quarter_endpoints_session, 1.0),
+    'comparison': (comparison_session, 1.0),
+}
+
+
+def parse_mix(text: Optional[str]) -> Dict[str, float]:
+    """
+    'quarter-report=3,comparison=1' -> weights; None -> every script at its default weight.
+
+    Raises:
+        ValueError: On an unknown script or a negative weight
+    """
+    if not text:
+        return {name: weight for name, (_, weight) in SESSION_SCRIPTS.items()}
+    mix = {}
+    for part in text.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in SESSION_SCRIPTS:
+            raise ValueError(f"Unknown session script {name!r} (choose from {', '.join(SESSION_SCRIPTS)})")
+        mix[name] = float(weight) if weight else 1.0
+        if mix[name] < 0:
+            raise ValueError(f"Negative weight for {name!r}")
+    if not any(mix.values()):
+        raise ValueError("Session mix has no positive weight")
+    return mix
+
+
+def percentile(ordered: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending sequence (0.0 when empty)."""
+    if not ordered:
+        return 0.0
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def latency_summary(seconds: Sequence[float]) -> Dict[str, float]:
+    """Latency percentiles, mean and max in milliseconds."""
+    ordered = sorted(seconds)
+    summary = {f"p{pct}": round(percentile(ordered, pct) * 1000, 2) for pct in LATENCY_PERCENTILES}
+    summary['mean'] = round(sum(ordered) / len(ordered) * 1000, 2) if ordered else 0.0
+    summary['max'] = round(ordered[-1] * 1000, 2) if ordered else 0.0
+    return summary
+
+
+def summarize_level(users: int, elapsed: float, samples: Sequence[Sample],
+                    sessions: Sequence[SessionResult]) -> Dict[str, Any]:
+    """
+    Throughput, latency and errors of one concurrency level, overall and per endpoint.
+
+    Args:
+        users: Concurrent virtual users
+        elapsed: Wall-clock seconds from the first user starting to the last finishing
+        samples: Every request sent
+        sessions: Every session replayed
+
+    Returns:
+        JSON-serializable level summary
+    """
+    def counts(values) -> Dict[str, int]:
+        out: Dict[str, int] = {}
+        for value in values:
+            out[str(value)] = out.get(str(value), 0) + 1
+        return dict(sorted(out.items()))
+
+    errors = [s for s in samples if s.error]
+    endpoints = {}
+    for endpoint in sorted({s.endpoint for s in samples}):
+        own = [s for s in samples if s.endpoint == endpoint]
+        own_errors = sum(1 for s in own if s.error)
+        endpoints[endpoint] = {
+            'requests': len(own),
+            'errors': own_errors,
+            'error_rate': round(own_errors / len(own), 4),
+            'latency_ms': latency_summary([s.seconds for s in own]),
+            'cache': counts(s.cache for s in own if s.cache),
+        }
+
+    return {
+        'users': users,
+        'elapsed_s': round(elapsed, 3),
+        'requests': len(samples),
+        'errors': len(errors),
+        'error_rate': round(len(errors) / len(samples), 4) if samples else 0.0,
+        'throughput_rps': round(len(samples) / elapsed, 2) if elapsed else 0.0,
+        'sessions': len(sessions),
+        'sessions_failed': sum(1 for s in sessions if not s.ok),
+        'sessions_per_s': round(len(sessions) / elapsed, 3) if elapsed else 0.0,
+        'session_s': latency_summary([s.seconds for s in sessions]),
+        'latency_ms': latency_summary([s.seconds for s in samples]),
+        'status': counts(s.status for s in samples),
+        'error_types': counts(s.error for s in errors),
+        'endpoints': endpoints,
+    }
+
+
+async def run_level(base_url: str, users: int, duration: float, mix: Dict[str, float],
+                    think_s: float = DEFAULT_THINK_S, ramp_s: float = 0.0, seed: int = 0,
+                    timeout: float = DEFAULT_TIMEOUT_S,
+                    transport: Optional[httpx.AsyncBaseTransport] = None) -> Dict[str, Any]:
+    """
+    Run `users` virtual users for `duration` seconds.
+
+    Users start evenly spread over `ramp_s` and begin new sessions until the duration
+    is up; sessions in progress then finish, so every request is counted whole.
+
+    Args:
+        base_url: Backend root (e.g. http://127.0.0.1:8000)
+        users: Concurrent virtual users
+        duration: Seconds during which new sessions start
+        mix: Session script -> relative frequency
+        think_s: Mean pause between a user's clicks
+        ramp_s: Seconds over which users start
+        seed: Random seed (each user draws from its own stream)
+        timeout: Per-request timeout in seconds
+        transport: httpx transport (e.g. httpx.ASGITransport to load an app in-process)
+
+    Returns:
+        Level summary (see summarize_level)
+    """
+    names = [name for name, weight in mix.items() if weight > 0]
+    weights = [mix[name] for name in names]
+    limits = httpx.Limits(max_connections=users, max_keepalive_connections=users)
+    sessions: List[SessionResult] = []
+    virtual_users: List[VirtualUser] = []
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits, transport=transport) as client:
+        start = time.perf_counter()
+        deadline = start + duration
+
+        async def run_user(index: int) -> None:
+            user = VirtualUser(client, random.Random(f"{seed}-{index}"), think_s)
+            virtual_users.append(user)
+            if users > 1 and ramp_s > 0:
+                await asyncio.sleep(ramp_s * index / users)
+            while time.perf_counter() < deadline:
+                name = user.rng.choices(names, weights)[0]
+                user.failed = False
+                session_start = time.perf_counter()
+                await SESSION_SCRIPTS[name][0](user)
+                sessions.append(SessionResult(name, time.perf_counter() - session_start, not user.failed))
+                await user.think()
+
+        await asyncio.gather(*(run_user(i) for i in range(users)))
+        elapsed = time.perf_counter() - start
+
+    samples = [sample for user in virtual_users for sample in user.samples]
+    return summarize_level(users, elapsed, samples, sessions)
+
+
+def within_slo(level: Dict[str, Any], p95_ms: float, error_rate: float) -> bool:
+    """Whether a level's p95 latency and error rate meet the service objective."""
+    return level['requests'] > 0 and level['latency_ms']['p95'] <= p95_ms and level['error_rate'] <= error_rate
+
+
+def summarize_run(levels: Sequence[Dict[str, Any]], p95_ms: float, error_rate: float) -> Dict[str, Any]:
+    """
+    Peak throughput and the largest concurrency level still within the objective.
+    """
+    passing = [level for level in levels if within_slo(level, p95_ms, error_rate)]
+    best = max(levels, key=lambda level: level['throughput_rps']) if levels else None
+    return {
+        'slo': {'p95_ms': p95_ms, 'error_rate': error_rate},
+        'max_users_within_slo': max((level['users'] for level in passing), default=0),
+        'peak_throughput_rps': best['throughput_rps'] if best else 0.0,
+        'peak_throughput_users': best['users'] if best else 0,
+    }
+
+
+def compare_runs(current: Dict[str, Any], previous: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Throughput and p95 of each concurrency level against another run's same level.
+
+    Args:
+        current: This run's report
+        previous: An earlier report (e.g. from the parent commit)
+
+    Returns:
+        One row per level present in both
+    """
+    earlier = {level['users']: level for level in previous.get('levels', [])}
+    rows = []
+    for level in current['levels']:
+        base = earlier.get(level['users'])
+        if not base:
+            continue
+        rows.append({
+            'users': level['users'],
+            'throughput_rps': (base['throughput_rps'], level['throughput_rps']),
+            'p95_ms': (base['latency_ms']['p95'], level['latency_ms']['p95']),
+            'error_rate': (base['error_rate'], level['error_rate']),
+        })
+    return rows
+
+
+def git_commit() -> Optional[str]:
+    """HEAD commit of the working tree, with '-dirty' when there are local changes."""
+    try:
+        head = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=PROJECT_ROOT,
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{head}-dirty" if dirty else head
+
+
+def start_server(port: int, workers: int) -> subprocess.Popen:
+    """
+    Start uvicorn serving web.backend.main:app on localhost and wait until it answers.
+
+    Several workers share parsed months through a temporary TGIR_SHARED_CACHE_DIR
+    unless one is already set, as in the Docker image.
+
+    Raises:
+        RuntimeError: If the server exits or does not answer within 60 seconds
+    """
+    env = dict(os.environ)
+    if workers > 1:
+        env.setdefault('TGIR_SHARED_CACHE_DIR', tempfile.mkdtemp(prefix='tgir-load-'))
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'uvicorn', 'web.backend.main:app', '--host', '127.0.0.1', '--port', str(port),
+         '--workers', str(workers), '--log-level', 'warning'],
+        cwd=PROJECT_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with code {process.returncode}")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/api/years", timeout=2).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.5)
+    process.terminate()
+    raise RuntimeError("uvicorn did not answer within 60 seconds")
+
+
+def main():
+    """
+    Run the load test from the command line.
+    """
+    parser = argparse.ArgumentParser(
+        description='Replay dashboard sessions at increasing concurrency and report throughput and latency',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python benchmarks/load_test.py --spawn --workers 2 --users 1,8,32 -o /tmp/load.json
+  python benchmarks/load_test.py --url http://127.0.0.1:8000 --users 16 --duration 60 --think 0
+  python benchmarks/load_test.py --spawn --mix comparison=1 --compare /tmp/load-main.json
+        """
+    )
+    parser.add_argument('--url', default=DEFAULT_URL, help=f'Backend to load (default: {DEFAULT_URL})')
+    parser.add_argument('--spawn', action='store_true', help='Start uvicorn on --port for the run and stop it after')
+    parser.add_argument('--port', type=int, default=8765, help='Port for --spawn (default: 8765)')
+    parser.add_argument('--workers', type=int, default=int(os.environ.get('WEB_CONCURRENCY', 2)),
+                        help='uvicorn workers for --spawn (default: WEB_CONCURRENCY or 2, as in the image)')
+    parser.add_argument('--users', default=DEFAULT_USERS,
+                        help=f'Comma-separated concurrency levels, run in order (default: {DEFAULT_USERS})')
+    parser.add_argument('--duration', type=float, default=DEFAULT_DURATION_S,
+                        help=f'Seconds per level (default: {DEFAULT_DURATION_S:g})')
+    parser.add_argument('--warmup', type=float, default=DEFAULT_WARMUP_S,
+                        help=f'Untimed seconds with one user before the first level (default: {DEFAULT_WARMUP_S:g})')
+    parser.add_argument('--ramp', type=float, default=0.0, help='Seconds over which each level starts its users')
+    parser.add_argument('--think', type=float, default=DEFAULT_THINK_S,
+                        help=f'Mean seconds between a user\'s clicks; 0 for closed-loop load (default: {DEFAULT_THINK_S:g})')
+    parser.add_argument('--mix', default=None,
+                        help='Session weights, e.g. quarter-report=3,quarter-endpoints=1,comparison=1 (the default)')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT_S,
+                        help=f'Per-request timeout in seconds (default: {DEFAULT_TIMEOUT_S:g})')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for the sessions (default: 0)')
+    parser.add_argument('--slo-p95-ms', type=float, default=DEFAULT_SLO_P95_MS,
+                        help=f'p95 latency objective in ms (default: {DEFAULT_SLO_P95_MS:g})')
+    parser.add_argument('--slo-error-rate', type=float, default=DEFAULT_SLO_ERROR_RATE,
+                        help=f'Error rate objective (default: {DEFAULT_SLO_ERROR_RATE:g})')
+    parser.add_argument('--output', '-o', type=Path, default=None, help='Write the report as JSON to this path')
+    parser.add_argument('--compare', type=Path, default=None, help='Earlier report to compare each level with')
+    args = parser.parse_args()
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as exc:
+        parser.error(str(exc))
+    levels_users = [int(u) for u in args.users.split(',') if u.strip()]
+
+    server = None
+    base_url = args.url
+    if args.spawn:
+        print(f"Starting uvicorn with {args.workers} worker(s) on port {args.port}...")
+        server = start_server(args.port, args.workers)
+        base_url = f"http://127.0.0.1:{args.port}"
+
+    levels = []
+    try:
+        if args.warmup > 0:
+            asyncio.run(run_level(base_url, 1, args.warmup, mix, think_s=0, seed=args.seed, timeout=args.timeout))
+
+        print("=" * 80)
+        print(f"LOAD TEST  {base_url}  (levels={levels_users}, {args.duration:g} s each, think={args.think:g} s)")
+        print("=" * 80)
+        print(f"{'Users':>6} {'Req/s':>9} {'Sess/s':>8} {'p50 (ms)':>10} {'p95 (ms)':>10} {'p99 (ms)':>10} "
+              f"{'Max (ms)':>10} {'Errors':>8}")
+        print("-" * 80)
+        for users in levels_users:
+            level = asyncio.run(run_level(base_url, users, args.duration, mix, think_s=args.think,
+                                          ramp_s=args.ramp, seed=args.seed, timeout=args.timeout))
+            levels.append(level)
+            latency = level['latency_ms']
+            print(f"{users:>6} {level['throughput_rps']:>9.1f} {level['sessions_per_s']:>8.2f} "
+                  f"{latency['p50']:>10.1f} {latency['p95']:>10.1f} {latency['p99']:>10.1f} "
+                  f"{latency['max']:>10.1f} {level['error_rate']:>7.2%}")
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+    report = {
+        'meta': {
+            'generated_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'commit': git_commit(),
+            'target': base_url,
+            'workers': args.workers if args.spawn else None,
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'options': {'duration_s': args.duration, 'warmup_s': args.warmup, 'ramp_s': args.ramp,
+                        'think_s': args.think, 'mix': mix, 'seed': args.seed, 'timeout_s': args.timeout},
+        },
+        'levels': levels,
+        'summary': summarize_run(levels, args.slo_p95_ms, args.slo_error_rate),
+    }
+
+    summary = report['summary']
+    print(f"\nPeak throughput: {summary['peak_throughput_rps']:.1f} req/s at {summary['peak_throughput_users']} users")
+    if summary['max_users_within_slo']:
+        print(f"✓ Within p95 <= {args.slo_p95_ms:g} ms and errors <= {args.slo_error_rate:.1%} "
+              f"up to {summary['max_users_within_slo']} users")
+    else:
+        print(f"✗ No level met p95 <= {args.slo_p95_ms:g} ms and errors <= {args.slo_error_rate:.1%}")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to: {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+        print("\n" + "=" * 80)
+        print(f"COMPARISON  ({previous.get('meta', {}).get('commit') or 'unknown commit'} -> {report['meta']['commit']})")
+        print("=" * 80)
+        for row in compare_runs(report, previous):
+            (rps_before, rps_after), (p95_before, p95_after) = row['throughput_rps'], row['p95_ms']
+            print(f"{row['users']:>6} users  {rps_before:>8.1f} -> {rps_after:>8.1f} req/s   "
+                  f"p95 {p95_before:>8.1f} -> {p95_after:>8.1f} ms   "
+                  f"errors {row['error_rate'][0]:.2%} -> {row['error_rate'][1]:.2%}")
+
+
+if __name__ == "__main__":
+    main()
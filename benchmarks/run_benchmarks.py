@@ -0,0 +1,473 @@
+#!/usr/bin/env python3
+"""
+Texas Grid Interconnect Reporter - Benchmark Suite
+Times extraction, API endpoints, the comparison diff and every report renderer,
+optionally on synthetic 10x/100x scale-ups, and checks results against a stored baseline.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import matplotlib
+matplotlib.use('Agg')
+
+import pandas as pd
+
+# Add project root and src to path (same layout main.py expects)
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.append(str(PROJECT_ROOT))
+sys.path.append(str(PROJECT_ROOT / "src"))
+
+from extract_large_gen import extract_large_gen_data
+from synthetic_workbook import generate_projects, write_workbook
+import reports
+
+INPUTS_DIR = PROJECT_ROOT / "inputs"
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+# Generated workbooks are reused across runs (large ones take minutes to write)
+SYNTHETIC_CACHE_DIR = Path(__file__).parent / ".cache"
+
+# A case is a regression when its median exceeds baseline median * threshold
+DEFAULT_THRESHOLD = 1.25
+# Excel parsing and matplotlib rendering are noisier than in-memory work
+GROUP_THRESHOLDS = {'extract': 1.5, 'render': 1.5}
+# On top of the ratio, allow this many of the baseline's robust standard deviations
+# (noise_s: 1.4826 x the median absolute deviation of its timings), so noisy cases do
+# not flag jitter while quiet millisecond cases are still held to the ratio
+NOISE_STDEVS = 3
+
+
+@dataclass
+class BenchmarkCase:
+    """A named, repeatable unit of work."""
+    name: str
+    group: str
+    func: Callable[[], object]
+    scale: int = 1
+    rows: int = 0
+    setup: Optional[Callable[[], None]] = None
+    teardown: Optional[Callable[[], None]] = None
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings for one case, in seconds."""
+    name: str
+    group: str
+    scale: int
+    rows: int
+    timings: List[float] = field(default_factory=list)
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            'group': self.group,
+            'scale': self.scale,
+            'rows': self.rows,
+            'repeat': len(self.timings),
+            'min_s': min(self.timings),
+            'median_s': statistics.median(self.timings),
+            'mean_s': statistics.fmean(self.timings),
+            'stdev_s': statistics.stdev(self.timings) if len(self.timings) > 1 else 0.0,
+            'noise_s': robust_stdev(self.timings),
+        }
+
+
+def robust_stdev(timings: List[float]) -> float:
+    """Standard deviation estimated from the median absolute deviation (ignores outliers)."""
+    median = statistics.median(timings)
+    return 1.4826 * statistics.median(abs(t - median) for t in timings)
+
+
+def list_input_files() -> List[Path]:
+    """Return every bundled inputs/<year>/<month>/file.xlsx, oldest first."""
+    return sorted(INPUTS_DIR.glob("*/*/file.xlsx"), key=lambda p: (int(p.parent.parent.name), int(p.parent.name)))
+
+
+def scale_frame(df: pd.DataFrame, factor: int) -> pd.DataFrame:
+    """
+    Replicate a month's rows to simulate a larger queue.
+
+    Each copy gets a distinct INR suffix so identifiers stay unique, which keeps
+    set/merge based code paths (e.g. the comparison diff) representative.
+
+    Args:
+        df: DataFrame returned by extract_large_gen_data
+        factor: Number of copies (1 returns the input unchanged)
+
+    Returns:
+        DataFrame with len(df) * factor rows
+    """
+    if factor <= 1:
+        return df
+    copies = []
+    for i in range(factor):
+        copy = df.copy()
+        if i:
+            copy['INR'] = copy['INR'].astype(str) + f"-x{i}"
+        copies.append(copy)
+    scaled = pd.concat(copies, ignore_index=True)
+    scaled.attrs = dict(df.attrs)
+    return scaled
+
+
+def synthetic_workbook(rows: int, seed: int = 0) -> Path:
+    """
+    Return an ERCOT-shaped workbook with `rows` projects, generating it on first use.
+
+    Args:
+        rows: Number of project rows
+        seed: Random seed passed to the generator
+
+    Returns:
+        Path to the cached workbook
+    """
+    path = SYNTHETIC_CACHE_DIR / f"synthetic_{rows}_{seed}.xlsx"
+    if not path.exists():
+        print(f"Generating synthetic workbook with {rows} rows: {path}")
+        write_workbook(generate_projects(rows, seed=seed), path)
+    return path
+
+
+class ScaledLoader:
+    """
+    Stand-in for extract_large_gen_data that serves cached (optionally scaled) frames.
+
+    Parsing is benchmarked separately; aggregation/API/render cases should only
+    measure the work that happens after a month is loaded.
+    """
+
+    def __init__(self):
+        self._cache: Dict[tuple, pd.DataFrame] = {}
+        self.scale = 1
+
+    def frame(self, file_path: Path, scale: int) -> pd.DataFrame:
+        key = (Path(file_path).resolve(), scale)
+        if key not in self._cache:
+            base_key = (key[0], 1)
+            if base_key not in self._cache:
+                self._cache[base_key] = extract_large_gen_data(Path(file_path))
+            self._cache[key] = scale_frame(self._cache[base_key], scale)
+        return self._cache[key]
+
+    def __call__(self, file_path: Path, *args, **kwargs) -> pd.DataFrame:
+        # Endpoints mutate the frame they receive, so hand out a copy like a fresh parse would
+        return self.frame(file_path, self.scale).copy()
+
+
+def build_cases(scales: List[int], groups: Optional[List[str]] = None) -> List[BenchmarkCase]:
+    """
+    Assemble the benchmark cases.
+
+    Args:
+        scales: Row multipliers for the scalable cases (1 = bundled data)
+        groups: Optional subset of 'extract', 'api', 'compare', 'render'
+
+    Returns:
+        List of cases in execution order
+    """
+    from fastapi.testclient import TestClient
+    from web.backend.main import app
+    import web.backend.api as api
+
+    # The backend logs every request at INFO; keep the benchmark table readable
+    logging.getLogger().setLevel(logging.WARNING)
+
+    files = list_input_files()
+    if len(files) < 2:
+        raise SystemExit(f"Benchmarks need at least two months under {INPUTS_DIR}")
+
+    latest, previous = files[-1], files[-2]
+    latest_year, latest_month = latest.parent.parent.name, latest.parent.name
+    prev_year, prev_month = previous.parent.parent.name, previous.parent.name
+
+    loader = ScaledLoader()
+    client = TestClient(app)
+    original_loader = api.extract_large_gen_data
+
+    # Endpoint cases time the full filter/aggregate/serialize pipeline, not result-cache hits
+    # (scaled frames also share the workbook's fingerprint, so cached bodies would cross scales)
+    result_cache_bytes = api.RESULT_CACHE.max_bytes
+    # The shared worker store and build-time snapshots are keyed on the workbook hash too,
+    # so they would also ignore scaling
+    api.MONTH_CACHE.shared = None
+    api.MONTH_CACHE.snapshots = None
+    api.RESULT_CACHE.max_bytes = 0
+
+    def use_result_cache():
+        api.RESULT_CACHE.max_bytes = result_cache_bytes
+
+    def bypass_result_cache():
+        api.RESULT_CACHE.clear()
+        api.RESULT_CACHE.max_bytes = 0
+
+    def use_loader(scale: int) -> Callable[[], None]:
+        def setup():
+            loader.scale = scale
+            loader.frame(latest, scale)
+            loader.frame(previous, scale)
+            api.extract_large_gen_data = loader
+            api.MONTH_CACHE.clear()
+        return setup
+
+    def restore_loader():
+        api.extract_large_gen_data = original_loader
+        api.MONTH_CACHE.clear()
+
+    # Pick parameters the dashboard would realistically send
+    df_latest = loader.frame(latest, 1)
+    cod = pd.to_datetime(df_latest['Projected COD'], errors='coerce')
+    all_quarters = sorted(cod.dt.to_period('Q').dropna().astype(str).unique())
+    quarters = all_quarters[:4]
+    in_quarters = cod.dt.to_period('Q').astype(str).isin(quarters)
+    top_county = df_latest[in_quarters].groupby('County')['Capacity (MW)'].sum().idxmax()
+    month_params = {'year': latest_year, 'month': latest_month}
+    quarter_params = [('quarters', q) for q in quarters] + list(month_params.items())
+
+    def get(path: str, params=None) -> Callable[[], object]:
+        def call():
+            response = client.get(path, params=params)
+            if response.status_code != 200:
+                raise RuntimeError(f"{path} returned {response.status_code}: {response.text[:200]}")
+            return response.content
+        return call
+
+    cases: List[BenchmarkCase] = []
+
+    # 1. Extraction (openpyxl parse + header build + validation) on every bundled month
+    for file_path in files:
+        label = f"{file_path.parent.parent.name}-{file_path.parent.name}"
+        cases.append(BenchmarkCase(f"extract[{label}]", 'extract',
+                                   lambda p=file_path: extract_large_gen_data(p),
+                                   rows=len(loader.frame(file_path, 1))))
+
+    # Parsing at scale needs real workbooks, not in-memory replicas
+    for scale in scales:
+        if scale > 1:
+            rows = len(loader.frame(latest, 1)) * scale
+            path = synthetic_workbook(rows)
+            cases.append(BenchmarkCase(f"extract[synthetic x{scale}]", 'extract',
+                                       lambda p=path: extract_large_gen_data(p), scale=scale, rows=rows))
+
+    # 2. API endpoints through the FastAPI TestClient
+    comparison_params = {'base_year': prev_year, 'base_month': prev_month,
+                         'target_year': latest_year, 'target_month': latest_month}
+    endpoint_cases = [
+        ('years', '/api/years', None, False),
+        ('months', '/api/months', None, False),
+        ('quarters', '/api/quarters', month_params, True),
+        ('data-quality', '/api/data-quality', month_params, True),
+        ('quarter-data', '/api/quarter-data', quarter_params, True),
+        ('county-details', '/api/county-details', [('county', top_county)] + quarter_params, True),
+        ('county-map-data', '/api/county-map-data', quarter_params, True),
+        ('quarter-report', '/api/quarter-report', quarter_params, True),
+        ('facets', '/api/facets', quarter_params, True),
+        ('cod-window', '/api/cod-window', {**month_params, 'months': 18, 'freq': 'Q'}, True),
+        ('capacity-curve', '/api/capacity-curve', {**month_params, 'freq': 'M'}, True),
+    ]
+    for name, path, params, scalable in endpoint_cases:
+        for scale in (scales if scalable else [1]):
+            cases.append(BenchmarkCase(f"api.{name}[x{scale}]", 'api', get(path, params), scale=scale,
+                                       setup=use_loader(scale) if scalable else None,
+                                       teardown=restore_loader if scalable else None))
+
+    # Repeat visits to the default view, answered from the result cache (warmup fills it)
+    cases.append(BenchmarkCase("api.quarter-report.cached[x1]", 'api', get('/api/quarter-report', quarter_params),
+                               setup=use_result_cache, teardown=bypass_result_cache))
+
+    # 3. Month-over-month comparison diff
+    for scale in scales:
+        cases.append(BenchmarkCase(f"compare[x{scale}]", 'compare',
+                                   get('/api/comparison-data', comparison_params), scale=scale,
+                                   setup=use_loader(scale), teardown=restore_loader))
+
+    # 4. Every generate_* renderer in reports.py
+    output_dir = Path(tempfile.mkdtemp(prefix='tgir-bench-'))
+    renderers = [
+        ('county', lambda df: reports.generate_county_report(df, output_dir)),
+        ('cod', lambda df: reports.generate_cod_quarterly_report(df, output_dir)),
+        ('fuel', lambda df: reports.generate_fuel_type_report(df, output_dir)),
+        ('technology', lambda df: reports.generate_technology_type_report(df, output_dir)),
+        ('county-fuel', lambda df: reports.generate_county_fuel_report(df, output_dir, quarters=quarters)),
+    ]
+    for name, render in renderers:
+        for scale in scales:
+            cases.append(BenchmarkCase(f"render.{name}[x{scale}]", 'render',
+                                       lambda r=render, s=scale: r(loader.frame(latest, s)), scale=scale))
+
+    if groups:
+        cases = [c for c in cases if c.group in groups]
+    for case in cases:
+        case.rows = case.rows or len(loader.frame(latest, case.scale))
+    return cases
+
+
+def run_case(case: BenchmarkCase, repeat: int, warmup: int) -> BenchmarkResult:
+    """
+    Time a case `repeat` times after `warmup` untimed calls, silencing its stdout.
+
+    Args:
+        case: Case to run
+        repeat: Number of timed iterations
+        warmup: Number of untimed iterations
+
+    Returns:
+        BenchmarkResult with per-iteration wall-clock timings
+    """
+    result = BenchmarkResult(case.name, case.group, case.scale, case.rows)
+    if case.setup:
+        case.setup()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(warmup):
+                case.func()
+            for _ in range(repeat):
+                start = time.perf_counter()
+                case.func()
+                result.timings.append(time.perf_counter() - start)
+    finally:
+        if case.teardown:
+            case.teardown()
+    return result
+
+
+def compare_to_baseline(results: Dict[str, Dict], baseline: Dict) -> List[Dict]:
+    """
+    Compare medians with a stored baseline.
+
+    Args:
+        results: Case name -> summary dict from this run
+        baseline: Parsed baseline.json
+
+    Returns:
+        One row per case present in both, with ratio and regression flag
+    """
+    rows = []
+    for name, summary in results.items():
+        base = baseline.get('cases', {}).get(name)
+        if not base:
+            continue
+        threshold = base.get('threshold', DEFAULT_THRESHOLD)
+        limit = base['median_s'] * threshold + NOISE_STDEVS * base.get('noise_s', 0.0)
+        rows.append({
+            'name': name,
+            'baseline_s': base['median_s'],
+            'current_s': summary['median_s'],
+            'ratio': summary['median_s'] / base['median_s'] if base['median_s'] else float('inf'),
+            'threshold': threshold,
+            'limit_s': limit,
+            'regression': summary['median_s'] > limit,
+        })
+    return rows
+
+
+def main():
+    """
+    Run the benchmark suite from the command line.
+    """
+    parser = argparse.ArgumentParser(
+        description='Benchmark extraction, API endpoints, comparison and report rendering',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python benchmarks/run_benchmarks.py                        # run and compare to baseline.json
+  python benchmarks/run_benchmarks.py --scales 1,10,100      # include 100x synthetic scale-up
+  python benchmarks/run_benchmarks.py --group api --repeat 10
+  python benchmarks/run_benchmarks.py --save-baseline        # record a new baseline
+        """
+    )
+    parser.add_argument('--scales', default='1,10', help='Comma-separated row multipliers (default: 1,10)')
+    parser.add_argument('--group', action='append', choices=['extract', 'api', 'compare', 'render'],
+                        help='Only run these groups (repeatable)')
+    parser.add_argument('--filter', '-k', default=None, help='Only run cases whose name contains this text')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed iterations per case (default: 5)')
+    parser.add_argument('--warmup', type=int, default=1, help='Untimed iterations per case (default: 1)')
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH, help='Baseline file to compare against')
+    parser.add_argument('--save-baseline', action='store_true', help='Write this run as the new baseline')
+    parser.add_argument('--threshold', type=float, default=None,
+                        help=f'Regression ratio stored with a new baseline '
+                             f'(default: {DEFAULT_THRESHOLD}, extract/render: 1.5)')
+    parser.add_argument('--output', '-o', type=Path, default=None, help='Write results as JSON to this path')
+    args = parser.parse_args()
+
+    scales = sorted({int(s) for s in args.scales.split(',') if s.strip()})
+    cases = build_cases(scales, args.group)
+    if args.filter:
+        cases = [c for c in cases if args.filter in c.name]
+
+    print("=" * 80)
+    print(f"BENCHMARKS  ({len(cases)} cases, repeat={args.repeat}, scales={scales})")
+    print("=" * 80)
+    print(f"{'Case':<40} {'Rows':>9} {'Median (ms)':>12} {'Min (ms)':>10} {'Stdev':>8}")
+    print("-" * 83)
+
+    results: Dict[str, Dict] = {}
+    for case in cases:
+        summary = run_case(case, args.repeat, args.warmup).summary()
+        results[case.name] = summary
+        print(f"{case.name:<40} {summary['rows']:>9} {summary['median_s'] * 1000:>12.2f} "
+              f"{summary['min_s'] * 1000:>10.2f} {summary['stdev_s'] * 1000:>8.2f}")
+
+    meta = {
+        'generated_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'machine': platform.machine(),
+        'platform': platform.platform(),
+    }
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, 'w') as f:
+            json.dump({'meta': meta, 'cases': results}, f, indent=2)
+        print(f"\nResults written to: {args.output}")
+
+    if args.save_baseline:
+        baseline = {'meta': meta, 'cases': {}}
+        if args.baseline.exists():
+            with open(args.baseline) as f:
+                baseline['cases'] = json.load(f).get('cases', {})
+        for name, summary in results.items():
+            threshold = args.threshold or GROUP_THRESHOLDS.get(summary['group'], DEFAULT_THRESHOLD)
+            baseline['cases'][name] = {'median_s': summary['median_s'], 'noise_s': summary['noise_s'],
+                                       'rows': summary['rows'], 'threshold': threshold}
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"\nBaseline saved to: {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create one.")
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    rows = compare_to_baseline(results, baseline)
+
+    print("\n" + "=" * 80)
+    print(f"BASELINE COMPARISON  ({baseline.get('meta', {}).get('generated_at', 'unknown date')})")
+    print("=" * 80)
+    for row in rows:
+        flag = "REGRESSION" if row['regression'] else "ok"
+        print(f"{row['name']:<40} {row['baseline_s'] * 1000:>10.2f} -> {row['current_s'] * 1000:>10.2f} ms "
+              f"({row['ratio']:.2f}x, limit {row['threshold']:.2f}x = {row['limit_s'] * 1000:.2f} ms)  {flag}")
+
+    regressions = [r for r in rows if r['regression']]
+    if regressions:
+        print(f"\n✗ {len(regressions)} case(s) regressed beyond their threshold")
+        sys.exit(1)
+    print("\n✓ No regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
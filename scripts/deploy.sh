@@ -37,6 +37,11 @@ echo "Deploying to Project: $project_id"
 echo "Region: $region"
 echo "Service: $service_name"
 
+# Pre-flight: parse every bundled month locally so a bad workbook fails here,
+# before a remote build (the image build repeats the full ingestion)
+echo "Checking bundled inputs..."
+./scripts/ingest.sh build --snapshots-only
+
 # Build Docker image
 echo "Building Docker image..."
 # Use Google Cloud Build for building (optional, but easier for pushing)
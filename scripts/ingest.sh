@@ -0,0 +1,60 @@
+#!/bin/bash
+
+# Texas Grid Interconnect Reporter - Build-time Ingestion
+# Parses every month under inputs/ into snapshots, stores the months as a compact delta
+# history and pre-renders the API responses, so the server starts without parsing Excel
+# or computing the dashboard's views.
+#
+# Usage: ./scripts/ingest.sh [build_dir] [--snapshots-only] [--keep-snapshots=N]
+#   build_dir            Output directory (default: build)
+#   --snapshots-only     Skip the static API tree (seconds instead of minutes)
+#   --keep-snapshots=N   Afterwards keep full snapshots of the newest N months only; the
+#                        server rebuilds older months from the delta history
+
+# Exit on error
+set -e
+
+# Navigate to project root
+cd "$(dirname "$0")/.."
+
+BUILD_DIR="build"
+SNAPSHOTS_ONLY=0
+KEEP_SNAPSHOTS=""
+for arg in "$@"; do
+    case "$arg" in
+        --snapshots-only) SNAPSHOTS_ONLY=1 ;;
+        --keep-snapshots=*) KEEP_SNAPSHOTS="${arg#*=}" ;;
+        *) BUILD_DIR="$arg" ;;
+    esac
+done
+
+echo "=================================================="
+echo "   Ingesting inputs/ into $BUILD_DIR"
+echo "=================================================="
+
+# 1. Typed snapshots of every month (the only step that parses Excel)
+echo "[1/3] Snapshotting months..."
+python src/ingest.py --out "$BUILD_DIR/snapshots"
+
+# 2. Delta history (checkpoints + per-month deltas), built from the snapshots above
+echo "[2/3] Building delta history..."
+TGIR_SNAPSHOT_DIR="$BUILD_DIR/snapshots" python src/history_store.py --out "$BUILD_DIR/history"
+
+if [ "$SNAPSHOTS_ONLY" = "1" ]; then
+    echo "[3/3] Skipping static API tree (--snapshots-only)"
+else
+    # 3. Pre-rendered API responses (quarter reports, county details, comparisons),
+    #    computed from the snapshots above
+    echo "[3/3] Pre-rendering API responses..."
+    TGIR_SNAPSHOT_DIR="$BUILD_DIR/snapshots" python web/backend/prerender.py --out "$BUILD_DIR/static_api"
+fi
+
+# Older months are served from the delta history, so their full snapshots can go
+if [ -n "$KEEP_SNAPSHOTS" ]; then
+    echo "Keeping snapshots of the newest $KEEP_SNAPSHOTS months..."
+    python src/ingest.py --out "$BUILD_DIR/snapshots" --prune-to "$KEEP_SNAPSHOTS"
+fi
+
+echo "=================================================="
+echo "   Build artifacts ready in $BUILD_DIR"
+echo "=================================================="
@@ -25,7 +25,8 @@ echo "=================================================="
 echo "[1/2] Starting Backend Server (FastAPI)..."
 # Navigate to project root
 cd "$(dirname "$0")/.."
-uvicorn web.backend.main:app --reload --port 8000 &
+# ?profile=1 is only honored in development
+TGIR_PROFILING="${TGIR_PROFILING:-1}" uvicorn web.backend.main:app --reload --port 8000 &
 BACKEND_PID=$!
 echo "      Backend running on http://localhost:8000"
 
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Texas Grid Interconnect Reporter - Artifact Store
+Content-addressed storage for rendered charts. An artifact's name is a hash of the
+dataset fingerprint, report type and parameters, so identical requests reuse one
+file and different filters can never overwrite each other.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+
+DEFAULT_QUOTA_BYTES = int(os.environ.get('TGIR_ARTIFACT_QUOTA_BYTES', str(512 * 1024 * 1024)))
+
+# Renders in progress live in hidden directories next to the artifacts (same filesystem,
+# so the final os.replace is atomic) and are never counted or evicted.
+_TMP_PREFIX = '.tmp-'
+
+
+def canonical_params(params: Optional[Mapping[str, Any]]) -> Dict[str, Any]:
+    """
+    Normalize request parameters for use in a cache key.
+
+    None and empty values are dropped and list values are de-duplicated and sorted,
+    so equivalent parameter sets compare equal.
+
+    Args:
+        params: Request parameters (e.g. {'quarters': ['2026Q2', '2026Q1']})
+
+    Returns:
+        Dictionary of the remaining parameters
+    """
+    canonical: Dict[str, Any] = {}
+    for name, value in (params or {}).items():
+        if value is None or (isinstance(value, (list, tuple, set)) and not value):
+            continue
+        if isinstance(value, (list, tuple, set)):
+            value = sorted({str(v) for v in value})
+        canonical[name] = value
+    return canonical
+
+
+def artifact_key(fingerprint: str, report: str, params: Optional[Mapping[str, Any]] = None) -> str:
+    """
+    Stable hash of one render request.
+
+    Parameters are normalized with canonical_params, so equivalent parameter sets
+    map to the same artifact.
+
+    Args:
+        fingerprint: Dataset content hash (MonthDataset.fingerprint)
+        report: Report type (e.g. 'county-fuel')
+        params: Render parameters (e.g. {'quarters': ['2026Q1']})
+
+    Returns:
+        First 20 hex characters of the SHA-256 of the canonical request
+    """
+    payload = json.dumps([fingerprint, report, canonical_params(params)], sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:20]
+
+
+class ArtifactStore:
+    """
+    Directory of rendered files named <report>-<key><suffix>, bounded by a disk quota.
+
+    Renders write into a private temporary directory and are moved into place with
+    os.replace, so readers only ever see complete files. Reads refresh the file's
+    modification time, which orders eviction (least recently used first).
+    """
+
+    def __init__(self, root: Path, quota_bytes: int = DEFAULT_QUOTA_BYTES):
+        """
+        Args:
+            root: Directory holding the artifacts (created if missing)
+            quota_bytes: Total size kept on disk before evicting
+        """
+        self.root = Path(root)
+        self.quota_bytes = quota_bytes
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def path_for(self, report: str, key: str, suffix: str = '.png') -> Path:
+        """Final location of an artifact."""
+        return self.root / f"{report}-{key}{suffix}"
+
+    def _lock(self, key: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def get_or_render(self, fingerprint: str, report: str, params: Optional[Mapping[str, Any]],
+                      render: Callable[[Path], None], suffix: str = '.png') -> Tuple[Path, bool]:
+        """
+        Return the artifact for a request, rendering it once if it does not exist.
+
+        Args:
+            fingerprint: Dataset content hash
+            report: Report type
+            params: Render parameters
+            render: Function writing exactly one `suffix` file into the directory it is given
+            suffix: Artifact file extension
+
+        Returns:
+            (path, cached) where cached is True when no render was needed
+
+        Raises:
+            RuntimeError: If the render did not produce exactly one `suffix` file
+        """
+        key = artifact_key(fingerprint, report, params)
+        path = self.path_for(report, key, suffix)
+        if self._touch(path):
+            return path, True
+
+        # One render per key in this process; other processes may race us, which only
+        # costs a duplicate render since both write identical content with os.replace
+        with self._lock(key):
+            if self._touch(path):
+                return path, True
+
+            self.root.mkdir(parents=True, exist_ok=True)
+            work_dir = Path(tempfile.mkdtemp(prefix=_TMP_PREFIX, dir=self.root))
+            try:
+                render(work_dir)
+                produced = sorted(work_dir.glob(f"*{suffix}"))
+                if len(produced) != 1:
+                    raise RuntimeError(f"Render for '{report}' produced {len(produced)} {suffix} files, expected 1")
+                os.replace(produced[0], path)
+            finally:
+                shutil.rmtree(work_dir, ignore_errors=True)
+                # Later requests find the file; a late waiter on this lock re-checks it too
+                with self._locks_guard:
+                    self._locks.pop(key, None)
+
+        self.enforce_quota(keep=path)
+        return path, False
+
+    @staticmethod
+    def _touch(path: Path) -> bool:
+        try:
+            os.utime(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def artifacts(self) -> List[Path]:
+        """Stored artifacts, least recently used first."""
+        if not self.root.exists():
+            return []
+        entries = []
+        for entry in os.scandir(self.root):
+            if entry.is_file() and not entry.name.startswith(_TMP_PREFIX):
+                try:
+                    entries.append((entry.stat().st_mtime_ns, Path(entry.path)))
+                except FileNotFoundError:
+                    continue
+        return [path for _, path in sorted(entries)]
+
+    def usage(self) -> int:
+        """Bytes used by stored artifacts."""
+        total = 0
+        for path in self.artifacts():
+            try:
+                total += path.stat().st_size
+            except FileNotFoundError:
+                continue
+        return total
+
+    def enforce_quota(self, keep: Optional[Path] = None) -> List[Path]:
+        """
+        Delete least recently used artifacts until the store fits its quota.
+
+        Args:
+            keep: Artifact never evicted (typically the one just rendered)
+
+        Returns:
+            Deleted paths
+        """
+        sizes = []
+        for path in self.artifacts():
+            try:
+                sizes.append((path, path.stat().st_size))
+            except FileNotFoundError:
+                continue
+        used = sum(size for _, size in sizes)
+        evicted = []
+        for path, size in sizes:
+            if used <= self.quota_bytes:
+                break
+            if keep is not None and path == keep:
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            used -= size
+            evicted.append(path)
+        return evicted
+
+    def stats(self) -> Dict[str, Any]:
+        """Artifact count, bytes used and quota."""
+        return {'artifacts': len(self.artifacts()), 'bytes': self.usage(), 'quota_bytes': self.quota_bytes}
+
+
+def main():
+    """
+    Show or trim an artifact store directory.
+    """
+    parser = argparse.ArgumentParser(
+        description='Inspect the rendered chart store',
+        epilog='Example: python src/artifact_store.py outputs/artifacts --quota-mb 256 --trim'
+    )
+    parser.add_argument('root', nargs='?', default=str(Path(__file__).parent.parent / 'outputs' / 'artifacts'),
+                        help='Artifact directory (default: outputs/artifacts)')
+    parser.add_argument('--quota-mb', type=float, default=DEFAULT_QUOTA_BYTES / (1024 * 1024),
+                        help='Disk quota in MiB (default: TGIR_ARTIFACT_QUOTA_BYTES or 512)')
+    parser.add_argument('--trim', action='store_true', help='Evict least recently used artifacts over the quota')
+    args = parser.parse_args()
+
+    store = ArtifactStore(Path(args.root), int(args.quota_mb * 1024 * 1024))
+    if args.trim:
+        for path in store.enforce_quota():
+            print(f"  evicted {path.name}")
+    stats = store.stats()
+    print(f"✓ {stats['artifacts']} artifacts, {stats['bytes'] / (1024 * 1024):.1f} MiB "
+          f"of {stats['quota_bytes'] / (1024 * 1024):.1f} MiB in {store.root}")
+
+
+if __name__ == "__main__":
+    main()
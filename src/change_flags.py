@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Texas Grid Interconnect Reporter - Change Indicator Flags
+Parses the "Change indicators" column of the Large Gen sheet into a per-row bitmask
+so flagged changes can be selected with a mask instead of rescanning strings.
+"""
+
+import argparse
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class ChangeType(NamedTuple):
+    """One change type ERCOT can flag in the change-indicator column."""
+    bit: int
+    tokens: tuple       # Substrings that mark this change in the indicator text
+    column: str         # Column holding the new value
+    label: str          # Prefix used when describing the new value
+    is_date: bool = False
+
+
+# Bits follow the column header (Proj Name, MW Size, COD, SFS/NtP, FIS Request,
+# Status Change INA-to-PLN); dict order is the order new values are listed in
+CHANGE_TYPES: Dict[str, ChangeType] = {
+    'cod': ChangeType(4, ('COD',), 'Projected COD', 'New COD', is_date=True),
+    'mw_size': ChangeType(2, ('MW',), 'Capacity (MW)', 'New MW'),
+    'proj_name': ChangeType(1, ('Proj Name',), 'Project Name', 'New Name'),
+    'sfs_ntp': ChangeType(8, ('SFS', 'NtP'), 'Financial Security and Notice to Proceed Provided', 'SFS/NtP'),
+    'fis_request': ChangeType(16, ('FIS Request',), 'FIS Requested', 'FIS Requested', is_date=True),
+    'status_change': ChangeType(32, ('INA-to-PLN', 'Status'), 'GIM Study Phase', 'Status'),
+}
+
+# Bitmask column added by extract_large_gen_data (0 = nothing flagged)
+CHANGE_FLAGS_COLUMN = 'Change Flags'
+
+
+def find_change_indicator_column(columns: Iterable[str]) -> Optional[str]:
+    """
+    Find the change-indicator column (its header lists every change type).
+
+    Args:
+        columns: Column names of a Large Gen DataFrame
+
+    Returns:
+        Column name, or None when the sheet has no change indicators
+    """
+    return next((c for c in columns if 'Change indicator' in c or 'Change Indicator' in c), None)
+
+
+def _is_blank(values: np.ndarray) -> np.ndarray:
+    """True where a value is NaN/None, empty/whitespace or the string 'nan'."""
+    text = pd.Series(values, dtype=object).astype(str).str.strip()
+    return (pd.isna(values) | (text == '') | (text.str.lower() == 'nan')).to_numpy()
+
+
+def parse_change_indicators(series: pd.Series) -> np.ndarray:
+    """
+    Convert change-indicator text (e.g. 'MW Size  COD') into a bitmask of CHANGE_TYPES.
+
+    Only the distinct indicator strings are scanned (a month has about a dozen).
+
+    Args:
+        series: Raw change-indicator column
+
+    Returns:
+        uint8 array with one bitmask per row
+    """
+    codes, uniques = pd.factorize(series)
+    masks = np.zeros(len(uniques) + 1, dtype=np.uint8)  # Last slot: missing values (code -1)
+    for i, text in enumerate(uniques):
+        text = str(text).strip()
+        if not text or text.lower() == 'nan':
+            continue
+        for change in CHANGE_TYPES.values():
+            if any(token in text for token in change.tokens):
+                masks[i] |= change.bit
+    return masks[codes]
+
+
+def add_change_flags(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add the CHANGE_FLAGS_COLUMN bitmask to a Large Gen DataFrame (in place).
+
+    Args:
+        df: DataFrame with the Large Gen column names applied
+
+    Returns:
+        The same DataFrame
+    """
+    indicator_col = find_change_indicator_column(df.columns)
+    if indicator_col is None:
+        df[CHANGE_FLAGS_COLUMN] = np.zeros(len(df), dtype=np.uint8)
+    else:
+        df[CHANGE_FLAGS_COLUMN] = parse_change_indicators(df[indicator_col])
+    return df
+
+
+def change_flag_mask(df: pd.DataFrame, change_types: Optional[Iterable[str]] = None,
+                     match_all: bool = False) -> np.ndarray:
+    """
+    Select rows flagged with the given change types.
+
+    Args:
+        df: DataFrame with CHANGE_FLAGS_COLUMN
+        change_types: Keys of CHANGE_TYPES; any flagged change when omitted
+        match_all: Require every listed type instead of any of them
+
+    Returns:
+        Boolean row mask
+
+    Raises:
+        KeyError: If a change type is unknown
+    """
+    flags = df[CHANGE_FLAGS_COLUMN].to_numpy() if CHANGE_FLAGS_COLUMN in df.columns else np.zeros(len(df), np.uint8)
+    if not change_types:
+        return flags != 0
+    bits = 0
+    for name in change_types:
+        if name not in CHANGE_TYPES:
+            raise KeyError(f"Unknown change type '{name}'. Valid: {', '.join(CHANGE_TYPES)}")
+        bits |= CHANGE_TYPES[name].bit
+    return (flags & bits) == bits if match_all else (flags & bits) != 0
+
+
+def change_flag_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Expand CHANGE_FLAGS_COLUMN into one boolean column per change type.
+
+    Args:
+        df: DataFrame with CHANGE_FLAGS_COLUMN
+
+    Returns:
+        DataFrame indexed like df with columns named after CHANGE_TYPES
+    """
+    flags = df[CHANGE_FLAGS_COLUMN].to_numpy()
+    return pd.DataFrame({name: (flags & change.bit) != 0 for name, change in CHANGE_TYPES.items()},
+                        index=df.index)
+
+
+def _format_values(values: pd.Series, is_date: bool) -> np.ndarray:
+    """Render new values as text, dates as YYYY-MM-DD where they parse."""
+    text = values.astype(object).map(str).to_numpy(dtype=object)
+    if is_date:
+        parsed = pd.to_datetime(values, errors='coerce', format='mixed')
+        dates = parsed.dt.strftime('%Y-%m-%d').to_numpy(dtype=object)
+        text = np.where(parsed.notna().to_numpy(), dates, text)
+    return text
+
+
+def flagged_changes(df: pd.DataFrame, change_types: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+    """
+    List flagged projects with the new value behind each flagged change.
+
+    Args:
+        df: DataFrame with CHANGE_FLAGS_COLUMN (see add_change_flags)
+        change_types: Optional subset of CHANGE_TYPES to keep (any of them)
+
+    Returns:
+        One dictionary per flagged project: INR, Project Name, County, change_flag
+        (raw indicator text), change_types and new_values (e.g. 'New COD: 2027-06-30')
+    """
+    flagged = df[change_flag_mask(df, change_types)]
+    if flagged.empty:
+        return []
+
+    flags = flagged[CHANGE_FLAGS_COLUMN].to_numpy()
+    indicator_col = find_change_indicator_column(flagged.columns)
+    indicators = flagged[indicator_col].astype(str).str.strip().tolist()
+
+    # Per change type: which rows it applies to and their formatted new value
+    descriptions = []
+    for name, change in CHANGE_TYPES.items():
+        applies = (flags & change.bit) != 0
+        if change.column in flagged.columns:
+            values = flagged[change.column]
+            applies &= ~_is_blank(values.to_numpy(dtype=object))
+            text = _format_values(values, change.is_date)
+        else:
+            applies = np.zeros(len(flagged), dtype=bool)
+            text = np.full(len(flagged), None, dtype=object)
+        descriptions.append((name, change, applies, text))
+
+    def column(name: str) -> List[Any]:
+        return flagged[name].tolist() if name in flagged.columns else ['N/A'] * len(flagged)
+
+    changes = []
+    for i, (inr, project, county, indicator, row_flags) in enumerate(
+            zip(column('INR'), column('Project Name'), column('County'), indicators, flags)):
+        changes.append({
+            "INR": inr,
+            "Project Name": project,
+            "County": county,
+            "change_flag": indicator,
+            "change_types": [name for name, change in CHANGE_TYPES.items() if row_flags & change.bit],
+            "new_values": [f"{change.label}: {text[i]}" for _, change, applies, text in descriptions if applies[i]]
+        })
+    return changes
+
+
+def main():
+    """
+    Print the projects flagged in one month's report, optionally limited to some change types.
+    """
+    from extract_large_gen import extract_large_gen_data
+
+    parser = argparse.ArgumentParser(
+        description='List projects flagged in the change-indicator column',
+        epilog='Example: python src/change_flags.py inputs/2026/01/file.xlsx --types cod mw_size'
+    )
+    parser.add_argument('input_file', help='Path to the Excel file')
+    parser.add_argument('--types', nargs='+', choices=list(CHANGE_TYPES), default=None,
+                        help='Change types to list (default: any flagged change)')
+    args = parser.parse_args()
+
+    df = extract_large_gen_data(Path(args.input_file))
+    changes = flagged_changes(df, args.types)
+
+    print("=" * 80)
+    print(f"FLAGGED CHANGES: {args.input_file}")
+    print("=" * 80)
+    counts = change_flag_frame(df).sum()
+    for name, count in counts.items():
+        print(f"  {name:<15} {int(count):>5}")
+    print("-" * 80)
+    for change in changes:
+        print(f"{change['INR']:<12} {str(change['County']):<15} {change['change_flag']:<25} "
+              f"{'; '.join(change['new_values'])}")
+    print(f"\n✓ {len(changes)} flagged projects")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Texas Grid Interconnect Reporter - Chart Specs
+Aggregated series, labels and colors for every report chart as compact JSON, so the
+frontend can draw them client-side and the PNG renderers in reports.py draw the same data.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from cod_index import CodIndex
+from constants import FUEL_COLORS, normalize_fuel_type, normalize_technology_type
+from dataset import normalize_month_frame
+
+
+ChartSpec = Dict[str, Any]
+
+TITLE_PREFIX = 'ERCOT Large Gen Projects'
+
+# Fallback for fuels without an entry in FUEL_COLORS
+DEFAULT_COLOR = '#D3D3D3'
+
+# matplotlib's Set3 palette, used for technology types (which have no fixed colors)
+SET3_COLORS = ['#8DD3C7', '#FFFFB3', '#BEBADA', '#FB8072', '#80B1D3', '#FDB462',
+               '#B3DE69', '#FCCDE5', '#D9D9D9', '#BC80BD', '#CCEBC5', '#FFED6F']
+
+# Counties shown in the county + fuel chart
+MAX_COUNTY_FUEL_COUNTIES = 20
+
+# Decimal places kept for MW values and percentages
+MW_DECIMALS = 2
+
+
+def _mw(values: pd.Series) -> List[float]:
+    return [round(float(v), MW_DECIMALS) for v in values]
+
+
+def county_spec(df: pd.DataFrame) -> ChartSpec:
+    """
+    Total MW by county, smallest first (bottom to top of a horizontal bar chart).
+
+    Args:
+        df: DataFrame containing the Large Gen project details
+    """
+    county_data = df.groupby('County')['Capacity (MW)'].sum().sort_values(ascending=True)
+    county_data = county_data[county_data.index.notna()]
+    return {
+        'report': 'county',
+        'kind': 'barh',
+        'title': f"{TITLE_PREFIX} - Total MW Capacity by County",
+        'x_label': 'Total Capacity (MW)',
+        'y_label': None,
+        'categories': [str(c) for c in county_data.index],
+        'series': [{'name': 'Capacity (MW)', 'values': _mw(county_data.values), 'color': '#2E86AB'}],
+        'total_mw': round(float(county_data.sum()), MW_DECIMALS),
+    }
+
+
+def cod_spec(df: pd.DataFrame, cod_index: CodIndex = None) -> ChartSpec:
+    """
+    Project count per Projected COD quarter, for quarters that have projects.
+
+    Args:
+        df: DataFrame containing the Large Gen project details
+        cod_index: Optional prebuilt COD index for df (e.g. MonthDataset.cod)
+    """
+    if cod_index is None:
+        cod_index = CodIndex.from_frame(normalize_month_frame(df.copy()))
+    quarterly_counts = cod_index.buckets('Q')['count'].sum(axis=1)
+    quarterly_counts = quarterly_counts[quarterly_counts > 0]
+    date_range = None
+    if len(cod_index):
+        date_range = [cod_index.first_date.strftime('%Y-%m-%d'), cod_index.last_date.strftime('%Y-%m-%d')]
+    return {
+        'report': 'cod',
+        'kind': 'bar',
+        'title': f"{TITLE_PREFIX} - Projected COD by Quarter",
+        'x_label': 'Quarter',
+        'y_label': 'Number of Projects',
+        'categories': [str(q) for q in quarterly_counts.index],
+        'series': [{'name': 'Projects', 'values': [int(v) for v in quarterly_counts.values], 'color': '#A23B72'}],
+        'total_projects': len(cod_index),
+        'date_range': date_range,
+    }
+
+
+def _breakdown_spec(report: str, labels: pd.Series, capacity: pd.Series, label_title: str,
+                    title: str, colors: Dict[str, str]) -> ChartSpec:
+    """
+    Pie of MW by label plus a Projects / Total MW / % of Total table, largest first.
+
+    colors maps labels to colors; labels without one cycle through SET3_COLORS by position.
+    """
+    grouped = capacity.groupby(labels)
+    counts = grouped.size()
+    mw = grouped.sum().sort_values(ascending=False)
+    mw = mw[mw.index != 'Unknown']
+    total_mw = float(mw.sum())
+    rows = []
+    for label, value in mw.items():
+        pct = (value / total_mw * 100) if total_mw > 0 else 0
+        rows.append([str(label), int(counts[label]), round(float(value), MW_DECIMALS), round(float(pct), MW_DECIMALS)])
+    return {
+        'report': report,
+        'kind': 'pie',
+        'title': title,
+        'categories': [row[0] for row in rows],
+        'series': [{'name': 'Total MW', 'values': [row[2] for row in rows]}],
+        'colors': [colors.get(label, SET3_COLORS[i % len(SET3_COLORS)]) for i, label in enumerate(mw.index)],
+        'table': {'columns': [label_title, 'Projects', 'Total MW', '% of Total'], 'rows': rows},
+        'total_mw': round(total_mw, MW_DECIMALS),
+    }
+
+
+def fuel_spec(df: pd.DataFrame) -> ChartSpec:
+    """
+    MW share and project counts by normalized fuel type (Unknown excluded).
+
+    Args:
+        df: DataFrame containing the Large Gen project details
+    """
+    fuels = df['Fuel'].apply(normalize_fuel_type)
+    colors = {fuel: FUEL_COLORS.get(fuel, DEFAULT_COLOR) for fuel in fuels.unique()}
+    return _breakdown_spec('fuel', fuels, df['Capacity (MW)'], 'Fuel Type',
+                           f"{TITLE_PREFIX} - Fuel Type Analysis", colors)
+
+
+def technology_spec(df: pd.DataFrame) -> ChartSpec:
+    """
+    MW share and project counts by normalized technology type (Unknown excluded).
+
+    Args:
+        df: DataFrame containing the Large Gen project details
+    """
+    technologies = df['Technology'].apply(normalize_technology_type)
+    return _breakdown_spec('technology', technologies, df['Capacity (MW)'], 'Technology Type',
+                           f"{TITLE_PREFIX} - Technology Type Analysis", {})
+
+
+def county_fuel_spec(df: pd.DataFrame, quarters: Optional[List[str]] = None) -> ChartSpec:
+    """
+    MW by county stacked by fuel type for the largest counties, smallest first.
+
+    Args:
+        df: DataFrame containing the Large Gen project details
+        quarters: Optional list of quarters to filter by (e.g. ['2024Q1', '2024Q2'])
+    """
+    df_filtered = df
+    if quarters:
+        cod = pd.to_datetime(df['Projected COD'], errors='coerce')
+        df_filtered = df[cod.dt.to_period('Q').astype(str).isin(quarters)]
+
+    fuels = df_filtered['Fuel'].apply(normalize_fuel_type)
+    pivot_data = df_filtered['Capacity (MW)'].groupby([df_filtered['County'], fuels]).sum().unstack(fill_value=0)
+    pivot_data = pivot_data.loc[pivot_data.sum(axis=1).sort_values(ascending=True).index]
+    county_count = len(pivot_data)
+    pivot_data = pivot_data.tail(MAX_COUNTY_FUEL_COUNTIES)
+
+    return {
+        'report': 'county-fuel',
+        'kind': 'stacked-barh',
+        'title': f"{TITLE_PREFIX} - MW by County and Fuel Type",
+        'subtitle': f"Quarters: {', '.join(quarters)}" if quarters else None,
+        'x_label': 'Total Capacity (MW)',
+        'y_label': 'County',
+        'legend_title': 'Fuel Type',
+        'categories': [str(c) for c in pivot_data.index],
+        'series': [{'name': str(fuel), 'values': _mw(pivot_data[fuel].values),
+                    'color': FUEL_COLORS.get(fuel, DEFAULT_COLOR)} for fuel in pivot_data.columns],
+        'quarters': list(quarters or []),
+        'county_count': county_count,
+        'total_mw': round(float(pivot_data.values.sum()), MW_DECIMALS),
+    }
+
+
+def limit_categories(spec: ChartSpec, count: int) -> ChartSpec:
+    """
+    Keep only the largest `count` bars of a horizontal bar spec (e.g. for thumbnails).
+
+    Horizontal bar specs are ordered smallest first, so the last bars are kept; other
+    kinds are returned unchanged.
+    """
+    if spec['kind'] not in ('barh', 'stacked-barh') or len(spec['categories']) <= count:
+        return spec
+    return dict(spec,
+                categories=spec['categories'][-count:],
+                series=[dict(series, values=series['values'][-count:]) for series in spec['series']])
+
+
+# Report type -> spec builder (the same keys as reports.REPORT_RENDERERS)
+CHART_SPECS = {
+    'county': county_spec,
+    'cod': cod_spec,
+    'fuel': fuel_spec,
+    'technology': technology_spec,
+    'county-fuel': county_fuel_spec,
+}
+
+
+def build_chart_spec(report: str, df: pd.DataFrame, quarters: Optional[List[str]] = None,
+                     cod_index: CodIndex = None) -> ChartSpec:
+    """
+    Build the chart spec for one report type.
+
+    Args:
+        report: Report type (see CHART_SPECS)
+        df: DataFrame containing the Large Gen project details
+        quarters: Optional quarter filter (county-fuel only)
+        cod_index: Optional prebuilt COD index for df (cod only)
+
+    Raises:
+        ValueError: If the report type is unknown
+    """
+    if report not in CHART_SPECS:
+        raise ValueError(f"Unknown report '{report}'. Valid: {', '.join(CHART_SPECS)}")
+    if report == 'cod':
+        return cod_spec(df, cod_index=cod_index)
+    if report == 'county-fuel':
+        return county_fuel_spec(df, quarters=quarters)
+    return CHART_SPECS[report](df)
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Texas Grid Interconnect Reporter - COD Index
+Projects sorted by Projected COD with per-fuel prefix sums of MW and project counts,
+so totals for any date window are two binary searches and a subtraction.
+"""
+
+import argparse
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+
+DateLike = Union[str, pd.Timestamp, np.datetime64, None]
+
+# Bucket frequencies accepted by buckets() / cumulative_curve()
+FREQUENCIES = {'M': 'Monthly', 'Q': 'Quarterly', 'Y': 'Yearly'}
+
+
+class CodIndex:
+    """
+    Rows with a parseable COD in date order, plus cumulative MW and counts per fuel.
+
+    Prefix arrays have one more row than there are projects: row i holds the totals
+    of the first i projects in COD order, so a window [start, end) is
+    prefix[hi] - prefix[lo] with lo/hi from np.searchsorted.
+    """
+
+    def __init__(self, dates: np.ndarray, rows: np.ndarray, fuels: List[str],
+                 cum_mw: np.ndarray, cum_count: np.ndarray):
+        """
+        Args:
+            dates: Sorted datetime64[ns] CODs
+            rows: Row position in the source frame for each sorted COD
+            fuels: Fuel names, one per prefix-sum column
+            cum_mw: Cumulative MW, shape (len(dates) + 1, len(fuels))
+            cum_count: Cumulative project counts, same shape as cum_mw
+        """
+        self.dates = dates
+        self.rows = rows
+        self.fuels = fuels
+        self.cum_mw = cum_mw
+        self.cum_count = cum_count
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, date_column: str = 'COD Date',
+                   fuel_column: str = 'Fuel_Normalized', mw_column: str = 'Capacity (MW)') -> 'CodIndex':
+        """
+        Build the index from a normalized month DataFrame.
+
+        Args:
+            df: DataFrame with parsed COD dates, fuel names and MW (see dataset.normalize_month_frame)
+            date_column: Datetime column to sort on
+            fuel_column: Column the prefix sums are split by
+            mw_column: Capacity column
+
+        Returns:
+            CodIndex over df's row positions (rows without a COD are left out)
+        """
+        dates = pd.to_datetime(df[date_column]).to_numpy(dtype='datetime64[ns]')
+        positions = np.flatnonzero(~np.isnat(dates))
+        order = positions[np.argsort(dates[positions], kind='stable')]
+
+        codes, fuels = pd.factorize(df[fuel_column].to_numpy(dtype=object)[order])
+        codes = np.where(codes < 0, len(fuels), codes)
+        fuel_names = [str(f) for f in fuels] + (['Unknown'] if (codes == len(fuels)).any() else [])
+
+        # A single NaN would poison every later prefix sum
+        mw = np.nan_to_num(pd.to_numeric(df[mw_column], errors='coerce').to_numpy(dtype=float)[order])
+        one_hot = np.zeros((len(order), len(fuel_names)), dtype=float)
+        one_hot[np.arange(len(order)), codes] = 1.0
+
+        cum_mw = np.zeros((len(order) + 1, len(fuel_names)))
+        cum_count = np.zeros((len(order) + 1, len(fuel_names)), dtype=np.int64)
+        np.cumsum(one_hot * mw[:, None], axis=0, out=cum_mw[1:])
+        np.cumsum(one_hot.astype(np.int64), axis=0, out=cum_count[1:])
+
+        return cls(dates[order], order, fuel_names, cum_mw, cum_count)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @property
+    def first_date(self) -> Optional[pd.Timestamp]:
+        return pd.Timestamp(self.dates[0]) if len(self) else None
+
+    @property
+    def last_date(self) -> Optional[pd.Timestamp]:
+        return pd.Timestamp(self.dates[-1]) if len(self) else None
+
+    def position(self, date: DateLike, default: int = 0) -> int:
+        """
+        Number of projects with COD strictly before a date (binary search).
+
+        Args:
+            date: Date, or None for `default`
+            default: Value returned when date is None
+
+        Returns:
+            Index into the prefix arrays
+        """
+        if date is None:
+            return default
+        return int(np.searchsorted(self.dates, np.datetime64(pd.Timestamp(date), 'ns'), side='left'))
+
+    def _bounds(self, start: DateLike, end: DateLike) -> tuple:
+        lo = self.position(start, 0)
+        hi = max(lo, self.position(end, len(self)))
+        return lo, hi
+
+    def range_totals(self, start: DateLike = None, end: DateLike = None) -> Dict[str, Any]:
+        """
+        MW and project counts with COD in [start, end), in total and by fuel.
+
+        Args:
+            start: Inclusive start (None = earliest COD)
+            end: Exclusive end (None = after the latest COD)
+
+        Returns:
+            Dictionary with total_mw, project_count and by_fuel {fuel: {'mw', 'count'}}
+        """
+        lo, hi = self._bounds(start, end)
+        mw = self.cum_mw[hi] - self.cum_mw[lo]
+        count = self.cum_count[hi] - self.cum_count[lo]
+        return {
+            'total_mw': float(mw.sum()),
+            'project_count': int(count.sum()),
+            'by_fuel': {fuel: {'mw': float(mw[i]), 'count': int(count[i])}
+                        for i, fuel in enumerate(self.fuels) if count[i]},
+        }
+
+    def range_rows(self, start: DateLike = None, end: DateLike = None) -> np.ndarray:
+        """
+        Source row positions with COD in [start, end), in COD order.
+        """
+        lo, hi = self._bounds(start, end)
+        return self.rows[lo:hi]
+
+    def period_edges(self, freq: str = 'Q', start: DateLike = None, end: DateLike = None) -> pd.PeriodIndex:
+        """
+        Periods covering [start, end] (default: the earliest to the latest COD).
+
+        Args:
+            freq: 'M', 'Q' or 'Y'
+
+        Returns:
+            PeriodIndex of consecutive periods
+        """
+        if freq not in FREQUENCIES:
+            raise ValueError(f"Unknown frequency '{freq}'. Valid: {', '.join(FREQUENCIES)}")
+        first = pd.Timestamp(start) if start is not None else self.first_date
+        last = pd.Timestamp(end) if end is not None else self.last_date
+        if first is None or last is None or last < first:
+            return pd.PeriodIndex([], freq=freq)
+        return pd.period_range(first.to_period(freq), last.to_period(freq), freq=freq)
+
+    def _edge_positions(self, periods: pd.PeriodIndex, start: DateLike = None, end: DateLike = None) -> np.ndarray:
+        # len(periods) + 1 boundaries: each period's start, then the last period's end
+        if len(periods) == 0:
+            return np.zeros(0, dtype=np.int64)
+        boundaries = np.append(periods.start_time.to_numpy(dtype='datetime64[ns]'),
+                               (periods[-1] + 1).start_time.to_datetime64().astype('datetime64[ns]'))
+        edges = np.searchsorted(self.dates, boundaries, side='left')
+        # Partial first and last periods keep only CODs from start through end
+        if start is not None:
+            edges[0] = max(edges[0], self.position(start))
+        if end is not None:
+            edges[-1] = min(edges[-1], np.searchsorted(self.dates, np.datetime64(pd.Timestamp(end), 'ns'),
+                                                       side='right'))
+        return edges
+
+    def buckets(self, freq: str = 'Q', start: DateLike = None, end: DateLike = None) -> Dict[str, pd.DataFrame]:
+        """
+        MW and project counts per period and fuel.
+
+        The first and last periods only count CODs from start through end, so the
+        buckets add up to the window's range_totals.
+
+        Args:
+            freq: 'M', 'Q' or 'Y'
+            start: Window start, inclusive (default: earliest COD)
+            end: Window's last date, inclusive (default: latest COD)
+
+        Returns:
+            {'mw': DataFrame, 'count': DataFrame}, indexed by Period with one column per fuel
+        """
+        periods = self.period_edges(freq, start, end)
+        edges = self._edge_positions(periods, start, end)
+        mw = np.diff(self.cum_mw[edges], axis=0) if len(edges) else np.zeros((0, len(self.fuels)))
+        count = np.diff(self.cum_count[edges], axis=0) if len(edges) else np.zeros((0, len(self.fuels)), np.int64)
+        return {
+            'mw': pd.DataFrame(mw, index=periods, columns=self.fuels),
+            'count': pd.DataFrame(count, index=periods, columns=self.fuels),
+        }
+
+    def cumulative_curve(self, freq: str = 'Q', start: DateLike = None, end: DateLike = None,
+                         include_before_start: bool = False) -> pd.DataFrame:
+        """
+        Cumulative MW reaching COD by the end of each period, per fuel.
+
+        Args:
+            freq: 'M', 'Q' or 'Y'
+            start: First period's date (default: earliest COD)
+            end: Last period's date (default: latest COD)
+            include_before_start: Also count projects with COD before the first period
+
+        Returns:
+            DataFrame indexed by Period with one column per fuel
+        """
+        periods = self.period_edges(freq, start, end)
+        edges = self._edge_positions(periods)
+        if not len(edges):
+            return pd.DataFrame(np.zeros((0, len(self.fuels))), index=periods, columns=self.fuels)
+        base = 0 if include_before_start else edges[0]
+        curve = self.cum_mw[edges[1:]] - self.cum_mw[base]
+        return pd.DataFrame(curve, index=periods, columns=self.fuels)
+
+
+def main():
+    """
+    Print MW and project totals for a COD window, optionally bucketed.
+    """
+    from dataset import load_month_dataset
+
+    parser = argparse.ArgumentParser(
+        description='Query projected COD windows in an ERCOT Large Gen report',
+        epilog='Example: python src/cod_index.py inputs/2026/01/file.xlsx --start 2026-01-01 --months 18 --freq Q'
+    )
+    parser.add_argument('input_file', help='Path to the Excel file')
+    parser.add_argument('--start', default=None, help='Window start, inclusive (default: earliest COD)')
+    parser.add_argument('--end', default=None, help='Window end, exclusive (default: after the latest COD)')
+    parser.add_argument('--months', type=int, default=None, help='Window length in months (instead of --end)')
+    parser.add_argument('--freq', choices=list(FREQUENCIES), default=None, help='Also print per-period buckets')
+    args = parser.parse_args()
+
+    index = load_month_dataset(Path(args.input_file)).cod
+    start = pd.Timestamp(args.start) if args.start else None
+    end = pd.Timestamp(args.end) if args.end else None
+    if args.months is not None:
+        end = (start or index.first_date) + pd.DateOffset(months=args.months)
+
+    totals = index.range_totals(start, end)
+    print("=" * 80)
+    print(f"COD WINDOW: {start.date() if start is not None else 'earliest'} to "
+          f"{end.date() if end is not None else 'latest'}  "
+          f"({totals['project_count']} projects, {totals['total_mw']:,.1f} MW)")
+    print("=" * 80)
+    for fuel, values in sorted(totals['by_fuel'].items(), key=lambda item: -item[1]['mw']):
+        print(f"  {fuel:<35} {values['count']:>5} projects  {values['mw']:>12,.1f} MW")
+
+    if args.freq:
+        last = end - pd.Timedelta(days=1) if end is not None else None
+        buckets = index.buckets(args.freq, start, last)
+        print("\n" + "-" * 80)
+        for period, mw in buckets['mw'].sum(axis=1).items():
+            print(f"  {str(period):<10} {int(buckets['count'].loc[period].sum()):>5} projects  {mw:>12,.1f} MW")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Texas Grid Interconnect Reporter - County Geometry
+Texas-only, simplified county TopoJSON cut once from the US counties file, plus the
+ERCOT county name -> FIPS mapping and the binned per-county payload the map draws,
+so the browser neither downloads every US county nor joins and scales data itself.
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+# US counties TopoJSON (us-atlas counties-10m); only the Texas counties are served
+SOURCE_TOPOLOGY = Path(__file__).parent.parent / "web" / "backend" / "data" / "counties-10m.json"
+
+TEXAS_FIPS_PREFIX = '48'
+
+# Douglas-Peucker tolerance in degrees (about 1 km; under a pixel at the dashboard's zoom)
+SIMPLIFY_TOLERANCE = 0.01
+# Grid the simplified coordinates are quantized to (TopoJSON transform)
+QUANTIZATION = 10000
+
+# Map color classes: equal-width MW bins from 0 to the largest county, colored along
+# the dashboard's green -> yellow -> red scale
+MAP_BINS = 7
+MAP_COLOR_STOPS = ['#10b981', '#fbbf24', '#ef4444']
+
+
+def county_key(name: Any) -> str:
+    """Join key for county names ('De Witt County' and 'DeWitt' -> 'DEWITT')."""
+    return re.sub(r'[^A-Z]', '', str(name).upper().replace(' COUNTY', ''))
+
+
+def _decode_arc(arc: List[List[int]]) -> np.ndarray:
+    """Absolute quantized coordinates of a delta-encoded TopoJSON arc."""
+    return np.cumsum(np.asarray(arc, dtype=np.int64), axis=0)
+
+
+def _arc_ids(arcs: List[Any]) -> List[int]:
+    """Arc indexes of a Polygon/MultiPolygon 'arcs' member (negative: reversed)."""
+    if arcs and isinstance(arcs[0], int):
+        return list(arcs)
+    return [a for part in arcs for a in _arc_ids(part)]
+
+
+def simplify_line(points: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Douglas-Peucker simplification keeping both end points.
+
+    A closed line (first point == last) is split at its farthest point from the start
+    so it cannot collapse.
+
+    Args:
+        points: (n, 2) coordinates
+        tolerance: Maximum distance of a dropped point from the simplified line
+
+    Returns:
+        The kept points, in order
+    """
+    if len(points) <= 2:
+        return points
+    if np.array_equal(points[0], points[-1]):
+        split = int(np.argmax(np.hypot(*(points - points[0]).T)))
+        if split == 0:
+            return points[[0, -1]]
+        first = simplify_line(points[:split + 1], tolerance)
+        return np.vstack([first, simplify_line(points[split:], tolerance)[1:]])
+
+    keep = np.zeros(len(points), dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        segment = points[end] - points[start]
+        offsets = points[start + 1:end] - points[start]
+        length = np.hypot(*segment)
+        if length == 0:
+            distances = np.hypot(*offsets.T)
+        else:
+            distances = np.abs(segment[0] * offsets[:, 1] - segment[1] * offsets[:, 0]) / length
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            middle = start + 1 + farthest
+            keep[middle] = True
+            stack += [(start, middle), (middle, end)]
+    return points[keep]
+
+
+def texas_topology(source: Dict[str, Any], tolerance: float = SIMPLIFY_TOLERANCE,
+                   quantization: int = QUANTIZATION) -> Dict[str, Any]:
+    """
+    Cut the Texas counties out of a US counties topology and simplify them.
+
+    Arcs are simplified one by one with their end points kept, so borders shared by
+    two counties stay shared and no gaps open between them.
+
+    Args:
+        source: US counties TopoJSON (quantized, objects.counties with FIPS ids)
+        tolerance: Simplification tolerance in degrees
+        quantization: Grid size of the output coordinates
+
+    Returns:
+        TopoJSON with one object, 'counties' (id = FIPS, properties.name)
+    """
+    scale = np.asarray(source['transform']['scale'])
+    translate = np.asarray(source['transform']['translate'])
+    geometries = [g for g in source['objects']['counties']['geometries']
+                  if str(g.get('id', '')).startswith(TEXAS_FIPS_PREFIX)]
+
+    used = sorted({a if a >= 0 else ~a for g in geometries for a in _arc_ids(g['arcs'])})
+    lines = [simplify_line(_decode_arc(source['arcs'][a]) * scale + translate, tolerance) for a in used]
+
+    stacked = np.vstack(lines)
+    low, high = stacked.min(axis=0), stacked.max(axis=0)
+    out_scale = (high - low) / (quantization - 1)
+    arcs = []
+    for line in lines:
+        grid = np.round((line - low) / out_scale).astype(np.int64)
+        # Drop points that landed on the same grid cell as the previous one
+        grid = grid[np.concatenate([[True], np.any(np.diff(grid, axis=0) != 0, axis=1)])]
+        if len(grid) == 1:
+            grid = np.vstack([grid, grid])
+        arcs.append(np.vstack([grid[:1], np.diff(grid, axis=0)]).tolist())
+
+    renumber = {old: new for new, old in enumerate(used)}
+
+    def remap(arcs_):
+        if arcs_ and isinstance(arcs_[0], int):
+            return [renumber[a] if a >= 0 else ~renumber[~a] for a in arcs_]
+        return [remap(part) for part in arcs_]
+
+    return {
+        'type': 'Topology',
+        'bbox': [round(float(v), 6) for v in (*low, *high)],
+        'transform': {'scale': [float(v) for v in out_scale], 'translate': [float(v) for v in low]},
+        'objects': {'counties': {'type': 'GeometryCollection', 'geometries': [
+            {'type': g['type'], 'arcs': remap(g['arcs']), 'id': str(g['id']), 'properties': {'name': g['properties']['name']}}
+            for g in sorted(geometries, key=lambda g: str(g['id']))
+        ]}},
+        'arcs': arcs,
+    }
+
+
+class CountyGeometry:
+    """
+    Serialized Texas county topology and the county name -> FIPS lookup.
+
+    Attributes:
+        topology: TopoJSON dict (see texas_topology)
+        body: Compact JSON bytes of the topology
+        gzipped: body, gzip-compressed once
+        version: Content hash of body (16 hex characters), for cache-busting URLs and ETags
+        fips: county_key(name) -> FIPS id
+    """
+
+    def __init__(self, topology: Dict[str, Any]):
+        self.topology = topology
+        self.body = json.dumps(topology, separators=(',', ':')).encode()
+        self.gzipped = gzip.compress(self.body, mtime=0)
+        self.version = hashlib.sha256(self.body).hexdigest()[:16]
+        self.fips = {county_key(g['properties']['name']): g['id']
+                     for g in topology['objects']['counties']['geometries']}
+
+    @classmethod
+    def from_file(cls, path: Path = SOURCE_TOPOLOGY, tolerance: float = SIMPLIFY_TOLERANCE) -> 'CountyGeometry':
+        """Build from a US counties TopoJSON file."""
+        return cls(texas_topology(json.loads(Path(path).read_text()), tolerance=tolerance))
+
+    def fips_for(self, county: Any) -> Optional[str]:
+        """FIPS id of an ERCOT county name, or None when it is not a Texas county."""
+        return self.fips.get(county_key(county))
+
+
+def _hex_to_rgb(color: str) -> np.ndarray:
+    return np.array([int(color[i:i + 2], 16) for i in (1, 3, 5)], dtype=float)
+
+
+def bin_colors(bins: int = MAP_BINS, stops: Sequence[str] = MAP_COLOR_STOPS) -> List[str]:
+    """Colors at the middle of each bin, interpolated in RGB between evenly spaced stops."""
+    rgb = np.array([_hex_to_rgb(stop) for stop in stops])
+    positions = (np.arange(bins) + 0.5) / bins * (len(stops) - 1)
+    lower = np.minimum(positions.astype(int), len(stops) - 2)
+    mixed = rgb[lower] + (rgb[lower + 1] - rgb[lower]) * (positions - lower)[:, None]
+    return ['#%02x%02x%02x' % tuple(int(round(c)) for c in color) for color in mixed]
+
+
+def county_map_payload(geometry: CountyGeometry, county_mw: pd.Series, county_counts: pd.Series,
+                       fuel_summary: Dict[str, str], bins: int = MAP_BINS) -> Dict[str, Any]:
+    """
+    Per-county values joined to FIPS ids and assigned to color bins.
+
+    Values are columnar (one list per field, aligned) and MW is rounded to whole
+    megawatts, which is all the map and its tooltip show. Bin edges keep one decimal,
+    so small totals still get distinct edges; with no MW at all there is nothing to
+    scale and the legend is None.
+
+    Args:
+        geometry: County geometry (FIPS lookup and version)
+        county_mw: Total MW per county name
+        county_counts: Project count per county name
+        fuel_summary: County name -> tooltip fuel summary
+        bins: Number of color bins
+
+    Returns:
+        {'geometry_version', 'legend': {'edges', 'colors'} or None, 'counties': {...}, 'unmatched'}
+    """
+    county_mw = county_mw[county_mw.index.notna()].sort_index()
+    top = float(county_mw.max()) if len(county_mw) else 0.0
+    edges = np.linspace(0, top if top > 0 else 1.0, bins + 1)
+    mw = county_mw.to_numpy(dtype=float)
+    classes = np.clip(np.searchsorted(edges, mw, side='right') - 1, 0, bins - 1)
+
+    counties: Dict[str, List[Any]] = {'fips': [], 'name': [], 'bin': [], 'mw': [], 'projects': [], 'fuels': []}
+    unmatched = []
+    for (name, value), cls in zip(county_mw.items(), classes):
+        fips = geometry.fips_for(name)
+        if fips is None:
+            unmatched.append(str(name))
+            continue
+        counties['fips'].append(fips)
+        counties['name'].append(str(name))
+        counties['bin'].append(int(cls))
+        counties['mw'].append(int(round(value)))
+        counties['projects'].append(int(county_counts.get(name, 0)))
+        counties['fuels'].append(fuel_summary.get(name, ''))
+
+    return {
+        'geometry_version': geometry.version,
+        'legend': {'edges': [round(float(e), 1) for e in edges], 'colors': bin_colors(bins)} if top > 0 else None,
+        'counties': counties,
+        'unmatched': unmatched,
+    }
+
+
+def main():
+    """
+    Write the simplified Texas county TopoJSON and report its size.
+    """
+    parser = argparse.ArgumentParser(
+        description='Cut and simplify the Texas counties from the US counties TopoJSON',
+        epilog='Example: python src/county_geo.py --out /tmp/texas-counties.json --tolerance 0.005'
+    )
+    parser.add_argument('--source', default=str(SOURCE_TOPOLOGY), help='US counties TopoJSON')
+    parser.add_argument('--out', default=None, help='Write the Texas topology here')
+    parser.add_argument('--tolerance', type=float, default=SIMPLIFY_TOLERANCE,
+                        help=f'Simplification tolerance in degrees (default: {SIMPLIFY_TOLERANCE})')
+    args = parser.parse_args()
+
+    source = Path(args.source)
+    geometry = CountyGeometry.from_file(source, tolerance=args.tolerance)
+    points = sum(len(arc) for arc in geometry.topology['arcs'])
+    print("=" * 80)
+    print(f"TEXAS COUNTIES: {len(geometry.fips)} counties, {len(geometry.topology['arcs'])} arcs, {points} points")
+    print("=" * 80)
+    print(f"  Source:      {source.stat().st_size / 1024:>8.1f} KiB")
+    print(f"  Texas:       {len(geometry.body) / 1024:>8.1f} KiB  ({len(geometry.gzipped) / 1024:.1f} KiB gzipped)")
+    print(f"  Version:     {geometry.version}")
+    if args.out:
+        Path(args.out).write_bytes(geometry.body)
+        print(f"\n✓ Topology saved to: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
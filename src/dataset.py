@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Texas Grid Interconnect Reporter - Month Dataset Cache
+Parses each monthly workbook once, adds the normalized columns the API and reports
+share, and keeps the result (plus lazily built indexes) in a small in-process LRU cache.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from constants import normalize_fuel_type, normalize_technology_type
+from cod_index import CodIndex
+from extract_large_gen import extract_large_gen_data
+from facet_index import FacetIndex
+from row_hashes import RowHashes
+from search_index import SearchIndex
+from shared_store import SharedMonthStore
+
+if TYPE_CHECKING:  # history_store imports this module
+    from history_store import HistoryStore
+
+
+# Columns added by normalize_month_frame (not part of the ERCOT sheet)
+DERIVED_COLUMNS = ['COD Date', 'Quarter', 'Fuel_Normalized', 'Technology_Normalized']
+
+DEFAULT_CACHE_ENTRIES = int(os.environ.get('TGIR_MONTH_CACHE_SIZE', '8'))
+
+
+def refine_fuel(fuel: Any, technology: Any) -> str:
+    """
+    Normalized fuel type, falling back to the technology when the fuel is 'Other' or 'Unknown'.
+
+    Args:
+        fuel: Raw fuel code (e.g. 'SOL')
+        technology: Raw technology code (e.g. 'PV')
+
+    Returns:
+        Display name used for fuel charts and breakdowns
+    """
+    fuel_name = normalize_fuel_type(fuel)
+    if fuel_name in ['Other', 'Unknown']:
+        tech_name = normalize_technology_type(technology)
+        if tech_name != 'Unknown':
+            return tech_name
+    return fuel_name
+
+
+def refine_fuel_column(df: pd.DataFrame) -> pd.Series:
+    """
+    Vectorized refine_fuel over a DataFrame's Fuel and Technology columns.
+
+    The rule is evaluated once per distinct (Fuel, Technology) pair instead of once per row.
+
+    Args:
+        df: DataFrame with 'Fuel' and 'Technology' columns
+
+    Returns:
+        Series of refined fuel names aligned with df
+    """
+    codes, pairs = pd.factorize(pd.MultiIndex.from_arrays([df['Fuel'], df['Technology']]))
+    refined = np.array([refine_fuel(fuel, tech) for fuel, tech in pairs], dtype=object)
+    return pd.Series(refined[codes], index=df.index, dtype=object)
+
+
+def normalize_month_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add DERIVED_COLUMNS to a freshly extracted month (in place).
+
+    'Projected COD' keeps its raw values; 'COD Date' holds the parsed datetime.
+
+    Args:
+        df: DataFrame returned by extract_large_gen_data
+
+    Returns:
+        The same DataFrame
+    """
+    cod = pd.to_datetime(df['Projected COD'], errors='coerce')
+    df['COD Date'] = cod
+    df['Quarter'] = cod.dt.to_period('Q').astype(str).where(cod.notna(), None)
+    df['Fuel_Normalized'] = refine_fuel_column(df)
+    df['Technology_Normalized'] = df['Technology'].map(normalize_technology_type)
+    return df
+
+
+def file_fingerprint(file_path: Path) -> str:
+    """
+    Content hash of a workbook, stable across machines and deploys.
+
+    Args:
+        file_path: Path to the Excel file
+
+    Returns:
+        First 16 hex characters of the file's SHA-256
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+def input_files(inputs_dir: Path) -> List[Tuple[str, Path]]:
+    """
+    Every workbook laid out as inputs/<year>/<month>/file.xlsx.
+
+    Args:
+        inputs_dir: The inputs directory
+
+    Returns:
+        ('YYYY/MM', path) pairs, oldest month first
+    """
+    files = []
+    for path in sorted(Path(inputs_dir).glob('*/*/file.xlsx')):
+        if path.parent.name.isdigit() and path.parent.parent.name.isdigit():
+            files.append((f"{path.parent.parent.name}/{path.parent.name}", path))
+    return files
+
+
+def input_fingerprints(inputs_dir: Path) -> Dict[str, str]:
+    """Content hash (file_fingerprint) of every workbook under inputs_dir, keyed 'YYYY/MM'."""
+    return {period: file_fingerprint(path) for period, path in input_files(inputs_dir)}
+
+
+class MonthDataset:
+    """
+    One parsed and normalized report month.
+
+    The frame is shared between requests: treat it as read-only and copy before
+    adding or changing columns.
+    """
+
+    def __init__(self, source: Path, frame: pd.DataFrame, fingerprint: str):
+        self.source = source
+        self.frame = frame
+        self.fingerprint = fingerprint
+        self.raw_columns = [c for c in frame.columns if c not in DERIVED_COLUMNS]
+        self._facets: Optional[FacetIndex] = None
+        self._cod: Optional[CodIndex] = None
+        self._row_hashes: Optional[RowHashes] = None
+        self._search: Optional[SearchIndex] = None
+        self._lock = threading.Lock()
+
+    @property
+    def period(self) -> str:
+        """Report period as 'YYYY/MM' for inputs/<year>/<month>/file.xlsx."""
+        return f"{self.source.parent.parent.name}/{self.source.parent.name}"
+
+    @property
+    def facets(self) -> FacetIndex:
+        """Facet index over the frame's rows, built on first use."""
+        if self._facets is None:
+            with self._lock:
+                if self._facets is None:
+                    self._facets = FacetIndex.from_frame(self.frame)
+        return self._facets
+
+    @property
+    def cod(self) -> CodIndex:
+        """COD-sorted prefix-sum index over the frame's rows, built on first use."""
+        if self._cod is None:
+            with self._lock:
+                if self._cod is None:
+                    self._cod = CodIndex.from_frame(self.frame)
+        return self._cod
+
+    @property
+    def row_hashes(self) -> RowHashes:
+        """Per-project hashes of the published columns (see row_hashes), built on first use."""
+        if self._row_hashes is None:
+            with self._lock:
+                if self._row_hashes is None:
+                    self._row_hashes = RowHashes(self.frame[self.raw_columns])
+        return self._row_hashes
+
+    @property
+    def search(self) -> SearchIndex:
+        """Word and trigram index over project names, INRs and counties, built on first use."""
+        if self._search is None:
+            with self._lock:
+                if self._search is None:
+                    self._search = SearchIndex.from_frame(self.frame)
+        return self._search
+
+    @property
+    def report_date(self) -> pd.Timestamp:
+        """First day of the report month."""
+        return pd.Timestamp(year=int(self.source.parent.parent.name), month=int(self.source.parent.name), day=1)
+
+    def take(self, rows: np.ndarray) -> pd.DataFrame:
+        """
+        Copy of the given row positions, safe to modify.
+
+        Args:
+            rows: Row positions (e.g. from FacetIndex.rows)
+
+        Returns:
+            DataFrame copy
+        """
+        return self.frame.iloc[rows].copy()
+
+
+class MonthDatasetCache:
+    """
+    LRU cache of MonthDataset keyed on the workbook path.
+
+    An entry is reused while the file's size and modification time are unchanged.
+    On a miss the month is memory-mapped from the build-time snapshots when they hold
+    the workbook's hash; otherwise, with a shared store, it maps the month another
+    worker already published instead of parsing the workbook again. A month that has
+    to be built is rebuilt from the delta history when that holds the workbook's hash,
+    and only parsed from Excel when neither store has it.
+    """
+
+    def __init__(self, loader: Callable[[Path], pd.DataFrame] = extract_large_gen_data,
+                 max_entries: int = DEFAULT_CACHE_ENTRIES, shared: Optional[SharedMonthStore] = None,
+                 snapshots: Optional[SharedMonthStore] = None, history: Optional['HistoryStore'] = None):
+        """
+        Args:
+            loader: Function parsing a workbook into a DataFrame
+            max_entries: Number of months kept in memory
+            shared: Optional cross-process store of normalized months (see shared_store)
+            snapshots: Optional read-only months written at build time (see ingest)
+            history: Optional delta history written at build time (see history_store)
+        """
+        self.loader = loader
+        self.max_entries = max_entries
+        self.shared = shared
+        self.snapshots = snapshots
+        self.history = history
+        self._entries: 'OrderedDict[Path, Tuple[Tuple[int, int], MonthDataset]]' = OrderedDict()
+        # Guards the entries and counters; held only for dictionary work, never for a load
+        self._lock = threading.Lock()
+        # One lock per workbook being loaded (with its number of holders and waiters), so
+        # concurrent requests for a month share one load while hits and loads of other
+        # months go ahead; dropped when the last of them is done
+        self._path_locks: Dict[Path, List[Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.snapshot_loads = 0
+        self.history_loads = 0
+
+    def _cached(self, path: Path, version: Tuple[int, int]) -> Optional[MonthDataset]:
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry[0] != version:
+                return None
+            self._entries.move_to_end(path)
+            self.hits += 1
+            return entry[1]
+
+    @contextmanager
+    def _loading(self, path: Path) -> Iterator[None]:
+        with self._lock:
+            entry = self._path_locks.setdefault(path, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._path_locks[path]
+
+    def get(self, file_path: Path) -> Tuple[MonthDataset, bool]:
+        """
+        Return the dataset for a workbook, parsing it on a miss.
+
+        Args:
+            file_path: Path to the Excel file
+
+        Returns:
+            (dataset, hit) where hit is True when served from the cache
+        """
+        path = Path(file_path).resolve()
+        stat = path.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+
+        dataset = self._cached(path, version)
+        if dataset is not None:
+            return dataset, True
+
+        with self._loading(path):
+            # Another request may have loaded the month while this one waited
+            dataset = self._cached(path, version)
+            if dataset is not None:
+                return dataset, True
+
+            fingerprint = file_fingerprint(path)
+            frame = self.snapshots.load(fingerprint) if self.snapshots is not None else None
+            from_snapshot = frame is not None
+            from_history = False
+
+            def build() -> pd.DataFrame:
+                nonlocal from_history
+                rows = self.history.load_fingerprint(fingerprint) if self.history is not None else None
+                from_history = rows is not None
+                return normalize_month_frame(rows if from_history else self.loader(path))
+
+            if not from_snapshot and self.shared is not None:
+                frame, _ = self.shared.get_or_build(fingerprint, build, path)
+            elif not from_snapshot:
+                frame = build()
+            dataset = MonthDataset(path, frame, fingerprint)
+
+            with self._lock:
+                self.misses += 1
+                self.snapshot_loads += from_snapshot
+                self.history_loads += from_history
+                self._entries[path] = (version, dataset)
+                self._entries.move_to_end(path)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            return dataset, False
+
+    def clear(self) -> None:
+        """Drop every cached month."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, hit/miss counters and approximate memory use."""
+        with self._lock:
+            datasets = [dataset for _, dataset in self._entries.values()]
+        return {
+            'entries': len(datasets),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'snapshot_loads': self.snapshot_loads,
+            'history_loads': self.history_loads,
+            'frame_bytes': int(sum(d.frame.memory_usage(deep=True).sum() for d in datasets)),
+            'months': [d.period for d in datasets],
+        }
+
+
+_default_cache = MonthDatasetCache()
+
+
+def load_month_dataset(file_path: Path) -> MonthDataset:
+    """
+    Load a month through the process-wide cache.
+
+    Args:
+        file_path: Path to the Excel file
+
+    Returns:
+        Cached MonthDataset
+    """
+    return _default_cache.get(file_path)[0]
@@ -8,17 +8,20 @@ import pandas as pd
 import sys
 from pathlib import Path
 
+from validation import validate_large_gen_data
+from change_flags import add_change_flags
 
-def extract_large_gen_data(file_path: Path) -> pd.DataFrame:
+
+def read_large_gen_sheet(file_path: Path) -> pd.DataFrame:
     """
-    Extract the 'Project Details - Large Gen' sheet from an Excel file.
-    
+    Read the 'Project Details - Large Gen' sheet with its column names, values as published.
+
     Args:
         file_path: Path to the Excel file
-        
+
     Returns:
-        DataFrame containing the Large Gen project details
-        
+        DataFrame of the sheet's project rows (no cleaning applied)
+
     Raises:
         FileNotFoundError: If the file doesn't exist
         ValueError: If the sheet is not found in the workbook
@@ -37,67 +40,110 @@ def extract_large_gen_data(file_path: Path) -> pd.DataFrame:
         
         # Read starting from UI row 31 (skiprows=30)
         df = pd.read_excel(file_path, sheet_name=sheet_name, engine='openpyxl', skiprows=30, header=None)
+    except ValueError as e:
+        raise ValueError(f"Sheet '{sheet_name}' not found in {file_path}. Error: {e}")
         
-        # Extract the header rows
-        main_header = df.iloc[0]  # Row 32: INR, Project Name, GIM Study Phase, etc.
-        multi_header_1 = df.iloc[1]  # Row 33
-        multi_header_2 = df.iloc[2]  # Row 34
-        multi_header_3 = df.iloc[3]  # Row 35
-        multi_header_4 = df.iloc[4]  # Row 36
+    # Extract the header rows
+    main_header = df.iloc[0]  # Row 32: INR, Project Name, GIM Study Phase, etc.
+    multi_header_1 = df.iloc[1]  # Row 33
+    multi_header_2 = df.iloc[2]  # Row 34
+    multi_header_3 = df.iloc[3]  # Row 35
+    multi_header_4 = df.iloc[4]  # Row 36
+    
+    # Build column names
+    column_names = []
+    for col_idx in range(len(df.columns)):
+        # For columns 0-10, use the main header from row 32
+        main_val = main_header.iloc[col_idx] if col_idx < len(main_header) else None
         
-        # Build column names
-        column_names = []
-        for col_idx in range(len(df.columns)):
-            # For columns 0-10, use the main header from row 32
-            main_val = main_header.iloc[col_idx] if col_idx < len(main_header) else None
+        if pd.notna(main_val) and str(main_val).strip():
+            column_names.append(str(main_val).strip())
+        else:
+            # For columns 11+, combine the multi-row headers
+            parts = []
+            for header_row in [multi_header_1, multi_header_2, multi_header_3, multi_header_4]:
+                val = header_row.iloc[col_idx] if col_idx < len(header_row) else None
+                if pd.notna(val) and str(val).strip():
+                    parts.append(str(val).strip())
             
-            if pd.notna(main_val) and str(main_val).strip():
-                column_names.append(str(main_val).strip())
+            if parts:
+                column_names.append(' '.join(parts))
             else:
-                # For columns 11+, combine the multi-row headers
-                parts = []
-                for header_row in [multi_header_1, multi_header_2, multi_header_3, multi_header_4]:
-                    val = header_row.iloc[col_idx] if col_idx < len(header_row) else None
-                    if pd.notna(val) and str(val).strip():
-                        parts.append(str(val).strip())
-                
-                if parts:
-                    column_names.append(' '.join(parts))
-                else:
-                    column_names.append(f'Column_{col_idx}')
-        
-        # Set column names and drop the header rows (rows 0-5)
-        df.columns = column_names
-        df = df.iloc[5:].reset_index(drop=True)
+                column_names.append(f'Column_{col_idx}')
+    
+    # Set column names and drop the header rows (rows 0-5)
+    df.columns = column_names
+    return df.iloc[5:].reset_index(drop=True)
+
+
+def clean_large_gen_data(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Coerce Capacity (MW) to non-negative numbers and parse the change indicators (in place).
+
+    Args:
+        df: DataFrame returned by read_large_gen_sheet
+
+    Returns:
+        The same DataFrame
+    """
+    # Clean Capacity (MW) column
+    if 'Capacity (MW)' in df.columns:
+        # Convert to numeric, coercing errors to NaN
+        df['Capacity (MW)'] = pd.to_numeric(df['Capacity (MW)'], errors='coerce')
+        # Fill NaNs with 0
+        df['Capacity (MW)'] = df['Capacity (MW)'].fillna(0)
+        # Ensure all values are positive (handle negative values like -100 or (100))
+        df['Capacity (MW)'] = df['Capacity (MW)'].abs()
+    
+    # Parse the change-indicator text once into a queryable bitmask
+    add_change_flags(df)
+    return df
+
+
+def extract_large_gen_data(file_path: Path, validate: bool = True) -> pd.DataFrame:
+    """
+    Extract the 'Project Details - Large Gen' sheet from an Excel file.
+    
+    Args:
+        file_path: Path to the Excel file
+        validate: Run the data-quality checks on the raw values before cleaning.
+            The result is attached as df.attrs['quality_report'].
         
-        # Clean Capacity (MW) column
-        if 'Capacity (MW)' in df.columns:
-            # Convert to numeric, coercing errors to NaN
-            df['Capacity (MW)'] = pd.to_numeric(df['Capacity (MW)'], errors='coerce')
-            # Fill NaNs with 0
-            df['Capacity (MW)'] = df['Capacity (MW)'].fillna(0)
-            # Ensure all values are positive (handle negative values like -100 or (100))
-            df['Capacity (MW)'] = df['Capacity (MW)'].abs()
+    Returns:
+        DataFrame containing the Large Gen project details
         
-        return df
-    except ValueError as e:
-        raise ValueError(f"Sheet '{sheet_name}' not found in {file_path}. Error: {e}")
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        ValueError: If the sheet is not found in the workbook
+    """
+    df = read_large_gen_sheet(file_path)
+    
+    # Validate before cleaning so coerced/abs'd values are still visible
+    quality_report = validate_large_gen_data(df) if validate else None
+    
+    clean_large_gen_data(df)
+    
+    if quality_report is not None:
+        df.attrs['quality_report'] = quality_report
+    
+    return df
 
 
 def main():
     """
     Main function to process the Excel file and display results.
     """
-    # Default file path pattern: inputs/MM/file.xlsx
-    # For now, we'll look for inputs/10/file.xlsx
-    # Script is in src/, so we need to go up one level
-    default_path = Path("../inputs/10/file.xlsx")
+    from dataset import input_files
     
-    # Allow command line argument to override default path
+    # Allow command line argument to override the default: the latest inputs/<year>/<month>/file.xlsx
     if len(sys.argv) > 1:
         file_path = Path(sys.argv[1])
     else:
-        file_path = default_path
+        files = input_files(Path(__file__).parent.parent / "inputs")
+        if not files:
+            print("ERROR: No inputs/<year>/<month>/file.xlsx found; pass a path", file=sys.stderr)
+            sys.exit(1)
+        file_path = files[-1][1]
     
     print(f"Reading file: {file_path}")
     print("=" * 80)
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Texas Grid Interconnect Reporter - Facet Index
+Per-month inverted index mapping each facet value (county, phase, fuel, ...) to a
+packed bitmap of row positions, so any AND/OR combination of facet filters is a
+handful of bitwise operations and facet counts are popcounts.
+"""
+
+import argparse
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+from change_flags import CHANGE_FLAGS_COLUMN, CHANGE_TYPES
+
+
+# Facet name -> DataFrame column (single-valued facets)
+FACET_COLUMNS = {
+    'county': 'County',
+    'zone': 'CDR Reporting Zone',
+    'phase': 'GIM Study Phase',
+    'fuel': 'Fuel_Normalized',
+    'technology': 'Technology_Normalized',
+    'quarter': 'Quarter',
+}
+
+# Multi-valued facet built from the change-flag bitmask (a row can carry several change types)
+CHANGE_FACET = 'change'
+
+FACETS = list(FACET_COLUMNS) + [CHANGE_FACET]
+
+# Set bits per byte value, for counting rows in a packed bitmap
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint16)
+
+
+class FacetIndex:
+    """
+    Packed bitmaps (np.packbits layout, one bit per row) for every value of every facet.
+
+    Filters are given as {facet: [values]}: values within a facet are OR'ed, facets
+    are AND'ed, and a missing or empty value list leaves that facet unconstrained.
+    """
+
+    def __init__(self, n_rows: int, values: Dict[str, List[str]], bitmaps: Dict[str, np.ndarray]):
+        """
+        Args:
+            n_rows: Number of rows indexed
+            values: Facet -> ordered list of values
+            bitmaps: Facet -> uint8 array of shape (len(values), ceil(n_rows / 8))
+        """
+        self.n_rows = n_rows
+        self.values = values
+        self.bitmaps = bitmaps
+        self._positions = {facet: {v: i for i, v in enumerate(vals)} for facet, vals in values.items()}
+        self._all = np.packbits(np.ones(n_rows, dtype=bool))
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, facet_columns: Mapping[str, str] = FACET_COLUMNS) -> 'FacetIndex':
+        """
+        Build the index from a normalized month DataFrame.
+
+        Args:
+            df: DataFrame with the facet columns (see dataset.normalize_month_frame)
+            facet_columns: Facet name -> column; missing columns are skipped
+
+        Returns:
+            FacetIndex over df's row positions
+        """
+        n_rows = len(df)
+        n_bytes = (n_rows + 7) // 8
+        positions = np.arange(n_rows)
+        byte_index = positions >> 3
+        bit_value = (0x80 >> (positions & 7)).astype(np.uint8)
+
+        values: Dict[str, List[str]] = {}
+        bitmaps: Dict[str, np.ndarray] = {}
+        for facet, column in facet_columns.items():
+            if column not in df.columns:
+                continue
+            codes, uniques = pd.factorize(df[column])
+            present = codes >= 0  # NaN/None rows belong to no value
+            bits = np.zeros((len(uniques), n_bytes), dtype=np.uint8)
+            np.bitwise_or.at(bits, (codes[present], byte_index[present]), bit_value[present])
+            values[facet] = [str(u) for u in uniques]
+            bitmaps[facet] = bits
+
+        if CHANGE_FLAGS_COLUMN in df.columns:
+            flags = df[CHANGE_FLAGS_COLUMN].to_numpy()
+            values[CHANGE_FACET] = list(CHANGE_TYPES)
+            bitmaps[CHANGE_FACET] = np.vstack([np.packbits((flags & change.bit) != 0)
+                                               for change in CHANGE_TYPES.values()])
+
+        return cls(n_rows, values, bitmaps)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the bitmaps."""
+        return int(sum(b.nbytes for b in self.bitmaps.values()))
+
+    def all_rows(self) -> np.ndarray:
+        """Bitmap with every row set."""
+        return self._all.copy()
+
+    def bitmap(self, facet: str, values: Iterable[str]) -> np.ndarray:
+        """
+        OR of the bitmaps for the given values of one facet.
+
+        Args:
+            facet: Facet name (see FACETS)
+            values: Values to include; unknown values match nothing
+
+        Returns:
+            Packed bitmap
+
+        Raises:
+            KeyError: If the facet is not indexed
+        """
+        if facet not in self.bitmaps:
+            raise KeyError(f"Unknown facet '{facet}'. Valid: {', '.join(self.bitmaps)}")
+        positions = self._positions[facet]
+        selected = [positions[v] for v in dict.fromkeys(values) if v in positions]
+        if not selected:
+            return np.zeros_like(self._all)
+        return np.bitwise_or.reduce(self.bitmaps[facet][selected], axis=0)
+
+    def select(self, filters: Optional[Mapping[str, Optional[Iterable[str]]]] = None,
+               exclude: Optional[str] = None) -> np.ndarray:
+        """
+        AND of every constrained facet's OR'ed values.
+
+        Args:
+            filters: Facet -> values (None/empty = unconstrained)
+            exclude: Facet to ignore (used for facet counts)
+
+        Returns:
+            Packed bitmap of matching rows
+        """
+        result = self.all_rows()
+        for facet, values in (filters or {}).items():
+            if facet == exclude or not values:
+                continue
+            result &= self.bitmap(facet, values)
+        return result
+
+    def rows(self, bitmap: np.ndarray) -> np.ndarray:
+        """Row positions set in a bitmap, ascending."""
+        return np.flatnonzero(np.unpackbits(bitmap, count=self.n_rows))
+
+    @staticmethod
+    def count(bitmap: np.ndarray) -> int:
+        """Number of rows set in a bitmap."""
+        return int(_POPCOUNT[bitmap].sum())
+
+    def facet_counts(self, filters: Optional[Mapping[str, Optional[Iterable[str]]]] = None,
+                     facets: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, int]]:
+        """
+        Row counts per facet value under the current filters.
+
+        Each facet is counted against the other facets' filters only, so the
+        counts show what selecting another value of that facet would return.
+
+        Args:
+            filters: Facet -> values, as for select()
+            facets: Facets to count (default: all indexed facets)
+
+        Returns:
+            Facet -> {value: count}, largest counts first
+        """
+        counts: Dict[str, Dict[str, int]] = {}
+        for facet in (facets or self.bitmaps):
+            if facet not in self.bitmaps:
+                raise KeyError(f"Unknown facet '{facet}'. Valid: {', '.join(self.bitmaps)}")
+            selection = self.select(filters, exclude=facet)
+            per_value = _POPCOUNT[self.bitmaps[facet] & selection].sum(axis=1)
+            order = sorted(range(len(per_value)), key=lambda i: (-int(per_value[i]), self.values[facet][i]))
+            counts[facet] = {self.values[facet][i]: int(per_value[i]) for i in order}
+        return counts
+
+
+def main():
+    """
+    Print facet counts for one month, optionally under facet filters.
+    """
+    from dataset import load_month_dataset
+
+    parser = argparse.ArgumentParser(
+        description='Show facet counts for an ERCOT Large Gen report',
+        epilog='Example: python src/facet_index.py inputs/2026/01/file.xlsx --filter fuel=Solar --filter zone=WEST'
+    )
+    parser.add_argument('input_file', help='Path to the Excel file')
+    parser.add_argument('--filter', action='append', default=[], metavar='FACET=VALUE',
+                        help=f"Facet filter, repeatable ({', '.join(FACETS)})")
+    parser.add_argument('--top', type=int, default=10, help='Values to show per facet (default: 10)')
+    args = parser.parse_args()
+
+    filters: Dict[str, List[str]] = {}
+    for item in args.filter:
+        facet, _, value = item.partition('=')
+        filters.setdefault(facet, []).append(value)
+
+    dataset = load_month_dataset(Path(args.input_file))
+    index = dataset.facets
+    selection = index.select(filters)
+
+    print("=" * 80)
+    print(f"FACETS: {args.input_file}  ({index.count(selection)} of {index.n_rows} rows match, "
+          f"index {index.nbytes / 1024:.1f} KiB)")
+    print("=" * 80)
+    for facet, counts in index.facet_counts(filters).items():
+        print(f"\n{facet}:")
+        for value, count in list(counts.items())[:args.top]:
+            print(f"  {value:<40} {count:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,447 @@
+#!/usr/bin/env python3
+"""
+Texas Grid Interconnect Reporter - Delta History Store
+Every report month as a delta against the month before (added rows, removed INRs and
+changed cells, keyed by INR) with a full checkpoint every few months, so years of
+history stay a few percent of the size of full snapshots. Any month is rebuilt from
+its nearest checkpoint, which bounds reconstruction to TGIR_HISTORY_CHECKPOINT_EVERY - 1
+deltas; walking the months in order applies each delta once.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from dataset import MonthDataset, file_fingerprint, input_files, normalize_month_frame
+from extract_large_gen import extract_large_gen_data
+from shared_store import frame_from_table, frame_to_table
+
+
+# History directory baked into the image; unset means no history store
+HISTORY_DIR_ENV = 'TGIR_HISTORY_DIR'
+# Months per checkpoint: a full month every N months, deltas in between
+DEFAULT_CHECKPOINT_EVERY = int(os.environ.get('TGIR_HISTORY_CHECKPOINT_EVERY', '12'))
+
+HISTORY_MANIFEST = 'history.json'
+HISTORY_FORMAT = 1
+
+# Arrow IPC buffer compression (history files are read rarely and shipped in the image)
+COMPRESSION = 'zstd'
+
+# Target row position of each added row, stored alongside the added rows
+POSITION_COLUMN = '_position'
+
+
+def _file_stem(period: str) -> str:
+    return period.replace('/', '-')
+
+
+def _write_frame(path: Path, frame: pd.DataFrame) -> int:
+    """Write a frame as a compressed Arrow file atomically; returns its size in bytes."""
+    table = frame_to_table(frame.reset_index(drop=True))
+    options = pa.ipc.IpcWriteOptions(compression=COMPRESSION)
+    fd, tmp_name = tempfile.mkstemp(prefix='.tmp-', suffix='.arrow', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'wb') as handle:
+            with pa.ipc.new_file(handle, table.schema, options=options) as writer:
+                writer.write_table(table)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    path.chmod(0o644)
+    return path.stat().st_size
+
+
+def _read_frame(path: Path) -> pd.DataFrame:
+    with pa.memory_map(str(path), 'r') as source:
+        return frame_from_table(pa.ipc.open_file(source).read_all())
+
+
+def _scalars(series: pd.Series) -> np.ndarray:
+    """Values as an object array of Python scalars (what the shared_store encoding accepts)."""
+    out = np.empty(len(series), dtype=object)
+    out[:] = [None if value is pd.NaT else value for value in series.tolist()]
+    return out
+
+
+def _same_cells(old: np.ndarray, new: np.ndarray) -> np.ndarray:
+    """Elementwise exact equality of two object arrays (same type and value; NaN equals NaN)."""
+    types_match = np.fromiter((type(a) is type(b) for a, b in zip(old, new)), dtype=bool, count=len(new))
+    equal = np.asarray(old == new, dtype=bool) | (pd.isna(old) & pd.isna(new))
+    return types_match & equal
+
+
+def delta_compatible(base: pd.DataFrame, target: pd.DataFrame) -> bool:
+    """
+    Whether target can be stored as a delta against base.
+
+    Both months need the same columns and dtypes and unique, non-blank INRs, and the
+    projects in both must keep their relative order; otherwise a checkpoint is written.
+    """
+    if list(base.columns) != list(target.columns) or not base.dtypes.equals(target.dtypes):
+        return False
+    for frame in (base, target):
+        if frame['INR'].isna().any() or frame['INR'].duplicated().any():
+            return False
+    in_target = base['INR'].isin(target['INR']).to_numpy()
+    in_base = target['INR'].isin(base['INR']).to_numpy()
+    return np.array_equal(base['INR'].to_numpy()[in_target], target['INR'].to_numpy()[in_base])
+
+
+def encode_delta(base: pd.DataFrame, target: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Delta turning base into target (see delta_compatible).
+
+    Args:
+        base: The previous month's rows as extracted
+        target: The month's rows as extracted
+
+    Returns:
+        (added, changes): added holds target's new rows plus POSITION_COLUMN and target's
+        attrs; changes holds one row per changed cell ('row' target position, 'column'
+        index, 'value') and attrs['removed'], the INRs no longer reported
+    """
+    in_base = target['INR'].isin(base['INR']).to_numpy()
+    added = target[~in_base].copy()
+    added[POSITION_COLUMN] = np.flatnonzero(~in_base).astype(np.int32)
+    added.attrs = dict(target.attrs)
+
+    survivors = base[base['INR'].isin(target['INR']).to_numpy()]
+    positions = np.flatnonzero(in_base)
+    rows, columns, values = [], [], []
+    for i, column in enumerate(target.columns):
+        new = _scalars(target[column].iloc[positions])
+        changed = ~_same_cells(_scalars(survivors[column]), new)
+        if changed.any():
+            rows.append(positions[changed])
+            columns.append(np.full(int(changed.sum()), i, dtype=np.int16))
+            values.append(new[changed])
+
+    changes = pd.DataFrame({
+        'row': np.concatenate(rows).astype(np.int32) if rows else np.empty(0, dtype=np.int32),
+        'column': np.concatenate(columns) if columns else np.empty(0, dtype=np.int16),
+        'value': pd.Series(np.concatenate(values) if values else np.empty(0, dtype=object), dtype=object),
+    })
+    changes.attrs = {'removed': sorted(set(base['INR']) - set(target['INR']))}
+    return added, changes
+
+
+def apply_delta(base: pd.DataFrame, added: pd.DataFrame, changes: pd.DataFrame) -> pd.DataFrame:
+    """
+    Rebuild a month from the previous month and its delta (inverse of encode_delta).
+
+    Args:
+        base: The previous month's rows
+        added: Added rows from encode_delta
+        changes: Changed cells from encode_delta
+
+    Returns:
+        The month's rows, equal to the frame the delta was encoded from
+    """
+    survivors = base[~base['INR'].isin(changes.attrs['removed']).to_numpy()]
+    positions = added[POSITION_COLUMN].to_numpy()
+    count = len(survivors) + len(added)
+    order = np.empty(count, dtype=np.int64)
+    is_added = np.zeros(count, dtype=bool)
+    is_added[positions] = True
+    order[~is_added] = np.arange(len(survivors))
+    order[positions] = len(survivors) + np.arange(len(added))
+
+    by_column = changes.groupby('column').indices
+    frame = {}
+    for i, column in enumerate(base.columns):
+        values = np.concatenate([_scalars(survivors[column]), _scalars(added[column])])[order]
+        if i in by_column:
+            cells = by_column[i]
+            values[changes['row'].to_numpy()[cells]] = changes['value'].to_numpy()[cells]
+        frame[column] = pd.Series(values, dtype=base[column].dtype)
+    frame = pd.DataFrame(frame)
+    frame.attrs = dict(added.attrs)
+    return frame
+
+
+class HistoryStore:
+    """
+    Directory of checkpoint and delta files plus history.json describing each month.
+
+    Manifest entries: {'fingerprint', 'kind' ('checkpoint' or 'delta'), 'base' (previous
+    period, deltas only), 'chain' (deltas since the checkpoint), 'files', 'rows',
+    'bytes', 'added', 'removed', 'cells'}.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def manifest(self) -> Dict[str, Any]:
+        try:
+            manifest = json.loads((self.root / HISTORY_MANIFEST).read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {'format': HISTORY_FORMAT, 'months': {}}
+        if manifest.get('format') != HISTORY_FORMAT:
+            return {'format': HISTORY_FORMAT, 'months': {}}
+        return manifest
+
+    def periods(self) -> List[str]:
+        """Stored report periods ('YYYY/MM'), oldest first."""
+        return sorted(self.manifest()['months'])
+
+    def _month(self, entry: Dict[str, Any], base: Optional[pd.DataFrame]) -> pd.DataFrame:
+        files = [self.root / name for name in entry['files']]
+        if entry['kind'] == 'checkpoint':
+            return _read_frame(files[0])
+        return apply_delta(base, _read_frame(files[0]), _read_frame(files[1]))
+
+    def load(self, period: str) -> pd.DataFrame:
+        """
+        Rebuild one month's rows (as extracted; see normalize_month_frame).
+
+        Args:
+            period: Report period ('YYYY/MM')
+
+        Raises:
+            KeyError: If the month is not stored
+        """
+        months = self.manifest()['months']
+        chain = [period]
+        while months[chain[-1]]['kind'] == 'delta':
+            chain.append(months[chain[-1]]['base'])
+        frame = None
+        for step in reversed(chain):
+            frame = self._month(months[step], frame)
+        return frame
+
+    def load_fingerprint(self, fingerprint: str) -> Optional[pd.DataFrame]:
+        """
+        Rebuild the month stored from the workbook with this content hash.
+
+        Args:
+            fingerprint: Workbook hash (see dataset.file_fingerprint)
+
+        Returns:
+            The month's rows (as load()), or None when no stored month has that hash
+        """
+        for period, entry in self.manifest()['months'].items():
+            if entry['fingerprint'] == fingerprint and all((self.root / name).exists() for name in entry['files']):
+                return self.load(period)
+        return None
+
+    def iter_months(self, start: Optional[str] = None, end: Optional[str] = None) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Yield (period, rows) for the stored months in [start, end], oldest first.
+
+        Consecutive months reuse the previous result, so each delta is applied once.
+        """
+        months = self.manifest()['months']
+        previous, frame = None, None
+        for period in sorted(months):
+            if end and period > end:
+                break
+            entry = months[period]
+            if start and period < start:
+                continue
+            if entry['kind'] == 'delta' and entry['base'] == previous:
+                frame = self._month(entry, frame)
+            else:
+                frame = self.load(period)
+            previous = period
+            yield period, frame
+
+    def datasets(self, start: Optional[str] = None, end: Optional[str] = None) -> Iterator[MonthDataset]:
+        """Stored months in [start, end] as normalized MonthDatasets (sources under inputs/)."""
+        months = self.manifest()['months']
+        for period, frame in self.iter_months(start, end):
+            source = Path('inputs') / period / 'file.xlsx'
+            yield MonthDataset(source, normalize_month_frame(frame.copy()), months[period]['fingerprint'])
+
+
+def build_history(inputs_dir: Path, out_dir: Path,
+                  loader: Callable[[Path], pd.DataFrame] = extract_large_gen_data,
+                  checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY) -> Dict[str, Any]:
+    """
+    Store every workbook under inputs_dir as a checkpoint or a delta in out_dir.
+
+    Months already stored from the same workbook, after the same previous month, are
+    kept; from the first month that differs onwards the history is rewritten (deltas
+    chain on the previous month). Files no longer referenced are removed.
+
+    Args:
+        inputs_dir: Directory holding inputs/<year>/<month>/file.xlsx
+        out_dir: History directory (created if missing)
+        loader: Function parsing a workbook into a DataFrame (as extract_large_gen_data)
+        checkpoint_every: Months per checkpoint (1 stores every month in full)
+
+    Returns:
+        The history manifest
+
+    Raises:
+        ValueError: If there are no workbooks
+    """
+    files = input_files(inputs_dir)
+    if not files:
+        raise ValueError(f"No workbooks under {inputs_dir}")
+
+    store = HistoryStore(Path(out_dir))
+    store.root.mkdir(parents=True, exist_ok=True)
+    stored = store.manifest()['months']
+    months: Dict[str, Dict[str, Any]] = {}
+    previous, previous_frame, rewriting = None, None, False
+    for period, path in files:
+        start = time.perf_counter()
+        fingerprint = file_fingerprint(path)
+        entry = stored.get(period)
+        if (not rewriting and entry is not None and entry['fingerprint'] == fingerprint
+                and entry.get('base') == (previous if entry['kind'] == 'delta' else None)
+                and all((store.root / name).exists() for name in entry['files'])):
+            months[period] = dict(entry, reused=True)
+            previous, previous_frame = period, None
+            continue
+
+        rewriting = True
+        frame = loader(path)
+        if previous is not None and previous_frame is None:
+            previous_frame = store.load(previous)
+
+        stem = _file_stem(period)
+        chain = months[previous]['chain'] + 1 if previous is not None else 0
+        if previous_frame is None or chain >= checkpoint_every or not delta_compatible(previous_frame, frame):
+            names = [f"{stem}.checkpoint.arrow"]
+            size = _write_frame(store.root / names[0], frame)
+            entry = {'kind': 'checkpoint', 'base': None, 'chain': 0, 'added': None, 'removed': None, 'cells': None}
+        else:
+            added, changes = encode_delta(previous_frame, frame)
+            names = [f"{stem}.added.arrow", f"{stem}.changes.arrow"]
+            size = _write_frame(store.root / names[0], added) + _write_frame(store.root / names[1], changes)
+            entry = {'kind': 'delta', 'base': previous, 'chain': chain, 'added': len(added),
+                     'removed': len(changes.attrs['removed']), 'cells': len(changes)}
+        months[period] = dict(entry, fingerprint=fingerprint, files=names, rows=len(frame), bytes=size,
+                              reused=False, seconds=round(time.perf_counter() - start, 3))
+        # Written before the next month so store.load() can rebuild from what is on disk
+        store.root.joinpath(HISTORY_MANIFEST).write_text(
+            json.dumps({'format': HISTORY_FORMAT, 'months': {**stored, **months}}, indent=2))
+        previous, previous_frame = period, frame
+
+    manifest = {
+        'format': HISTORY_FORMAT,
+        'created': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'checkpoint_every': checkpoint_every,
+        'months': months,
+    }
+    (store.root / HISTORY_MANIFEST).write_text(json.dumps(manifest, indent=2))
+    referenced = {name for entry in months.values() for name in entry['files']}
+    for path in store.root.glob('*.arrow'):
+        if path.name not in referenced:
+            path.unlink()
+    store.root.chmod(0o755)
+    return manifest
+
+
+def verify_history(history_dir: Path, inputs_dir: Path) -> Dict[str, str]:
+    """
+    Check the stored months against the workbooks currently under inputs_dir.
+
+    Returns:
+        'YYYY/MM' -> 'ok', 'stale' (stored from a different workbook) or 'missing'
+    """
+    months = HistoryStore(Path(history_dir)).manifest()['months']
+    status = {}
+    for period, path in input_files(inputs_dir):
+        entry = months.get(period)
+        if entry is None or not all((Path(history_dir) / name).exists() for name in entry['files']):
+            status[period] = 'missing'
+        elif entry['fingerprint'] != file_fingerprint(path):
+            status[period] = 'stale'
+        else:
+            status[period] = 'ok'
+    return status
+
+
+def default_history_store() -> Optional[HistoryStore]:
+    """
+    History store configured by TGIR_HISTORY_DIR, or None when unset or absent.
+    """
+    root = os.environ.get(HISTORY_DIR_ENV)
+    if not root or not Path(root).is_dir():
+        return None
+    return HistoryStore(Path(root))
+
+
+def main():
+    """
+    Build the delta history of the bundled months, or verify it.
+    """
+    parser = argparse.ArgumentParser(
+        description='Store every bundled month as a delta against the month before, with periodic checkpoints',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python src/history_store.py --out build/history                    # Build or extend the history
+  python src/history_store.py --out build/history --checkpoint-every 6
+  python src/history_store.py --out build/history --verify           # Exit 1 unless it covers inputs/
+        """
+    )
+    project_root = Path(__file__).parent.parent
+    parser.add_argument('--inputs', default=str(project_root / 'inputs'), help='Input workbooks directory (default: inputs/)')
+    parser.add_argument('--out', default=os.environ.get(HISTORY_DIR_ENV, str(project_root / 'build' / 'history')),
+                        help=f'History directory (default: ${HISTORY_DIR_ENV} or build/history)')
+    parser.add_argument('--checkpoint-every', type=int, default=DEFAULT_CHECKPOINT_EVERY,
+                        help=f'Months per full checkpoint (default: {DEFAULT_CHECKPOINT_EVERY})')
+    parser.add_argument('--verify', action='store_true',
+                        help='Only check the history against the workbooks; exit 1 on any mismatch')
+    args = parser.parse_args()
+    if args.checkpoint_every < 1:
+        parser.error("--checkpoint-every must be at least 1")
+
+    print("=" * 80)
+    if args.verify:
+        status = verify_history(Path(args.out), Path(args.inputs))
+        print(f"HISTORY CHECK: {args.out}")
+        print("=" * 80)
+        for period, state in status.items():
+            print(f"  {period}  {state}")
+        if not status or any(state != 'ok' for state in status.values()):
+            print("\n✗ History does not cover the current inputs; run without --verify to rebuild")
+            sys.exit(1)
+        print(f"\n✓ {len(status)} months match their workbooks")
+        return
+
+    from dataset import MonthDatasetCache
+    from ingest import default_snapshot_store
+
+    # Months come from the build-time snapshots when present, so nothing is parsed twice
+    cache = MonthDatasetCache(snapshots=default_snapshot_store(), max_entries=1)
+
+    def load(path: Path) -> pd.DataFrame:
+        dataset = cache.get(path)[0]
+        frame = dataset.frame[dataset.raw_columns]
+        frame.attrs = dict(dataset.frame.attrs)
+        return frame
+
+    print(f"BUILDING HISTORY {args.inputs} -> {args.out}")
+    print("=" * 80)
+    try:
+        manifest = build_history(Path(args.inputs), Path(args.out), loader=load,
+                                 checkpoint_every=args.checkpoint_every)
+    except ValueError as e:
+        parser.error(str(e))
+    for period, entry in manifest['months'].items():
+        detail = 'checkpoint' if entry['kind'] == 'checkpoint' else \
+            f"+{entry['added']} -{entry['removed']} ~{entry['cells']} cells"
+        note = 'reused' if entry['reused'] else f"built in {entry['seconds']:.1f}s"
+        print(f"  {period}  {entry['rows']:>7} rows  {entry['bytes'] / 1024:>8.1f} KiB  {detail:<28} {note}")
+    total = sum(entry['bytes'] for entry in manifest['months'].values())
+    print(f"\n✓ {len(manifest['months'])} months stored in {total / (1024 * 1024):.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
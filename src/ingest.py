@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Texas Grid Interconnect Reporter - Build-time Ingestion
+Parses every bundled month once, ahead of deployment, into typed Arrow snapshots
+(the shared_store format) plus an ingest.json recording which workbook hash each
+snapshot was built from. The backend memory-maps a snapshot instead of parsing the
+workbook whenever the hashes match, so a fresh container does no Excel parsing.
+"""
+
+import argparse
+import datetime
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+
+from dataset import file_fingerprint, input_files, normalize_month_frame
+from extract_large_gen import extract_large_gen_data
+from history_store import HistoryStore, verify_history
+from shared_store import SharedMonthStore
+
+logger = logging.getLogger("tgir.ingest")
+
+# Snapshot directory baked into the image; unset means months are parsed on first use
+SNAPSHOT_DIR_ENV = 'TGIR_SNAPSHOT_DIR'
+# Set to 1 to refuse to start when a bundled month has no matching snapshot
+REQUIRE_SNAPSHOTS_ENV = 'TGIR_REQUIRE_SNAPSHOTS'
+
+INGEST_MANIFEST = 'ingest.json'
+
+
+def ingest_months(inputs_dir: Path, out_dir: Path,
+                  loader: Callable[[Path], pd.DataFrame] = extract_large_gen_data) -> Dict[str, Any]:
+    """
+    Snapshot every workbook under inputs_dir into out_dir.
+
+    Months whose snapshot already exists are reused; snapshots of workbooks no longer
+    in inputs_dir are removed.
+
+    Args:
+        inputs_dir: Directory holding inputs/<year>/<month>/file.xlsx
+        out_dir: Snapshot directory (created if missing)
+        loader: Function parsing a workbook into a DataFrame
+
+    Returns:
+        The ingest manifest ({'created', 'months': {'YYYY/MM': {...}}})
+
+    Raises:
+        ValueError: If there are no workbooks
+    """
+    files = input_files(inputs_dir)
+    if not files:
+        raise ValueError(f"No workbooks under {inputs_dir}")
+
+    store = SharedMonthStore(Path(out_dir))
+    # Never prune while ingesting; months that left inputs_dir are removed at the end
+    store.max_entries = len(files) + len(store.manifest())
+    months: Dict[str, Dict[str, Any]] = {}
+    for period, path in files:
+        start = time.perf_counter()
+        fingerprint = file_fingerprint(path)
+        frame = store.load(fingerprint)
+        reused = frame is not None
+        if frame is None:
+            frame = normalize_month_frame(loader(path))
+            store.save(fingerprint, frame, path)
+        snapshot = store.path_for(fingerprint)
+        snapshot.chmod(0o644)  # the serving user may differ from the build user
+        months[period] = {
+            'fingerprint': fingerprint,
+            'rows': len(frame),
+            'bytes': snapshot.stat().st_size,
+            'snapshot': snapshot.name,
+            'reused': reused,
+            'seconds': round(time.perf_counter() - start, 3),
+        }
+
+    current = {entry['fingerprint'] for entry in months.values()}
+    for fingerprint in set(store.manifest()) - current:
+        store.remove(fingerprint)
+
+    manifest = {
+        'created': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'months': months,
+    }
+    (store.root / INGEST_MANIFEST).write_text(json.dumps(manifest, indent=2))
+    store.root.chmod(0o755)
+    return manifest
+
+
+def prune_snapshots(snapshot_dir: Path, keep: int) -> List[str]:
+    """
+    Delete all but the newest `keep` months' snapshots.
+
+    Used at build time once the delta history (history_store) holds every month, so
+    the image ships full snapshots only for the months served most.
+
+    Args:
+        snapshot_dir: Directory written by ingest_months
+        keep: Number of most recent months to keep
+
+    Returns:
+        Report periods ('YYYY/MM') whose snapshots were removed
+    """
+    store = SharedMonthStore(Path(snapshot_dir))
+    manifest_path = store.root / INGEST_MANIFEST
+    manifest = json.loads(manifest_path.read_text())
+    periods = sorted(manifest['months'])
+    removed = periods[:max(0, len(periods) - keep)]
+    for period in removed:
+        store.remove(manifest['months'].pop(period)['fingerprint'])
+    manifest_path.write_text(json.dumps(manifest, indent=2))
+    return removed
+
+
+def verify_snapshots(snapshot_dir: Path, inputs_dir: Path) -> Dict[str, str]:
+    """
+    Check the snapshots against the workbooks currently under inputs_dir.
+
+    Args:
+        snapshot_dir: Directory written by ingest_months
+        inputs_dir: Directory holding the workbooks
+
+    Returns:
+        'YYYY/MM' -> 'ok' (snapshot matches the workbook's hash), 'stale' (the month
+        was ingested from a different workbook) or 'missing' (never ingested)
+    """
+    snapshot_dir = Path(snapshot_dir)
+    try:
+        ingested = json.loads((snapshot_dir / INGEST_MANIFEST).read_text())['months']
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        ingested = {}
+
+    status = {}
+    for period, path in input_files(inputs_dir):
+        entry = ingested.get(period)
+        if entry is None or not (snapshot_dir / entry['snapshot']).exists():
+            status[period] = 'missing'
+        elif entry['fingerprint'] != file_fingerprint(path):
+            status[period] = 'stale'
+        else:
+            status[period] = 'ok'
+    return status
+
+
+def default_snapshot_store() -> Optional[SharedMonthStore]:
+    """
+    Snapshot store configured by TGIR_SNAPSHOT_DIR, or None when unset or absent.
+    """
+    root = os.environ.get(SNAPSHOT_DIR_ENV)
+    if not root or not Path(root).is_dir():
+        return None
+    return SharedMonthStore(Path(root))
+
+
+def check_snapshots_at_startup(snapshots: Optional[SharedMonthStore], inputs_dir: Path,
+                               history: Optional[HistoryStore] = None) -> Dict[str, str]:
+    """
+    Log how many bundled months start without Excel parsing.
+
+    Args:
+        snapshots: Store from default_snapshot_store() (None: nothing to check)
+        inputs_dir: Directory holding the workbooks
+        history: Store from history_store.default_history_store(); months it holds
+            are rebuilt from it instead of parsed
+
+    Returns:
+        verify_snapshots() result, with 'history' for months only the history holds
+        ({} without either store)
+
+    Raises:
+        RuntimeError: If TGIR_REQUIRE_SNAPSHOTS=1 and a month is in neither store
+    """
+    if snapshots is None and history is None:
+        if os.environ.get(REQUIRE_SNAPSHOTS_ENV) == '1':
+            raise RuntimeError(f"{REQUIRE_SNAPSHOTS_ENV}=1 but {SNAPSHOT_DIR_ENV} is not a directory")
+        return {}
+    if snapshots is not None:
+        status = verify_snapshots(snapshots.root, inputs_dir)
+    else:
+        status = {period: 'missing' for period, _ in input_files(inputs_dir)}
+    if history is not None:
+        in_history = verify_history(history.root, inputs_dir)
+        status = {period: 'history' if state != 'ok' and in_history.get(period) == 'ok' else state
+                  for period, state in status.items()}
+
+    location = ' and '.join(str(store.root) for store in (snapshots, history) if store is not None)
+    unmatched = {period: state for period, state in status.items() if state not in ('ok', 'history')}
+    if unmatched:
+        detail = ', '.join(f"{period} {state}" for period, state in sorted(unmatched.items()))
+        if os.environ.get(REQUIRE_SNAPSHOTS_ENV) == '1':
+            raise RuntimeError(f"Snapshots in {location} do not match inputs: {detail}")
+        logger.warning("Snapshots in %s do not match inputs (%s); those months are parsed on first use",
+                       location, detail)
+    else:
+        from_history = sum(state == 'history' for state in status.values())
+        logger.info("All %d months load from snapshots in %s (%d rebuilt from the delta history)",
+                    len(status), location, from_history)
+    return status
+
+
+def main():
+    """
+    Ingest the bundled months, or verify existing snapshots.
+    """
+    parser = argparse.ArgumentParser(
+        description='Parse every bundled month into snapshots the backend loads without Excel parsing',
+        epilog='Example: python src/ingest.py --out build/snapshots'
+    )
+    project_root = Path(__file__).parent.parent
+    parser.add_argument('--inputs', default=str(project_root / 'inputs'), help='Input workbooks directory (default: inputs/)')
+    parser.add_argument('--out', default=os.environ.get(SNAPSHOT_DIR_ENV, str(project_root / 'build' / 'snapshots')),
+                        help=f'Snapshot directory (default: ${SNAPSHOT_DIR_ENV} or build/snapshots)')
+    parser.add_argument('--verify', action='store_true',
+                        help='Only check the snapshots against the workbooks; exit 1 on any mismatch')
+    parser.add_argument('--prune-to', type=int, default=None, metavar='N',
+                        help='Only delete all but the newest N snapshots (once the delta history holds every month)')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    if args.prune_to is not None:
+        removed = prune_snapshots(Path(args.out), max(args.prune_to, 0))
+        print(f"SNAPSHOT PRUNE: {args.out}")
+        print("=" * 80)
+        for period in removed:
+            print(f"  {period}  removed (served from the delta history)")
+        print(f"\n✓ {len(removed)} snapshots removed")
+        return
+
+    if args.verify:
+        status = verify_snapshots(Path(args.out), Path(args.inputs))
+        print(f"SNAPSHOT CHECK: {args.out}")
+        print("=" * 80)
+        for period, state in status.items():
+            print(f"  {period}  {state}")
+        if not status or any(state != 'ok' for state in status.values()):
+            print("\n✗ Snapshots do not cover the current inputs; run without --verify to rebuild")
+            sys.exit(1)
+        print(f"\n✓ {len(status)} months match their snapshots")
+        return
+
+    print(f"INGESTING {args.inputs} -> {args.out}")
+    print("=" * 80)
+    try:
+        manifest = ingest_months(Path(args.inputs), Path(args.out))
+    except ValueError as e:
+        parser.error(str(e))
+    for period, entry in manifest['months'].items():
+        note = 'reused' if entry['reused'] else f"parsed in {entry['seconds']:.1f}s"
+        print(f"  {period}  {entry['fingerprint']}  {entry['rows']:>7} rows  "
+              f"{entry['bytes'] / (1024 * 1024):>6.1f} MiB  {note}")
+    print(f"\n✓ {len(manifest['months'])} months snapshotted")
+
+
+if __name__ == "__main__":
+    main()
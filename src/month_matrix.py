@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Texas Grid Interconnect Reporter - Month Matrix
+Aligns any number of report months on INR in one pass: a projects x months grid of
+presence, COD and MW, from which added/removed projects, COD shifts and MW deltas
+between consecutive months are array operations instead of one comparison per pair.
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from dataset import MonthDataset
+
+
+# Descriptive columns reported per project, from the latest month it appears in
+INFO_COLUMNS = {'Project Name': 'Project Name', 'County': 'County', 'Fuel_Normalized': 'Fuel Type'}
+
+_EPOCH = pd.Timestamp('1970-01-01')
+
+
+class MonthMatrix:
+    """
+    Report months aligned on INR.
+
+    Attributes:
+        months: Report periods ('YYYY/MM'), in the order given
+        inrs: Project INRs, one per row, in order of first appearance
+        present: bool [projects x months], whether the project is in the month's report
+        cod: float [projects x months], Projected COD in days since 1970-01-01 (NaN when
+             absent or not a date)
+        mw: float [projects x months], Capacity (MW) (NaN when absent or blank)
+        info: INFO_COLUMNS of each project's latest month, indexed like inrs
+    """
+
+    def __init__(self, months: List[str], inrs: np.ndarray, present: np.ndarray, cod: np.ndarray,
+                 mw: np.ndarray, info: pd.DataFrame):
+        self.months = months
+        self.inrs = inrs
+        self.present = present
+        self.cod = cod
+        self.mw = mw
+        self.info = info
+
+    @classmethod
+    def align(cls, datasets: Iterable[MonthDataset]) -> 'MonthMatrix':
+        """
+        Build the grid from months in report order (each month is read once).
+
+        Rows without an INR are skipped; a duplicated INR within a month keeps its first row.
+        """
+        months, parts = [], []
+        for dataset in datasets:
+            frame = dataset.frame
+            part = frame.loc[frame['INR'].notna(), ['INR', 'COD Date', 'Capacity (MW)', *INFO_COLUMNS]]
+            part = part.drop_duplicates('INR')
+            parts.append(part.assign(_month=len(months)))
+            months.append(dataset.period)
+
+        if not parts:
+            raise ValueError("No months to align")
+        stacked = pd.concat(parts, ignore_index=True)
+        rows, inrs = pd.factorize(stacked['INR'])
+        columns = stacked['_month'].to_numpy()
+
+        shape = (len(inrs), len(months))
+        present = np.zeros(shape, dtype=bool)
+        present[rows, columns] = True
+        cod = np.full(shape, np.nan)
+        cod[rows, columns] = ((pd.to_datetime(stacked['COD Date']) - _EPOCH) / pd.Timedelta(days=1)).to_numpy(float)
+        mw = np.full(shape, np.nan)
+        mw[rows, columns] = pd.to_numeric(stacked['Capacity (MW)'], errors='coerce').to_numpy(float)
+
+        # Parts are in month order, so the last row per INR is its latest month
+        latest = stacked.drop_duplicates('INR', keep='last').set_index('INR')
+        info = latest.loc[inrs, list(INFO_COLUMNS)].rename(columns=INFO_COLUMNS).reset_index(drop=True)
+        return cls(months, np.asarray(inrs, dtype=object), present, cod, mw, info)
+
+    # Consecutive-month transitions: column i compares months[i] with months[i + 1]
+
+    def added(self) -> np.ndarray:
+        """bool [projects x months-1]: in the later month's report but not the earlier one's."""
+        return self.present[:, 1:] & ~self.present[:, :-1]
+
+    def removed(self) -> np.ndarray:
+        """bool [projects x months-1]: in the earlier month's report but not the later one's."""
+        return self.present[:, :-1] & ~self.present[:, 1:]
+
+    def cod_shift_days(self) -> np.ndarray:
+        """float [projects x months-1]: COD change in days (NaN unless both months have a COD date)."""
+        return self.cod[:, 1:] - self.cod[:, :-1]
+
+    def mw_delta(self) -> np.ndarray:
+        """float [projects x months-1]: capacity change in MW (NaN unless both months have one)."""
+        return self.mw[:, 1:] - self.mw[:, :-1]
+
+
+def _nullable(values: np.ndarray, decimals: Optional[int] = None) -> List[List[Any]]:
+    """Rows of a float array as lists: NaN as None, values rounded (to int when decimals is None)."""
+    missing = np.isnan(values)
+    rounded = np.round(values, decimals or 0)
+    if decimals is None:
+        rounded = np.where(missing, 0, rounded).astype(np.int64)
+    out = rounded.astype(object)
+    out[missing] = None
+    return out.tolist()
+
+
+def matrix_payload(matrix: MonthMatrix, changed_only: bool = True) -> Dict[str, Any]:
+    """
+    Per-month totals and per-project change series across all months of a MonthMatrix.
+
+    Series have one entry per month; the first month has no predecessor, so its entry is
+    None, as is any month where the project or value is missing on either side.
+
+    Args:
+        matrix: Aligned months
+        changed_only: Only list projects added, removed, re-dated or resized within the range
+
+    Returns:
+        {'months', 'summary': [per month], 'projects': [per project]}
+    """
+    added, removed = matrix.added(), matrix.removed()
+    shift, delta = matrix.cod_shift_days(), matrix.mw_delta()
+    shifted = np.nan_to_num(shift) != 0
+    resized = np.abs(np.nan_to_num(delta)) > 1e-9
+
+    summary = []
+    for m, month in enumerate(matrix.months):
+        present = matrix.present[:, m]
+        entry = {
+            'month': month,
+            'projects': int(present.sum()),
+            'total_mw': round(float(np.nansum(matrix.mw[present, m])), 2),
+            'added': None, 'removed': None, 'added_mw': None, 'removed_mw': None,
+            'cod_delayed': None, 'cod_advanced': None, 'mean_cod_shift_days': None, 'mw_delta': None,
+        }
+        if m:
+            t = m - 1
+            moved = shift[shifted[:, t], t]
+            entry.update({
+                'added': int(added[:, t].sum()),
+                'removed': int(removed[:, t].sum()),
+                'added_mw': round(float(np.nansum(matrix.mw[added[:, t], m])), 2),
+                'removed_mw': round(float(np.nansum(matrix.mw[removed[:, t], t])), 2),
+                'cod_delayed': int((moved > 0).sum()),
+                'cod_advanced': int((moved < 0).sum()),
+                'mean_cod_shift_days': round(float(moved.mean()), 1) if len(moved) else None,
+                'mw_delta': round(float(np.nansum(delta[:, t])), 2),
+            })
+        summary.append(entry)
+
+    rows = np.arange(len(matrix.inrs))
+    if changed_only:
+        rows = rows[(added | removed | shifted | resized).any(axis=1)]
+
+    # One leading None per series for the first month
+    lead = np.full((len(rows), 1), np.nan)
+    shift_series = _nullable(np.hstack([lead, shift[rows]]))
+    delta_series = _nullable(np.hstack([lead, delta[rows]]), 2)
+    months = np.array(matrix.months)
+    present = matrix.present[rows]
+    first = present.argmax(axis=1)
+    last = present.shape[1] - 1 - present[:, ::-1].argmax(axis=1)
+    info = matrix.info.iloc[rows]
+    info = info.astype(object).where(info.notna(), None).to_dict('records')
+
+    projects = []
+    for i, row in enumerate(rows):
+        projects.append({
+            'INR': matrix.inrs[row],
+            **info[i],
+            'first_month': str(months[first[i]]),
+            'last_month': str(months[last[i]]),
+            'present': ''.join('1' if p else '0' for p in present[i]),
+            'added': months[1:][added[row]].tolist(),
+            'removed': months[1:][removed[row]].tolist(),
+            'cod_shift_days': shift_series[i],
+            'mw_delta': delta_series[i],
+            'total_cod_shift_days': int(np.nansum(shift[row])),
+            'total_mw_delta': round(float(np.nansum(delta[row])), 2),
+        })
+    projects.sort(key=lambda p: p['INR'])
+
+    return {'months': matrix.months, 'summary': summary, 'projects': projects}
+
+
+def main():
+    """
+    Print the month-by-month change summary over a range of report months.
+    """
+    parser = argparse.ArgumentParser(
+        description='Align report months on INR and summarize changes between consecutive months',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python src/month_matrix.py                                # Every month under inputs/
+  python src/month_matrix.py --start 2025-02 --end 2026-01  # One year
+  python src/month_matrix.py --json changes.json            # Also write the full payload
+  python src/month_matrix.py --history build/history       # Months from the delta history
+        """
+    )
+    parser.add_argument('--inputs', default=None, help='Inputs directory (default: inputs/)')
+    parser.add_argument('--start', default=None, metavar='YYYY-MM', help='First report month (default: earliest)')
+    parser.add_argument('--end', default=None, metavar='YYYY-MM', help='Last report month (default: latest)')
+    parser.add_argument('--json', default=None, metavar='PATH', help='Write the full payload as JSON')
+    parser.add_argument('--history', default=None, metavar='DIR',
+                        help='Read months from a delta history (src/history_store.py) instead of the workbooks')
+    args = parser.parse_args()
+
+    from dataset import MonthDatasetCache, input_files
+    from history_store import HistoryStore
+    from ingest import default_snapshot_store
+
+    start = args.start.replace('-', '/') if args.start else None
+    end = args.end.replace('-', '/') if args.end else None
+    if args.history:
+        history = HistoryStore(Path(args.history))
+        if not any((not start or p >= start) and (not end or p <= end) for p in history.periods()):
+            parser.error("No report months in the requested range")
+        matrix = MonthMatrix.align(history.datasets(start, end))
+    else:
+        inputs_dir = Path(args.inputs) if args.inputs else Path(__file__).parent.parent / "inputs"
+        files = [(period, path) for period, path in input_files(inputs_dir)
+                 if (not start or period >= start) and (not end or period <= end)]
+        if not files:
+            parser.error("No report months in the requested range")
+
+        cache = MonthDatasetCache(snapshots=default_snapshot_store(), max_entries=1)
+        matrix = MonthMatrix.align(cache.get(path)[0] for _, path in files)
+    payload = matrix_payload(matrix)
+
+    print("=" * 80)
+    print(f"MONTH MATRIX: {len(matrix.months)} months, {len(matrix.inrs)} projects, "
+          f"{len(payload['projects'])} with changes")
+    print("=" * 80)
+    print(f"{'Month':<9} {'Projects':>9} {'Total MW':>12} {'Added':>6} {'Removed':>8} "
+          f"{'Delayed':>8} {'Advanced':>9} {'MW Delta':>10}")
+    print("-" * 80)
+    for entry in payload['summary']:
+        def cell(name, width):
+            return f"{'-' if entry[name] is None else entry[name]:>{width}}"
+        print(f"{entry['month']:<9} {entry['projects']:>9} {entry['total_mw']:>12.1f} {cell('added', 6)} "
+              f"{cell('removed', 8)} {cell('cod_delayed', 8)} {cell('cod_advanced', 9)} {cell('mw_delta', 10)}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(payload))
+        print(f"\n✓ Payload saved to: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
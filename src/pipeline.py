@@ -0,0 +1,505 @@
+#!/usr/bin/env python3
+"""
+Texas Grid Interconnect Reporter - Monthly Pipeline
+Runs the monthly batch as a DAG of explicit stages (extract, normalize, validate,
+aggregate, diff, render, export). Every stage output is stored under a key hashing
+the stage's code, its upstream keys and its parameters (workbooks enter by content
+hash), so a rerun only executes the stages whose inputs or code changed. Each run
+writes a manifest listing every task with its key, status and timing.
+"""
+
+import argparse
+import contextlib
+import datetime
+import hashlib
+import inspect
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+import pandas as pd
+import pyarrow as pa
+
+import change_flags
+import chart_specs
+import constants
+import dataset as dataset_module
+import extract_large_gen
+import reports
+import row_hashes
+import validation
+from change_flags import CHANGE_FLAGS_COLUMN
+from dataset import DERIVED_COLUMNS, file_fingerprint, input_files, normalize_month_frame
+from row_hashes import RowHashes, changed_groups
+from shared_store import frame_from_table, frame_to_table
+
+
+class Stage(NamedTuple):
+    """One kind of pipeline step."""
+    name: str
+    run: Callable[..., Any]   # Called with the task's dependencies (by name) and params; 'dir' stages get work_dir first
+    codec: str                # How the output is stored: 'frame' (Arrow), 'json' or 'dir' (a directory of files)
+    modules: tuple = ()       # Modules whose source, with run's, versions the stage's code
+    check: Optional[Callable[[Any], bool]] = None  # For stages with side effects: is a stored output still in place?
+
+
+class Task(NamedTuple):
+    """One stage applied to specific inputs, e.g. normalize for 2026/01."""
+    id: str
+    stage: str
+    deps: Dict[str, str] = {}     # run() argument -> upstream task id
+    params: Dict[str, Any] = {}   # JSON-serializable run() arguments
+    sources: tuple = ()           # Files hashed by content into the key (e.g. the workbook)
+
+
+# ---------------------------------------------------------------------------
+# Stage functions
+# ---------------------------------------------------------------------------
+
+def extract_stage(path: str) -> pd.DataFrame:
+    """Read a workbook's Large Gen sheet, values as published."""
+    return extract_large_gen.read_large_gen_sheet(Path(path))
+
+
+def normalize_stage(extracted: pd.DataFrame) -> pd.DataFrame:
+    """Clean and type the sheet (as extract_large_gen_data does), then add the derived columns."""
+    return normalize_month_frame(extract_large_gen.clean_large_gen_data(extracted.copy()))
+
+
+def validate_stage(extracted: pd.DataFrame) -> Dict[str, Any]:
+    """Data-quality report of the sheet's raw values."""
+    return validation.validate_large_gen_data(extracted)
+
+
+def aggregate_stage(normalized: pd.DataFrame) -> Dict[str, Any]:
+    """Headline totals: project count and MW overall and by fuel, zone, quarter and phase."""
+    capacity = pd.to_numeric(normalized['Capacity (MW)'], errors='coerce')
+
+    def total_by(column: str) -> Dict[str, float]:
+        totals = capacity.groupby(normalized[column].fillna('Unknown').astype(str)).sum()
+        return {key: round(float(value), 2) for key, value in totals.sort_index().items()}
+
+    return {
+        'projects': int(len(normalized)),
+        'capacity_mw': round(float(capacity.sum()), 2),
+        'mw_by_fuel': total_by('Fuel_Normalized'),
+        'mw_by_zone': total_by('CDR Reporting Zone'),
+        'mw_by_quarter': total_by('Quarter'),
+        'projects_by_phase': {str(k): int(v) for k, v in normalized['GIM Study Phase'].value_counts().sort_index().items()},
+    }
+
+
+DIFF_COLUMNS = ['INR', 'Project Name', 'County', 'Change', 'Column', 'Old Value', 'New Value']
+
+
+def _diff_text(value: Any) -> Optional[str]:
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    if isinstance(value, (pd.Timestamp, datetime.date)):
+        return pd.Timestamp(value).strftime('%Y-%m-%d')
+    text = str(value).strip()
+    return text or None
+
+
+def diff_stage(base: pd.DataFrame, target: pd.DataFrame) -> pd.DataFrame:
+    """
+    Projects added and removed between two months, and every published field that
+    changed for projects in both (one row per field).
+
+    Only projects whose row hashes differ are compared, and only in the column groups
+    that changed (see row_hashes).
+    """
+    skip = {'INR', CHANGE_FLAGS_COLUMN, *DERIVED_COLUMNS}
+    columns = [c for c in target.columns if c in base.columns and c not in skip and 'Change indicator' not in c]
+    old = base.dropna(subset=['INR']).drop_duplicates('INR').set_index('INR')
+    new = target.dropna(subset=['INR']).drop_duplicates('INR').set_index('INR')
+
+    parts = []
+    for change, frame, inrs in (('added', new, new.index.difference(old.index)),
+                                ('removed', old, old.index.difference(new.index))):
+        rows = frame.loc[inrs]
+        parts.append(pd.DataFrame({'INR': inrs, 'Project Name': rows['Project Name'].map(_diff_text).to_numpy(),
+                                   'County': rows['County'].map(_diff_text).to_numpy(), 'Change': change}))
+
+    target_hashes = RowHashes(target[[c for c in target.columns if c not in DERIVED_COLUMNS]])
+    changed_rows = changed_groups(RowHashes(base[[c for c in base.columns if c not in DERIVED_COLUMNS]]), target_hashes)
+    group_of = {column: group for group, members in target_hashes.groups.items() for column in members}
+    for column in columns:
+        common = changed_rows.index[changed_rows[group_of[column]].to_numpy()]
+        before = old.loc[common, column].map(_diff_text)
+        after = new.loc[common, column].map(_diff_text)
+        changed = (before != after) & ~(before.isna() & after.isna())
+        if changed.any():
+            inrs = common[changed.to_numpy()]
+            parts.append(pd.DataFrame({
+                'INR': inrs,
+                'Project Name': new.loc[inrs, 'Project Name'].map(_diff_text).to_numpy(),
+                'County': new.loc[inrs, 'County'].map(_diff_text).to_numpy(),
+                'Change': 'changed', 'Column': column,
+                'Old Value': before[changed].to_numpy(), 'New Value': after[changed].to_numpy(),
+            }))
+
+    diff = pd.concat(parts, ignore_index=True).reindex(columns=DIFF_COLUMNS)
+    return diff.astype(object).where(diff.notna(), None)
+
+
+def render_stage(work_dir: Path, normalized: pd.DataFrame, reports_to_render: List[str]) -> None:
+    """Render report charts (see reports.REPORT_RENDERERS) into work_dir."""
+    raw = normalized[[c for c in normalized.columns if c not in DERIVED_COLUMNS]]
+    # The renderers narrate to stdout; keep the pipeline's own output readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        for report in reports_to_render:
+            reports.REPORT_RENDERERS[report](raw, work_dir)
+
+
+def export_stage(out_dir: str, normalized: pd.DataFrame, quality: Dict[str, Any], aggregates: Dict[str, Any],
+                 charts: Path, diff: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
+    """
+    Write a month's deliverables to out_dir: projects.csv, aggregates.json, the
+    quality report, changes.csv (when there is an earlier month) and the charts.
+
+    Returns:
+        {'dir', 'files': {name: bytes}}
+    """
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    normalized.to_csv(out / 'projects.csv', index=False)
+    (out / 'aggregates.json').write_text(json.dumps(aggregates, indent=2))
+    validation.write_quality_report(quality, out)
+    if diff is not None:
+        diff.to_csv(out / 'changes.csv', index=False)
+    for chart in sorted(Path(charts).iterdir()):
+        shutil.copy2(chart, out / chart.name)
+    return {'dir': str(out), 'files': {p.name: p.stat().st_size for p in sorted(out.iterdir()) if p.is_file()}}
+
+
+def exported_files_present(result: Dict[str, Any]) -> bool:
+    """True while every file an export wrote is still there, unchanged in size."""
+    out = Path(result['dir'])
+    return all((out / name).is_file() and (out / name).stat().st_size == size
+               for name, size in result['files'].items())
+
+
+# This module, for stages whose run() calls helpers or constants defined here
+_PIPELINE_MODULE = sys.modules[__name__]
+
+STAGES: Dict[str, Stage] = {stage.name: stage for stage in [
+    Stage('extract', extract_stage, 'frame', (extract_large_gen,)),
+    Stage('normalize', normalize_stage, 'frame', (extract_large_gen, dataset_module, change_flags, constants)),
+    Stage('validate', validate_stage, 'json', (validation, constants)),
+    Stage('aggregate', aggregate_stage, 'json'),
+    Stage('diff', diff_stage, 'frame', (_PIPELINE_MODULE, row_hashes, dataset_module, change_flags)),
+    Stage('render', render_stage, 'dir', (reports, chart_specs)),
+    Stage('export', export_stage, 'json', (validation,), check=exported_files_present),
+]}
+
+DEFAULT_REPORTS = ['county', 'cod', 'fuel', 'technology']
+
+
+def monthly_tasks(inputs_dir: Path, out_dir: Path, months: Optional[Iterable[str]] = None,
+                  reports_to_render: Iterable[str] = DEFAULT_REPORTS) -> List[Task]:
+    """
+    Tasks for every month under inputs_dir (or the listed 'YYYY/MM' months).
+
+    Each month's diff is against the month before it in inputs_dir, even when that
+    month is not itself listed.
+
+    Args:
+        inputs_dir: Directory holding inputs/<year>/<month>/file.xlsx
+        out_dir: Exports go to out_dir/<year>/<month>/
+        months: Optional subset of months to run
+        reports_to_render: Report types to render (see reports.REPORT_RENDERERS)
+
+    Returns:
+        Tasks in dependency order
+
+    Raises:
+        ValueError: If a listed month has no workbook
+    """
+    files = input_files(inputs_dir)
+    periods = [period for period, _ in files]
+    wanted = set(months) if months else set(periods)
+    missing = wanted - set(periods)
+    if missing:
+        raise ValueError(f"No workbook for {', '.join(sorted(missing))} under {inputs_dir}")
+
+    tasks: List[Task] = []
+    added = set()
+
+    def source_tasks(period: str, path: Path) -> None:
+        if period in added:
+            return
+        added.add(period)
+        tasks.append(Task(f"extract:{period}", 'extract', params={'path': str(path)}, sources=(path,)))
+        tasks.append(Task(f"normalize:{period}", 'normalize', {'extracted': f"extract:{period}"}))
+
+    for i, (period, path) in enumerate(files):
+        if period not in wanted:
+            continue
+        source_tasks(period, path)
+        deps = {
+            'normalized': f"normalize:{period}",
+            'quality': f"validate:{period}",
+            'aggregates': f"aggregate:{period}",
+            'charts': f"render:{period}",
+        }
+        tasks.append(Task(f"validate:{period}", 'validate', {'extracted': f"extract:{period}"}))
+        tasks.append(Task(f"aggregate:{period}", 'aggregate', {'normalized': f"normalize:{period}"}))
+        if i > 0:
+            prev_period, prev_path = files[i - 1]
+            source_tasks(prev_period, prev_path)
+            tasks.append(Task(f"diff:{period}", 'diff', {'base': f"normalize:{prev_period}",
+                                                         'target': f"normalize:{period}"}))
+            deps['diff'] = f"diff:{period}"
+        tasks.append(Task(f"render:{period}", 'render', {'normalized': f"normalize:{period}"},
+                          {'reports_to_render': list(reports_to_render)}))
+        tasks.append(Task(f"export:{period}", 'export', deps, {'out_dir': str(Path(out_dir) / period)}))
+    return tasks
+
+
+# ---------------------------------------------------------------------------
+# Executor
+# ---------------------------------------------------------------------------
+
+def stage_version(stage: Stage) -> str:
+    """Hash of the stage function's source and its modules' source files."""
+    digest = hashlib.sha256(inspect.getsource(stage.run).encode('utf-8'))
+    for module in stage.modules:
+        digest.update(Path(module.__file__).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+class StageStore:
+    """
+    Stage outputs on disk, as <root>/<stage>/<key>.arrow, .json or a <key>/ directory.
+
+    Outputs are written to a temporary name and renamed into place, so an
+    interrupted run never leaves a partial output under a valid key.
+    """
+
+    SUFFIXES = {'frame': '.arrow', 'json': '.json', 'dir': ''}
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def path_for(self, stage: Stage, key: str) -> Path:
+        return self.root / stage.name / f"{key}{self.SUFFIXES[stage.codec]}"
+
+    def has(self, stage: Stage, key: str) -> bool:
+        return self.path_for(stage, key).exists()
+
+    def load(self, stage: Stage, key: str) -> Any:
+        path = self.path_for(stage, key)
+        if stage.codec == 'frame':
+            return frame_from_table(pa.ipc.open_file(pa.memory_map(str(path), 'r')).read_all())
+        if stage.codec == 'json':
+            return json.loads(path.read_text())
+        return path
+
+    def save(self, stage: Stage, key: str, produce: Callable[[Optional[Path]], Any]) -> Any:
+        """
+        Store the output of produce(work_dir) (work_dir only for 'dir' stages).
+
+        Returns:
+            The output as load() would return it
+        """
+        path = self.path_for(stage, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if stage.codec == 'dir':
+            work_dir = Path(tempfile.mkdtemp(prefix='.tmp-', dir=path.parent))
+            try:
+                produce(work_dir)
+                shutil.rmtree(path, ignore_errors=True)
+                os.replace(work_dir, path)
+            finally:
+                shutil.rmtree(work_dir, ignore_errors=True)
+            return path
+
+        value = produce(None)
+        fd, tmp_name = tempfile.mkstemp(prefix='.tmp-', dir=path.parent)
+        try:
+            with os.fdopen(fd, 'wb') as handle:
+                if stage.codec == 'frame':
+                    table = frame_to_table(value.reset_index(drop=True))
+                    with pa.ipc.new_file(handle, table.schema) as writer:
+                        writer.write_table(table)
+                else:
+                    handle.write(json.dumps(value, indent=1, default=str).encode('utf-8'))
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return value
+
+
+def task_keys(tasks: List[Task], stages: Dict[str, Stage] = STAGES) -> Dict[str, str]:
+    """
+    Key of every task: a hash of its stage's code version, its sources' content hashes,
+    its upstream keys and its parameters.
+
+    Raises:
+        ValueError: If a task names an unknown stage or depends on a task not listed before it
+    """
+    versions: Dict[str, str] = {}
+    keys: Dict[str, str] = {}
+    for task in tasks:
+        if task.stage not in stages:
+            raise ValueError(f"Task {task.id}: unknown stage '{task.stage}'")
+        for dep in task.deps.values():
+            if dep not in keys:
+                raise ValueError(f"Task {task.id} depends on {dep}, which is not listed before it")
+        if task.stage not in versions:
+            versions[task.stage] = stage_version(stages[task.stage])
+        payload = json.dumps([task.stage, versions[task.stage], [file_fingerprint(Path(p)) for p in task.sources],
+                              {name: keys[dep] for name, dep in sorted(task.deps.items())}, task.params],
+                             sort_keys=True, default=str)
+        keys[task.id] = hashlib.sha256(payload.encode('utf-8')).hexdigest()[:20]
+    return keys
+
+
+def run_pipeline(tasks: List[Task], store: StageStore, force: Iterable[str] = (),
+                 stages: Dict[str, Stage] = STAGES,
+                 progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """
+    Run the tasks whose stored output is missing (or whose stage is forced).
+
+    Outputs of skipped tasks are loaded only when a task that runs needs them, and
+    every output is released once no remaining task depends on it.
+    A failed task is recorded and its dependents are skipped; other tasks still run.
+
+    Args:
+        tasks: Tasks in dependency order (see monthly_tasks)
+        store: Where stage outputs live
+        force: Stage names to rerun even when their output is stored
+        stages: Stage definitions by name
+        progress: Optional callback receiving each task's manifest entry as it finishes
+
+    Returns:
+        Run manifest: {'started', 'elapsed_s', 'counts': {status: n}, 'tasks': [...]}
+    """
+    started = datetime.datetime.now(datetime.timezone.utc)
+    start = time.perf_counter()
+    keys = task_keys(tasks, stages)
+    by_id = {task.id: task for task in tasks}
+    force = set(force)
+    pending = Counter(dep for task in tasks for dep in task.deps.values())
+    values: Dict[str, Any] = {}
+    failed: set = set()
+    entries = []
+
+    def value_of(task_id: str) -> Any:
+        if task_id not in values:
+            task = by_id[task_id]
+            values[task_id] = store.load(stages[task.stage], keys[task_id])
+        return values[task_id]
+
+    for task in tasks:
+        stage = stages[task.stage]
+        key = keys[task.id]
+        entry = {'task': task.id, 'stage': task.stage, 'key': key}
+        task_start = time.perf_counter()
+
+        if any(dep in failed for dep in task.deps.values()):
+            entry['status'] = 'skipped'
+            failed.add(task.id)
+        elif (task.stage not in force and store.has(stage, key)
+              and (stage.check is None or stage.check(store.load(stage, key)))):
+            entry['status'] = 'cached'
+        else:
+            try:
+                args = {name: value_of(dep) for name, dep in task.deps.items()}
+                if stage.codec == 'dir':
+                    values[task.id] = store.save(stage, key, lambda work_dir: stage.run(work_dir, **args, **task.params))
+                else:
+                    values[task.id] = store.save(stage, key, lambda _: stage.run(**args, **task.params))
+                entry['status'] = 'ran'
+            except Exception as e:
+                entry['status'] = 'failed'
+                entry['error'] = f"{type(e).__name__}: {e}"
+                failed.add(task.id)
+        entry['seconds'] = round(time.perf_counter() - task_start, 3)
+        entries.append(entry)
+        if progress is not None:
+            progress(entry)
+
+        for dep in task.deps.values():
+            pending[dep] -= 1
+            if pending[dep] <= 0:
+                values.pop(dep, None)
+        if pending[task.id] <= 0:
+            values.pop(task.id, None)
+
+    return {
+        'started': started.isoformat(timespec='seconds'),
+        'elapsed_s': round(time.perf_counter() - start, 3),
+        'counts': dict(Counter(entry['status'] for entry in entries)),
+        'tasks': entries,
+    }
+
+
+def write_run_manifest(manifest: Dict[str, Any], runs_dir: Path) -> Path:
+    """Write a run manifest as runs_dir/run-<UTC timestamp>.json and latest.json."""
+    runs_dir.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.datetime.fromisoformat(manifest['started']).strftime('%Y%m%dT%H%M%SZ')
+    path = runs_dir / f"run-{stamp}.json"
+    text = json.dumps(manifest, indent=2)
+    path.write_text(text)
+    (runs_dir / 'latest.json').write_text(text)
+    return path
+
+
+def main():
+    """
+    Run the monthly pipeline, executing only the stages whose inputs or code changed.
+    """
+    project_root = Path(__file__).parent.parent
+    parser = argparse.ArgumentParser(
+        description='Run the monthly pipeline (extract, normalize, validate, aggregate, diff, render, export)',
+        epilog='Example: python src/pipeline.py --months 2026/01 --force render'
+    )
+    parser.add_argument('--inputs', default=str(project_root / 'inputs'), help='Input workbooks directory (default: inputs/)')
+    parser.add_argument('--out', default=str(project_root / 'outputs' / 'pipeline'),
+                        help='Exports go to <out>/<year>/<month>/, stage outputs to <out>/cache, '
+                             'run manifests to <out>/runs (default: outputs/pipeline)')
+    parser.add_argument('--months', nargs='+', default=None, metavar='YYYY/MM', help='Months to run (default: all)')
+    parser.add_argument('--reports', nargs='+', choices=list(reports.REPORT_RENDERERS), default=DEFAULT_REPORTS,
+                        help=f"Charts to render (default: {' '.join(DEFAULT_REPORTS)})")
+    parser.add_argument('--force', nargs='+', choices=list(STAGES), default=[], help='Stages to rerun regardless of cache')
+    args = parser.parse_args()
+
+    out = Path(args.out)
+    try:
+        tasks = monthly_tasks(Path(args.inputs), out, args.months, args.reports)
+    except ValueError as e:
+        parser.error(str(e))
+    if not tasks:
+        parser.error(f"No workbooks under {args.inputs}")
+
+    print("=" * 80)
+    print(f"PIPELINE: {len(tasks)} tasks -> {out}")
+    print("=" * 80)
+
+    def report(entry: Dict[str, Any]) -> None:
+        mark = {'ran': '✓', 'cached': '·', 'failed': '✗', 'skipped': '-'}[entry['status']]
+        print(f"  {mark} {entry['task']:<20} {entry['status']:<8} {entry['seconds']:>8.2f}s  {entry['key']}")
+        if 'error' in entry:
+            print(f"      {entry['error']}")
+
+    manifest = run_pipeline(tasks, StageStore(out / 'cache'), force=args.force, progress=report)
+    path = write_run_manifest(manifest, out / 'runs')
+    counts = ', '.join(f"{n} {status}" for status, n in sorted(manifest['counts'].items()))
+    print(f"\n{'✗' if manifest['counts'].get('failed') else '✓'} {counts} in {manifest['elapsed_s']:.1f}s "
+          f"(manifest: {path})")
+    if manifest['counts'].get('failed'):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Texas Grid Interconnect Reporter - SQL Query Engine
+Loads every report month into an in-process SQLite database so ad-hoc questions
+(totals by zone over time, projects whose COD slipped twice, ...) are one SELECT
+instead of a new pandas endpoint. Queries run read-only, under a time limit and a
+row cap, against these tables and views:
+
+- projects: one row per project per report month (report_month 'YYYY/MM', snake_case
+  columns of the ERCOT sheet plus cod_date, quarter, fuel_type, technology_type)
+- months: report_month, prev_month, fingerprint, projects, capacity_mw
+- change_types: the change-indicator types (name, bit, label)
+- flags: one row per change type flagged on a project in a month
+- changes: one row per tracked field that differs for a project between a month and
+  the month before it
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from change_flags import CHANGE_FLAGS_COLUMN, CHANGE_TYPES
+from dataset import MonthDataset
+
+
+DEFAULT_TIMEOUT_SECONDS = float(os.environ.get('TGIR_QUERY_TIMEOUT', '5'))
+DEFAULT_MAX_ROWS = 1000
+MAX_ROWS = int(os.environ.get('TGIR_QUERY_MAX_ROWS', '10000'))
+
+# Longest string or blob a query may build (guards against zeroblob/replace blow-ups)
+MAX_VALUE_BYTES = 16 * 1024 * 1024
+
+# Column names that read better than their slug; every other column is slugified
+COLUMN_NAMES = {
+    'INR': 'inr',
+    'GIM Study Phase': 'phase',
+    'CDR Reporting Zone': 'zone',
+    'Capacity (MW)': 'capacity_mw',
+    'COD Date': 'cod_date',
+    'Fuel_Normalized': 'fuel_type',
+    'Technology_Normalized': 'technology_type',
+    CHANGE_FLAGS_COLUMN: 'change_flags',
+}
+
+# projects columns compared month over month by the changes view
+TRACKED_COLUMNS = ['project_name', 'phase', 'interconnecting_entity', 'poi_location', 'county', 'zone',
+                   'projected_cod', 'fuel', 'technology', 'capacity_mw']
+
+# Authorizer actions a query may perform; everything else (writes, DDL, PRAGMA, ATTACH) is denied
+_ALLOWED_ACTIONS = {sqlite3.SQLITE_SELECT, sqlite3.SQLITE_READ, sqlite3.SQLITE_FUNCTION,
+                    getattr(sqlite3, 'SQLITE_RECURSIVE', 33)}
+
+# SQLite VM instructions between time-limit checks
+_PROGRESS_STEPS = 10000
+
+
+class QueryError(ValueError):
+    """A query was rejected, failed, or ran past its time limit."""
+
+
+def sql_column(name: str) -> str:
+    """SQL name of a month frame column (e.g. 'Capacity (MW)' -> 'capacity_mw')."""
+    if name in COLUMN_NAMES:
+        return COLUMN_NAMES[name]
+    if name.startswith('Change indicators'):
+        return 'change_indicators'
+    return re.sub(r'[^a-z0-9]+', '_', name.lower()).strip('_')
+
+
+def _sql_values(series: pd.Series) -> List[Any]:
+    # Dates become ISO text (so SQLite's date functions apply); blanks become NULL
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return [None if pd.isna(v) else v.strftime('%Y-%m-%d') for v in series]
+    if pd.api.types.is_integer_dtype(series) or pd.api.types.is_bool_dtype(series):
+        return [int(v) for v in series]
+    if pd.api.types.is_float_dtype(series):
+        return [None if np.isnan(v) else float(v) for v in series]
+    values = []
+    for v in series:
+        if v is None or v is pd.NaT or (isinstance(v, float) and np.isnan(v)):
+            values.append(None)
+        elif isinstance(v, pd.Timestamp):
+            values.append(v.strftime('%Y-%m-%d') if v == v.normalize() else v.isoformat())
+        elif isinstance(v, np.generic):
+            values.append(v.item())
+        elif isinstance(v, (int, float, str)):
+            values.append(v)
+        else:
+            values.append(str(v))
+    return values
+
+
+def _allow_all(*_) -> int:
+    # Stands in for set_authorizer(None), which Python before 3.11 does not accept
+    return sqlite3.SQLITE_OK
+
+
+def _authorize(action: int, arg1: Optional[str], arg2: Optional[str], *_) -> int:
+    if action not in _ALLOWED_ACTIONS:
+        return sqlite3.SQLITE_DENY
+    if action == sqlite3.SQLITE_FUNCTION and arg2 and arg2.lower() == 'load_extension':
+        return sqlite3.SQLITE_DENY
+    return sqlite3.SQLITE_OK
+
+
+class QueryEngine:
+    """
+    In-memory SQLite database of report months.
+
+    sync() brings the database in line with a list of months, reloading only months
+    whose workbook hash changed; query() runs one read-only SELECT. Both hold a lock,
+    so one engine can be shared between request threads.
+    """
+
+    # Declared up front so the views never depend on which sheet columns a month has
+    CORE_COLUMNS = ['report_month', 'inr', 'project_name', 'county', 'change_flags']
+
+    def __init__(self):
+        self._conn = sqlite3.connect(':memory:', check_same_thread=False)
+        if hasattr(self._conn, 'setlimit'):  # Python 3.11+; older builds keep SQLite's 1 GB default
+            self._conn.setlimit(sqlite3.SQLITE_LIMIT_LENGTH, MAX_VALUE_BYTES)
+        self._lock = threading.Lock()
+        self._columns: List[str] = list(self.CORE_COLUMNS)
+        self._months: Dict[str, str] = {}  # report_month -> fingerprint
+        with self._conn:
+            self._conn.execute(f"CREATE TABLE projects ({', '.join(self.CORE_COLUMNS)})")
+            self._conn.execute("CREATE INDEX projects_month_inr ON projects (report_month, inr)")
+            self._conn.execute("CREATE TABLE months (report_month TEXT PRIMARY KEY, prev_month TEXT, "
+                               "fingerprint TEXT, projects INTEGER, capacity_mw REAL)")
+            self._conn.execute("CREATE TABLE change_types (name TEXT PRIMARY KEY, bit INTEGER, label TEXT)")
+            self._conn.executemany("INSERT INTO change_types VALUES (?, ?, ?)",
+                                   [(name, change.bit, change.label) for name, change in CHANGE_TYPES.items()])
+            self._create_views()
+
+    @property
+    def months(self) -> Dict[str, str]:
+        """Loaded report months ('YYYY/MM' -> workbook hash), oldest first."""
+        return dict(self._months)
+
+    def sync(self, datasets: Iterable[MonthDataset], unchanged: Iterable[str] = ()) -> List[str]:
+        """
+        Make the database hold exactly these months.
+
+        datasets is consumed one month at a time, so a generator that loads each month
+        on demand keeps only one month's frame alive. Months the caller already knows
+        to be current (their hash matches `months`) can be passed as `unchanged`
+        instead, so they need not be loaded at all.
+
+        Args:
+            datasets: One MonthDataset per report month to load or check
+            unchanged: Report months to keep as they are
+
+        Returns:
+            Report months that were (re)loaded
+        """
+        with self._lock, self._conn:
+            loaded = []
+            seen = {period for period in unchanged if period in self._months}
+            for dataset in datasets:
+                period = dataset.period
+                seen.add(period)
+                if self._months.get(period) == dataset.fingerprint:
+                    continue
+                self._conn.execute("DELETE FROM projects WHERE report_month = ?", (period,))
+                self._insert(period, dataset.frame)
+                self._months[period] = dataset.fingerprint
+                loaded.append(period)
+            dropped = [period for period in self._months if period not in seen]
+            for period in dropped:
+                self._conn.execute("DELETE FROM projects WHERE report_month = ?", (period,))
+                del self._months[period]
+            if loaded or dropped:
+                self._months = dict(sorted(self._months.items()))
+                self._refresh_months()
+            return loaded
+
+    def _insert(self, period: str, frame: pd.DataFrame) -> None:
+        names = [sql_column(str(c)) for c in frame.columns]
+        for name in names:
+            if name not in self._columns:
+                self._conn.execute(f'ALTER TABLE projects ADD COLUMN "{name}"')
+                self._columns.append(name)
+        columns = [[period] * len(frame)] + [_sql_values(frame[c]) for c in frame.columns]
+        placeholders = ', '.join('?' * (len(names) + 1))
+        quoted = ', '.join(f'"{name}"' for name in ['report_month'] + names)
+        self._conn.executemany(f"INSERT INTO projects ({quoted}) VALUES ({placeholders})", zip(*columns))
+
+    def _refresh_months(self) -> None:
+        self._conn.execute("DELETE FROM months")
+        periods = list(self._months)
+        capacity = 'SUM(capacity_mw)' if 'capacity_mw' in self._columns else 'NULL'
+        for prev, period in zip([None] + periods, periods):
+            self._conn.execute(
+                f"INSERT INTO months SELECT ?, ?, ?, COUNT(*), {capacity} FROM projects WHERE report_month = ?",
+                (period, prev, self._months[period], period))
+        # New sheet columns may have become trackable
+        self._create_views()
+
+    def _create_views(self) -> None:
+        self._conn.execute("DROP VIEW IF EXISTS flags")
+        self._conn.execute(
+            "CREATE VIEW flags AS SELECT p.report_month, p.inr, p.project_name, p.county, "
+            "t.name AS change_type, t.label FROM projects p JOIN change_types t ON p.change_flags & t.bit")
+
+        branches = [
+            f"SELECT m.report_month, m.prev_month, b.inr, b.project_name, b.county, '{name}' AS field, "
+            f"a.{name} AS old_value, b.{name} AS new_value "
+            f"FROM months m JOIN projects a ON a.report_month = m.prev_month "
+            f"JOIN projects b ON b.report_month = m.report_month AND b.inr = a.inr WHERE a.{name} IS NOT b.{name}"
+            for name in TRACKED_COLUMNS if name in self._columns
+        ]
+        self._conn.execute("DROP VIEW IF EXISTS changes")
+        self._conn.execute("CREATE VIEW changes AS " + " UNION ALL ".join(branches))
+
+    def schema(self) -> Dict[str, List[str]]:
+        """Column names of every table and view, keyed by name."""
+        with self._lock:
+            names = [row[0] for row in self._conn.execute(
+                "SELECT name FROM sqlite_master WHERE type IN ('table', 'view') ORDER BY type, name")]
+            return {name: [row[1] for row in self._conn.execute(f'PRAGMA table_info("{name}")')] for name in names}
+
+    def query(self, sql: str, max_rows: int = DEFAULT_MAX_ROWS,
+              timeout: float = DEFAULT_TIMEOUT_SECONDS) -> Dict[str, Any]:
+        """
+        Run one read-only SELECT.
+
+        Args:
+            sql: A single SELECT (or WITH ... SELECT) statement
+            max_rows: Rows to return (capped at MAX_ROWS); later rows are dropped
+            timeout: Seconds the query may run, fetching included
+
+        Returns:
+            {'columns', 'rows' (lists), 'row_count', 'truncated', 'elapsed_ms'}
+
+        Raises:
+            QueryError: If the statement is not a read, fails, or exceeds the time limit
+        """
+        max_rows = max(1, min(int(max_rows), MAX_ROWS))
+        start = time.perf_counter()
+        deadline = start + timeout
+
+        with self._lock:
+            self._conn.set_authorizer(_authorize)
+            self._conn.set_progress_handler(lambda: time.perf_counter() > deadline, _PROGRESS_STEPS)
+            try:
+                cursor = self._conn.execute(sql)
+                columns = [d[0] for d in cursor.description or []]
+                rows = cursor.fetchmany(max_rows + 1)
+                cursor.close()
+            except sqlite3.Warning as e:
+                raise QueryError(str(e)) from e
+            except sqlite3.Error as e:
+                if time.perf_counter() > deadline:
+                    raise QueryError(f"Query exceeded the {timeout:g}s time limit") from e
+                raise QueryError(str(e)) from e
+            finally:
+                self._conn.set_progress_handler(None, 0)
+                self._conn.set_authorizer(_allow_all)
+                if self._conn.in_transaction:
+                    self._conn.rollback()
+
+        if not columns:
+            raise QueryError("Only SELECT statements are allowed")
+        truncated = len(rows) > max_rows
+        rows = rows[:max_rows]
+        return {
+            'columns': columns,
+            'rows': [list(row) for row in rows],
+            'row_count': len(rows),
+            'truncated': truncated,
+            'elapsed_ms': round((time.perf_counter() - start) * 1000, 2),
+        }
+
+
+def main():
+    """
+    Run a SQL query over every bundled month.
+    """
+    from dataset import MonthDatasetCache, input_files
+    from ingest import default_snapshot_store
+
+    parser = argparse.ArgumentParser(
+        description='Query every report month with SQL (tables: projects, months, change_types; '
+                    'views: flags, changes)',
+        epilog="Example: python src/query_engine.py \"SELECT report_month, zone, SUM(capacity_mw) "
+               "FROM projects GROUP BY 1, 2\""
+    )
+    project_root = Path(__file__).parent.parent
+    parser.add_argument('sql', nargs='?', help='SELECT statement (omit with --schema)')
+    parser.add_argument('--inputs', default=str(project_root / 'inputs'), help='Input workbooks directory (default: inputs/)')
+    parser.add_argument('--schema', action='store_true', help='List tables, views and their columns')
+    parser.add_argument('--max-rows', type=int, default=DEFAULT_MAX_ROWS, help=f'Row cap (default: {DEFAULT_MAX_ROWS})')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT_SECONDS,
+                        help=f'Time limit in seconds (default: {DEFAULT_TIMEOUT_SECONDS:g})')
+    parser.add_argument('--format', choices=['table', 'csv', 'json'], default='table', help='Output format (default: table)')
+    args = parser.parse_args()
+    if not args.sql and not args.schema:
+        parser.error('give a SELECT statement or --schema')
+
+    # Build-time snapshots (TGIR_SNAPSHOT_DIR) spare the Excel parsing when present
+    cache = MonthDatasetCache(snapshots=default_snapshot_store(), max_entries=1)
+    engine = QueryEngine()
+    files = input_files(Path(args.inputs))
+    if not files:
+        parser.error(f"No workbooks under {args.inputs}")
+    engine.sync(cache.get(path)[0] for _, path in files)
+
+    if args.schema:
+        for name, columns in engine.schema().items():
+            print(f"{name}: {', '.join(columns)}")
+        return
+
+    try:
+        result = engine.query(args.sql, max_rows=args.max_rows, timeout=args.timeout)
+    except QueryError as e:
+        print(f"✗ {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.format == 'json':
+        print(json.dumps(result, indent=2, default=str))
+    elif args.format == 'csv':
+        writer = csv.writer(sys.stdout)
+        writer.writerow(result['columns'])
+        writer.writerows(result['rows'])
+    else:
+        print(pd.DataFrame(result['rows'], columns=result['columns']).to_string(index=False))
+        note = ' (truncated)' if result['truncated'] else ''
+        print(f"\n✓ {result['row_count']} rows{note} in {result['elapsed_ms']:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
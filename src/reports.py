@@ -11,10 +11,211 @@ from pathlib import Path
 from datetime import datetime
 import sys
 import argparse
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 from extract_large_gen import extract_large_gen_data
+from artifact_store import ArtifactStore
+from chart_specs import (ChartSpec, build_chart_spec, cod_spec, county_fuel_spec, county_spec, fuel_spec,
+                         limit_categories, technology_spec)
+from cod_index import CodIndex
+from dataset import MonthDataset, MonthDatasetCache, input_files
+from shared_store import SharedMonthStore
 
 
-def generate_county_fuel_report(df: pd.DataFrame, output_dir: Path, quarters: list = None) -> None:
+# Layout of the pie + table reports, by report type
+PIE_STYLES = {
+    'fuel': {'figsize': (16, 8), 'fontsize': 10, 'pct_fontsize': None, 'col_widths': [0.35, 0.2, 0.25, 0.2]},
+    'technology': {'figsize': (18, 8), 'fontsize': 9, 'pct_fontsize': 8, 'col_widths': [0.45, 0.18, 0.2, 0.17]},
+}
+
+
+def plot_barh(spec: ChartSpec) -> plt.Figure:
+    """Horizontal bar chart with value labels (county)."""
+    series = spec['series'][0]
+    categories, values = spec['categories'], series['values']
+    fig, ax = plt.subplots(figsize=(12, max(8, len(categories) * 0.3)))
+
+    ax.barh(range(len(categories)), values, color=series['color'])
+    ax.set_yticks(range(len(categories)))
+    ax.set_yticklabels(categories, fontsize=9)
+    ax.set_xlabel(spec['x_label'], fontsize=12, fontweight='bold')
+    ax.set_title(spec['title'], fontsize=14, fontweight='bold', pad=20)
+
+    # Add value labels on bars
+    for i, value in enumerate(values):
+        ax.text(value, i, f' {value:.1f}', va='center', fontsize=8)
+
+    ax.grid(axis='x', alpha=0.3, linestyle='--')
+    return fig
+
+
+def plot_stacked_barh(spec: ChartSpec) -> plt.Figure:
+    """Horizontal bars stacked by series, with a legend (county + fuel)."""
+    categories = spec['categories']
+    fig, ax = plt.subplots(figsize=(14, max(10, len(categories) * 0.4)))
+
+    left = [0.0] * len(categories)
+    for series in spec['series']:
+        ax.barh(categories, series['values'], height=0.8, left=left, color=series['color'], label=series['name'])
+        left = [a + b for a, b in zip(left, series['values'])]
+    ax.set_ylim(-0.5, len(categories) - 0.5)
+
+    ax.set_xlabel(spec['x_label'], fontsize=12, fontweight='bold')
+    ax.set_ylabel(spec['y_label'], fontsize=12, fontweight='bold')
+    title = spec['title']
+    if spec.get('subtitle'):
+        title += f"\n({spec['subtitle']})"
+    ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+
+    ax.legend(title=spec['legend_title'], bbox_to_anchor=(1.05, 1), loc='upper left')
+    ax.grid(axis='x', alpha=0.3, linestyle='--')
+    return fig
+
+
+def plot_bar(spec: ChartSpec) -> plt.Figure:
+    """Vertical bar chart with value labels (COD quarters)."""
+    series = spec['series'][0]
+    categories, values = spec['categories'], series['values']
+    fig, ax = plt.subplots(figsize=(max(12, len(categories) * 0.4), 8))
+
+    x_positions = range(len(categories))
+    ax.bar(x_positions, values, color=series['color'], width=0.7)
+
+    ax.set_xticks(x_positions)
+    ax.set_xticklabels(categories, rotation=45, ha='right', fontsize=9)
+    ax.set_ylabel(spec['y_label'], fontsize=12, fontweight='bold')
+    ax.set_xlabel(spec['x_label'], fontsize=12, fontweight='bold')
+    ax.set_title(spec['title'], fontsize=14, fontweight='bold', pad=20)
+
+    # Add value labels on bars
+    for i, value in enumerate(values):
+        ax.text(i, value, str(value), ha='center', va='bottom', fontsize=9, fontweight='bold')
+
+    ax.grid(axis='y', alpha=0.3, linestyle='--')
+    return fig
+
+
+def plot_pie_table(spec: ChartSpec) -> plt.Figure:
+    """Pie chart of MW share next to the detailed breakdown table (fuel, technology)."""
+    style = PIE_STYLES[spec['report']]
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=style['figsize'])
+
+    # Pie chart for MW distribution
+    wedges, texts, autotexts = ax1.pie(spec['series'][0]['values'], labels=spec['categories'], autopct='%1.1f%%',
+                                       colors=spec['colors'], startangle=90,
+                                       textprops={'fontsize': style['fontsize']})
+
+    # Make percentage text bold
+    for autotext in autotexts:
+        autotext.set_color('white')
+        autotext.set_fontweight('bold')
+        if style['pct_fontsize']:
+            autotext.set_fontsize(style['pct_fontsize'])
+
+    ax1.set_title('Distribution by Total MW Capacity', fontsize=12, fontweight='bold', pad=20)
+
+    # Table with detailed breakdown
+    table_data = [[label, f"{count}", f"{mw:.1f}", f"{pct:.1f}%"]
+                  for label, count, mw, pct in spec['table']['rows']]
+    table = ax2.table(cellText=table_data,
+                      colLabels=spec['table']['columns'],
+                      cellLoc='left',
+                      loc='center',
+                      colWidths=style['col_widths'])
+
+    table.auto_set_font_size(False)
+    table.set_fontsize(style['fontsize'])
+    table.scale(1, 2)
+
+    # Style the header row
+    for i in range(4):
+        table[(0, i)].set_facecolor('#2E86AB')
+        table[(0, i)].set_text_props(weight='bold', color='white')
+
+    # Alternate row colors
+    for i in range(1, len(table_data) + 1):
+        for j in range(4):
+            if i % 2 == 0:
+                table[(i, j)].set_facecolor('#F0F0F0')
+
+    ax2.axis('off')
+    ax2.set_title('Detailed Breakdown', fontsize=12, fontweight='bold', pad=20)
+
+    plt.suptitle(spec['title'], fontsize=14, fontweight='bold', y=0.98)
+    return fig
+
+
+# Chart spec kind -> matplotlib plotter
+SPEC_PLOTTERS = {
+    'barh': plot_barh,
+    'stacked-barh': plot_stacked_barh,
+    'bar': plot_bar,
+    'pie': plot_pie_table,
+}
+
+
+class RenderTier(NamedTuple):
+    """
+    Output resolution of a rendered chart.
+
+    Attributes:
+        dpi: Dots per inch (vector formats keep text and shapes sharp regardless)
+        max_categories: Largest bars kept in horizontal bar charts, or None for all
+    """
+    dpi: int
+    max_categories: Optional[int] = None
+
+
+# Resolution tiers: Dashboard previews, on-screen viewing, print/download
+RENDER_TIERS = {
+    'thumbnail': RenderTier(dpi=40, max_categories=12),
+    'screen': RenderTier(dpi=100),
+    'print': RenderTier(dpi=300),
+}
+
+# Cheap tiers, rendered ahead of requests; print is only rendered when first asked for
+EAGER_TIERS = ('thumbnail', 'screen')
+
+# Output formats (WebP goes through Pillow)
+CHART_FORMATS = ('png', 'svg', 'webp')
+
+# WebP images are limited to this many pixels per side
+WEBP_MAX_PIXELS = 16383
+
+
+def render_chart_spec(spec: ChartSpec, output_path: Path, tier: str = 'print') -> None:
+    """
+    Draw a chart spec (see chart_specs) with matplotlib and save it at a resolution tier.
+
+    The format follows output_path's suffix (see CHART_FORMATS).
+
+    Args:
+        spec: Chart spec from chart_specs.build_chart_spec
+        output_path: Image file to write
+        tier: Resolution tier (see RENDER_TIERS)
+    """
+    settings = RENDER_TIERS[tier]
+    if settings.max_categories:
+        spec = limit_categories(spec, settings.max_categories)
+    fig = SPEC_PLOTTERS[spec['kind']](spec)
+    fig.tight_layout()
+    dpi = settings.dpi
+    if output_path.suffix == '.webp':
+        # Leave room for the legend the tight bounding box may add beside the axes
+        dpi = min(dpi, int(WEBP_MAX_PIXELS * 0.9 / max(fig.get_size_inches())))
+    fig.savefig(output_path, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+
+
+def generate_county_fuel_report(df: pd.DataFrame, output_dir: Path, quarters: list = None,
+                                tier: str = 'print', fmt: str = 'png') -> None:
     """
     Generate a stacked bar chart showing MW capacity by county and fuel type.
     
@@ -22,372 +223,410 @@ def generate_county_fuel_report(df: pd.DataFrame, output_dir: Path, quarters: li
         df: DataFrame containing the Large Gen project details
         output_dir: Directory to save the output chart
         quarters: Optional list of quarters to filter by (e.g. ['2024Q1', '2024Q2'])
+        tier: Resolution tier (see RENDER_TIERS)
+        fmt: Image format (see CHART_FORMATS)
     """
-    from constants import normalize_fuel_type, FUEL_COLORS
-    
     print("\n" + "=" * 80)
     print("REPORT 5: County + Fuel Type MW Breakdown")
     print("=" * 80)
     
-    # Filter by quarters if provided
-    df_filtered = df.copy()
     if quarters:
         print(f"Filtering by quarters: {', '.join(quarters)}")
-        # Ensure Projected COD is datetime
-        df_filtered['Projected COD'] = pd.to_datetime(df_filtered['Projected COD'], errors='coerce')
-        # Create quarter column
-        df_filtered['Quarter'] = df_filtered['Projected COD'].dt.to_period('Q').astype(str)
-        # Filter
-        df_filtered = df_filtered[df_filtered['Quarter'].isin(quarters)]
+    spec = county_fuel_spec(df, quarters=quarters)
         
-    if len(df_filtered) == 0:
+    if not spec['categories']:
         print("No data found for the selected criteria.")
         return
 
-    # Normalize fuel types
-    df_filtered['Fuel_Normalized'] = df_filtered['Fuel'].apply(normalize_fuel_type)
-    
-    # Aggregate by County and Fuel Type
-    pivot_data = df_filtered.groupby(['County', 'Fuel_Normalized'])['Capacity (MW)'].sum().unstack(fill_value=0)
-    
-    # Sort by total capacity
-    pivot_data['Total'] = pivot_data.sum(axis=1)
-    pivot_data = pivot_data.sort_values('Total', ascending=True)
-    pivot_data = pivot_data.drop('Total', axis=1)
-    
-    # Take top 20 counties if there are too many
-    if len(pivot_data) > 20:
-        print(f"Showing top 20 counties out of {len(pivot_data)}")
-        pivot_data = pivot_data.tail(20)
+    if spec['county_count'] > len(spec['categories']):
+        print(f"Showing top {len(spec['categories'])} counties out of {spec['county_count']}")
         
-    print(f"\nTotal Counties in Report: {len(pivot_data)}")
-    print(f"Total MW Capacity: {pivot_data.sum().sum():.2f} MW")
-    
-    # Create stacked horizontal bar chart
-    fig, ax = plt.subplots(figsize=(14, max(10, len(pivot_data) * 0.4)))
-    
-    # Map colors to columns
-    colors = [FUEL_COLORS.get(col, '#D3D3D3') for col in pivot_data.columns]
-    
-    pivot_data.plot(kind='barh', stacked=True, ax=ax, width=0.8, color=colors)
-    
-    ax.set_xlabel('Total Capacity (MW)', fontsize=12, fontweight='bold')
-    ax.set_ylabel('County', fontsize=12, fontweight='bold')
-    title = 'ERCOT Large Gen Projects - MW by County and Fuel Type'
-    if quarters:
-        title += f"\n(Quarters: {', '.join(quarters)})"
-    ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
-    
-    # Legend
-    ax.legend(title='Fuel Type', bbox_to_anchor=(1.05, 1), loc='upper left')
-    
-    ax.grid(axis='x', alpha=0.3, linestyle='--')
-    plt.tight_layout()
+    print(f"\nTotal Counties in Report: {len(spec['categories'])}")
+    print(f"Total MW Capacity: {spec['total_mw']:.2f} MW")
     
     # Save the chart
-    output_path = output_dir / 'county_fuel_breakdown.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    output_path = output_dir / f"county_fuel_breakdown.{fmt}"
+    render_chart_spec(spec, output_path, tier)
     print(f"\n✓ Chart saved to: {output_path}")
-    plt.close()
 
 
-def generate_county_report(df: pd.DataFrame, output_dir: Path) -> None:
+def generate_county_report(df: pd.DataFrame, output_dir: Path,
+                           tier: str = 'print', fmt: str = 'png') -> None:
     """
     Generate a horizontal bar chart showing total MW capacity by county.
     
     Args:
         df: DataFrame containing the Large Gen project details
         output_dir: Directory to save the output chart
+        tier: Resolution tier (see RENDER_TIERS)
+        fmt: Image format (see CHART_FORMATS)
     """
     print("\n" + "=" * 80)
     print("REPORT 1: County MW Breakdown")
     print("=" * 80)
     
-    # Aggregate capacity by county
-    county_data = df.groupby('County')['Capacity (MW)'].sum().sort_values(ascending=True)
-    
-    # Remove any NaN counties
-    county_data = county_data[county_data.index.notna()]
+    spec = county_spec(df)
+    counties, values = spec['categories'], spec['series'][0]['values']
     
-    print(f"\nTotal Counties: {len(county_data)}")
-    print(f"Total MW Capacity: {county_data.sum():.2f} MW")
+    print(f"\nTotal Counties: {len(counties)}")
+    print(f"Total MW Capacity: {spec['total_mw']:.2f} MW")
     print(f"\nTop 5 Counties by MW:")
-    for county, mw in county_data.tail(5).iloc[::-1].items():
+    for county, mw in list(zip(counties, values))[:-6:-1]:
         print(f"  {county}: {mw:.2f} MW")
     
-    # Create horizontal bar chart
-    fig, ax = plt.subplots(figsize=(12, max(8, len(county_data) * 0.3)))
-    
-    bars = ax.barh(range(len(county_data)), county_data.values, color='#2E86AB')
-    ax.set_yticks(range(len(county_data)))
-    ax.set_yticklabels(county_data.index, fontsize=9)
-    ax.set_xlabel('Total Capacity (MW)', fontsize=12, fontweight='bold')
-    ax.set_title('ERCOT Large Gen Projects - Total MW Capacity by County', 
-                 fontsize=14, fontweight='bold', pad=20)
-    
-    # Add value labels on bars
-    for i, (county, value) in enumerate(county_data.items()):
-        ax.text(value, i, f' {value:.1f}', va='center', fontsize=8)
-    
-    ax.grid(axis='x', alpha=0.3, linestyle='--')
-    plt.tight_layout()
-    
     # Save the chart
-    output_path = output_dir / 'county_mw_breakdown.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    output_path = output_dir / f"county_mw_breakdown.{fmt}"
+    render_chart_spec(spec, output_path, tier)
     print(f"\n✓ Chart saved to: {output_path}")
-    plt.close()
 
 
-def generate_cod_quarterly_report(df: pd.DataFrame, output_dir: Path) -> None:
+def generate_cod_quarterly_report(df: pd.DataFrame, output_dir: Path, cod_index: CodIndex = None,
+                                  tier: str = 'print', fmt: str = 'png') -> None:
     """
     Generate a vertical bar chart showing project count by quarter.
     
     Args:
         df: DataFrame containing the Large Gen project details
         output_dir: Directory to save the output chart
+        cod_index: Optional prebuilt COD index for df (e.g. MonthDataset.cod)
+        tier: Resolution tier (see RENDER_TIERS)
+        fmt: Image format (see CHART_FORMATS)
     """
     print("\n" + "=" * 80)
     print("REPORT 2: COD Quarterly Buckets")
     print("=" * 80)
     
-    # Convert Projected COD to datetime
-    df_cod = df.copy()
-    df_cod['Projected COD'] = pd.to_datetime(df_cod['Projected COD'], errors='coerce')
-    
-    # Remove rows with invalid dates
-    df_cod = df_cod[df_cod['Projected COD'].notna()]
-    
-    # Create quarter labels
-    df_cod['Quarter'] = df_cod['Projected COD'].dt.to_period('Q')
+    spec = cod_spec(df, cod_index=cod_index)
+    quarterly_counts = pd.Series(spec['series'][0]['values'], index=spec['categories'], dtype='int64')
     
-    # Count projects per quarter
-    quarterly_counts = df_cod.groupby('Quarter').size().sort_index()
-    
-    print(f"\nTotal Projects with COD: {len(df_cod)}")
-    print(f"Date Range: {df_cod['Projected COD'].min().strftime('%Y-%m-%d')} to {df_cod['Projected COD'].max().strftime('%Y-%m-%d')}")
+    print(f"\nTotal Projects with COD: {spec['total_projects']}")
+    if spec['date_range']:
+        print(f"Date Range: {spec['date_range'][0]} to {spec['date_range'][1]}")
     print(f"Total Quarters: {len(quarterly_counts)}")
     print(f"\nTop 5 Quarters by Project Count:")
     for quarter, count in quarterly_counts.nlargest(5).items():
         print(f"  {quarter}: {count} projects")
     
-    # Create vertical bar chart
-    fig, ax = plt.subplots(figsize=(max(12, len(quarterly_counts) * 0.4), 8))
-    
-    x_positions = range(len(quarterly_counts))
-    bars = ax.bar(x_positions, quarterly_counts.values, color='#A23B72', width=0.7)
-    
-    ax.set_xticks(x_positions)
-    ax.set_xticklabels([str(q) for q in quarterly_counts.index], rotation=45, ha='right', fontsize=9)
-    ax.set_ylabel('Number of Projects', fontsize=12, fontweight='bold')
-    ax.set_xlabel('Quarter', fontsize=12, fontweight='bold')
-    ax.set_title('ERCOT Large Gen Projects - Projected COD by Quarter', 
-                 fontsize=14, fontweight='bold', pad=20)
-    
-    # Add value labels on bars
-    for i, (quarter, value) in enumerate(quarterly_counts.items()):
-        ax.text(i, value, str(value), ha='center', va='bottom', fontsize=9, fontweight='bold')
-    
-    ax.grid(axis='y', alpha=0.3, linestyle='--')
-    plt.tight_layout()
-    
     # Save the chart
-    output_path = output_dir / 'cod_quarterly_buckets.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    output_path = output_dir / f"cod_quarterly_buckets.{fmt}"
+    render_chart_spec(spec, output_path, tier)
     print(f"\n✓ Chart saved to: {output_path}")
-    plt.close()
 
 
-def generate_fuel_type_report(df: pd.DataFrame, output_dir: Path) -> None:
+def print_breakdown_table(spec: ChartSpec, label_width: int) -> None:
+    """Print the table of a pie chart spec as the fuel/technology console summary."""
+    label_title = spec['table']['columns'][0]
+    print(f"\nTotal {label_title}s: {len(spec['table']['rows'])}")
+    print(f"\nBreakdown by {label_title}:")
+    print(f"{label_title:<{label_width}} {'Projects':<12} {'Total MW':<15} {'% of Total MW'}")
+    print("-" * (label_width + 47))
+    for label, count, mw, pct in spec['table']['rows']:
+        print(f"{label:<{label_width}} {count:<12} {mw:<15.2f} {pct:.1f}%")
+
+
+def generate_fuel_type_report(df: pd.DataFrame, output_dir: Path,
+                              tier: str = 'print', fmt: str = 'png') -> None:
     """
     Generate a pie chart showing distribution by fuel type with normalized names.
     
     Args:
         df: DataFrame containing the Large Gen project details
         output_dir: Directory to save the output chart
+        tier: Resolution tier (see RENDER_TIERS)
+        fmt: Image format (see CHART_FORMATS)
     """
-    from constants import normalize_fuel_type, FUEL_COLORS
-    
     print("\n" + "=" * 80)
     print("REPORT 3: Fuel Type Breakdown")
     print("=" * 80)
     
-    # Create a copy and normalize fuel types
-    df_fuel = df.copy()
-    df_fuel['Fuel_Normalized'] = df_fuel['Fuel'].apply(normalize_fuel_type)
-    
-    # Aggregate by normalized fuel type
-    fuel_counts = df_fuel.groupby('Fuel_Normalized').size().sort_values(ascending=False)
-    fuel_mw = df_fuel.groupby('Fuel_Normalized')['Capacity (MW)'].sum().sort_values(ascending=False)
-    
-    # Remove NaN/Unknown fuel types
-    fuel_counts = fuel_counts[fuel_counts.index != 'Unknown']
-    fuel_mw = fuel_mw[fuel_mw.index != 'Unknown']
-    
-    print(f"\nTotal Fuel Types: {len(fuel_counts)}")
-    print(f"\nBreakdown by Fuel Type:")
-    print(f"{'Fuel Type':<20} {'Projects':<12} {'Total MW':<15} {'% of Total MW'}")
-    print("-" * 67)
-    total_mw = fuel_mw.sum()
-    for fuel in fuel_counts.index:
-        count = fuel_counts[fuel]
-        mw = fuel_mw[fuel]
-        pct = (mw / total_mw * 100) if total_mw > 0 else 0
-        print(f"{fuel:<20} {count:<12} {mw:<15.2f} {pct:.1f}%")
-    
-    # Create figure with pie chart and table
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
-    
-    # Pie chart for MW distribution
-    # Use custom colors
-    colors = [FUEL_COLORS.get(fuel, '#D3D3D3') for fuel in fuel_mw.index]
-    wedges, texts, autotexts = ax1.pie(fuel_mw.values, labels=fuel_mw.index, autopct='%1.1f%%',
-                                         colors=colors, startangle=90, textprops={'fontsize': 10})
-    
-    # Make percentage text bold
-    for autotext in autotexts:
-        autotext.set_color('white')
-        autotext.set_fontweight('bold')
-    
-    ax1.set_title('Distribution by Total MW Capacity', fontsize=12, fontweight='bold', pad=20)
-    
-    # Table with detailed breakdown
-    table_data = []
-    for fuel in fuel_mw.index:
-        count = fuel_counts[fuel]
-        mw = fuel_mw[fuel]
-        pct = (mw / total_mw * 100) if total_mw > 0 else 0
-        table_data.append([fuel, f"{count}", f"{mw:.1f}", f"{pct:.1f}%"])
-    
-    table = ax2.table(cellText=table_data,
-                      colLabels=['Fuel Type', 'Projects', 'Total MW', '% of Total'],
-                      cellLoc='left',
-                      loc='center',
-                      colWidths=[0.35, 0.2, 0.25, 0.2])
-    
-    table.auto_set_font_size(False)
-    table.set_fontsize(10)
-    table.scale(1, 2)
-    
-    # Style the header row
-    for i in range(4):
-        table[(0, i)].set_facecolor('#2E86AB')
-        table[(0, i)].set_text_props(weight='bold', color='white')
-    
-    # Alternate row colors
-    for i in range(1, len(table_data) + 1):
-        for j in range(4):
-            if i % 2 == 0:
-                table[(i, j)].set_facecolor('#F0F0F0')
-    
-    ax2.axis('off')
-    ax2.set_title('Detailed Breakdown', fontsize=12, fontweight='bold', pad=20)
-    
-    plt.suptitle('ERCOT Large Gen Projects - Fuel Type Analysis', 
-                 fontsize=14, fontweight='bold', y=0.98)
-    plt.tight_layout()
+    spec = fuel_spec(df)
+    print_breakdown_table(spec, 20)
     
     # Save the chart
-    output_path = output_dir / 'fuel_type_breakdown.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    output_path = output_dir / f"fuel_type_breakdown.{fmt}"
+    render_chart_spec(spec, output_path, tier)
     print(f"\n✓ Chart saved to: {output_path}")
-    plt.close()
 
 
-def generate_technology_type_report(df: pd.DataFrame, output_dir: Path) -> None:
+def generate_technology_type_report(df: pd.DataFrame, output_dir: Path,
+                                    tier: str = 'print', fmt: str = 'png') -> None:
     """
     Generate a pie chart showing distribution by technology type with normalized names.
     
     Args:
         df: DataFrame containing the Large Gen project details
         output_dir: Directory to save the output chart
+        tier: Resolution tier (see RENDER_TIERS)
+        fmt: Image format (see CHART_FORMATS)
     """
-    from constants import normalize_technology_type
-    
     print("\n" + "=" * 80)
     print("REPORT 4: Technology Type Breakdown")
     print("=" * 80)
     
-    # Create a copy and normalize technology types
-    df_tech = df.copy()
-    df_tech['Technology_Normalized'] = df_tech['Technology'].apply(normalize_technology_type)
-    
-    # Aggregate by normalized technology type
-    tech_counts = df_tech.groupby('Technology_Normalized').size().sort_values(ascending=False)
-    tech_mw = df_tech.groupby('Technology_Normalized')['Capacity (MW)'].sum().sort_values(ascending=False)
-    
-    # Remove NaN/Unknown technology types
-    tech_counts = tech_counts[tech_counts.index != 'Unknown']
-    tech_mw = tech_mw[tech_mw.index != 'Unknown']
-    
-    print(f"\nTotal Technology Types: {len(tech_counts)}")
-    print(f"\nBreakdown by Technology Type:")
-    print(f"{'Technology Type':<35} {'Projects':<12} {'Total MW':<15} {'% of Total MW'}")
-    print("-" * 82)
-    total_mw = tech_mw.sum()
-    for tech in tech_counts.index:
-        count = tech_counts[tech]
-        mw = tech_mw[tech]
-        pct = (mw / total_mw * 100) if total_mw > 0 else 0
-        print(f"{tech:<35} {count:<12} {mw:<15.2f} {pct:.1f}%")
-    
-    # Create figure with pie chart and table
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(18, 8))
-    
-    # Pie chart for MW distribution
-    colors = plt.cm.Set3(range(len(tech_mw)))
-    wedges, texts, autotexts = ax1.pie(tech_mw.values, labels=tech_mw.index, autopct='%1.1f%%',
-                                         colors=colors, startangle=90, textprops={'fontsize': 9})
-    
-    # Make percentage text bold
-    for autotext in autotexts:
-        autotext.set_color('white')
-        autotext.set_fontweight('bold')
-        autotext.set_fontsize(8)
-    
-    ax1.set_title('Distribution by Total MW Capacity', fontsize=12, fontweight='bold', pad=20)
-    
-    # Table with detailed breakdown
-    table_data = []
-    for tech in tech_mw.index:
-        count = tech_counts[tech]
-        mw = tech_mw[tech]
-        pct = (mw / total_mw * 100) if total_mw > 0 else 0
-        table_data.append([tech, f"{count}", f"{mw:.1f}", f"{pct:.1f}%"])
-    
-    table = ax2.table(cellText=table_data,
-                      colLabels=['Technology Type', 'Projects', 'Total MW', '% of Total'],
-                      cellLoc='left',
-                      loc='center',
-                      colWidths=[0.45, 0.18, 0.2, 0.17])
-    
-    table.auto_set_font_size(False)
-    table.set_fontsize(9)
-    table.scale(1, 2)
-    
-    # Style the header row
-    for i in range(4):
-        table[(0, i)].set_facecolor('#2E86AB')
-        table[(0, i)].set_text_props(weight='bold', color='white')
-    
-    # Alternate row colors
-    for i in range(1, len(table_data) + 1):
-        for j in range(4):
-            if i % 2 == 0:
-                table[(i, j)].set_facecolor('#F0F0F0')
-    
-    ax2.axis('off')
-    ax2.set_title('Detailed Breakdown', fontsize=12, fontweight='bold', pad=20)
-    
-    plt.suptitle('ERCOT Large Gen Projects - Technology Type Analysis', 
-                 fontsize=14, fontweight='bold', y=0.98)
-    plt.tight_layout()
+    spec = technology_spec(df)
+    print_breakdown_table(spec, 35)
     
     # Save the chart
-    output_path = output_dir / 'technology_type_breakdown.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    output_path = output_dir / f"technology_type_breakdown.{fmt}"
+    render_chart_spec(spec, output_path, tier)
     print(f"\n✓ Chart saved to: {output_path}")
-    plt.close()
+
+
+# Report type -> renderer; each writes one chart with a fixed name into the directory it is given
+REPORT_RENDERERS = {
+    'county': generate_county_report,
+    'cod': generate_cod_quarterly_report,
+    'fuel': generate_fuel_type_report,
+    'technology': generate_technology_type_report,
+    'county-fuel': generate_county_fuel_report,
+}
+
+# Reports that accept a quarter filter
+QUARTER_FILTERED_REPORTS = {'county-fuel'}
+
+# pyplot keeps global figure state, so renders in one process take turns
+_PLOT_LOCK = threading.Lock()
+
+
+class EmptyChartError(ValueError):
+    """A report has nothing to draw (e.g. no projects in the selected quarters)."""
+
+
+def render_report_artifact(store: ArtifactStore, dataset: MonthDataset, report: str,
+                           quarters: Optional[List[str]] = None, tier: str = 'print', fmt: str = 'png',
+                           spec: Optional[Callable[[], ChartSpec]] = None) -> Tuple[Path, bool]:
+    """
+    Render a report for a cached month into the artifact store, reusing an identical earlier render.
+
+    Each tier and format is a separate artifact, so a thumbnail never waits on a print render.
+
+    Args:
+        store: Artifact store to write into
+        dataset: Parsed month (see dataset.load_month_dataset)
+        report: Report type (see REPORT_RENDERERS)
+        quarters: Optional quarter filter for QUARTER_FILTERED_REPORTS
+        tier: Resolution tier (see RENDER_TIERS)
+        fmt: Image format (see CHART_FORMATS)
+        spec: Optional function returning the report's chart spec, to share one across tiers
+
+    Returns:
+        (path, cached) where cached is True when the chart already existed
+
+    Raises:
+        ValueError: If the report type, tier or format is unknown
+        EmptyChartError: If the report has no data to draw
+    """
+    if report not in REPORT_RENDERERS:
+        raise ValueError(f"Unknown report '{report}'. Valid: {', '.join(REPORT_RENDERERS)}")
+    if tier not in RENDER_TIERS:
+        raise ValueError(f"Unknown tier '{tier}'. Valid: {', '.join(RENDER_TIERS)}")
+    if fmt not in CHART_FORMATS:
+        raise ValueError(f"Unknown format '{fmt}'. Valid: {', '.join(CHART_FORMATS)}")
+    quarters = quarters if report in QUARTER_FILTERED_REPORTS else None
+    params = {'tier': tier, 'format': fmt, 'quarters': quarters}
+
+    def render(work_dir: Path) -> None:
+        chart = spec() if spec else build_chart_spec(report, dataset.frame[dataset.raw_columns],
+                                                     quarters=quarters, cod_index=dataset.cod)
+        if not chart['categories']:
+            raise EmptyChartError(f"No data for report '{report}'")
+        with _PLOT_LOCK:
+            render_chart_spec(chart, work_dir / f"{report}.{fmt}", tier)
+
+    return store.get_or_render(dataset.fingerprint, report, params, render, suffix=f".{fmt}")
+
+
+def render_eager_tiers(store: ArtifactStore, dataset: MonthDataset, reports: Optional[List[str]] = None,
+                       quarters: Optional[List[str]] = None, fmt: str = 'png') -> List[Tuple[Path, bool]]:
+    """
+    Render the EAGER_TIERS of reports for a month that are not in the store yet.
+
+    Each report's spec is built at most once, and only if one of its tiers is missing.
+    Reports without data (an empty quarter selection) are skipped.
+
+    Args:
+        store: Artifact store to write into
+        dataset: Parsed month
+        reports: Report types (default: all of REPORT_RENDERERS)
+        quarters: Optional quarter filter for QUARTER_FILTERED_REPORTS
+        fmt: Image format (see CHART_FORMATS)
+
+    Returns:
+        (path, cached) per rendered or reused artifact
+    """
+    results = []
+    for report in reports or REPORT_RENDERERS:
+        specs: List[ChartSpec] = []
+
+        def spec() -> ChartSpec:
+            if not specs:
+                specs.append(build_chart_spec(report, dataset.frame[dataset.raw_columns],
+                                              quarters=quarters, cod_index=dataset.cod))
+            return specs[0]
+
+        for tier in EAGER_TIERS:
+            try:
+                results.append(render_report_artifact(store, dataset, report, quarters, tier, fmt, spec=spec))
+            except EmptyChartError:
+                break
+    return results
+
+
+# Reports generated by --report all (county-fuel is added per --quarters set)
+ALL_REPORTS = ['county', 'cod', 'fuel', 'technology']
+
+# Batch worker state: parsed months, shared between the workers through a SharedMonthStore
+_batch_cache: Optional[MonthDatasetCache] = None
+
+
+def _init_batch_worker(shared_dir: str) -> None:
+    global _batch_cache
+    from ingest import default_snapshot_store
+    _batch_cache = MonthDatasetCache(shared=SharedMonthStore(Path(shared_dir)),
+                                     snapshots=default_snapshot_store(), max_entries=2)
+
+
+def quarters_dirname(quarters: Optional[List[str]]) -> Optional[str]:
+    """Subdirectory for a quarter-filtered report, e.g. 'quarters-2026Q1+2026Q2'."""
+    return f"quarters-{'+'.join(sorted(quarters))}" if quarters else None
+
+
+def render_batch_task(file_path: str, report: str, quarters: Optional[List[str]], output_dir: str,
+                      tier: str = 'print', fmt: str = 'png') -> Dict[str, Any]:
+    """
+    Render one report for one month in a batch worker.
+
+    Returns:
+        {'load_s', 'render_s', 'files': [paths written]}
+    """
+    start = time.perf_counter()
+    dataset, _ = _batch_cache.get(Path(file_path))
+    loaded = time.perf_counter()
+
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    df = dataset.frame[dataset.raw_columns]
+    # Render privately and move the charts into place: tasks for one month share its directory
+    work_dir = Path(tempfile.mkdtemp(prefix='.tmp-', dir=out))
+    try:
+        # The renderers narrate each chart; the batch prints one summary table instead
+        with contextlib.redirect_stdout(io.StringIO()):
+            if report == 'cod':
+                generate_cod_quarterly_report(df, work_dir, cod_index=dataset.cod, tier=tier, fmt=fmt)
+            elif report in QUARTER_FILTERED_REPORTS:
+                REPORT_RENDERERS[report](df, work_dir, quarters=quarters, tier=tier, fmt=fmt)
+            else:
+                REPORT_RENDERERS[report](df, work_dir, tier=tier, fmt=fmt)
+        files = []
+        for chart in sorted(work_dir.iterdir()):
+            os.replace(chart, out / chart.name)
+            files.append(str(out / chart.name))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return {
+        'load_s': loaded - start,
+        'render_s': time.perf_counter() - loaded,
+        'files': files,
+    }
+
+
+def run_batch(files: List[Tuple[str, Path]], reports: List[str], quarter_sets: List[List[str]],
+              output_root: Path, jobs: int = 1, tier: str = 'print', fmt: str = 'png') -> List[Dict[str, Any]]:
+    """
+    Render reports for many months in one process pool.
+
+    Each month is parsed once (the first worker to need it publishes it to a shared
+    store the others memory-map). Outputs go to <output_root>/<year>/<month>/, and
+    quarter-filtered reports to a quarters-<set> subdirectory per quarter set.
+
+    Args:
+        files: ('YYYY/MM', workbook path) pairs
+        reports: Report types without a quarter filter (see ALL_REPORTS)
+        quarter_sets: Quarter lists to render county-fuel for
+        output_root: Root output directory
+        jobs: Worker processes
+        tier: Resolution tier (see RENDER_TIERS)
+        fmt: Image format (see CHART_FORMATS)
+
+    Returns:
+        One result per (month, report, quarters), in submission order: {'month', 'report',
+        'quarters', 'output_dir', 'load_s', 'render_s', 'files'} or {'error'} instead of timings
+    """
+    tasks = []
+    for period, path in files:
+        month_dir = output_root / period
+        tasks += [(period, path, report, None, month_dir) for report in reports]
+        tasks += [(period, path, 'county-fuel', quarters or None,
+                   month_dir / quarters_dirname(quarters) if quarters else month_dir)
+                  for quarters in quarter_sets]
+
+    shared_dir = tempfile.mkdtemp(prefix='tgir-reports-')
+    try:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_batch_worker, initargs=(shared_dir,)) as pool:
+            futures = [pool.submit(render_batch_task, str(path), report, quarters, str(out), tier, fmt)
+                       for _, path, report, quarters, out in tasks]
+            results = []
+            for (period, _, report, quarters, out), future in zip(tasks, futures):
+                result = {'month': period, 'report': report, 'quarters': quarters, 'output_dir': str(out)}
+                try:
+                    result.update(future.result())
+                except Exception as e:
+                    result['error'] = f"{type(e).__name__}: {e}"
+                results.append(result)
+        return results
+    finally:
+        shutil.rmtree(shared_dir, ignore_errors=True)
+
+
+def batch_main(args: argparse.Namespace, parser: argparse.ArgumentParser, project_root: Path) -> None:
+    """
+    --all-months / --months: render the selected reports for many months in one run.
+    """
+    files = input_files(project_root / "inputs")
+    if args.months:
+        wanted = set(args.months)
+        unknown = wanted - {period for period, _ in files}
+        if unknown:
+            parser.error(f"No workbook for {', '.join(sorted(unknown))} under inputs/")
+        files = [(period, path) for period, path in files if period in wanted]
+    if not files:
+        parser.error("No inputs/<year>/<month>/file.xlsx found")
+
+    reports = ALL_REPORTS if args.report == 'all' else ([] if args.report == 'county-fuel' else [args.report])
+    quarter_sets = args.quarters or ([] if args.report != 'county-fuel' else [[]])
+    output_root = Path(args.output) if args.output else project_root / "outputs" / "reports"
+
+    print("=" * 80)
+    print("ERCOT LARGE GEN REPORTS GENERATOR - BATCH")
+    print("=" * 80)
+    print(f"\nMonths: {', '.join(period for period, _ in files)}")
+    print(f"Reports: {', '.join(reports + (['county-fuel'] if quarter_sets else []))}"
+          + (f"  (quarter sets: {len(quarter_sets)})" if args.quarters else ''))
+    print(f"Output Directory: {output_root.resolve()}  (jobs: {args.jobs}, {args.tier} {args.format})\n")
+
+    start = time.perf_counter()
+    results = run_batch(files, reports, quarter_sets, output_root, jobs=args.jobs, tier=args.tier, fmt=args.format)
+    elapsed = time.perf_counter() - start
+
+    print(f"{'Month':<9} {'Report':<12} {'Quarters':<24} {'Load (s)':>9} {'Render (s)':>11}  Output")
+    print("-" * 80)
+    for result in results:
+        quarters = ','.join(result['quarters']) if result['quarters'] else '-'
+        if 'error' in result:
+            print(f"{result['month']:<9} {result['report']:<12} {quarters:<24} {'✗ ' + result['error']}")
+            continue
+        outputs = ', '.join(Path(f).name for f in result['files']) or '(no data)'
+        print(f"{result['month']:<9} {result['report']:<12} {quarters:<24} "
+              f"{result['load_s']:>9.2f} {result['render_s']:>11.2f}  {outputs}")
+
+    failed = sum('error' in result for result in results)
+    render_total = sum(result.get('render_s', 0) for result in results)
+    print("-" * 80)
+    print(f"\n{'✗' if failed else '✓'} {len(results) - failed} of {len(results)} reports in {elapsed:.1f}s "
+          f"({render_total:.1f}s of rendering across {args.jobs} worker(s))")
+    print(f"View your reports in: {output_root.resolve()}")
+    if failed:
+        sys.exit(1)
 
 
 def main():
@@ -404,13 +643,21 @@ Report Types:
   cod         - COD quarterly buckets (vertical bar chart)
   fuel        - Fuel type breakdown (pie chart with table)
   technology  - Technology type breakdown (pie chart with table)
-  all         - Generate all reports (default)
+  county-fuel - County MW by fuel type (stacked bar chart; filtered by --quarters)
+  all         - Generate all reports (default; plus county-fuel per --quarters set)
 
 Examples:
-  python src/reports.py                           # Generate all reports
+  python src/reports.py                           # Generate all reports for the latest month
   python src/reports.py --report county           # Generate only county report
-  python src/reports.py inputs/09/file.xlsx       # Use custom input file
-  python src/reports.py inputs/09/file.xlsx --report fuel
+  python src/reports.py inputs/2025/10/file.xlsx  # Use custom input file
+  python src/reports.py inputs/2025/10/file.xlsx --report fuel
+  python src/reports.py --tier thumbnail --format webp   # Small previews instead of 300-dpi PNGs
+
+Tiers: thumbnail (40 dpi, largest 12 bars), screen (100 dpi), print (300 dpi, default)
+
+Batch (every month in one run, parsed once each, rendered in parallel):
+  python src/reports.py --all-months --jobs 4
+  python src/reports.py --months 2025/12 2026/01 --quarters 2026Q1 2026Q1,2026Q2 --jobs 4
         """
     )
     
@@ -418,26 +665,84 @@ Examples:
         'input_file',
         nargs='?',
         default=None,
-        help='Path to the Excel file (default: inputs/10/file.xlsx)'\
+        help='Path to the Excel file (default: the latest inputs/<year>/<month>/file.xlsx)'
     )
     
     parser.add_argument(
         '--report', '-r',
-        choices=['county', 'cod', 'fuel', 'technology', 'all'],
+        choices=['county', 'cod', 'fuel', 'technology', 'county-fuel', 'all'],
         default='all',
         help='Which report to generate (default: all)'
     )
     
+    parser.add_argument(
+        '--tier',
+        choices=list(RENDER_TIERS),
+        default='print',
+        help='Resolution tier (default: print)'
+    )
+    
+    parser.add_argument(
+        '--format',
+        choices=list(CHART_FORMATS),
+        default='png',
+        help='Image format (default: png)'
+    )
+    
+    parser.add_argument(
+        '--all-months',
+        action='store_true',
+        help='Batch: generate reports for every inputs/<year>/<month>/file.xlsx'
+    )
+    
+    parser.add_argument(
+        '--months',
+        nargs='+',
+        default=None,
+        metavar='YYYY/MM',
+        help='Batch: generate reports for these months only'
+    )
+    
+    parser.add_argument(
+        '--quarters',
+        nargs='+',
+        default=None,
+        type=lambda value: [q.strip() for q in value.split(',') if q.strip()],
+        metavar='Q[,Q...]',
+        help='Also render county-fuel per quarter set, e.g. 2026Q1 2026Q1,2026Q2 (two sets)'
+    )
+    
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Batch: worker processes (default: one per CPU)'
+    )
+    
+    parser.add_argument(
+        '--output', '-o',
+        default=None,
+        help='Batch: output root, one <year>/<month> directory per month (default: outputs/reports)'
+    )
+    
     args = parser.parse_args()
+    project_root = Path(__file__).parent.parent
+    
+    if args.all_months or args.months:
+        if args.input_file:
+            parser.error('give an input file or --all-months/--months, not both')
+        batch_main(args, parser, project_root)
+        return
     
     # Determine input file path
     if args.input_file:
         file_path = Path(args.input_file)
     else:
-        # Default: inputs/10/file.xlsx relative to project root
-        # Script is in src/, so go up one level to project root
-        project_root = Path(__file__).parent.parent
-        file_path = project_root / "inputs" / "10" / "file.xlsx"
+        # Default: the latest inputs/<year>/<month>/file.xlsx relative to project root
+        files = input_files(project_root / "inputs")
+        if not files:
+            parser.error("No inputs/<year>/<month>/file.xlsx found; pass a path")
+        file_path = files[-1][1]
     
     # Output directory - fixed to be relative to src/
     output_dir = Path(__file__).parent.parent / "outputs"
@@ -459,21 +764,29 @@ Examples:
         reports_generated = []
         
         if args.report in ['county', 'all']:
-            generate_county_report(df, output_dir)
+            generate_county_report(df, output_dir, tier=args.tier, fmt=args.format)
             reports_generated.append('County MW Breakdown')
         
         if args.report in ['cod', 'all']:
-            generate_cod_quarterly_report(df, output_dir)
+            generate_cod_quarterly_report(df, output_dir, tier=args.tier, fmt=args.format)
             reports_generated.append('COD Quarterly Buckets')
         
         if args.report in ['fuel', 'all']:
-            generate_fuel_type_report(df, output_dir)
+            generate_fuel_type_report(df, output_dir, tier=args.tier, fmt=args.format)
             reports_generated.append('Fuel Type Breakdown')
         
         if args.report in ['technology', 'all']:
-            generate_technology_type_report(df, output_dir)
+            generate_technology_type_report(df, output_dir, tier=args.tier, fmt=args.format)
             reports_generated.append('Technology Type Breakdown')
         
+        if args.report == 'county-fuel' or args.quarters:
+            for quarters in args.quarters or [None]:
+                quarter_dir = output_dir / quarters_dirname(quarters) if quarters else output_dir
+                quarter_dir.mkdir(exist_ok=True)
+                generate_county_fuel_report(df, quarter_dir, quarters=quarters, tier=args.tier, fmt=args.format)
+                reports_generated.append('County + Fuel Type MW Breakdown'
+                                         + (f" ({', '.join(quarters)})" if quarters else ''))
+        
         print("\n" + "=" * 80)
         if len(reports_generated) > 1:
             print("✓ ALL REPORTS GENERATED SUCCESSFULLY")
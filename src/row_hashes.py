@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Texas Grid Interconnect Reporter - Row Hashes
+64-bit hashes of each project's published values, for the whole row and per column
+group, so month-to-month comparisons can skip unchanged projects with one integer
+comparison and only look at the column groups that did change.
+"""
+
+from typing import Dict, Iterable, List
+
+import numpy as np
+import pandas as pd
+
+from change_flags import CHANGE_FLAGS_COLUMN
+
+
+# Column groups hashed separately; every other published column falls into OTHER_GROUP
+COLUMN_GROUPS = {
+    'project': ['Project Name', 'Interconnecting Entity', 'POI Location', 'County', 'CDR Reporting Zone'],
+    'cod': ['Projected COD'],
+    'capacity': ['Capacity (MW)'],
+    'fuel': ['Fuel', 'Technology'],
+    'comment': ['Comment'],
+}
+OTHER_GROUP = 'milestones'
+ROW_HASH = 'row'
+
+
+def business_columns(columns: Iterable[str]) -> List[str]:
+    """Published columns that describe a project (not its INR or change indicators)."""
+    return [c for c in columns if c != 'INR' and c != CHANGE_FLAGS_COLUMN and 'Change indicator' not in c]
+
+
+def column_groups(columns: Iterable[str]) -> Dict[str, List[str]]:
+    """Business columns present in a month, by group (groups may be empty)."""
+    present = business_columns(columns)
+    groups = {group: [c for c in members if c in present] for group, members in COLUMN_GROUPS.items()}
+    grouped = {c for members in COLUMN_GROUPS.values() for c in members}
+    groups[OTHER_GROUP] = [c for c in present if c not in grouped]
+    return groups
+
+
+def normalized_text(column: pd.Series) -> pd.Series:
+    """
+    Values as stripped text, blanks and missing values as None.
+
+    Equal text implies equal values for the month comparisons (which strip text and
+    treat blanks as missing), so equal hashes never hide a change they would report.
+    """
+    text = column.astype(str).str.strip()
+    return text.astype(object).where(column.notna().to_numpy() & (text != '').to_numpy(), None)
+
+
+class RowHashes:
+    """
+    uint64 hashes per project of one month, indexed by INR (first row of a duplicated INR).
+
+    Attributes:
+        groups: Group name -> the month's columns in it
+        table: One column per group plus ROW_HASH, indexed by INR
+        duplicated: INRs that appear on more than one row
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        """
+        Args:
+            frame: A month's rows as published (without dataset.DERIVED_COLUMNS)
+        """
+        self.groups = column_groups(frame.columns)
+        hashes = {}
+        for group, columns in self.groups.items():
+            if columns:
+                values = pd.DataFrame({c: normalized_text(frame[c]) for c in columns})
+                hashes[group] = pd.util.hash_pandas_object(values, index=False).to_numpy()
+            else:
+                hashes[group] = np.zeros(len(frame), dtype=np.uint64)
+        table = pd.DataFrame(hashes, index=pd.Index(frame['INR'].to_numpy(), name='INR'))
+        table[ROW_HASH] = pd.util.hash_pandas_object(table, index=False).to_numpy()
+
+        has_inr = table.index.notna()
+        self.duplicated = set(table.index[has_inr & table.index.duplicated(keep=False)])
+        self.table = table[has_inr & ~table.index.duplicated(keep='first')]
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+
+def changed_groups(base: RowHashes, target: RowHashes) -> pd.DataFrame:
+    """
+    Projects in both months whose published values differ, and in which column groups.
+
+    Unchanged projects are dropped by comparing one hash per project. A group whose
+    columns differ between the months, and any INR duplicated in either month, counts
+    as changed so that nothing is skipped that a column-by-column comparison would report.
+
+    Args:
+        base: Hashes of the earlier month
+        target: Hashes of the later month
+
+    Returns:
+        bool DataFrame indexed by INR (in target order), one column per group
+    """
+    common = target.table.index.intersection(base.table.index)
+    groups = list(target.groups)
+    renamed = [group for group in groups if target.groups[group] != base.groups.get(group)]
+    duplicated = list(base.duplicated | target.duplicated)
+
+    # One comparison per project; only the rows that differ are compared group by group
+    differs = target.table[ROW_HASH].loc[common].to_numpy() != base.table[ROW_HASH].loc[common].to_numpy()
+    if renamed:
+        differs[:] = True
+    rows = common[differs | common.isin(duplicated)]
+    changed = pd.DataFrame(target.table.loc[rows, groups].to_numpy() != base.table.loc[rows, groups].to_numpy(),
+                           index=rows, columns=groups)
+    changed[renamed] = True
+    changed[rows.isin(duplicated)] = True
+    return changed[changed.any(axis=1).to_numpy()]
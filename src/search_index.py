@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Texas Grid Interconnect Reporter - Search Index
+Per-month inverted index over project names, INRs and counties for search-as-you-type:
+each distinct word maps to the rows containing it, a sorted vocabulary answers prefix
+lookups with a binary search, and a trigram index over the vocabulary finds misspelled
+words without comparing the query against every row.
+"""
+
+import argparse
+import re
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# Field name -> DataFrame column, with the weight of a match in that field
+SEARCH_FIELDS = {
+    'inr': ('INR', 1.5),
+    'name': ('Project Name', 1.0),
+    'county': ('County', 0.8),
+}
+
+# Word match scores: whole word, prefix (scaled by how much of the word was typed), typo
+EXACT_SCORE = 1.0
+PREFIX_SCORE = 0.5
+FUZZY_SCORE = 0.6
+# Score lost per edit beyond the first
+FUZZY_EDIT_PENALTY = 0.2
+
+DEFAULT_LIMIT = 20
+
+_NON_WORD = re.compile(r'[^0-9a-z]+')
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric words of a text ('Sun Valley-2 Solar' -> ['sun', 'valley', '2', 'solar'])."""
+    return [word for word in _NON_WORD.split(str(text).lower()) if word]
+
+
+def max_edits(word: str) -> int:
+    """
+    Typos tolerated in a query word: none up to 3 characters, 1 up to 7, then 2.
+
+    Words with digits (INRs, unit numbers) are identifiers and only match exactly or
+    as a prefix.
+    """
+    if len(word) < 4 or any(c.isdigit() for c in word):
+        return 0
+    return 1 if len(word) < 8 else 2
+
+
+def trigrams(word: str) -> List[str]:
+    """Trigrams of a word padded with '$' at both ends (len(word) trigrams)."""
+    padded = f"${word}$"
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Optimal string alignment distance (insertions, deletions, substitutions and adjacent
+    transpositions), or limit + 1 as soon as it must exceed limit.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if previous2 is not None and i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+class SearchHit(NamedTuple):
+    row: int
+    score: float
+    fields: List[str]
+
+
+class SearchIndex:
+    """
+    Words of the SEARCH_FIELDS columns of one month, with their rows and fields.
+
+    Queries are split into words; a row matches when every query word matches one of
+    its words exactly, as a prefix, or within max_edits typos, and rows are ranked by
+    the summed word scores weighted by field.
+    """
+
+    def __init__(self, n_rows: int, vocabulary: np.ndarray, offsets: np.ndarray, rows: np.ndarray,
+                 fields: np.ndarray, grams: Dict[str, np.ndarray]):
+        """
+        Args:
+            n_rows: Number of rows indexed
+            vocabulary: Sorted distinct words
+            offsets: Postings of vocabulary[i] are rows/fields[offsets[i]:offsets[i + 1]]
+            rows: Row position per posting
+            fields: Field number (position in SEARCH_FIELDS) per posting
+            grams: Trigram -> vocabulary positions of the words containing it
+        """
+        self.n_rows = n_rows
+        self.vocabulary = vocabulary
+        self.offsets = offsets
+        self.rows = rows
+        self.fields = fields
+        self.grams = grams
+        self._lengths = np.array([len(word) for word in vocabulary], dtype=np.int64)
+        self._weights = np.array([weight for _, weight in SEARCH_FIELDS.values()])
+        self._field_names = list(SEARCH_FIELDS)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'SearchIndex':
+        """
+        Build the index from a month DataFrame (missing SEARCH_FIELDS columns are skipped).
+
+        Args:
+            df: DataFrame with 'INR', 'Project Name' and 'County'
+
+        Returns:
+            SearchIndex over df's row positions
+        """
+        words, rows, fields = [], [], []
+        for field, (column, _) in enumerate(SEARCH_FIELDS.values()):
+            if column not in df.columns:
+                continue
+            values = df[column]
+            # Tokenize each distinct value once (counties and name stems repeat a lot)
+            codes, uniques = pd.factorize(values)
+            tokens = [tokenize(value) for value in uniques]
+            for row, code in enumerate(codes):
+                if code < 0:
+                    continue
+                for word in tokens[code]:
+                    words.append(word)
+                    rows.append(row)
+                    fields.append(field)
+
+        words = np.array(words, dtype=object)
+        vocabulary, word_ids = np.unique(words.astype(str), return_inverse=True) if len(words) else \
+            (np.array([], dtype=str), np.array([], dtype=np.int64))
+        order = np.argsort(word_ids, kind='stable')
+        offsets = np.searchsorted(word_ids[order], np.arange(len(vocabulary) + 1))
+
+        grams: Dict[str, List[int]] = defaultdict(list)
+        for position, word in enumerate(vocabulary):
+            for gram in set(trigrams(word)):
+                grams[gram].append(position)
+
+        return cls(len(df), vocabulary, offsets.astype(np.int64),
+                   np.asarray(rows, dtype=np.int64)[order], np.asarray(fields, dtype=np.int8)[order],
+                   {gram: np.array(positions, dtype=np.int64) for gram, positions in grams.items()})
+
+    def _word_matches(self, word: str) -> Dict[int, float]:
+        """Vocabulary position -> score of every indexed word matching one query word."""
+        matches: Dict[int, float] = {}
+        start = np.searchsorted(self.vocabulary, word, side='left')
+        stop = np.searchsorted(self.vocabulary, word + '\uffff', side='left')
+        for position in range(start, stop):
+            candidate = self.vocabulary[position]
+            matches[position] = EXACT_SCORE if candidate == word else \
+                PREFIX_SCORE * (1 + len(word) / len(candidate))
+
+        limit = max_edits(word)
+        if limit:
+            # A word within `limit` edits keeps at least len(word) - 3 * limit of its trigrams
+            word_grams = [self.grams[gram] for gram in set(trigrams(word)) if gram in self.grams]
+            if word_grams:
+                shared = np.bincount(np.concatenate(word_grams), minlength=len(self.vocabulary))
+                close = (shared >= len(word) - 3 * limit) & (np.abs(self._lengths - len(word)) <= limit)
+                for position in np.flatnonzero(close):
+                    if position in matches:
+                        continue
+                    distance = edit_distance(word, self.vocabulary[position], limit)
+                    if distance <= limit:
+                        matches[int(position)] = FUZZY_SCORE - FUZZY_EDIT_PENALTY * (distance - 1)
+        return matches
+
+    def search(self, query: str, limit: Optional[int] = DEFAULT_LIMIT) -> List[SearchHit]:
+        """
+        Rows matching every word of the query, best first.
+
+        Args:
+            query: Free text (e.g. 'sun valy', '24INR03', 'pecos solar')
+            limit: Maximum hits (None for all)
+
+        Returns:
+            SearchHit(row, score, fields matched) list; ties keep row order
+        """
+        words = tokenize(query)
+        if not words or not self.n_rows:
+            return []
+
+        total = np.zeros(self.n_rows)
+        matched = np.ones(self.n_rows, dtype=bool)
+        hit_fields = np.zeros(self.n_rows, dtype=np.uint8)
+        for word in dict.fromkeys(words):
+            best = np.zeros(self.n_rows)
+            for position, score in self._word_matches(word).items():
+                postings = slice(self.offsets[position], self.offsets[position + 1])
+                rows, fields = self.rows[postings], self.fields[postings]
+                np.maximum.at(best, rows, score * self._weights[fields])
+                np.bitwise_or.at(hit_fields, rows, (1 << fields).astype(np.uint8))
+            matched &= best > 0
+            total += best
+
+        candidates = np.flatnonzero(matched)
+        ranked = candidates[np.argsort(-total[candidates], kind='stable')]
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [SearchHit(int(row), round(float(total[row]), 3),
+                          [name for bit, name in enumerate(self._field_names) if hit_fields[row] >> bit & 1])
+                for row in ranked]
+
+    def count(self, query: str) -> int:
+        """Number of rows matching the query."""
+        return len(self.search(query, limit=None))
+
+
+def main():
+    """
+    Search one month's projects by name, INR or county.
+    """
+    parser = argparse.ArgumentParser(
+        description='Typo-tolerant, prefix search over project names, INRs and counties',
+        epilog='Example: python src/search_index.py inputs/2026/01/file.xlsx "sun valy sol"'
+    )
+    parser.add_argument('file', help='Path to a monthly workbook')
+    parser.add_argument('query', help='Search text')
+    parser.add_argument('--limit', type=int, default=DEFAULT_LIMIT, help=f'Maximum results (default: {DEFAULT_LIMIT})')
+    args = parser.parse_args()
+
+    import time
+    from dataset import load_month_dataset
+
+    dataset = load_month_dataset(Path(args.file))
+    start = time.perf_counter()
+    index = dataset.search
+    built = time.perf_counter() - start
+    start = time.perf_counter()
+    hits = index.search(args.query, limit=args.limit)
+    searched = time.perf_counter() - start
+
+    print("=" * 80)
+    print(f"SEARCH {args.query!r} in {dataset.period}: {len(hits)} shown "
+          f"(index {built * 1000:.1f} ms, query {searched * 1000:.2f} ms)")
+    print("=" * 80)
+    frame = dataset.frame
+    for hit in hits:
+        row = frame.iloc[hit.row]
+        print(f"  {hit.score:>5.2f}  {row['INR']:<12} {str(row['Project Name'])[:40]:<40} "
+              f"{str(row['County']):<14} {','.join(hit.fields)}")
+
+
+if __name__ == "__main__":
+    main()
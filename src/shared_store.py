@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Texas Grid Interconnect Reporter - Shared Month Store
+Normalized month frames saved as uncompressed Arrow IPC files that every worker
+process memory-maps read-only. String and numeric columns are then backed by one
+physical copy in the page cache (e.g. /dev/shm) instead of one copy per worker,
+and only the first worker to need a month parses the workbook.
+"""
+
+import argparse
+import datetime
+import json
+import logging
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process build lock, workers may parse a month twice
+    fcntl = None
+
+logger = logging.getLogger("tgir.shared_store")
+
+# Directory shared by the workers; unset disables the shared store (per-process frames only)
+SHARED_DIR_ENV = 'TGIR_SHARED_CACHE_DIR'
+DEFAULT_MAX_ENTRIES = int(os.environ.get('TGIR_SHARED_CACHE_ENTRIES', '24'))
+
+MANIFEST_NAME = 'manifest.json'
+
+# Text columns come back Arrow-backed in this dtype (pandas 3's default str) on pandas 2
+# and 3 alike, so they reference the mapped buffers instead of one Python str per cell
+TEXT_DTYPE = pd.StringDtype('pyarrow', na_value=np.nan)
+_TEXT_TYPES = {pa.string(): TEXT_DTYPE, pa.large_string(): TEXT_DTYPE}
+
+# Object columns (mixed datetimes, text and NaN straight from Excel) cannot be Arrow
+# columns as-is. Each is stored as a type tag plus one typed column per kind of value
+# and rebuilt into the same Python objects on load.
+_TAG_NONE, _TAG_FLOAT, _TAG_DATETIME, _TAG_STR, _TAG_INT, _TAG_BOOL = range(6)
+
+
+def _encode_objects(values: np.ndarray) -> Dict[str, pa.Array]:
+    n = len(values)
+    tags = np.zeros(n, dtype=np.int8)
+    floats = np.full(n, np.nan)
+    ints = np.zeros(n, dtype=np.int64)
+    stamps: List[Optional[datetime.datetime]] = [None] * n
+    texts: List[Optional[str]] = [None] * n
+    for i, value in enumerate(values):
+        kind = type(value)
+        if value is None:
+            continue
+        if kind is float:
+            tags[i], floats[i] = _TAG_FLOAT, value
+        elif kind is datetime.datetime or kind is pd.Timestamp:
+            tags[i], stamps[i] = _TAG_DATETIME, value
+        elif kind is str:
+            tags[i], texts[i] = _TAG_STR, value
+        elif kind is bool:
+            tags[i], ints[i] = _TAG_BOOL, int(value)
+        elif kind is int:
+            tags[i], ints[i] = _TAG_INT, value
+        else:
+            raise TypeError(f"Cannot store {kind.__name__} values in the shared month store")
+    return {
+        'tag': pa.array(tags),
+        'float': pa.array(floats, from_pandas=False),  # keep NaN as a value, not a null
+        'int': pa.array(ints),
+        'datetime': pa.array(stamps, type=pa.timestamp('us')),
+        'str': pa.array(texts, type=pa.large_string()),
+    }
+
+
+def _decode_objects(fields: Dict[str, pa.ChunkedArray]) -> np.ndarray:
+    tags = fields['tag'].to_numpy()
+    out = np.full(len(tags), None, dtype=object)
+    for tag, name in ((_TAG_FLOAT, 'float'), (_TAG_DATETIME, 'datetime'), (_TAG_STR, 'str'),
+                      (_TAG_INT, 'int'), (_TAG_BOOL, 'int')):
+        mask = tags == tag
+        if not mask.any():
+            continue
+        # One Python object per distinct value (dates, NaN and labels repeat a lot)
+        encoded = fields[name].filter(pa.array(mask)).combine_chunks().dictionary_encode()
+        if tag == _TAG_DATETIME:
+            uniques = [d.to_pydatetime() for d in pd.to_datetime(encoded.dictionary.to_numpy(zero_copy_only=False))]
+        elif tag == _TAG_BOOL:
+            uniques = [bool(v) for v in encoded.dictionary.to_pylist()]
+        else:
+            uniques = encoded.dictionary.to_pylist()
+        lookup = np.empty(len(uniques), dtype=object)
+        lookup[:] = uniques
+        out[mask] = lookup[encoded.indices.to_numpy()]
+    return out
+
+
+def frame_to_table(frame: pd.DataFrame) -> pa.Table:
+    """
+    Convert a normalized month frame to an Arrow table that frame_from_table restores exactly.
+
+    Column names, object columns and frame.attrs (JSON) are recorded in the schema metadata.
+    Object columns holding only text and blanks (how pandas 2 reads text) are stored as
+    string columns, so they are restored as TEXT_DTYPE.
+
+    Args:
+        frame: DataFrame with a default RangeIndex
+
+    Returns:
+        Arrow table
+
+    Raises:
+        TypeError: If an object column holds values other than None/float/int/bool/str/datetime
+    """
+    arrays: Dict[str, pa.Array] = {}
+    columns = []
+    for i, name in enumerate(frame.columns):
+        series = frame[name]
+        if series.dtype == object and pd.api.types.infer_dtype(series, skipna=True) == 'string':
+            arrays[f"c{i}"] = pa.array(series.to_numpy(), type=pa.large_string(), from_pandas=True)
+            columns.append({'name': name, 'object': False})
+        elif series.dtype == object:
+            fields = _encode_objects(series.to_numpy())
+            for field, array in fields.items():
+                arrays[f"c{i}.{field}"] = array
+            columns.append({'name': name, 'object': True})
+        else:
+            arrays[f"c{i}"] = pa.Array.from_pandas(series)
+            columns.append({'name': name, 'object': False})
+    metadata = {'tgir.columns': json.dumps(columns), 'tgir.attrs': json.dumps(frame.attrs)}
+    return pa.table(arrays).replace_schema_metadata(metadata)
+
+
+def frame_from_table(table: pa.Table) -> pd.DataFrame:
+    """
+    Rebuild the frame saved by frame_to_table.
+
+    String columns (as TEXT_DTYPE) and numeric columns without nulls reference the
+    table's buffers (no copy), so a memory-mapped table stays shared between processes.
+
+    Args:
+        table: Table read from a month file
+
+    Returns:
+        DataFrame equal to the one saved, with text columns as TEXT_DTYPE
+    """
+    metadata = table.schema.metadata
+    columns = json.loads(metadata[b'tgir.columns'])
+    plain = [f"c{i}" for i, column in enumerate(columns) if not column['object']]
+    frame = table.select(plain).to_pandas(split_blocks=True, types_mapper=_TEXT_TYPES.get)
+    frame.columns = [column['name'] for column in columns if not column['object']]
+
+    for i, column in enumerate(columns):
+        if column['object']:
+            fields = {field: table.column(f"c{i}.{field}") for field in ('tag', 'float', 'int', 'datetime', 'str')}
+            frame.insert(i, column['name'], pd.Series(_decode_objects(fields), index=frame.index, dtype=object))
+
+    frame.attrs = json.loads(metadata[b'tgir.attrs'])
+    return frame
+
+
+class SharedMonthStore:
+    """
+    Directory of <fingerprint>.arrow month files plus a manifest of the ready months.
+
+    A month file appears (atomic rename) only once it is complete, so its existence is
+    the readiness signal; manifest.json records what each file holds for operators.
+    Builds take an exclusive lock on <fingerprint>.lock, so concurrent workers wait
+    for one parse instead of all parsing.
+    """
+
+    def __init__(self, root: Path, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Args:
+            root: Shared directory (created if missing), ideally on tmpfs such as /dev/shm
+            max_entries: Month files kept; the oldest beyond this are deleted
+        """
+        self.root = Path(root)
+        self.max_entries = max_entries
+        self.root.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    def path_for(self, fingerprint: str) -> Path:
+        return self.root / f"{fingerprint}.arrow"
+
+    @contextmanager
+    def _locked(self, name: str) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+        with open(self.root / name, 'a') as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def load(self, fingerprint: str) -> Optional[pd.DataFrame]:
+        """
+        Memory-map a ready month.
+
+        Args:
+            fingerprint: Workbook content hash
+
+        Returns:
+            DataFrame, or None when the month is not in the store
+        """
+        path = self.path_for(fingerprint)
+        try:
+            source = pa.memory_map(str(path), 'r')
+        except FileNotFoundError:
+            return None
+        return frame_from_table(pa.ipc.open_file(source).read_all())
+
+    def save(self, fingerprint: str, frame: pd.DataFrame, source: Optional[Path] = None) -> Path:
+        """
+        Write a month atomically and record it in the manifest.
+
+        Args:
+            fingerprint: Workbook content hash
+            frame: Normalized month frame
+            source: Workbook the frame came from (recorded in the manifest)
+
+        Returns:
+            Path of the month file
+        """
+        table = frame_to_table(frame)
+        path = self.path_for(fingerprint)
+        fd, tmp_name = tempfile.mkstemp(prefix='.tmp-', suffix='.arrow', dir=self.root)
+        try:
+            with os.fdopen(fd, 'wb') as handle:
+                with pa.ipc.new_file(handle, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        with self._locked('manifest.lock'):
+            manifest = self.manifest()
+            manifest[fingerprint] = {
+                'source': str(source) if source is not None else None,
+                'rows': len(frame),
+                'bytes': path.stat().st_size,
+                'created': time.time(),
+            }
+            by_age = sorted(manifest, key=lambda fp: manifest[fp]['created'])
+            for old in by_age[:max(0, len(manifest) - self.max_entries)]:
+                # Workers that already mapped the file keep their mapping
+                self.path_for(old).unlink(missing_ok=True)
+                (self.root / f"{old}.lock").unlink(missing_ok=True)
+                del manifest[old]
+            self._write_manifest(manifest)
+        return path
+
+    def get_or_build(self, fingerprint: str, build: Callable[[], pd.DataFrame],
+                     source: Optional[Path] = None) -> Tuple[pd.DataFrame, bool]:
+        """
+        Return a month from the store, building and publishing it on first use.
+
+        If the frame cannot be stored (unsupported object values), the built frame is
+        returned unshared and a warning is logged.
+
+        Args:
+            fingerprint: Workbook content hash
+            build: Function parsing and normalizing the workbook
+            source: Workbook path (recorded in the manifest)
+
+        Returns:
+            (frame, shared_hit) where shared_hit is True when another worker had built it
+        """
+        frame = self.load(fingerprint)
+        if frame is not None:
+            return frame, True
+
+        with self._locked(f"{fingerprint}.lock"):
+            frame = self.load(fingerprint)
+            if frame is not None:
+                return frame, True
+            built = build()
+            try:
+                self.save(fingerprint, built, source)
+            except (TypeError, pa.ArrowException) as e:
+                logger.warning("Month %s not shared across workers: %s", source or fingerprint, e)
+                return built, False
+
+        # Serve the mapped copy so this worker shares memory with the others too
+        return self.load(fingerprint), False
+
+    def remove(self, fingerprint: str) -> None:
+        """Delete a month file and its manifest entry (workers that mapped it keep their mapping)."""
+        with self._locked('manifest.lock'):
+            manifest = self.manifest()
+            self.path_for(fingerprint).unlink(missing_ok=True)
+            (self.root / f"{fingerprint}.lock").unlink(missing_ok=True)
+            if manifest.pop(fingerprint, None) is not None:
+                self._write_manifest(manifest)
+
+    def manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Fingerprint -> {source, rows, bytes, created} for the ready months."""
+        try:
+            return json.loads((self.root / MANIFEST_NAME).read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write_manifest(self, manifest: Dict[str, Dict[str, Any]]) -> None:
+        fd, tmp_name = tempfile.mkstemp(prefix='.tmp-', suffix='.json', dir=self.root)
+        with os.fdopen(fd, 'w') as handle:
+            json.dump(manifest, handle, indent=2)
+        os.replace(tmp_name, self.root / MANIFEST_NAME)
+
+
+def default_shared_store() -> Optional[SharedMonthStore]:
+    """
+    Shared store configured by TGIR_SHARED_CACHE_DIR, or None when unset.
+    """
+    root = os.environ.get(SHARED_DIR_ENV)
+    return SharedMonthStore(Path(root)) if root else None
+
+
+def main():
+    """
+    List the months in a shared store directory.
+    """
+    parser = argparse.ArgumentParser(
+        description='Show the months published to the shared worker cache',
+        epilog='Example: python src/shared_store.py /dev/shm/tgir'
+    )
+    parser.add_argument('root', nargs='?', default=os.environ.get(SHARED_DIR_ENV),
+                        help=f'Shared directory (default: ${SHARED_DIR_ENV})')
+    args = parser.parse_args()
+    if not args.root:
+        parser.error(f"pass a directory or set {SHARED_DIR_ENV}")
+
+    store = SharedMonthStore(Path(args.root))
+    manifest = store.manifest()
+    print("=" * 80)
+    print(f"SHARED MONTH STORE: {store.root}  ({len(manifest)} months)")
+    print("=" * 80)
+    for fingerprint, entry in sorted(manifest.items(), key=lambda item: item[1]['created']):
+        print(f"  {fingerprint}  {entry['rows']:>7} rows  {entry['bytes'] / (1024 * 1024):>8.1f} MiB  {entry['source']}")
+
+
+if __name__ == "__main__":
+    main()
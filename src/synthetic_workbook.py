@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+Texas Grid Interconnect Reporter - Synthetic Workbook Generator
+Writes ERCOT-shaped GIM report workbooks for offline scale testing.
+
+The "Project Details - Large Gen" sheet reproduces the layout extract_large_gen_data
+expects: a 30-row preamble, a group header row, the main header row and the
+multi-row headers for the change-indicator and milestone columns.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+
+
+SHEET_NAME = "Project Details - Large Gen"
+
+# Column layout (0-indexed) of the Large Gen sheet, with header text per header row.
+# Row 31 holds the main header; rows 32-35 hold the multi-row headers for columns 11+.
+COLUMNS: List[Tuple[str, Dict[int, str]]] = [
+    ('INR', {31: 'INR'}),
+    ('Project Name', {31: 'Project Name'}),
+    ('GIM Study Phase', {31: 'GIM Study Phase'}),
+    ('Interconnecting Entity', {31: 'Interconnecting Entity'}),
+    ('POI Location', {31: 'POI Location'}),
+    ('County', {31: 'County'}),
+    ('CDR Reporting Zone', {31: 'CDR Reporting Zone'}),
+    ('Projected COD', {31: 'Projected COD'}),
+    ('Fuel', {31: 'Fuel'}),
+    ('Technology', {31: 'Technology'}),
+    ('Capacity (MW)', {31: 'Capacity (MW)'}),
+    ('Change indicators', {32: 'Change indicators: Proj Name, MW', 33: 'Size, COD, SFS/NtP, FIS Request,',
+                           34: 'Status Change INA-to-PLN'}),
+    ('Approval Date for Submission of Proof of Site Control', {32: 'Approval Date for', 33: 'Submission of Proof of ',
+                                                               34: 'Site Control'}),
+    ('Screening Study Started', {31: 'Screening Study Started'}),
+    ('Screening Study Complete', {31: 'Screening Study Complete'}),
+    ('FIS Requested', {31: 'FIS Requested'}),
+    ('FIS Approved', {31: 'FIS Approved'}),
+    ('Economic Study Required', {31: 'Economic Study Required'}),
+    ('IA Signed', {31: 'IA Signed'}),
+    ('Financial Security and Notice to Proceed Provided', {32: 'Financial Security ', 33: 'and Notice to ',
+                                                           34: 'Proceed Provided'}),
+    ('Air Permit', {31: 'Air Permit'}),
+    ('GHG Permit', {31: 'GHG Permit'}),
+    ('Water Availability', {31: 'Water Availability'}),
+    ('Meets Planning', {31: 'Meets Planning', 32: 'Guide Section 6.9(1) ', 33: 'Requirements for ',
+                        34: 'Inclusion in Planning ', 35: 'Models'}),
+    ('Meets All Planning', {31: 'Meets All Planning', 32: 'Guide Section 6.9', 33: 'Requirements for ',
+                            34: 'Inclusion in Planning', 35: 'Models'}),
+    ('Meets Planning Guide QSA (Section 5.9) Prerequisites', {32: 'Meets Planning Guide', 33: ' QSA (Section 5.9) ',
+                                                              34: 'Prerequisites'}),
+    ('Construction Start', {31: 'Construction Start'}),
+    ('Construction End', {31: 'Construction End'}),
+    ('Approved for Energization', {31: 'Approved for Energization'}),
+    ('Approved for Synchronization', {31: 'Approved for Synchronization'}),
+    ('Comment', {31: 'Comment'}),
+]
+COLUMN_NAMES = [name for name, _ in COLUMNS]
+
+PREAMBLE = {
+    7: 'GIM Project Details - Large Generators',
+    9: 'NOTES:',
+    10: 'Due to Protocol confidentiality provisions, only those projects for which a Full Interconnection '
+        'Study has been requested are included.',
+    12: 'Excludes projects that have a status of Inactive (status = INA).',
+    14: 'SYNTHETIC DATA - generated by src/synthetic_workbook.py for scale testing.',
+}
+GROUP_HEADERS = {0: 'Project Attributes', 11: '    Changes from Last Report', 12: 'GIM Project Milestone Dates'}
+
+# (Fuel, Technology) mix, typical MW and its spread, from recent ERCOT reports
+FUEL_TECH_MIX = [
+    ('OTH', 'BA', 0.505, 165, 90),
+    ('SOL', 'PV', 0.349, 200, 80),
+    ('WIN', 'WT', 0.085, 255, 110),
+    ('GAS', 'GT', 0.026, 310, 150),
+    ('GAS', 'CC', 0.014, 900, 300),
+    ('GAS', 'IC', 0.012, 165, 60),
+    ('GAS', 'ST', 0.002, 650, 200),
+    ('OTH', 'OT', 0.002, 80, 40),
+    ('MWH', 'OT', 0.002, 80, 40),
+    ('HYD', 'OT', 0.001, 80, 40),
+    ('OIL', 'OT', 0.001, 80, 40),
+    ('WAT', 'OT', 0.001, 80, 40),
+]
+
+# County, CDR zone and relative weight (share of projects in recent reports)
+COUNTIES = [
+    ('Brazoria', 'COASTAL', 55), ('Wharton', 'SOUTH', 40), ('Pecos', 'WEST', 40), ('Harris', 'HOUSTON', 37),
+    ('Milam', 'SOUTH', 33), ('San Patricio', 'COASTAL', 30), ('Navarro', 'NORTH', 30), ('Lamar', 'NORTH', 28),
+    ('Matagorda', 'COASTAL', 27), ('Cameron', 'COASTAL', 27), ('Hidalgo', 'SOUTH', 26), ('Webb', 'SOUTH', 25),
+    ('Ector', 'WEST', 24), ('Hill', 'NORTH', 23), ('Ellis', 'NORTH', 23), ('Bexar', 'SOUTH', 23),
+    ('Robertson', 'NORTH', 22), ('Zapata', 'SOUTH', 22), ('Freestone', 'NORTH', 21), ('Wilbarger', 'WEST', 21),
+    ('Haskell', 'WEST', 20), ('Upton', 'WEST', 20), ('Starr', 'SOUTH', 19), ('Grimes', 'NORTH', 18),
+    ('Reeves', 'WEST', 18), ('Victoria', 'SOUTH', 18), ('Glasscock', 'WEST', 18), ('Mitchell', 'WEST', 17),
+    ('McLennan', 'NORTH', 17), ('Duval', 'SOUTH', 17), ('Caldwell', 'SOUTH', 17), ('Borden', 'WEST', 17),
+    ('Jack', 'NORTH', 17), ('Howard', 'WEST', 17), ('Kaufman', 'NORTH', 17), ('Colorado', 'SOUTH', 16),
+    ('Nueces', 'COASTAL', 16), ('Nolan', 'WEST', 16), ('Goliad', 'SOUTH', 16), ('Scurry', 'WEST', 15),
+    ('Bastrop', 'SOUTH', 15), ('Brown', 'NORTH', 15), ('Hopkins', 'NORTH', 14), ('Falls', 'NORTH', 14),
+    ('Bell', 'NORTH', 14), ('Castro', 'PANHANDLE', 10), ('Deaf Smith', 'PANHANDLE', 9), ('Mills', 'NORTH', 8),
+    ('Fort Bend', 'HOUSTON', 12), ('Val Verde', 'WEST', 6), ('Kenedy', 'COASTAL', 6), ('Crockett', 'WEST', 8),
+]
+
+STUDY_PHASES = [
+    ('SS Started, FIS Started, No IA', 0.022),
+    ('SS Completed, FIS Not Started, IA', 0.001),
+    ('SS Completed, FIS Started, No IA', 0.598),
+    ('SS Completed, FIS Started, IA', 0.140),
+    ('SS Completed, FIS Completed, No IA', 0.066),
+    ('SS Completed, FIS Completed, IA', 0.173),
+]
+
+NAME_SUFFIX = {'BA': 'Storage', 'PV': 'Solar', 'WT': 'Wind', 'GT': 'Peaker', 'CC': 'Energy Center',
+               'IC': 'Power', 'ST': 'Station', 'OT': 'Project'}
+NAME_WORDS = np.array(['Lone Star', 'Mesquite', 'Bluebonnet', 'Pecan', 'Caprock', 'Red Oak', 'Cedar', 'Prairie',
+                       'Longhorn', 'Comanche', 'Brazos', 'Sabine', 'Llano', 'Frio', 'Nueces', 'Pinto', 'Rio',
+                       'Eagle', 'Falcon', 'Hawk', 'Coyote', 'Armadillo', 'Sandhill', 'Mustang', 'Sagebrush'])
+
+# Change-indicator strings as ERCOT formats them (fixed-width slots padded with spaces)
+CHANGE_FLAGS = {
+    'name': 'Proj Name     ',
+    'mw': 'MW Size    ',
+    'cod': 'COD  ',
+    'sfs': 'SFS/NtP',
+    'fis': 'FIS Request ',
+}
+
+
+def _dates(rng: np.random.Generator, start: str, end: str, size: int) -> np.ndarray:
+    """Uniform random day-resolution dates between start and end."""
+    lo, hi = np.datetime64(start, 'D'), np.datetime64(end, 'D')
+    return lo + rng.integers(0, int((hi - lo).astype(int)) + 1, size=size).astype('timedelta64[D]')
+
+
+def generate_projects(n_rows: int, report_date: str = '2026-01-01', seed: Optional[int] = None,
+                      inr_start: int = 0) -> pd.DataFrame:
+    """
+    Generate a realistic mix of Large Gen projects.
+
+    Args:
+        n_rows: Number of projects
+        report_date: Report month (YYYY-MM-DD); CODs and milestones are placed around it
+        seed: Random seed for reproducible output
+        inr_start: Offset for INR sequence numbers (keeps INRs unique across batches)
+
+    Returns:
+        DataFrame with the Large Gen column names used by extract_large_gen_data
+    """
+    rng = np.random.default_rng(seed)
+    report = pd.Timestamp(report_date)
+
+    mix_weights = np.array([m[2] for m in FUEL_TECH_MIX])
+    mix_idx = rng.choice(len(FUEL_TECH_MIX), size=n_rows, p=mix_weights / mix_weights.sum())
+    fuels = np.array([m[0] for m in FUEL_TECH_MIX])[mix_idx]
+    techs = np.array([m[1] for m in FUEL_TECH_MIX])[mix_idx]
+    mw_mean = np.array([m[3] for m in FUEL_TECH_MIX], dtype=float)[mix_idx]
+    mw_std = np.array([m[4] for m in FUEL_TECH_MIX], dtype=float)[mix_idx]
+    capacity = np.round(np.clip(rng.normal(mw_mean, mw_std), 1, 1800), 2)
+    # A handful of repowering projects report net (zero or negative) MW
+    repower = rng.random(n_rows) < 0.003
+    capacity[repower] = -np.round(rng.uniform(0, 60, repower.sum()), 1)
+
+    county_weights = np.array([c[2] for c in COUNTIES], dtype=float)
+    county_idx = rng.choice(len(COUNTIES), size=n_rows, p=county_weights / county_weights.sum())
+    counties = np.array([c[0] for c in COUNTIES])[county_idx]
+    zones = np.array([c[1] for c in COUNTIES])[county_idx]
+
+    phase_weights = np.array([p[1] for p in STUDY_PHASES])
+    phases = np.array([p[0] for p in STUDY_PHASES])[
+        rng.choice(len(STUDY_PHASES), size=n_rows, p=phase_weights / phase_weights.sum())]
+
+    # INRs carry the request year; most are from the last few years
+    request_year = np.clip(np.round(rng.normal(report.year % 100 - 1.5, 2.0, n_rows)), 15, report.year % 100 + 1)
+    seq = np.arange(inr_start, inr_start + n_rows)
+    inrs = pd.Series(request_year.astype(int).astype(str)) + 'INR' + pd.Series(seq % 10000 + 1).astype(str).str.zfill(4)
+    # Keep INRs unique beyond 10k projects per year the way ERCOT does for split projects
+    overflow = seq // 10000
+    inrs = inrs.where(overflow == 0, inrs + pd.Series(overflow).map(lambda k: chr(ord('a') + (k - 1) % 26)))
+
+    words = NAME_WORDS[rng.integers(0, len(NAME_WORDS), n_rows)]
+    suffix = pd.Series(techs).map(NAME_SUFFIX).to_numpy()
+    names = pd.Series(words) + ' ' + suffix + ' ' + pd.Series(rng.integers(1, 99, n_rows)).astype(str)
+
+    cod = pd.to_datetime(_dates(rng, str((report - pd.DateOffset(months=8)).date()),
+                                str((report + pd.DateOffset(years=6)).date()), n_rows))
+    ss_started = pd.to_datetime(_dates(rng, '2018-01-01', str((report - pd.DateOffset(months=6)).date()), n_rows))
+    ss_complete = ss_started + pd.to_timedelta(rng.integers(30, 200, n_rows), unit='D')
+    fis_requested = ss_complete + pd.to_timedelta(rng.integers(0, 120, n_rows), unit='D')
+    has_fis_approved = np.char.find(phases.astype(str), 'FIS Completed') >= 0
+    has_ia = np.char.endswith(phases.astype(str), ' IA') & ~np.char.endswith(phases.astype(str), 'No IA')
+    fis_approved = (fis_requested + pd.to_timedelta(rng.integers(200, 900, n_rows), unit='D')).where(has_fis_approved)
+    ia_signed = (fis_requested + pd.to_timedelta(rng.integers(100, 1000, n_rows), unit='D')).where(has_ia)
+
+    df = pd.DataFrame({
+        'INR': inrs.to_numpy(),
+        'Project Name': names.to_numpy(),
+        'GIM Study Phase': phases,
+        'Interconnecting Entity': (pd.Series(words) + ' ' + suffix + ', LLC').to_numpy(),
+        'POI Location': (pd.Series(rng.integers(1000, 99999, n_rows)).astype(str) + ' '
+                         + pd.Series(counties).str.upper() + ' ' + rng.choice(['138kV', '345kV'], n_rows)).to_numpy(),
+        'County': counties,
+        'CDR Reporting Zone': zones,
+        'Projected COD': cod,
+        'Fuel': fuels,
+        'Technology': techs,
+        'Capacity (MW)': capacity,
+        'Change indicators': None,
+        'Approval Date for Submission of Proof of Site Control': ss_started.where(rng.random(n_rows) < 0.8),
+        'Screening Study Started': ss_started,
+        'Screening Study Complete': ss_complete,
+        'FIS Requested': fis_requested,
+        'FIS Approved': fis_approved,
+        'Economic Study Required': np.where(rng.random(n_rows) < 0.15, 'Yes', 'No'),
+        'IA Signed': ia_signed,
+        'Financial Security and Notice to Proceed Provided': np.where(has_ia & (rng.random(n_rows) < 0.6), 'Yes', 'No'),
+        'Air Permit': np.where(np.isin(fuels, ['GAS', 'OIL']), None, 'Not Required'),
+        'GHG Permit': np.where(np.isin(fuels, ['GAS', 'OIL']), None, 'Not Required'),
+        'Water Availability': np.where(np.isin(fuels, ['GAS', 'OIL']), None, 'Not Required'),
+        'Meets Planning': ia_signed,
+        'Meets All Planning': ia_signed.where(rng.random(n_rows) < 0.6),
+        'Meets Planning Guide QSA (Section 5.9) Prerequisites': ia_signed.where(rng.random(n_rows) < 0.4),
+        'Construction Start': pd.NaT,
+        'Construction End': pd.NaT,
+        'Approved for Energization': pd.NaT,
+        'Approved for Synchronization': pd.NaT,
+        'Comment': None,
+    })
+    return df
+
+
+def apply_monthly_churn(df: pd.DataFrame, report_date: str, seed: Optional[int] = None,
+                        add_rate: float = 0.02, remove_rate: float = 0.01, change_rate: float = 0.08,
+                        inr_start: int = 0) -> pd.DataFrame:
+    """
+    Produce the next month's report from the previous one.
+
+    Removes a fraction of INRs, adds new ones and changes COD / MW / name / SFS /
+    FIS for others, filling the change-indicator column the way ERCOT does.
+
+    Args:
+        df: Previous month's projects
+        report_date: New report month (YYYY-MM-DD)
+        seed: Random seed
+        add_rate: New projects as a fraction of the previous row count
+        remove_rate: Fraction of previous projects dropped (withdrawn/commissioned)
+        change_rate: Fraction of remaining projects with at least one flagged change
+        inr_start: INR sequence offset for the added projects
+
+    Returns:
+        New month's DataFrame
+    """
+    rng = np.random.default_rng(seed)
+    n = len(df)
+
+    keep = rng.random(n) >= remove_rate
+    current = df.loc[keep].reset_index(drop=True).copy()
+    current['Change indicators'] = None
+    m = len(current)
+
+    changed = rng.random(m) < change_rate
+    # Each changed project gets one primary change type, with occasional combos (e.g. "MW Size  COD  ")
+    kinds = rng.choice(list(CHANGE_FLAGS), size=m, p=[0.05, 0.17, 0.6, 0.06, 0.12])
+    extra_cod = changed & (kinds == 'mw') & (rng.random(m) < 0.25)
+
+    is_cod = changed & ((kinds == 'cod') | extra_cod)
+    shift_days = rng.choice([-90, -30, 30, 60, 90, 120, 180, 365], size=m)
+    current.loc[is_cod, 'Projected COD'] = (
+        pd.to_datetime(current.loc[is_cod, 'Projected COD']) + pd.to_timedelta(shift_days[is_cod], unit='D'))
+
+    is_mw = changed & (kinds == 'mw')
+    factor = rng.uniform(0.7, 1.3, m)
+    current.loc[is_mw, 'Capacity (MW)'] = np.round(current.loc[is_mw, 'Capacity (MW)'].to_numpy() * factor[is_mw], 2)
+
+    is_name = changed & (kinds == 'name')
+    current.loc[is_name, 'Project Name'] = current.loc[is_name, 'Project Name'] + ' II'
+
+    is_sfs = changed & (kinds == 'sfs')
+    current.loc[is_sfs, 'Financial Security and Notice to Proceed Provided'] = 'Yes'
+
+    is_fis = changed & (kinds == 'fis')
+    current.loc[is_fis, 'FIS Requested'] = pd.Timestamp(report_date) - pd.Timedelta(days=15)
+
+    flags = pd.Series('', index=current.index, dtype=object)
+    for kind, mask in [('name', is_name), ('mw', is_mw), ('cod', is_cod), ('sfs', is_sfs), ('fis', is_fis)]:
+        flags[mask] = flags[mask] + CHANGE_FLAGS[kind]
+    current['Change indicators'] = flags.where(flags != '', None)
+
+    n_added = int(round(n * add_rate))
+    added = generate_projects(n_added, report_date=report_date, seed=None if seed is None else seed + 1,
+                              inr_start=inr_start) if n_added else current.iloc[0:0]
+
+    return pd.concat([current, added], ignore_index=True)
+
+
+def write_workbook(df: pd.DataFrame, output_path: Path) -> Path:
+    """
+    Write projects into an ERCOT-shaped workbook.
+
+    Uses openpyxl's write-only mode so memory stays flat for very large row counts.
+
+    Args:
+        df: Projects with the Large Gen column names (see COLUMN_NAMES)
+        output_path: Destination .xlsx file
+
+    Returns:
+        The output path
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(SHEET_NAME)
+    width = len(COLUMNS)
+
+    # Rows 1-29: title and notes
+    for row_num in range(1, 30):
+        row = [None] * width
+        row[0] = PREAMBLE.get(row_num)
+        ws.append(row)
+
+    # Row 30: group headers, rows 31-35: column headers
+    ws.append([GROUP_HEADERS.get(i) for i in range(width)])
+    for row_num in range(31, 36):
+        ws.append([headers.get(row_num) for _, headers in COLUMNS])
+
+    # Rows 36+: data. Convert to plain Python objects column-wise, then stream rows.
+    frame = df.reindex(columns=COLUMN_NAMES)
+    columns = []
+    for name in COLUMN_NAMES:
+        col = frame[name]
+        if pd.api.types.is_datetime64_any_dtype(col):
+            values = [None if pd.isna(v) else v.to_pydatetime() for v in col]
+        else:
+            values = col.astype(object).where(col.notna(), None).tolist()
+        columns.append(values)
+    for row in zip(*columns):
+        ws.append(row)
+
+    wb.save(output_path)
+    return output_path
+
+
+def generate_month_series(n_rows: int, months: int, output_root: Path, start: str = '2025-01',
+                          seed: int = 0, add_rate: float = 0.02, remove_rate: float = 0.01,
+                          change_rate: float = 0.08) -> List[Path]:
+    """
+    Write a sequence of monthly workbooks into output_root/<year>/<month>/file.xlsx.
+
+    Args:
+        n_rows: Projects in the first month
+        months: Number of consecutive months
+        output_root: Directory laid out like inputs/
+        start: First report month (YYYY-MM)
+        seed: Base random seed
+        add_rate: Monthly additions as a fraction of the queue
+        remove_rate: Monthly removals as a fraction of the queue
+        change_rate: Monthly fraction of projects with flagged changes
+
+    Returns:
+        Paths of the written workbooks, oldest first
+    """
+    periods = pd.period_range(start=start, periods=months, freq='M')
+    written = []
+    df = None
+    next_inr = 0
+    for i, period in enumerate(periods):
+        report_date = str(period.start_time.date())
+        if df is None:
+            df = generate_projects(n_rows, report_date=report_date, seed=seed)
+            next_inr = n_rows
+        else:
+            n_added = int(round(len(df) * add_rate))
+            df = apply_monthly_churn(df, report_date, seed=seed + i * 7919, add_rate=add_rate,
+                                     remove_rate=remove_rate, change_rate=change_rate, inr_start=next_inr)
+            next_inr += n_added
+        path = output_root / f"{period.year}" / f"{period.month:02d}" / "file.xlsx"
+        written.append(write_workbook(df, path))
+    return written
+
+
+def main():
+    """
+    Generate synthetic monthly workbooks from the command line.
+    """
+    parser = argparse.ArgumentParser(
+        description='Generate ERCOT-shaped synthetic GIM workbooks for scale testing',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python src/synthetic_workbook.py --rows 20000 --output /tmp/synthetic_inputs
+  python src/synthetic_workbook.py --rows 180000 --months 12 --start 2024-01 --output /tmp/big
+        """
+    )
+    parser.add_argument('--rows', type=int, default=1800, help='Projects in the first month (default: 1800)')
+    parser.add_argument('--months', type=int, default=1, help='Number of consecutive months (default: 1)')
+    parser.add_argument('--start', default='2026-01', help='First report month, YYYY-MM (default: 2026-01)')
+    parser.add_argument('--output', '-o', type=Path, required=True,
+                        help='Output root, laid out as <year>/<month>/file.xlsx')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    parser.add_argument('--add-rate', type=float, default=0.02, help='Monthly additions fraction (default: 0.02)')
+    parser.add_argument('--remove-rate', type=float, default=0.01, help='Monthly removals fraction (default: 0.01)')
+    parser.add_argument('--change-rate', type=float, default=0.08, help='Monthly changed fraction (default: 0.08)')
+    args = parser.parse_args()
+
+    if args.rows <= 0 or args.months <= 0:
+        print("ERROR: --rows and --months must be positive", file=sys.stderr)
+        sys.exit(1)
+
+    written = generate_month_series(args.rows, args.months, args.output, start=args.start, seed=args.seed,
+                                    add_rate=args.add_rate, remove_rate=args.remove_rate,
+                                    change_rate=args.change_rate)
+    for path in written:
+        print(f"✓ Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
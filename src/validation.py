@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Texas Grid Interconnect Reporter - Data Quality Validation
+Vectorized schema and data-quality checks for the "Project Details - Large Gen" sheet.
+"""
+
+import argparse
+import csv
+import io
+import json
+import sys
+import time
+from itertools import repeat
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from constants import FUEL_TYPES, TECHNOLOGY_TYPES
+
+
+# Columns every downstream report and endpoint relies on
+REQUIRED_COLUMNS = [
+    'INR',
+    'Project Name',
+    'GIM Study Phase',
+    'County',
+    'Projected COD',
+    'Fuel',
+    'Technology',
+    'Capacity (MW)',
+]
+
+# Plausible bounds for a single Large Gen project and its projected COD
+MAX_CAPACITY_MW = 5000.0
+MIN_COD = pd.Timestamp('1990-01-01')
+MAX_COD = pd.Timestamp('2100-12-31')
+
+# Number of offending rows kept per check in the JSON report (the CSV keeps all of them)
+MAX_SAMPLES_PER_CHECK = 25
+
+ISSUE_COLUMNS = ['row', 'INR', 'check', 'severity', 'column', 'value']
+
+
+def _unknown_code_mask(series: pd.Series, known_codes: Dict[str, str]) -> np.ndarray:
+    """
+    Flag codes missing from a lookup table by checking only the distinct values.
+
+    Args:
+        series: Raw low-cardinality code column (e.g. Fuel or Technology)
+        known_codes: Acronym lookup from constants.py
+
+    Returns:
+        Boolean array, True where a non-blank code is not in known_codes
+    """
+    codes, uniques = pd.factorize(series)
+    unknown = np.array([bool(str(u).strip()) and str(u).strip().upper() not in known_codes for u in uniques] + [False])
+    return unknown[codes]
+
+
+def validate_large_gen_data(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Run whole-column data-quality checks against a raw Large Gen DataFrame.
+
+    The frame is expected *before* any cleaning (e.g. prior to the Capacity (MW)
+    coercion in extract_large_gen_data) so that bad values are still visible.
+
+    Args:
+        df: Raw DataFrame with the Large Gen column names applied
+
+    Returns:
+        Dictionary with per-check results, a sample of offending rows per check
+        and every offending row as CSV text under 'issues_csv'
+    """
+    start = time.perf_counter()
+    checks: List[Dict[str, Any]] = []
+    failures: List[tuple] = []
+    inr_values = df['INR'].to_numpy(dtype=object) if 'INR' in df.columns else np.full(len(df), None, dtype=object)
+
+    def record(check: str, severity: str, column: str, mask: Optional[np.ndarray] = None, detail: str = '') -> None:
+        rows = np.flatnonzero(mask) if mask is not None else np.empty(0, dtype=np.intp)
+        checks.append({
+            'check': check,
+            'column': column,
+            'severity': severity,
+            'status': 'fail' if len(rows) or detail else 'pass',
+            'failed_rows': int(len(rows)),
+            'detail': detail,
+        })
+        if len(rows):
+            failures.append((check, severity, column, rows))
+
+    # 1. Required columns
+    missing_columns = [c for c in REQUIRED_COLUMNS if c not in df.columns]
+    record('required_columns', 'error', ', '.join(REQUIRED_COLUMNS),
+           detail=f"Missing columns: {', '.join(missing_columns)}" if missing_columns else '')
+
+    # 2. INR presence and uniqueness
+    if 'INR' in df.columns:
+        inr = df['INR']
+        missing_inr = (inr.isna() | (inr.astype(str).str.strip() == '')).to_numpy()
+        record('missing_inr', 'error', 'INR', missing_inr)
+        record('duplicate_inr', 'error', 'INR', inr.duplicated(keep=False).to_numpy() & ~missing_inr)
+
+    # 3. Projected COD parseability and range
+    if 'Projected COD' in df.columns:
+        raw_cod = df['Projected COD']
+        cod = pd.to_datetime(raw_cod, errors='coerce')
+        present = raw_cod.notna().to_numpy()
+        parsed = cod.notna().to_numpy()
+        record('unparseable_cod', 'warning', 'Projected COD', present & ~parsed)
+        record('missing_cod', 'warning', 'Projected COD', ~present)
+        record('cod_out_of_range', 'warning', 'Projected COD',
+               parsed & ((cod < MIN_COD) | (cod > MAX_COD)).to_numpy())
+
+    # 4. Capacity (MW) numeric and within range
+    if 'Capacity (MW)' in df.columns:
+        raw_mw = df['Capacity (MW)']
+        mw = pd.to_numeric(raw_mw, errors='coerce').to_numpy(dtype=float)
+        present = raw_mw.notna().to_numpy()
+        with np.errstate(invalid='ignore'):
+            record('non_numeric_mw', 'warning', 'Capacity (MW)', present & np.isnan(mw))
+            record('missing_mw', 'warning', 'Capacity (MW)', ~present)
+            record('negative_mw', 'warning', 'Capacity (MW)', mw < 0)
+            record('mw_above_max', 'warning', 'Capacity (MW)', mw > MAX_CAPACITY_MW)
+
+    # 5. Fuel and technology codes known to constants.py
+    for column, known_codes, check in [('Fuel', FUEL_TYPES, 'unknown_fuel_code'),
+                                       ('Technology', TECHNOLOGY_TYPES, 'unknown_technology_code')]:
+        if column in df.columns:
+            record(check, 'warning', column, _unknown_code_mask(df[column], known_codes))
+
+    samples: Dict[str, List[Dict[str, Any]]] = {}
+    unknown_codes: Dict[str, Dict[str, int]] = {}
+    issues_csv = io.StringIO()
+    writer = csv.writer(issues_csv, lineterminator='\n')
+    writer.writerow(ISSUE_COLUMNS)
+    for check, severity, column, rows in failures:
+        if column in df.columns:
+            raw_values = df[column].to_numpy(dtype=object)[rows]
+            values = np.where(pd.isna(raw_values), None, raw_values.astype(str))
+        else:
+            values = np.full(len(rows), None, dtype=object)
+        writer.writerows(zip(rows.tolist(), inr_values[rows], repeat(check), repeat(severity), repeat(column), values))
+        samples[check] = [
+            {'row': int(r), 'INR': inr_values[r], 'value': v}
+            for r, v in zip(rows[:MAX_SAMPLES_PER_CHECK], values[:MAX_SAMPLES_PER_CHECK])
+        ]
+        if check in ('unknown_fuel_code', 'unknown_technology_code'):
+            distinct, counts = np.unique(values.astype(str), return_counts=True)
+            unknown_codes[check] = {str(k): int(c) for k, c in zip(distinct, counts)}
+
+    errors = sum(1 for c in checks if c['status'] == 'fail' and c['severity'] == 'error')
+    warnings = sum(1 for c in checks if c['status'] == 'fail' and c['severity'] == 'warning')
+
+    return {
+        'row_count': int(len(df)),
+        'passed': errors == 0,
+        'error_checks': errors,
+        'warning_checks': warnings,
+        'checks': checks,
+        'unknown_codes': unknown_codes,
+        'samples': samples,
+        'elapsed_ms': round((time.perf_counter() - start) * 1000, 3),
+        # Kept as CSV text: the report travels in DataFrame.attrs, which pandas
+        # compares and deep-copies on most operations
+        'issues_csv': issues_csv.getvalue(),
+    }
+
+
+def write_quality_report(report: Dict[str, Any], output_dir: Path, source: Optional[Path] = None) -> Path:
+    """
+    Write a quality report as JSON (summary) and CSV (all offending rows).
+
+    Args:
+        report: Report returned by validate_large_gen_data
+        output_dir: Directory to write 'quality_report.json' and 'quality_issues.csv' into
+        source: Optional path of the workbook the report was built from
+
+    Returns:
+        Path of the JSON report
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    summary = {k: v for k, v in report.items() if k != 'issues_csv'}
+    if source is not None:
+        summary = {'source': str(source), **summary}
+
+    json_path = output_dir / 'quality_report.json'
+    with open(json_path, 'w') as f:
+        json.dump(summary, f, indent=2, default=str)
+
+    with open(output_dir / 'quality_issues.csv', 'w', newline='') as f:
+        f.write(report.get('issues_csv') or ','.join(ISSUE_COLUMNS) + '\n')
+
+    return json_path
+
+
+def main():
+    """
+    Validate every bundled month (or a single file) and write quality reports to outputs/quality.
+    """
+    from extract_large_gen import extract_large_gen_data
+
+    parser = argparse.ArgumentParser(description='Validate ERCOT Large Gen input workbooks')
+    parser.add_argument('input_file', nargs='?', default=None,
+                        help='Path to a single Excel file (default: every inputs/<year>/<month>/file.xlsx)')
+    args = parser.parse_args()
+
+    project_root = Path(__file__).parent.parent
+    inputs_dir = project_root / "inputs"
+    quality_dir = project_root / "outputs" / "quality"
+
+    if args.input_file:
+        files = [Path(args.input_file)]
+    else:
+        files = sorted(inputs_dir.glob("*/*/file.xlsx"))
+
+    if not files:
+        print(f"ERROR: No input files found under {inputs_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    failed = False
+    for file_path in files:
+        df = extract_large_gen_data(file_path)
+        report = df.attrs['quality_report']
+
+        if file_path.parent.parent.parent == inputs_dir:
+            output_dir = quality_dir / file_path.parent.parent.name / file_path.parent.name
+        else:
+            output_dir = quality_dir / file_path.stem
+        json_path = write_quality_report(report, output_dir, source=file_path)
+
+        status = "PASS" if report['passed'] else "FAIL"
+        print(f"{status}  {file_path}  rows={report['row_count']}  "
+              f"errors={report['error_checks']}  warnings={report['warning_checks']}  "
+              f"({report['elapsed_ms']:.1f} ms)  -> {json_path}")
+        failed = failed or not report['passed']
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import os
+import sys
+import threading
+from pathlib import Path
+
+# Add project root and src to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+sys.path.append(str(project_root / "src"))
+
+from artifact_store import ArtifactStore, artifact_key, canonical_params
+
+
+def write_png(content: bytes, calls: list):
+    def render(work_dir: Path):
+        calls.append(1)
+        (work_dir / 'chart.png').write_bytes(content)
+    return render
+
+
+def test_identical_requests_share_one_render(tmp_path):
+    store = ArtifactStore(tmp_path)
+    calls = []
+    results = []
+
+    def request(quarters):
+        results.append(store.get_or_render('abc', 'county-fuel', {'quarters': quarters}, write_png(b'png', calls)))
+
+    threads = [threading.Thread(target=request, args=(q,))
+               for q in (['2026Q1', '2026Q2'], ['2026Q2', '2026Q1']) * 4]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(10)
+
+    assert len(calls) == 1
+    assert len({path for path, _ in results}) == 1
+    assert sorted(cached for _, cached in results) == [False] + [True] * 7
+    assert results[0][0].read_bytes() == b'png'
+    # No temporary render directories are left behind
+    assert [p.name for p in tmp_path.iterdir()] == [results[0][0].name]
+
+    other, cached = store.get_or_render('abc', 'county-fuel', {'quarters': ['2026Q3']}, write_png(b'other', calls))
+    assert not cached and other != results[0][0]
+    assert artifact_key('abc', 'cod') != artifact_key('def', 'cod')
+
+
+def test_canonical_params_shared_with_result_cache():
+    from web.backend.result_cache import canonical_key
+
+    params = {'quarters': ['2026Q2', '2026Q1', '2026Q2'], 'county': None, 'fuel': []}
+    assert canonical_params(params) == {'quarters': ['2026Q1', '2026Q2']}
+    assert artifact_key('abc', 'cod', params) == artifact_key('abc', 'cod', {'quarters': ('2026Q1', '2026Q2')})
+    assert canonical_key('abc', 'cod', params) == canonical_key('abc', 'cod', {'quarters': ['2026Q1', '2026Q2']})
+
+
+def test_quota_evicts_least_recently_used(tmp_path):
+    store = ArtifactStore(tmp_path, quota_bytes=250)
+    calls = []
+    paths = {}
+    for i, name in enumerate(['a', 'b', 'c']):
+        paths[name], _ = store.get_or_render(name, 'cod', None, write_png(b'x' * 100, calls))
+        os.utime(paths[name], ns=(i * 10**9, i * 10**9))
+
+    # 'c' just pushed the store over quota, so the oldest ('a') went; now reuse 'b' and add 'd'
+    assert not paths['a'].exists() and paths['b'].exists() and paths['c'].exists()
+    store.get_or_render('b', 'cod', None, write_png(b'x' * 100, calls))
+    store.get_or_render('d', 'cod', None, write_png(b'x' * 100, calls))
+    assert paths['b'].exists() and not paths['c'].exists()
+    assert store.usage() <= 250
@@ -0,0 +1,40 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "src"))
+
+from change_flags import CHANGE_FLAGS_COLUMN, add_change_flags, change_flag_mask, flagged_changes
+
+INDICATOR = 'Change indicators: Proj Name, MW Size, COD, SFS/NtP, FIS Request, Status Change INA-to-PLN'
+
+
+def test_change_indicators_parse_into_queryable_flags():
+    df = pd.DataFrame({
+        'INR': ['A', 'B', 'C', 'D', 'E'],
+        'Project Name': ['Alpha', 'Beta', 'Gamma', 'Delta', 'Epsilon'],
+        'County': ['Pecos', 'Ector', 'Pecos', 'Harris', 'Webb'],
+        'GIM Study Phase': ['FIS Started', 'Planning', 'IA Signed', 'FIS Started', 'Planning'],
+        'Projected COD': [pd.Timestamp('2027-06-30'), '2028-01-15', None, pd.Timestamp('2026-12-01'), None],
+        'Capacity (MW)': [150.0, 99.5, 10.0, 0.0, 20.0],
+        'FIS Requested': [None, None, None, None, pd.Timestamp('2024-03-01')],
+        INDICATOR: ['COD  ', 'MW Size  COD', np.nan, '   ', 'FIS Request '],
+    })
+    add_change_flags(df)
+
+    assert df[CHANGE_FLAGS_COLUMN].tolist() == [4, 6, 0, 0, 16]
+    assert change_flag_mask(df).tolist() == [True, True, False, False, True]
+    assert change_flag_mask(df, ['cod']).tolist() == [True, True, False, False, False]
+    assert change_flag_mask(df, ['cod', 'mw_size'], match_all=True).tolist() == [False, True, False, False, False]
+
+    changes = flagged_changes(df)
+    assert [c['INR'] for c in changes] == ['A', 'B', 'E']
+    assert changes[0]['change_flag'] == 'COD'
+    assert changes[0]['new_values'] == ['New COD: 2027-06-30']
+    assert changes[1]['change_types'] == ['cod', 'mw_size']
+    assert changes[1]['new_values'] == ['New COD: 2028-01-15', 'New MW: 99.5']
+    assert changes[2]['new_values'] == ['FIS Requested: 2024-03-01']
@@ -0,0 +1,94 @@
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add project root and src to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+sys.path.append(str(project_root / "src"))
+
+from fastapi.testclient import TestClient
+
+from artifact_store import ArtifactStore
+from chart_specs import build_chart_spec, CHART_SPECS, limit_categories
+from dataset import MonthDataset, normalize_month_frame
+from reports import EAGER_TIERS, REPORT_RENDERERS, EmptyChartError, render_eager_tiers, render_report_artifact
+from web.backend.main import app
+
+
+def projects() -> pd.DataFrame:
+    return pd.DataFrame({
+        'INR': ['21INR0001', '22INR0002', '23INR0003', '24INR0004', '25INR0005'],
+        'County': ['Pecos', 'Reeves', 'Pecos', 'Ward', np.nan],
+        'Projected COD': [pd.Timestamp('2026-03-01'), '2026-08-15', 'TBD', pd.Timestamp('2026-09-30'), np.nan],
+        'Fuel': ['SOL', 'WIN', 'OTH', 'SOL', 'XYZ'],
+        'Technology': ['PV', 'WT', 'BA', 'PV', 'PV'],
+        'Capacity (MW)': [150.5, 200.0, 49.25, 10.0, 5.0],
+    })
+
+
+def test_specs_carry_aggregated_series_labels_and_colors():
+    df = projects()
+    specs = {report: build_chart_spec(report, df) for report in CHART_SPECS}
+    json.dumps(specs)
+
+    county = specs['county']
+    assert county['categories'] == ['Ward', 'Pecos', 'Reeves']
+    assert county['series'][0]['values'] == [10.0, 199.75, 200.0]
+
+    assert specs['cod']['categories'] == ['2026Q1', '2026Q3']
+    assert specs['cod']['series'][0]['values'] == [1, 2]
+    assert specs['cod']['date_range'] == ['2026-03-01', '2026-09-30']
+
+    fuel = specs['fuel']
+    assert fuel['categories'] == ['Wind', 'Solar', 'Other', 'XYZ']
+    assert fuel['colors'][:2] == ['#87CEEB', '#FFD700'] and fuel['colors'][-1] == '#D3D3D3'
+    assert fuel['table']['rows'][1] == ['Solar', 2, 160.5, round(160.5 / 414.75 * 100, 2)]
+
+    county_fuel = build_chart_spec('county-fuel', df, quarters=['2026Q3'])
+    assert county_fuel['subtitle'] == 'Quarters: 2026Q3'
+    assert county_fuel['categories'] == ['Ward', 'Reeves']
+    assert {s['name']: s['values'] for s in county_fuel['series']} == {'Solar': [10.0, 0.0], 'Wind': [0.0, 200.0]}
+
+
+def test_png_renderers_draw_the_specs(tmp_path):
+    df = projects()
+    for renderer in REPORT_RENDERERS.values():
+        renderer(df, tmp_path)
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        'cod_quarterly_buckets.png', 'county_fuel_breakdown.png', 'county_mw_breakdown.png',
+        'fuel_type_breakdown.png', 'technology_type_breakdown.png']
+
+
+def test_tiers_and_formats_are_cached_separately(tmp_path):
+    dataset = MonthDataset(Path('inputs/2026/01/file.xlsx'), normalize_month_frame(projects()), 'abc')
+    store = ArtifactStore(tmp_path)
+
+    thumbnail, cached = render_report_artifact(store, dataset, 'county', tier='thumbnail', fmt='webp')
+    assert not cached and thumbnail.suffix == '.webp' and thumbnail.read_bytes()[8:12] == b'WEBP'
+    printed, cached = render_report_artifact(store, dataset, 'county', tier='print', fmt='png')
+    assert not cached and printed != thumbnail
+    assert thumbnail.stat().st_size * 10 < printed.stat().st_size
+
+    # Eager tiers render once per report and reuse what exists; empty selections are skipped
+    warmed = render_eager_tiers(store, dataset, fmt='webp')
+    assert len(warmed) == len(REPORT_RENDERERS) * len(EAGER_TIERS)
+    assert [cached for path, cached in warmed if path == thumbnail] == [True]
+    assert all(cached for _, cached in render_eager_tiers(store, dataset, fmt='webp'))
+    assert render_eager_tiers(store, dataset, ['county-fuel'], quarters=['2030Q1']) == []
+    with pytest.raises(EmptyChartError):
+        render_report_artifact(store, dataset, 'county-fuel', quarters=['2030Q1'])
+
+    spec = build_chart_spec('county', projects())
+    assert limit_categories(spec, 2)['categories'] == ['Pecos', 'Reeves']
+    assert limit_categories(spec, 2)['series'][0]['values'] == [199.75, 200.0]
+
+
+def test_report_chart_endpoint_empty_selection_is_404():
+    response = TestClient(app).get('/api/report-chart', params={'report': 'county-fuel', 'quarters': '2099Q1'})
+    assert response.status_code == 404
+    assert response.json()['detail'] == 'No data for the selected quarters'
@@ -0,0 +1,75 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add project root and src to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+sys.path.append(str(project_root / "src"))
+
+from fastapi.testclient import TestClient
+
+from cod_index import CodIndex
+from web.backend.main import app
+
+
+def test_cod_ranges_match_boolean_scans():
+    rng = np.random.default_rng(11)
+    n = 500
+    dates = pd.Series(pd.to_datetime('2024-01-01') + pd.to_timedelta(rng.integers(0, 2000, n), unit='D'))
+    dates[rng.random(n) < 0.1] = pd.NaT
+    df = pd.DataFrame({
+        'COD Date': dates,
+        'Fuel_Normalized': rng.choice(['Solar', 'Wind', 'Gas'], n),
+        'Capacity (MW)': rng.uniform(10, 500, n).round(1),
+    })
+    df.loc[3, 'Capacity (MW)'] = np.nan
+    index = CodIndex.from_frame(df)
+    assert len(index) == int(dates.notna().sum())
+
+    start, end = pd.Timestamp('2025-03-15'), pd.Timestamp('2026-09-01')
+    mask = (df['COD Date'] >= start) & (df['COD Date'] < end)
+    totals = index.range_totals(start, end)
+    assert totals['project_count'] == int(mask.sum())
+    assert np.isclose(totals['total_mw'], df.loc[mask, 'Capacity (MW)'].sum())
+    by_fuel = df[mask].groupby('Fuel_Normalized')['Capacity (MW)'].sum()
+    for fuel, mw in by_fuel.items():
+        assert np.isclose(totals['by_fuel'][fuel]['mw'], mw)
+    assert sorted(index.range_rows(start, end).tolist()) == np.flatnonzero(mask).tolist()
+
+    # Open-ended and empty windows
+    assert index.range_totals()['project_count'] == len(index)
+    assert index.range_totals(end, start)['project_count'] == 0
+
+    # Quarter buckets agree with a groupby on the period
+    counts = index.buckets('Q')['count'].sum(axis=1)
+    expected = df.dropna(subset=['COD Date']).groupby(df['COD Date'].dt.to_period('Q')).size()
+    assert counts[counts > 0].to_dict() == expected.to_dict()
+
+    # Buckets over a window that splits its first and last quarters add up to its totals
+    window = index.buckets('Q', start, end - pd.Timedelta(days=1))
+    assert window['count'].to_numpy().sum() == totals['project_count']
+    assert np.isclose(window['mw'].to_numpy().sum(), totals['total_mw'])
+    assert window['count'].iloc[0].sum() == int((mask & (df['COD Date'] < pd.Timestamp('2025-04-01'))).sum())
+
+    # Month curve: periods start on the 1st, so the final value covers March 2025 through August 2026
+    curve = index.cumulative_curve('M', start, end - pd.Timedelta(days=1))
+    covered = (df['COD Date'] >= pd.Timestamp('2025-03-01')) & (df['COD Date'] < end)
+    assert len(curve) == 18
+    assert np.isclose(curve.iloc[-1].sum(), df.loc[covered, 'Capacity (MW)'].sum())
+
+
+def test_cod_window_endpoint():
+    client = TestClient(app)
+    params = {'start': '2026-02-15', 'end': '2027-05-20'}
+    for freq in ('M', 'Q', 'Y'):
+        window = client.get('/api/cod-window', params={**params, 'freq': freq}).json()
+        assert sum(bucket['count'] for bucket in window['buckets']) == window['project_count']
+        assert np.isclose(sum(bucket['mw'] for bucket in window['buckets']), window['total_mw'], atol=0.01)
+
+    reversed_window = {'start': '2030-01-01', 'end': '2020-01-01'}
+    for url in ('/api/cod-window', '/api/capacity-curve'):
+        response = client.get(url, params=reversed_window)
+        assert response.status_code == 400 and 'after start' in response.json()['detail']
@@ -0,0 +1,92 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add project root and src to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+sys.path.append(str(project_root / "src"))
+
+from fastapi.testclient import TestClient
+
+from county_geo import CountyGeometry, bin_colors, county_key, county_map_payload, simplify_line, texas_topology
+from web.backend.main import app
+
+
+def tiny_topology() -> dict:
+    # Two Texas squares sharing arc 1, and one Oklahoma county on arc 2
+    return {
+        'type': 'Topology',
+        'transform': {'scale': [0.001, 0.001], 'translate': [-100.0, 30.0]},
+        'objects': {'counties': {'type': 'GeometryCollection', 'geometries': [
+            {'type': 'Polygon', 'arcs': [[0, 1]], 'id': '48001', 'properties': {'name': 'Anderson'}},
+            {'type': 'Polygon', 'arcs': [[3, ~1]], 'id': '48123', 'properties': {'name': 'DeWitt'}},
+            {'type': 'Polygon', 'arcs': [[2]], 'id': '40001', 'properties': {'name': 'Adair'}},
+        ]}},
+        'arcs': [
+            [[0, 0], [0, 1000], [1000, 0]],
+            [[1000, 1000], [0, -500], [1, -500], [-1001, 0]],
+            [[5000, 5000], [10, 0], [0, 10], [-10, -10]],
+            [[1000, 1000], [1000, 0], [0, -1000], [-1000, 0]],
+        ],
+    }
+
+
+def test_texas_topology_keeps_shared_borders():
+    line = np.array([[0.0, 0.0], [1.0, 0.001], [2.0, 0.0], [3.0, 1.0]])
+    assert simplify_line(line, 0.01).tolist() == [[0.0, 0.0], [2.0, 0.0], [3.0, 1.0]]
+    ring = np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]])
+    assert len(simplify_line(ring, 0.01)) == 4
+
+    topology = texas_topology(tiny_topology(), tolerance=0.01, quantization=1001)
+    geometries = topology['objects']['counties']['geometries']
+    assert [g['id'] for g in geometries] == ['48001', '48123']
+    # Arcs 0, 1 and 3 renumbered to 0, 1, 2; the border stays one arc used both ways
+    assert [g['arcs'] for g in geometries] == [[[0, 1]], [[2, ~1]]]
+    assert len(topology['arcs']) == 3
+    # The nearly straight middle point of the shared border is dropped
+    assert len(topology['arcs'][1]) == 3
+    assert topology['bbox'] == [-100.0, 30.0, -98.0, 31.0]
+
+
+def test_county_map_payload_joins_and_bins():
+    geometry = CountyGeometry(texas_topology(tiny_topology(), quantization=1001))
+    assert county_key('De Witt County') == 'DEWITT' and geometry.fips_for('De Witt') == '48123'
+    assert len(geometry.version) == 16 and geometry.gzipped
+
+    mw = pd.Series({'Anderson': 700.4, 'De Witt': 90.0, 'Nowhere': 5.0})
+    counts = pd.Series({'Anderson': 3, 'De Witt': 1, 'Nowhere': 1})
+    payload = county_map_payload(geometry, mw, counts, {'Anderson': 'Solar: 700 MW'}, bins=7)
+    assert payload['geometry_version'] == geometry.version
+    assert payload['legend']['edges'] == [0.0, 100.1, 200.1, 300.2, 400.2, 500.3, 600.3, 700.4]
+    assert payload['legend']['colors'] == bin_colors(7) and len(set(bin_colors(7))) == 7
+    assert payload['counties'] == {'fips': ['48001', '48123'], 'name': ['Anderson', 'De Witt'], 'bin': [6, 0],
+                                   'mw': [700, 90], 'projects': [3, 1], 'fuels': ['Solar: 700 MW', '']}
+    assert payload['unmatched'] == ['Nowhere']
+
+    # Small totals keep distinct edges; no MW at all has no scale
+    small = county_map_payload(geometry, pd.Series({'Anderson': 3.0}), pd.Series({'Anderson': 1}), {}, bins=3)
+    assert small['legend']['edges'] == [0.0, 1.0, 2.0, 3.0] and small['counties']['bin'] == [2]
+    empty = county_map_payload(geometry, pd.Series(dtype=float), pd.Series(dtype=int), {})
+    assert empty['legend'] is None and empty['counties']['fips'] == []
+    zero = county_map_payload(geometry, pd.Series({'Anderson': 0.0}), pd.Series({'Anderson': 2}), {})
+    assert zero['legend'] is None and zero['counties']['bin'] == [0]
+
+
+def test_county_map_endpoints():
+    client = TestClient(app)
+    payload = client.get('/api/county-map').json()
+    counties = payload['counties']
+    assert counties['fips'] and all(fips.startswith('48') for fips in counties['fips'])
+    assert len(set(map(len, counties.values()))) == 1
+
+    url = payload['geometry_url']
+    response = client.get(url, headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    assert response.headers['cache-control'] == 'public, max-age=31536000, immutable'
+    ids = {g['id'] for g in response.json()['objects']['counties']['geometries']}
+    assert set(counties['fips']) <= ids
+    assert client.get(url, headers={'If-None-Match': response.headers['etag']}).status_code == 304
+    assert client.get('/api/county-geometry').headers['cache-control'] == 'no-cache'
@@ -0,0 +1,82 @@
+import os
+import shutil
+import sys
+import threading
+from pathlib import Path
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "src"))
+
+import pandas as pd
+import pytest
+
+from dataset import DERIVED_COLUMNS, MonthDatasetCache
+
+
+def test_month_cache_reuses_parse_until_file_changes(tmp_path):
+    source = sorted((project_root / "inputs").glob("*/*/file.xlsx"))[0]
+    path = tmp_path / "2025" / "10" / "file.xlsx"
+    path.parent.mkdir(parents=True)
+    shutil.copy(source, path)
+
+    cache = MonthDatasetCache(max_entries=1)
+    first, hit = cache.get(path)
+    assert not hit
+    assert set(DERIVED_COLUMNS) <= set(first.frame.columns)
+    assert first.period == "2025/10"
+    assert first.raw_columns[0] == 'INR' and 'Quarter' not in first.raw_columns
+
+    again, hit = cache.get(path)
+    assert hit and again is first
+
+    # A rewritten workbook is parsed again; content fingerprint is unchanged for identical bytes
+    os.utime(path, ns=(1, 1))
+    reloaded, hit = cache.get(path)
+    assert not hit and reloaded is not first
+    assert reloaded.fingerprint == first.fingerprint
+    assert cache.stats()['entries'] == 1
+
+
+def test_slow_load_does_not_block_other_months(tmp_path):
+    paths = []
+    for month in ("10", "11"):
+        path = tmp_path / "2025" / month / "file.xlsx"
+        path.parent.mkdir(parents=True)
+        path.write_text(month)
+        paths.append(path)
+
+    release = threading.Event()
+    loads = []
+
+    def loader(path):
+        loads.append(path.parent.name)
+        if path.parent.name == "11":
+            assert release.wait(10)
+        return pd.DataFrame({'INR': ['A'], 'County': ['Pecos'], 'Projected COD': ['TBD'], 'Fuel': ['SOL'],
+                             'Technology': ['PV'], 'Capacity (MW)': [1.0]})
+
+    cache = MonthDatasetCache(loader=loader)
+    cache.get(paths[0])
+    slow = [threading.Thread(target=cache.get, args=(paths[1],)) for _ in range(2)]
+    for thread in slow:
+        thread.start()
+    # October is served while November is still loading
+    assert cache.get(paths[0])[1]
+    release.set()
+    for thread in slow:
+        thread.join()
+    # Both November requests shared one load
+    assert loads == ["10", "11"] and cache.stats()['misses'] == 2
+
+    # Per-workbook locks go once nobody is loading that workbook, even after a failed load
+    broken = tmp_path / "2025" / "12" / "file.xlsx"
+    broken.parent.mkdir(parents=True)
+    broken.write_text("12")
+    def unreadable(path):
+        raise ValueError(f"cannot read {path}")
+
+    cache.loader = unreadable
+    with pytest.raises(ValueError):
+        cache.get(broken)
+    assert cache._path_locks == {}
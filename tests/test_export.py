@@ -0,0 +1,72 @@
+import io
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+from openpyxl import load_workbook
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+sys.path.append(str(project_root / "src"))
+
+from web.backend.export import chunk_frame, export_filename, stream_export
+
+
+def month_chunks():
+    # Two months of the kind of frame the parser produces: mixed object columns
+    # (dates, text, blanks), numbers, and a column only the later month has
+    first = pd.DataFrame({
+        'Report Month': ['2025/12'] * 3,
+        'INR': ['21INR0001', '22INR0002', '23INR0003'],
+        'Projected COD': [pd.Timestamp('2026-03-01'), 'TBD', np.nan],
+        'Capacity (MW)': [150.5, 20.0, np.nan],
+    })
+    second = pd.DataFrame({
+        'Report Month': ['2026/01'] * 2,
+        'INR': ['21INR0001', '24INR0004'],
+        'Projected COD': ['2026-06-01', pd.Timestamp('2027-01-15')],
+        'Capacity (MW)': [151.0, 300.0],
+        'Comment': ['new column', None],
+    })
+    return [first, second]
+
+
+def test_writers_stream_one_table_across_chunks():
+    csv = pd.read_csv(io.BytesIO(b''.join(stream_export(month_chunks(), 'csv'))))
+    assert list(csv.columns) == ['Report Month', 'INR', 'Projected COD', 'Capacity (MW)']
+    assert len(csv) == 5 and csv['Capacity (MW)'].tolist()[-1] == 300.0
+
+    parquet = pq.ParquetFile(io.BytesIO(b''.join(stream_export(month_chunks(), 'parquet'))))
+    assert parquet.metadata.num_row_groups == 2
+    table = parquet.read()
+    assert table.num_rows == 5
+    assert str(table.schema.field('Capacity (MW)').type) == 'double'
+    assert table.column('Projected COD').to_pylist() == ['2026-03-01', 'TBD', None, '2026-06-01', '2027-01-15']
+
+    sheet = load_workbook(io.BytesIO(b''.join(stream_export(month_chunks(), 'xlsx'))), read_only=True).active
+    rows = list(sheet.iter_rows(values_only=True))
+    assert rows[0] == ('Report Month', 'INR', 'Projected COD', 'Capacity (MW)')
+    assert len(rows) == 6 and rows[1][3] == 150.5 and rows[2][2] == 'TBD'
+    assert rows[3][:2] == ('2025/12', '23INR0003') and not any(rows[3][2:])  # blanks stay empty
+
+    with pytest.raises(ValueError):
+        stream_export(month_chunks(), 'pdf')
+
+
+def test_csv_bytes_arrive_per_chunk():
+    df = pd.DataFrame({'INR': [f"INR{i:04d}" for i in range(10)]})
+    blocks = list(stream_export(chunk_frame(df, rows=4), 'csv'))
+    assert len(blocks) == 3 and blocks[0].startswith(b'INR\n') and not blocks[1].startswith(b'INR\n')
+
+
+def test_export_filename_encodes_filters():
+    name = export_filename('projects', [('', '2026-01'), ('quarters', ['2026Q1', '2026Q2']), ('county', None),
+                                        ('fuel', ['Solar']), ('zone', [])], 'csv')
+    assert name == 'tgir_projects_2026-01_quarters-2026Q1+2026Q2_fuel-Solar.csv'
+    assert export_filename('projects', [('county', 'Fort Bend')], 'xlsx') == 'tgir_projects_county-Fort-Bend.xlsx'
+    long = export_filename('projects', [('quarters', [f"20{y}Q{q}" for y in range(26, 40) for q in range(1, 5)])], 'csv')
+    assert len(long) <= 160 and long.endswith('.csv')
@@ -0,0 +1,54 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add project root and src to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+sys.path.append(str(project_root / "src"))
+
+from fastapi.testclient import TestClient
+
+from change_flags import CHANGE_TYPES
+from facet_index import FacetIndex
+from web.backend.main import app
+
+
+def test_facet_filters_match_boolean_scans():
+    rng = np.random.default_rng(7)
+    n = 1003  # not a multiple of 8, so the last bitmap byte is partial
+    df = pd.DataFrame({
+        'County': rng.choice(['Pecos', 'Ector', 'Harris', None], n),
+        'GIM Study Phase': rng.choice(['Planning', 'FIS Started', 'IA Signed'], n),
+        'Fuel_Normalized': rng.choice(['Solar', 'Wind', 'Gas'], n),
+        'Quarter': rng.choice(['2026Q1', '2026Q2', '2026Q3'], n),
+        'Change Flags': rng.choice(np.array([0, 2, 4, 6], dtype=np.uint8), n),
+    })
+    index = FacetIndex.from_frame(df)
+
+    filters = {'county': ['Pecos', 'Harris'], 'fuel': ['Solar'], 'quarter': ['2026Q1', '2026Q3'], 'change': ['cod']}
+    expected = (df['County'].isin(['Pecos', 'Harris']) & (df['Fuel_Normalized'] == 'Solar')
+                & df['Quarter'].isin(['2026Q1', '2026Q3']) & ((df['Change Flags'] & 4) != 0))
+    selection = index.select(filters)
+    assert index.rows(selection).tolist() == np.flatnonzero(expected).tolist()
+    assert index.count(selection) == int(expected.sum())
+
+    # Unconstrained and unknown values
+    assert index.count(index.select({})) == n
+    assert index.count(index.select({'county': ['Nowhere']})) == 0
+
+    # Facet counts ignore the facet's own filter
+    counts = index.facet_counts(filters)
+    others = (df['Fuel_Normalized'] == 'Solar') & df['Quarter'].isin(['2026Q1', '2026Q3']) & ((df['Change Flags'] & 4) != 0)
+    assert counts['county'] == df[others]['County'].value_counts().to_dict()
+
+
+def test_unknown_change_type_is_rejected():
+    client = TestClient(app)
+    assert client.get('/api/facets', params={'change': 'cod'}).status_code == 200
+    for url in ('/api/facets', '/api/quarter-report', '/api/export/projects'):
+        response = client.get(url, params=[('change', 'cod'), ('change', 'bogus')])
+        assert response.status_code == 400
+        assert 'bogus' in response.json()['detail'] and all(t in response.json()['detail'] for t in CHANGE_TYPES)
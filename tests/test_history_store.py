@@ -0,0 +1,104 @@
+import datetime
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "src"))
+
+from history_store import HistoryStore, apply_delta, build_history, encode_delta, verify_history
+from shared_store import TEXT_DTYPE
+
+
+def month(rows: dict, attrs: dict = None) -> pd.DataFrame:
+    frame = pd.DataFrame({
+        'INR': pd.Series(list(rows), dtype=TEXT_DTYPE),
+        'County': pd.Series([county for county, _, _ in rows.values()], dtype=TEXT_DTYPE),
+        'Projected COD': pd.Series([cod for _, cod, _ in rows.values()], dtype=object),
+        'Fuel': pd.Series(['SOL'] * len(rows), dtype=TEXT_DTYPE),
+        'Technology': pd.Series(['PV'] * len(rows), dtype=TEXT_DTYPE),
+        'Capacity (MW)': [mw for _, _, mw in rows.values()],
+        'Change Flags': np.zeros(len(rows), dtype=np.uint8),
+    })
+    frame.attrs = attrs or {}
+    return frame
+
+
+MONTHS = {
+    '2025/10': month({'A': ('Pecos', datetime.datetime(2026, 3, 1), 100.0), 'B': ('Ward', 'TBD', 50.0),
+                      'C': ('Reeves', np.nan, 10.0)}, {'quality_report': {'row_count': 3}}),
+    '2025/11': month({'A': ('Pecos', datetime.datetime(2026, 4, 1), 100.0), 'X': ('Harris', 'TBD', 5.0),
+                      'B': ('Ward', 'TBD', np.nan), 'C': ('Reeves', np.nan, 10.0)}),
+    '2025/12': month({'A': ('Pecos', datetime.datetime(2026, 4, 1), 100.0), 'X': ('Harris', 'TBD', 5.0),
+                      'C': ('Reeves', 'TBD', 10.0), 'D': ('Ward', datetime.datetime(2027, 1, 1), 20.0)}),
+    '2026/01': month({'A': ('Pecos', datetime.datetime(2026, 4, 1), 100.0), 'X': ('Harris', 'TBD', 5.0),
+                      'C': ('Reeves', 'TBD', 12.5), 'D': ('Ward', datetime.datetime(2027, 1, 1), 20.0)}),
+}
+
+
+def make_inputs(tmp_path: Path) -> Path:
+    inputs = tmp_path / 'inputs'
+    for period in MONTHS:
+        (inputs / period).mkdir(parents=True)
+        (inputs / period / 'file.xlsx').write_text(period)
+    return inputs
+
+
+def load_fake(path: Path) -> pd.DataFrame:
+    frame = MONTHS[path.read_text()].copy()
+    frame.attrs = dict(MONTHS[path.read_text()].attrs)
+    return frame
+
+
+def assert_same(actual: pd.DataFrame, expected: pd.DataFrame):
+    assert actual.equals(expected) and actual.attrs == expected.attrs
+    assert actual.dtypes.equals(expected.dtypes)
+    for column in expected.columns:
+        assert [type(v) for v in actual[column]] == [type(v) for v in expected[column]]
+
+
+def test_delta_holds_only_added_removed_and_changed_cells():
+    added, changes = encode_delta(MONTHS['2025/10'], MONTHS['2025/11'])
+    assert added['INR'].tolist() == ['X'] and added['_position'].tolist() == [1]
+    assert changes.attrs['removed'] == []
+    assert sorted(zip(changes['row'], changes['column'])) == [(0, 2), (2, 5)]
+    assert_same(apply_delta(MONTHS['2025/10'], added, changes), MONTHS['2025/11'])
+
+    added, changes = encode_delta(MONTHS['2025/11'], MONTHS['2025/12'])
+    assert changes.attrs['removed'] == ['B']
+    # NaN -> 'TBD' is a change of type and value
+    assert changes['value'].tolist() == ['TBD']
+    assert_same(apply_delta(MONTHS['2025/11'], added, changes), MONTHS['2025/12'])
+
+
+def test_months_rebuild_from_checkpoints_and_extend_incrementally(tmp_path, monkeypatch):
+    inputs = make_inputs(tmp_path)
+    manifest = build_history(inputs, tmp_path / 'history', loader=load_fake, checkpoint_every=3)
+    assert [entry['kind'] for entry in manifest['months'].values()] == ['checkpoint', 'delta', 'delta', 'checkpoint']
+    assert verify_history(tmp_path / 'history', inputs) == dict.fromkeys(MONTHS, 'ok')
+
+    store = HistoryStore(tmp_path / 'history')
+    for period, expected in MONTHS.items():
+        assert_same(store.load(period), expected)
+    assert [period for period, _ in store.iter_months(start='2025/11', end='2025/12')] == ['2025/11', '2025/12']
+    dataset = list(store.datasets(start='2026/01'))[0]
+    assert dataset.period == '2026/01' and 'COD Date' in dataset.frame
+
+    # A revised month rewrites itself and what follows; earlier months are reused
+    (inputs / '2025' / '11' / 'file.xlsx').write_text('2025/12')
+    manifest = build_history(inputs, tmp_path / 'history', loader=load_fake, checkpoint_every=3)
+    assert [entry['reused'] for entry in manifest['months'].values()] == [True, False, False, False]
+    assert_same(store.load('2025/11'), MONTHS['2025/12'])
+    assert_same(store.load('2026/01'), MONTHS['2026/01'])
+    assert len(list((tmp_path / 'history').glob('*.arrow'))) == 6
+
+    # A change of columns cannot be a delta
+    monkeypatch.setitem(MONTHS, '2026/02', MONTHS['2026/01'].assign(Comment=''))
+    (inputs / '2026' / '02').mkdir(parents=True)
+    (inputs / '2026' / '02' / 'file.xlsx').write_text('2026/02')
+    manifest = build_history(inputs, tmp_path / 'history', loader=load_fake, checkpoint_every=12)
+    assert manifest['months']['2026/02']['kind'] == 'checkpoint'
+    assert [entry['reused'] for entry in manifest['months'].values()] == [True, True, True, True, False]
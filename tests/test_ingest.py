@@ -0,0 +1,97 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "src"))
+
+from dataset import MonthDatasetCache
+from history_store import HistoryStore, build_history
+from ingest import check_snapshots_at_startup, ingest_months, prune_snapshots, verify_snapshots
+from shared_store import SharedMonthStore
+
+
+def fake_month(path: Path) -> pd.DataFrame:
+    return pd.DataFrame({
+        'INR': ['21INR0001', '22INR0002'],
+        'County': ['Pecos', 'Reeves'],
+        'Projected COD': ['2026-03-01', '2027-01-15'],
+        'Fuel': ['SOL', 'WIN'],
+        'Technology': ['PV', 'WT'],
+        'Capacity (MW)': [150.5, 20.0],
+        'Source': [path.read_text()] * 2,
+    })
+
+
+def make_inputs(tmp_path: Path) -> Path:
+    inputs = tmp_path / 'inputs'
+    for year, month in (('2025', '12'), ('2026', '01')):
+        (inputs / year / month).mkdir(parents=True)
+        (inputs / year / month / 'file.xlsx').write_text(f"{year}-{month}")
+    return inputs
+
+
+def test_snapshots_replace_parsing_until_a_workbook_changes(tmp_path):
+    inputs = make_inputs(tmp_path)
+    manifest = ingest_months(inputs, tmp_path / 'snapshots', loader=fake_month)
+    assert sorted(manifest['months']) == ['2025/12', '2026/01']
+    assert verify_snapshots(tmp_path / 'snapshots', inputs) == {'2025/12': 'ok', '2026/01': 'ok'}
+
+    # The server maps the snapshot and never calls the parser
+    def no_parsing(path):
+        raise AssertionError(f"parsed {path}")
+
+    cache = MonthDatasetCache(loader=no_parsing, snapshots=SharedMonthStore(tmp_path / 'snapshots'))
+    dataset, _ = cache.get(inputs / '2026' / '01' / 'file.xlsx')
+    assert dataset.frame['Source'].tolist() == ['2026-01', '2026-01']
+    assert dataset.frame['Fuel_Normalized'].tolist() == ['Solar', 'Wind']
+    assert cache.stats()['snapshot_loads'] == 1
+
+    # A replaced workbook is reported stale and parsed on use
+    (inputs / '2026' / '01' / 'file.xlsx').write_text('revised')
+    assert verify_snapshots(tmp_path / 'snapshots', inputs)['2026/01'] == 'stale'
+    cache = MonthDatasetCache(loader=fake_month, snapshots=SharedMonthStore(tmp_path / 'snapshots'))
+    assert cache.get(inputs / '2026' / '01' / 'file.xlsx')[0].frame['Source'][0] == 'revised'
+    assert cache.stats()['snapshot_loads'] == 0
+
+    # Re-ingesting rebuilds only that month and drops the old snapshot
+    manifest = ingest_months(inputs, tmp_path / 'snapshots', loader=fake_month)
+    assert [m['reused'] for m in manifest['months'].values()] == [True, False]
+    assert len(list((tmp_path / 'snapshots').glob('*.arrow'))) == 2
+
+
+def test_required_snapshots_fail_startup(tmp_path, monkeypatch):
+    inputs = make_inputs(tmp_path)
+    store = SharedMonthStore(tmp_path / 'snapshots')
+    assert set(check_snapshots_at_startup(store, inputs).values()) == {'missing'}
+
+    monkeypatch.setenv('TGIR_REQUIRE_SNAPSHOTS', '1')
+    with pytest.raises(RuntimeError):
+        check_snapshots_at_startup(store, inputs)
+    ingest_months(inputs, tmp_path / 'snapshots', loader=fake_month)
+    assert set(check_snapshots_at_startup(store, inputs).values()) == {'ok'}
+
+
+def test_pruned_months_are_rebuilt_from_history(tmp_path, monkeypatch):
+    inputs = make_inputs(tmp_path)
+    ingest_months(inputs, tmp_path / 'snapshots', loader=fake_month)
+    build_history(inputs, tmp_path / 'history', loader=fake_month)
+    assert prune_snapshots(tmp_path / 'snapshots', 1) == ['2025/12']
+    assert len(list((tmp_path / 'snapshots').glob('*.arrow'))) == 1
+
+    snapshots, history = SharedMonthStore(tmp_path / 'snapshots'), HistoryStore(tmp_path / 'history')
+    monkeypatch.setenv('TGIR_REQUIRE_SNAPSHOTS', '1')
+    assert check_snapshots_at_startup(snapshots, inputs, history) == {'2025/12': 'history', '2026/01': 'ok'}
+
+    def no_parsing(path):
+        raise AssertionError(f"parsed {path}")
+
+    cache = MonthDatasetCache(loader=no_parsing, snapshots=snapshots, history=history)
+    older = cache.get(inputs / '2025' / '12' / 'file.xlsx')[0]
+    assert older.frame['Source'].tolist() == ['2025-12', '2025-12']
+    assert older.frame['Fuel_Normalized'].tolist() == ['Solar', 'Wind']
+    cache.get(inputs / '2026' / '01' / 'file.xlsx')
+    assert (cache.stats()['snapshot_loads'], cache.stats()['history_loads']) == (1, 1)
@@ -0,0 +1,64 @@
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from web.backend.instrumentation import InstrumentationMiddleware, metrics_router, span
+
+
+def make_client():
+    router = APIRouter()
+
+    @router.get("/work")
+    async def work():
+        with span("extract"):
+            sum(range(1000))
+        with span("aggregate"):
+            pass
+        return {"ok": True}
+
+    app = FastAPI()
+    app.add_middleware(InstrumentationMiddleware)
+    app.include_router(router, prefix="/api")
+    app.include_router(metrics_router)
+    return TestClient(app)
+
+
+def test_server_timing_metrics_and_profile(monkeypatch):
+    monkeypatch.delenv("TGIR_PROFILING", raising=False)
+    client = make_client()
+
+    response = client.get("/api/work")
+    assert response.json() == {"ok": True}
+    timing = response.headers["server-timing"]
+    assert timing.startswith("extract;dur=")
+    assert "aggregate;dur=" in timing and "total;dur=" in timing
+
+    # Profiling is opt-in; by default the parameter is ignored
+    assert client.get("/api/work?profile=1").json() == {"ok": True}
+    monkeypatch.setenv("TGIR_PROFILING", "1")
+    profiled = client.get("/api/work?profile=1")
+    assert profiled.headers["content-type"].startswith("text/plain")
+    assert "Ordered by: cumulative time" in profiled.text
+
+    metrics = client.get("/metrics").text
+    assert 'tgir_requests_total{method="GET",route="/api/work",status="200"} 3' in metrics
+    assert 'tgir_span_duration_seconds_count{span="extract"}' in metrics
+
+
+def test_profile_covers_cached_endpoint_builds(monkeypatch):
+    from web.backend.main import app
+
+    monkeypatch.setenv("TGIR_PROFILING", "1")
+    client = TestClient(app)
+    params = {"quarters": "2026Q1"}
+    client.get("/api/quarter-data", params=params)  # a cached body must not hide the build
+
+    profiled = client.get("/api/quarter-data", params={**params, "profile": "1"}).text
+    assert "aggregate;dur=" in profiled.splitlines()[1]
+    assert "pandas/core" in profiled
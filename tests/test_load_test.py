@@ -0,0 +1,51 @@
+import asyncio
+import random
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+# Add project root, src and benchmarks to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+sys.path.append(str(project_root / "src"))
+sys.path.append(str(project_root / "benchmarks"))
+
+from load_test import compare_runs, parse_mix, percentile, pick_quarters, run_level, summarize_run
+from web.backend.main import app
+
+
+def test_helpers():
+    assert percentile([1, 2, 3, 4], 50) == 2 and percentile([1, 2, 3, 4], 99) == 4 and percentile([], 95) == 0.0
+    assert parse_mix('comparison=2,quarter-report') == {'comparison': 2.0, 'quarter-report': 1.0}
+    with pytest.raises(ValueError):
+        parse_mix('checkout=1')
+
+    rng = random.Random(0)
+    quarters = ['2025Q3', '2025Q4', '2026Q1', '2026Q2', '2026Q3', '2027Q1']
+    for _ in range(50):
+        selection = pick_quarters(rng, quarters, '2026Q1')
+        assert 1 <= len(selection) <= 4 and selection[0] in quarters[2:]
+        assert selection == quarters[quarters.index(selection[0]):][:len(selection)]
+
+
+def test_sessions_replay_in_process():
+    transport = httpx.ASGITransport(app=app)
+    # In-process, a user loading a month blocks the others, so only count on one session
+    level = asyncio.run(run_level('http://testserver', 2, 1.0, parse_mix('quarter-report'), think_s=0, seed=1,
+                                  transport=transport))
+
+    assert level['users'] == 2 and level['sessions'] >= 1 and level['sessions_failed'] == 0
+    assert level['errors'] == 0 and set(level['status']) == {'200'}
+    assert level['requests'] == sum(e['requests'] for e in level['endpoints'].values())
+    assert {'months', 'quarters', 'quarter-report'} <= set(level['endpoints'])
+    latency = level['latency_ms']
+    assert 0 < latency['p50'] <= latency['p95'] <= latency['p99'] <= latency['max']
+
+    slow = dict(level, users=8, throughput_rps=level['throughput_rps'] / 2,
+                latency_ms=dict(latency, p95=latency['max'] + 1))
+    summary = summarize_run([level, slow], p95_ms=latency['max'], error_rate=0.01)
+    assert summary['max_users_within_slo'] == 2 and summary['peak_throughput_users'] == 2
+    rows = compare_runs({'levels': [level, slow]}, {'levels': [level]})
+    assert [row['users'] for row in rows] == [2] and rows[0]['p95_ms'] == (latency['p95'], latency['p95'])
@@ -0,0 +1,100 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi import HTTPException
+
+# Add project root and src to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+sys.path.append(str(project_root / "src"))
+
+from dataset import MonthDataset, normalize_month_frame
+from month_matrix import MonthMatrix, matrix_payload
+
+
+def month(period: str, rows: dict) -> MonthDataset:
+    year, mm = period.split('/')
+    frame = normalize_month_frame(pd.DataFrame({
+        'INR': list(rows),
+        'Project Name': [f"Project {inr}" for inr in rows],
+        'County': ['Pecos'] * len(rows),
+        'Projected COD': [cod for cod, _ in rows.values()],
+        'Fuel': ['SOL'] * len(rows),
+        'Technology': ['PV'] * len(rows),
+        'Capacity (MW)': [mw for _, mw in rows.values()],
+    }))
+    return MonthDataset(Path(f"inputs/{year}/{mm}/file.xlsx"), frame, period)
+
+
+def three_months():
+    return [
+        month('2025/11', {'A': ('2026-03-01', 100.0), 'B': ('TBD', 50.0), 'C': ('2026-06-01', 10.0)}),
+        month('2025/12', {'A': ('2026-04-01', 100.0), 'B': ('2026-01-15', 75.0), 'D': ('2027-01-01', 20.0)}),
+        month('2026/01', {'A': ('2026-03-02', 100.0), 'B': ('2026-01-15', np.nan), 'C': ('2026-06-01', 10.0),
+                          'D': ('2027-01-01', 20.0), 'E': ('2026-05-01', 5.0)}),
+    ]
+
+
+def test_alignment_series_are_vectorized_over_all_months():
+    matrix = MonthMatrix.align(three_months())
+    assert matrix.months == ['2025/11', '2025/12', '2026/01']
+    assert list(matrix.inrs) == ['A', 'B', 'C', 'D', 'E']
+    assert matrix.present.astype(int).tolist() == [[1, 1, 1], [1, 1, 1], [1, 0, 1], [0, 1, 1], [0, 0, 1]]
+    assert matrix.added().astype(int).tolist() == [[0, 0], [0, 0], [0, 1], [1, 0], [0, 1]]
+    assert matrix.removed().astype(int).tolist() == [[0, 0], [0, 0], [1, 0], [0, 0], [0, 0]]
+    shift = matrix.cod_shift_days()
+    assert shift[0].tolist() == [31, -30]
+    assert np.isnan(shift[1, 0]) and shift[1, 1] == 0
+    delta = matrix.mw_delta()
+    assert delta[1, 0] == 25.0 and np.isnan(delta[1, 1])
+
+
+def test_payload():
+    payload = matrix_payload(MonthMatrix.align(three_months()))
+    summary = {entry['month']: entry for entry in payload['summary']}
+    assert summary['2025/11']['added'] is None and summary['2025/11']['projects'] == 3
+    assert (summary['2025/12']['added'], summary['2025/12']['removed']) == (1, 1)
+    assert (summary['2025/12']['added_mw'], summary['2025/12']['removed_mw']) == (20.0, 10.0)
+    assert summary['2025/12']['cod_delayed'] == 1 and summary['2026/01']['cod_advanced'] == 1
+    assert summary['2025/12']['mw_delta'] == 25.0
+
+    projects = {p['INR']: p for p in payload['projects']}
+    # D only appeared (no changes afterwards) but counts as added within the range
+    assert sorted(projects) == ['A', 'B', 'C', 'D', 'E']
+    assert projects['A']['cod_shift_days'] == [None, 31, -30] and projects['A']['total_cod_shift_days'] == 1
+    assert projects['B']['mw_delta'] == [None, 25.0, None]
+    assert projects['C']['present'] == '101' and projects['C']['removed'] == ['2025/12']
+    assert projects['C']['added'] == ['2026/01']
+    assert projects['E']['first_month'] == '2026/01' and projects['E']['Fuel Type'] == 'Solar'
+
+    everything = matrix_payload(MonthMatrix.align(three_months()[1:]), changed_only=False)
+    assert len(everything['projects']) == 5
+    # D is unchanged and B's capacity only went blank, which is no measurable change
+    assert [p['INR'] for p in matrix_payload(MonthMatrix.align(three_months()[1:]))['projects']] == ['A', 'C', 'E']
+
+
+def test_months_in_range_parses_bounds(tmp_path, monkeypatch):
+    from web.backend import api
+
+    for period in ['2025/02', '2025/09', '2025/10', '2026/01']:
+        (tmp_path / period).mkdir(parents=True)
+        (tmp_path / period / 'file.xlsx').write_bytes(b'')
+    monkeypatch.setattr(api, 'INPUTS_DIR', tmp_path)
+
+    def periods(start, end):
+        return [period for period, _ in api.months_in_range(start, end)]
+
+    # Bounds are zero-padded, so '2025-9' does not sort after '2025/10'
+    assert periods('2025-9', None) == ['2025/09', '2025/10', '2026/01']
+    assert periods(None, '2025-9') == ['2025/02', '2025/09']
+    assert periods('2025-02', '2025-10') == ['2025/02', '2025/09', '2025/10']
+    for bound in ['bogus', '2025-13', '2025-0', '25-01', '2025/01', '2025-']:
+        with pytest.raises(HTTPException) as error:
+            api.months_in_range(bound, None)
+        assert error.value.status_code == 400
+    with pytest.raises(HTTPException) as error:
+        api.months_in_range('2024-01', '2024-12')
+    assert error.value.status_code == 404
@@ -13,22 +13,18 @@ from extract_large_gen import extract_large_gen_data
 def test_county_fuel_report():
     print("Testing County + Fuel Report Generation...")
     
-    # Setup paths
-    input_file = project_root / "inputs" / "10" / "file.xlsx"
+    # Setup paths: use the latest inputs/<year>/<month>/file.xlsx
     output_dir = project_root / "outputs"
     output_dir.mkdir(exist_ok=True)
     
-    # Check input file
-    if not input_file.exists():
-        # Try to find any xlsx
-        inputs_dir = project_root / "inputs"
-        for p in inputs_dir.glob("*/*.xlsx"):
-            input_file = p
-            break
-            
-    if not input_file.exists():
+    input_files = sorted(
+        (project_root / "inputs").glob("*/*/file.xlsx"),
+        key=lambda p: (int(p.parent.parent.name), int(p.parent.name))
+    )
+    if not input_files:
         print("ERROR: No input file found.")
         return
+    input_file = input_files[-1]
 
     print(f"Using input file: {input_file}")
     
@@ -40,6 +36,7 @@ def test_county_fuel_report():
     print("\nTest 1: Generating report without filters...")
     generate_county_fuel_report(df, output_dir)
     expected_file = output_dir / "county_fuel_breakdown.png"
+    assert expected_file.exists()
     if expected_file.exists():
         print("✓ Report generated successfully (no filter)")
     else:
@@ -58,6 +55,7 @@ def test_county_fuel_report():
         generate_county_fuel_report(df, output_dir, quarters=test_quarters)
         
         # Check if file was updated (timestamp check would be better but existence is ok for now)
+        assert expected_file.exists()
         if expected_file.exists():
              print("✓ Report generated successfully (with filter)")
         else:
@@ -0,0 +1,138 @@
+import importlib
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "src"))
+
+import change_flags
+import constants
+import pipeline
+from pipeline import STAGES as PIPELINE_STAGES, Stage, StageStore, Task, diff_stage, run_pipeline, stage_version
+
+
+calls = []
+
+
+def read_stage(path: str) -> pd.DataFrame:
+    calls.append(('read', path))
+    return pd.DataFrame({'INR': ['21INR0001'], 'Text': [Path(path).read_text()]})
+
+
+def upper_stage(frame: pd.DataFrame) -> pd.DataFrame:
+    calls.append(('upper', frame['Text'][0]))
+    return frame.assign(Text=frame['Text'].str.upper())
+
+
+def count_stage(frame: pd.DataFrame, min_length: int) -> dict:
+    calls.append(('count', frame['Text'][0]))
+    if len(frame['Text'][0]) < min_length:
+        raise ValueError("too short")
+    return {'length': len(frame['Text'][0])}
+
+
+STAGES = {stage.name: stage for stage in [
+    Stage('read', read_stage, 'frame'),
+    Stage('upper', upper_stage, 'frame'),
+    Stage('count', count_stage, 'json'),
+]}
+
+
+def tasks_for(paths):
+    tasks = []
+    for name, path in paths.items():
+        tasks += [Task(f"read:{name}", 'read', params={'path': str(path)}, sources=(path,)),
+                  Task(f"upper:{name}", 'upper', {'frame': f"read:{name}"}),
+                  Task(f"count:{name}", 'count', {'frame': f"upper:{name}"}, {'min_length': 3})]
+    return tasks
+
+
+def statuses(manifest):
+    return {entry['task']: entry['status'] for entry in manifest['tasks']}
+
+
+def test_rerun_executes_only_what_changed(tmp_path):
+    paths = {'a': tmp_path / 'a.txt', 'b': tmp_path / 'b.txt'}
+    paths['a'].write_text('alpha')
+    paths['b'].write_text('beta')
+    store = StageStore(tmp_path / 'cache')
+
+    calls.clear()
+    first = run_pipeline(tasks_for(paths), store, stages=STAGES)
+    assert first['counts'] == {'ran': 6} and len(calls) == 6
+
+    calls.clear()
+    assert run_pipeline(tasks_for(paths), store, stages=STAGES)['counts'] == {'cached': 6}
+    assert calls == []
+
+    # A changed input reruns its own chain; the unchanged month's outputs are not even loaded
+    calls.clear()
+    paths['b'].write_text('bravo')
+    manifest = run_pipeline(tasks_for(paths), store, stages=STAGES)
+    assert calls == [('read', str(paths['b'])), ('upper', 'bravo'), ('count', 'BRAVO')]
+    assert statuses(manifest)['count:a'] == 'cached' and statuses(manifest)['count:b'] == 'ran'
+
+    # Forcing a stage reruns it from stored upstream outputs
+    calls.clear()
+    run_pipeline(tasks_for(paths), store, force=['count'], stages=STAGES)
+    assert calls == [('count', 'ALPHA'), ('count', 'BRAVO')]
+
+
+def test_failures_skip_dependents_only(tmp_path):
+    paths = {'a': tmp_path / 'a.txt', 'b': tmp_path / 'b.txt'}
+    paths['a'].write_text('alpha')
+    paths['b'].write_text('b')
+    tasks = tasks_for(paths) + [Task('count:again', 'count', {'frame': 'upper:b'}, {'min_length': 1})]
+    tasks.insert(len(tasks) - 1, Task('upper:twice', 'upper', {'frame': 'count:b'}))
+
+    manifest = run_pipeline(tasks, StageStore(tmp_path / 'cache'), stages=STAGES)
+    status = statuses(manifest)
+    assert status['count:b'] == 'failed' and status['upper:twice'] == 'skipped'
+    assert status['count:a'] == 'ran' and status['count:again'] == 'ran'
+    assert 'too short' in next(e['error'] for e in manifest['tasks'] if e['task'] == 'count:b')
+
+
+def test_diff_stage():
+    base = pd.DataFrame({'INR': ['A', 'B', 'C'], 'Project Name': ['Alpha', 'Bravo', 'Charlie'],
+                         'County': ['Pecos', 'Reeves', 'Ward'],
+                         'Projected COD': [pd.Timestamp('2026-03-01'), 'TBD', np.nan],
+                         'Capacity (MW)': [100.0, 50.0, 10.0]})
+    target = pd.DataFrame({'INR': ['A', 'B', 'D'], 'Project Name': ['Alpha', 'Bravo', 'Delta'],
+                           'County': ['Pecos', 'Reeves', 'Ector'],
+                           'Projected COD': [pd.Timestamp('2026-06-01'), 'TBD', np.nan],
+                           'Capacity (MW)': [100.0, 75.0, 20.0]})
+    diff = diff_stage(base, target)
+    rows = {(r['INR'], r['Change'], r['Column']): (r['Old Value'], r['New Value']) for r in diff.to_dict('records')}
+    assert rows == {
+        ('D', 'added', None): (None, None),
+        ('C', 'removed', None): (None, None),
+        ('A', 'changed', 'Projected COD'): ('2026-03-01', '2026-06-01'),
+        ('B', 'changed', 'Capacity (MW)'): ('50.0', '75.0'),
+    }
+
+
+def test_helper_changes_invalidate_stage_keys(tmp_path, monkeypatch):
+    # run() calls a helper defined in another module; only the helper is edited
+    helper = tmp_path / 'stage_helpers.py'
+    helper.write_text("def shout(text):\n    return text.upper()\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    helpers = importlib.import_module('stage_helpers')
+
+    def shout_stage(frame):
+        return helpers.shout(frame)
+
+    with_module, without = Stage('shout', shout_stage, 'frame', (helpers,)), Stage('shout', shout_stage, 'frame')
+    before = stage_version(with_module), stage_version(without)
+    helper.write_text("def shout(text):\n    return text.upper() + '!'\n")
+    assert stage_version(with_module) != before[0]
+    # Without the module in Stage.modules the edit would go unnoticed
+    assert stage_version(without) == before[1]
+
+    # The real stages list the modules whose code they run
+    assert {change_flags, constants} <= set(PIPELINE_STAGES['normalize'].modules)
+    assert constants in PIPELINE_STAGES['validate'].modules
+    assert pipeline in PIPELINE_STAGES['diff'].modules  # _diff_text, DIFF_COLUMNS
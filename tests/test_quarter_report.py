@@ -0,0 +1,55 @@
+import sys
+from pathlib import Path
+
+# Add project root and src to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+sys.path.append(str(project_root / "src"))
+
+from fastapi.testclient import TestClient
+
+from web.backend.main import app
+
+
+def test_quarter_report_matches_individual_endpoints():
+    client = TestClient(app)
+    quarters = client.get("/api/quarters").json()["quarters"]
+    params = [("quarters", q) for q in quarters[-4:]]
+
+    report = client.get("/api/quarter-report", params=params).json()
+    quarter_data = client.get("/api/quarter-data", params=params).json()
+    map_data = client.get("/api/county-map", params=params).json()
+
+    assert report["summary"] == quarter_data["summary"]
+    assert report["fuel_chart"] == quarter_data["fuel_chart"]
+    assert report["county_data"] == quarter_data["county_data"]
+    assert report["county_map"] == {k: v for k, v in map_data.items() if k not in ("source", "quarters")}
+    assert "county_details" not in report
+
+    # County details on demand, alone
+    county = report["county_data"][0]["county"]
+    details = client.get("/api/quarter-report",
+                         params=params + [("sections", "county_details"), ("county", county)]).json()
+    assert set(details) == {"quarters", "sections", "filters", "county_details"}
+    assert details["county_details"] == client.get("/api/county-details",
+                                                   params=params + [("county", county)]).json()
+    # The internal change-flags bitmask stays out of project records
+    assert "Change Flags" not in details["county_details"]["projects"][0]
+
+    assert client.get("/api/quarter-report", params={"sections": "summary,bogus"}).status_code == 400
+
+
+def test_comparison_records_hide_internal_columns():
+    client = TestClient(app)
+    months = sorted(client.get("/api/months").json()["months"], key=lambda m: m["value"])
+    (base_year, base_month), (target_year, target_month) = (m["value"].split("-") for m in months[-2:])
+    params = {"base_year": base_year, "base_month": base_month, "target_year": target_year, "target_month": target_month}
+    response = client.get("/api/comparison-data", params=params)
+    comparison = response.json()
+    assert comparison["target_period"] == f"{target_month}/{target_year}"
+    # Built in the threadpool and cached on both workbooks' hashes
+    assert response.headers["X-Cache"] in ("MISS", "HIT")
+    repeat = client.get("/api/comparison-data", params=params)
+    assert repeat.headers["X-Cache"] == "HIT" and repeat.content == response.content
+    assert comparison["added_projects"]
+    assert all("Change Flags" not in project for project in comparison["added_projects"])
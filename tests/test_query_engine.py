@@ -0,0 +1,98 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add project root and src to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+sys.path.append(str(project_root / "src"))
+
+from fastapi.testclient import TestClient
+
+from dataset import MonthDataset, normalize_month_frame
+from query_engine import QueryEngine, QueryError
+from web.backend import api
+from web.backend.main import app
+
+
+def month(period: str, cod: list, capacity: list, flags: list, fingerprint: str = None) -> MonthDataset:
+    year, mm = period.split('/')
+    frame = normalize_month_frame(pd.DataFrame({
+        'INR': ['21INR0001', '22INR0002'],
+        'Project Name': ['Pecos Solar', 'Reeves Wind'],
+        'County': ['Pecos', 'Reeves'],
+        'CDR Reporting Zone': ['WEST', 'WEST'],
+        'Projected COD': cod,
+        'Fuel': ['SOL', 'WIN'],
+        'Technology': ['PV', 'WT'],
+        'Capacity (MW)': capacity,
+        'Change Flags': np.array(flags, dtype=np.uint8),
+    }))
+    return MonthDataset(Path(f"inputs/{year}/{mm}/file.xlsx"), frame, fingerprint or period)
+
+
+def two_months():
+    return [month('2025/12', [pd.Timestamp('2026-03-01'), 'TBD'], [150.5, 20.0], [0, 0]),
+            month('2026/01', [pd.Timestamp('2026-09-01'), 'TBD'], [150.5, np.nan], [4, 0])]
+
+
+def test_views_over_months():
+    engine = QueryEngine()
+    assert engine.sync(two_months()) == ['2025/12', '2026/01']
+
+    totals = engine.query("SELECT report_month, fuel_type, capacity_mw FROM projects "
+                          "WHERE inr = '21INR0001' ORDER BY 1")
+    assert totals['rows'] == [['2025/12', 'Solar', 150.5], ['2026/01', 'Solar', 150.5]]
+    assert engine.query("SELECT report_month, prev_month FROM months")['rows'] == [
+        ['2025/12', None], ['2026/01', '2025/12']]
+    assert engine.query("SELECT inr, change_type FROM flags")['rows'] == [['21INR0001', 'cod']]
+    changes = engine.query("SELECT inr, field, old_value, new_value FROM changes ORDER BY 1, 2")['rows']
+    assert changes == [['21INR0001', 'projected_cod', '2026-03-01', '2026-09-01'],
+                       ['22INR0002', 'capacity_mw', 20.0, None]]
+
+    # Only changed months are reloaded; months no longer given are dropped
+    revised = month('2026/01', ['2027-01-01', 'TBD'], [150.5, 25.0], [4, 2], fingerprint='revised')
+    assert engine.sync([two_months()[0], revised]) == ['2026/01']
+    assert engine.sync([revised]) == []
+    assert engine.months == {'2026/01': 'revised'}
+    assert engine.query("SELECT COUNT(*) FROM projects")['rows'] == [[2]]
+
+    # Months the caller already knows are current stay without being passed in
+    assert engine.sync([two_months()[0]], unchanged=['2026/01', '2026/02']) == ['2025/12']
+    assert engine.months == {'2025/12': '2025/12', '2026/01': 'revised'}
+
+
+def test_queries_are_read_only_capped_and_time_limited():
+    engine = QueryEngine()
+    engine.sync(two_months())
+    for sql in ("DELETE FROM projects", "DROP TABLE months", "PRAGMA table_info(projects)",
+                "ATTACH DATABASE ':memory:' AS other", "SELECT 1; DELETE FROM projects", "SELECT * FROM missing"):
+        with pytest.raises(QueryError):
+            engine.query(sql)
+    assert engine.query("SELECT COUNT(*) FROM projects")['rows'] == [[4]]
+
+    result = engine.query("SELECT inr FROM projects", max_rows=3)
+    assert result['row_count'] == 3 and result['truncated']
+
+    with pytest.raises(QueryError, match='time limit'):
+        engine.query("WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n) SELECT COUNT(*) FROM n",
+                     timeout=0.2)
+    # The engine keeps working (and loading) after a rejected query
+    assert engine.sync([two_months()[0]]) == []
+    assert engine.query("SELECT COUNT(*) FROM projects")['rows'] == [[2]]
+
+
+def test_query_endpoint_loads_only_stale_months(monkeypatch):
+    client = TestClient(app)
+    sql = "SELECT COUNT(DISTINCT report_month) FROM projects"
+    months = client.get('/api/query', params={'sql': sql}).json()['rows'][0][0]
+    assert months == len(api.QUERY_ENGINE.months) > 0
+
+    # Every workbook is unchanged, so the second query never touches the month cache
+    def fail(path):
+        raise AssertionError(f"reloaded {path}")
+    monkeypatch.setattr(api.MONTH_CACHE, 'get', fail)
+    assert client.get('/api/query', params={'sql': sql}).json()['rows'] == [[months]]
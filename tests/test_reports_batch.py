@@ -0,0 +1,32 @@
+import sys
+from pathlib import Path
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "src"))
+
+from dataset import input_files
+from reports import quarters_dirname, run_batch
+from synthetic_workbook import generate_month_series
+
+
+def test_batch_renders_every_month_and_quarter_set(tmp_path):
+    generate_month_series(120, 2, tmp_path / 'inputs', start='2026-01', seed=5)
+    files = input_files(tmp_path / 'inputs')
+    quarter_sets = [['2026Q1'], ['2026Q2', '2026Q1']]
+
+    results = run_batch(files, ['fuel'], quarter_sets, tmp_path / 'out', jobs=2)
+
+    assert [(r['month'], r['report']) for r in results] == [
+        ('2026/01', 'fuel'), ('2026/01', 'county-fuel'), ('2026/01', 'county-fuel'),
+        ('2026/02', 'fuel'), ('2026/02', 'county-fuel'), ('2026/02', 'county-fuel'),
+    ]
+    assert not [r for r in results if 'error' in r]
+    for period in ('2026/01', '2026/02'):
+        month_dir = tmp_path / 'out' / period
+        assert (month_dir / 'fuel_type_breakdown.png').is_file()
+        assert quarters_dirname(['2026Q2', '2026Q1']) == 'quarters-2026Q1+2026Q2'
+        for quarters in quarter_sets:
+            assert (month_dir / quarters_dirname(quarters) / 'county_fuel_breakdown.png').is_file()
+    # No private render directories are left behind
+    assert not list((tmp_path / 'out').rglob('.tmp-*'))
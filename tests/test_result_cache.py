@@ -0,0 +1,83 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+sys.path.append(str(project_root / "src"))
+
+from web.backend.result_cache import ResultCache, canonical_key
+
+
+def test_canonical_key_ignores_list_order_and_empty_params():
+    a = canonical_key('abc', 'quarter-data', {'quarters': ['2026Q2', '2026Q1'], 'county': None, 'fuel': []})
+    b = canonical_key('abc', 'quarter-data', {'quarters': ['2026Q1', '2026Q2', '2026Q1']})
+    assert a == b
+    assert a != canonical_key('def', 'quarter-data', {'quarters': ['2026Q1', '2026Q2']})
+    assert a != canonical_key('abc', 'county-map-data', {'quarters': ['2026Q1', '2026Q2']})
+
+
+def test_lru_byte_budget_and_ttl():
+    cache = ResultCache(name='test', max_bytes=300, ttl_seconds=60)
+    for key in ('a', 'b', 'c'):
+        cache.get_or_compute(key, lambda: b'x' * 99)
+    assert cache.get_or_compute('a', lambda: b'new')[1] == 'hit'
+
+    # 'b' is least recently used once 'a' was read
+    cache.get_or_compute('d', lambda: b'x' * 99)
+    stats = cache.stats()
+    assert stats['entries'] == 3 and stats['bytes'] <= 300 and stats['evictions'] == 1
+    assert cache.get_or_compute('b', lambda: b'recomputed') == (b'recomputed', 'miss')
+
+    # Bodies larger than the budget are served but not kept
+    assert cache.get_or_compute('big', lambda: b'x' * 1000)[1] == 'miss'
+    assert cache.get_or_compute('big', lambda: b'x' * 1000)[1] == 'miss'
+
+    cache.ttl_seconds = 0
+    time.sleep(0.01)
+    assert cache.get_or_compute('a', lambda: b'fresh') == (b'fresh', 'miss')
+
+
+def test_concurrent_requests_share_one_computation():
+    cache = ResultCache(name='test')
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return b'body'
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(cache.get_or_compute('k', slow)))
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=lambda: results.append(cache.get_or_compute('k', slow)))
+                 for _ in range(4)]
+    for t in followers:
+        t.start()
+    time.sleep(0.05)
+    release.set()
+    for t in [leader] + followers:
+        t.join(5)
+
+    assert len(calls) == 1
+    assert sorted(outcome for _, outcome in results) == ['coalesced'] * 4 + ['miss']
+    assert {body for body, _ in results} == {b'body'}
+
+
+def test_errors_are_not_cached():
+    cache = ResultCache(name='test')
+
+    def fail():
+        raise ValueError('boom')
+
+    with pytest.raises(ValueError):
+        cache.get_or_compute('k', fail)
+    assert cache.get_or_compute('k', lambda: b'ok') == (b'ok', 'miss')
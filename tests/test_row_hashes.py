@@ -0,0 +1,65 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "src"))
+
+from dataset import MonthDataset, normalize_month_frame
+from row_hashes import OTHER_GROUP, ROW_HASH, RowHashes, changed_groups
+
+
+def projects(**overrides) -> pd.DataFrame:
+    frame = pd.DataFrame({
+        'INR': ['A', 'B', 'C', 'D'],
+        'Project Name': ['Alpha Solar', 'Bravo Wind', 'Charlie Storage', 'Delta Gas'],
+        'County': ['Pecos', 'Reeves', 'Ward', 'Harris'],
+        'Projected COD': ['2026-03-01', '2026-08-15', 'TBD', '2027-01-01'],
+        'Fuel': ['SOL', 'WIN', 'OTH', 'GAS'],
+        'Technology': ['PV', 'WT', 'BA', 'GT'],
+        'Capacity (MW)': [150.5, 200.0, 49.25, 10.0],
+        'Comment': ['', np.nan, 'Phase 1', ''],
+        'IA Signed': ['2024-01-01', np.nan, np.nan, '2023-05-01'],
+    })
+    for column, values in overrides.items():
+        frame[column] = values
+    return frame
+
+
+def test_unchanged_projects_are_skipped_and_changes_grouped():
+    base = RowHashes(projects())
+    # Whitespace and blank-vs-missing differences are not changes
+    assert changed_groups(base, RowHashes(projects(Comment=[np.nan, '', 'Phase 1 ', None]))).empty
+
+    target = projects(**{'Projected COD': ['2026-04-01', '2026-08-15', 'TBD', '2027-01-01'],
+                         'Capacity (MW)': [150.5, 200.0, 60.0, 10.0],
+                         'IA Signed': ['2024-01-01', np.nan, np.nan, '2023-06-01']})
+    changed = changed_groups(base, RowHashes(target.iloc[::-1]))
+    assert list(changed.index) == ['D', 'C', 'A']
+    assert changed.loc['A'].to_dict() == {'project': False, 'cod': True, 'capacity': False, 'fuel': False,
+                                          'comment': False, OTHER_GROUP: False}
+    assert changed.loc['C', 'capacity'] and not changed.loc['C', 'cod']
+    assert changed.loc['D', OTHER_GROUP] and changed.loc['D'].sum() == 1
+
+
+def test_renamed_columns_and_duplicated_inrs_are_never_skipped():
+    base = RowHashes(projects())
+    renamed = RowHashes(projects().rename(columns={'IA Signed': 'IA Executed'}))
+    changed = changed_groups(base, renamed)
+    assert list(changed.index) == ['A', 'B', 'C', 'D'] and changed[OTHER_GROUP].all()
+    assert not changed['cod'].any()
+
+    duplicated = RowHashes(pd.concat([projects(), projects().iloc[[1]]], ignore_index=True))
+    assert duplicated.duplicated == {'B'} and len(duplicated) == 4
+    assert list(changed_groups(base, duplicated).index) == ['B']
+
+
+def test_month_dataset_hashes_lazily_without_derived_columns():
+    dataset = MonthDataset(Path('inputs/2026/01/file.xlsx'), normalize_month_frame(projects()), '2026/01')
+    hashes = dataset.row_hashes
+    assert hashes is dataset.row_hashes
+    assert 'Fuel_Normalized' not in hashes.groups['fuel'] and 'Fuel_Normalized' not in hashes.groups[OTHER_GROUP]
+    assert hashes.table[ROW_HASH].dtype == np.uint64
@@ -0,0 +1,61 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add project root and src to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+sys.path.append(str(project_root / "src"))
+
+from fastapi.testclient import TestClient
+
+from search_index import SearchIndex, edit_distance, max_edits, tokenize
+from web.backend.main import app
+
+
+def projects() -> pd.DataFrame:
+    return pd.DataFrame({
+        'INR': ['24INR0452', '24INR0454', '25INR0146', '27INR0146', '23INR0283'],
+        'Project Name': ['Longfellow Solar I', 'Longfellow Solar II', 'Blue Heron BESS', 'Larrea Solar', np.nan],
+        'County': ['Pecos', 'Pecos', 'Reeves', 'Pecos', 'Carson'],
+    })
+
+
+def rows(index: SearchIndex, query: str):
+    return [hit.row for hit in index.search(query)]
+
+
+def test_words_prefixes_and_typos():
+    assert tokenize("McCamey's Castle-2") == ['mccamey', 's', 'castle', '2']
+    assert edit_distance('batery', 'battery', 1) == 1 and edit_distance('larea', 'larrea', 1) == 1
+    assert edit_distance('slar', 'sola', 1) == 2
+    assert max_edits('sol') == 0 and max_edits('solar') == 1 and max_edits('longfelows') == 2
+    assert max_edits('25inr01') == 0
+
+    index = SearchIndex.from_frame(projects())
+    # Every word must match; an exact word outranks a prefix of a longer one
+    assert rows(index, 'longfellow solar i') == [0, 1]
+    assert rows(index, 'longfellow solar ii') == [1]
+    assert rows(index, 'pecos sol') == [0, 1, 3]
+    assert rows(index, 'longfelow') == [0, 1]
+    assert rows(index, 'larea solar') == [3]
+    assert rows(index, '27inr') == [3]
+    assert rows(index, '0146') == []
+    assert rows(index, 'reeves solar') == []
+    assert rows(index, 'carson') == [4]
+    assert rows(index, '  ') == []
+
+    hit = index.search('25INR0146 reev')[0]
+    assert hit.row == 2 and hit.fields == ['inr', 'county']
+    assert index.count('pecos') == 3 and len(index.search('pecos', limit=2)) == 2
+
+
+def test_search_endpoint():
+    client = TestClient(app)
+    name = client.get('/api/search', params={'q': 'solar', 'limit': 1}).json()['results'][0]['Project Name']
+    payload = client.get('/api/search', params={'q': name[:-1]}).json()
+    assert payload['total_matches'] >= 1
+    assert payload['results'][0]['Project Name'] == name and payload['results'][0]['matched'] == ['name']
+    assert client.get('/api/search', params={'q': 'solar', 'limit': 0}).status_code == 422
@@ -0,0 +1,75 @@
+import datetime
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "src"))
+
+from shared_store import TEXT_DTYPE, SharedMonthStore, frame_from_table, frame_to_table
+
+
+def sample_frame() -> pd.DataFrame:
+    frame = pd.DataFrame({
+        'INR': ['21INR0001', '22INR0002', None],
+        'Capacity (MW)': [150.5, np.nan, 20.0],
+        'Change Flags': np.array([0, 4, 6], dtype=np.uint8),
+        'COD Date': pd.to_datetime(['2026-03-01', None, '2027-01-15']),
+        # Excel columns mixing dates, text and blanks stay as Python objects
+        'IA Signed': np.array([datetime.datetime(2025, 5, 1), 'N/A', np.nan], dtype=object),
+        'Fuel_Normalized': np.array(['Solar', 'Wind', 'Solar'], dtype=object),
+    })
+    frame.attrs['quality_report'] = {'row_count': 3, 'passed': True}
+    return frame
+
+
+def test_round_trip_is_exact():
+    frame = sample_frame()
+    restored = frame_from_table(frame_to_table(frame))
+    # Text columns come back Arrow-backed whether pandas read them as object or str
+    pd.testing.assert_frame_equal(restored, frame.astype({'INR': TEXT_DTYPE, 'Fuel_Normalized': TEXT_DTYPE}))
+    assert restored.attrs == frame.attrs
+    assert type(restored.loc[0, 'IA Signed']) is datetime.datetime
+
+
+def test_second_worker_maps_published_month(tmp_path):
+    frame = sample_frame()
+    builds = []
+
+    def build():
+        builds.append(1)
+        return frame
+
+    first, shared = SharedMonthStore(tmp_path).get_or_build('abc123', build, Path('inputs/2026/01/file.xlsx'))
+    assert not shared
+    # A separate store instance stands in for another worker process
+    second, shared = SharedMonthStore(tmp_path).get_or_build('abc123', build)
+    assert shared and len(builds) == 1
+    pd.testing.assert_frame_equal(second, frame_from_table(frame_to_table(frame)))
+    assert SharedMonthStore(tmp_path).manifest()['abc123']['rows'] == 3
+
+
+def test_old_months_are_pruned(tmp_path):
+    store = SharedMonthStore(tmp_path, max_entries=2)
+    for fingerprint in ('a', 'b', 'c'):
+        store.save(fingerprint, sample_frame())
+    assert sorted(store.manifest()) == ['b', 'c']
+    assert store.load('a') is None and store.load('c') is not None
+
+
+def test_text_columns_stay_arrow_backed(tmp_path):
+    store = SharedMonthStore(tmp_path)
+    text = pd.DataFrame({'County': np.array(['Pecos', np.nan, 'Reeves'] * 1000, dtype=object),
+                         'Quarter': ['2026Q1', '2026Q2', '2026Q3'] * 1000})
+    store.save('text', text)
+
+    allocated = pa.total_allocated_bytes()
+    loaded = store.load('text')
+    # Strings point into the mapped file rather than being copied out of it (~35 kB of text)
+    assert pa.total_allocated_bytes() - allocated < 1024
+    assert list(loaded.dtypes) == [TEXT_DTYPE, TEXT_DTYPE] and TEXT_DTYPE.storage == 'pyarrow'
+    assert loaded['County'].isna().tolist()[:3] == [False, True, False]
@@ -0,0 +1,85 @@
+import gzip
+import json
+import sys
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+sys.path.append(str(project_root / "src"))
+
+from dataset import input_fingerprints
+from web.backend.prerender import quarter_sets
+from web.backend.static_api import (MANIFEST_NAME, MANIFEST_VERSION, StaticApiMiddleware, StaticApiTree,
+                                    accepted_encodings, static_relpath)
+
+
+def test_static_relpath_is_canonical():
+    a = static_relpath('quarter-report', [('year', '2026'), ('quarters', '2026Q2'), ('month', '01'),
+                                          ('quarters', '2026Q1'), ('quarters', '2026Q2')])
+    b = static_relpath('quarter-report', [('month', '01'), ('quarters', '2026Q1'), ('quarters', '2026Q2'),
+                                          ('year', '2026')])
+    assert a == b == 'api/quarter-report/month=01&quarters=2026Q1&quarters=2026Q2&year=2026.json'
+    assert static_relpath('years', []) == 'api/years/index.json'
+    # Values are percent-encoded; order is kept for endpoints that echo it
+    assert static_relpath('facets', [('county', 'Fort Bend')]) == 'api/facets/county=Fort%20Bend.json'
+    assert static_relpath('facets', [('zone', 'B'), ('zone', 'A')]) != static_relpath('facets', [('zone', 'A'), ('zone', 'B')])
+    long = static_relpath('quarter-report', [('quarters', f"20{y}Q{q}") for y in range(26, 40) for q in range(1, 5)])
+    assert Path(long).name.startswith('q-') and len(Path(long).name) < 40
+
+
+def test_accepted_encodings():
+    assert accepted_encodings('gzip, deflate, br;q=0.5') == {'gzip', 'deflate', 'br'}
+    assert accepted_encodings('br;q=0, gzip') == {'gzip'}
+    assert accepted_encodings('') == set()
+
+
+def test_quarter_sets():
+    sets = quarter_sets(['2027Q1', '2026Q1', '2026Q3', '2028Q2', '2026Q4'], '2026Q1')
+    assert ['2026Q3'] in sets and ['2026Q1', '2026Q3', '2026Q4'] in sets
+    assert ['2026Q1', '2026Q3', '2026Q4', '2027Q1'] in sets  # next four from the report quarter
+    assert sets[-1] == ['2026Q1', '2026Q3', '2026Q4', '2027Q1', '2028Q2']
+    assert len(sets) == len({tuple(s) for s in sets})
+
+
+def build_tree(tmp_path: Path):
+    inputs = tmp_path / 'inputs'
+    (inputs / '2026' / '01').mkdir(parents=True)
+    (inputs / '2026' / '01' / 'file.xlsx').write_bytes(b'workbook')
+    root = tmp_path / 'static'
+    body = json.dumps({'years': ['2026']}).encode()
+    relpath = static_relpath('years', [])
+    (root / relpath).parent.mkdir(parents=True)
+    (root / relpath).write_bytes(body)
+    Path(str(root / relpath) + '.gz').write_bytes(gzip.compress(body))
+    manifest = {'version': MANIFEST_VERSION, 'inputs': input_fingerprints(inputs),
+                'files': {relpath: {'route': 'years', 'query': '', 'bytes': len(body), 'encodings': {'gzip': 1}}}}
+    (root / MANIFEST_NAME).write_text(json.dumps(manifest))
+    return root, inputs
+
+
+def test_middleware_serves_tree_until_inputs_change(tmp_path):
+    root, inputs = build_tree(tmp_path)
+    tree = StaticApiTree(root, inputs, check_interval=0)
+    app = FastAPI()
+    app.add_middleware(StaticApiMiddleware, tree=tree)
+
+    @app.get("/api/years")
+    async def live_years():
+        return {"years": ["live"]}
+
+    client = TestClient(app)
+    response = client.get('/api/years', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['x-cache'] == 'STATIC' and response.headers['content-encoding'] == 'gzip'
+    assert response.json() == {'years': ['2026']}
+    assert client.get('/api/years', headers={'Accept-Encoding': 'identity'}).json() == {'years': ['2026']}
+    # Requests that were not rendered fall through to the endpoint
+    assert client.get('/api/years?extra=1').json() == {'years': ['live']}
+
+    # A new workbook makes the tree stale
+    (inputs / '2026' / '01' / 'file.xlsx').write_bytes(b'revised workbook')
+    response = client.get('/api/years')
+    assert response.json() == {'years': ['live']} and 'x-cache' not in response.headers
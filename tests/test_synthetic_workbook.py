@@ -0,0 +1,31 @@
+import sys
+from pathlib import Path
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "src"))
+
+from extract_large_gen import extract_large_gen_data
+from synthetic_workbook import generate_month_series
+
+
+def test_synthetic_months_parse_like_real_reports(tmp_path):
+    paths = generate_month_series(300, 2, tmp_path, start='2026-01', seed=3, change_rate=0.2)
+    assert [p.relative_to(tmp_path).as_posix() for p in paths] == ['2026/01/file.xlsx', '2026/02/file.xlsx']
+
+    first = extract_large_gen_data(paths[0])
+    second = extract_large_gen_data(paths[1])
+    real = extract_large_gen_data(sorted((project_root / "inputs").glob("*/*/file.xlsx"))[0])
+
+    # Same column names as a real ERCOT workbook, clean INRs, numeric MW
+    assert list(first.columns) == list(real.columns)
+    assert len(first) == 300
+    assert first.attrs['quality_report']['passed']
+    assert second.attrs['quality_report']['passed']
+
+    # Month-over-month churn: added, removed and flagged-changed projects
+    change_col = next(c for c in second.columns if 'Change indicator' in c)
+    assert set(second['INR']) - set(first['INR'])
+    assert set(first['INR']) - set(second['INR'])
+    assert second[change_col].notna().sum() > 0
+    assert first[change_col].isna().all()
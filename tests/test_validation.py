@@ -0,0 +1,68 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "src"))
+
+from validation import validate_large_gen_data, write_quality_report
+
+
+def _raw_frame():
+    return pd.DataFrame({
+        'INR': ['24INR0001', '24INR0002', '24INR0002', None],
+        'Project Name': ['A', 'B', 'C', 'D'],
+        'GIM Study Phase': ['SS Completed, FIS Started, IA'] * 4,
+        'County': ['Pecos', 'Reeves', 'Reeves', 'Ward'],
+        'Projected COD': [pd.Timestamp('2026-03-31'), 'not a date', None, pd.Timestamp('1900-01-01')],
+        'Fuel': ['SOL', 'win ', 'MWH', None],
+        'Technology': ['PV', 'WT', 'SO', 'BA'],
+        'Capacity (MW)': [200.0, 'abc', -25, 9000],
+    })
+
+
+def _failed(report):
+    return {c['check']: c['failed_rows'] for c in report['checks'] if c['status'] == 'fail'}
+
+
+def test_validation_flags_each_problem_once():
+    report = validate_large_gen_data(_raw_frame())
+
+    assert _failed(report) == {
+        'missing_inr': 1,
+        'duplicate_inr': 2,
+        'unparseable_cod': 1,
+        'missing_cod': 1,
+        'cod_out_of_range': 1,
+        'non_numeric_mw': 1,
+        'negative_mw': 1,
+        'mw_above_max': 1,
+        'unknown_fuel_code': 1,
+        'unknown_technology_code': 1,
+    }
+    assert report['passed'] is False
+    assert report['unknown_codes'] == {'unknown_fuel_code': {'MWH': 1}, 'unknown_technology_code': {'SO': 1}}
+    assert len(report['issues_csv'].splitlines()) - 1 == sum(_failed(report).values())
+
+
+def test_validation_reports_missing_required_columns():
+    report = validate_large_gen_data(_raw_frame().drop(columns=['County', 'Fuel']))
+
+    required = next(c for c in report['checks'] if c['check'] == 'required_columns')
+    assert required['status'] == 'fail'
+    assert 'County' in required['detail'] and 'Fuel' in required['detail']
+    assert report['passed'] is False
+
+
+def test_clean_frame_passes_and_writes_reports(tmp_path):
+    df = _raw_frame().iloc[:1]
+    report = validate_large_gen_data(df)
+
+    assert report['passed'] is True
+    assert report['warning_checks'] == 0
+
+    json_path = write_quality_report(report, tmp_path)
+    assert json_path.exists()
+    assert (tmp_path / 'quality_issues.csv').exists()
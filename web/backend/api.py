@@ -1,11 +1,16 @@
+import hashlib
 import shutil
+import threading
 from pathlib import Path
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Query
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 import zipfile
 import os
+import logging
 from fastapi.staticfiles import StaticFiles
-from typing import Optional, List, Dict, Any
+from typing import Any, Callable, Dict, Iterator, List, Optional
 import pandas as pd
 import numpy as np
 
@@ -13,10 +18,34 @@ import numpy as np
 # Assuming src is in path (handled in main.py)
 from extract_large_gen import extract_large_gen_data
 
-from constants import normalize_fuel_type, normalize_technology_type, FUEL_COLORS
+from constants import FUEL_COLORS
+from change_flags import CHANGE_FLAGS_COLUMN, CHANGE_TYPES, flagged_changes
+from dataset import MonthDataset, MonthDatasetCache, file_fingerprint, input_files
+from shared_store import default_shared_store
+from ingest import default_snapshot_store
+from history_store import default_history_store
+from search_index import DEFAULT_LIMIT as SEARCH_DEFAULT_LIMIT
+from cod_index import FREQUENCIES as COD_FREQUENCIES
+from artifact_store import ArtifactStore
+from month_matrix import MonthMatrix, matrix_payload
+from row_hashes import changed_groups
+from chart_specs import CHART_SPECS, build_chart_spec
+from county_geo import CountyGeometry, county_map_payload
+from query_engine import DEFAULT_MAX_ROWS as QUERY_DEFAULT_ROWS, MAX_ROWS as QUERY_MAX_ROWS, QueryEngine, QueryError
+import matplotlib
+matplotlib.use('Agg')  # charts render in worker threads; never pick a GUI backend
+from reports import (CHART_FORMATS, QUARTER_FILTERED_REPORTS, RENDER_TIERS, REPORT_RENDERERS, EmptyChartError,
+                     render_eager_tiers, render_report_artifact)
 import calendar
 
+from web.backend.instrumentation import profiling, record_cache_access, span
+from web.backend.result_cache import ResultCache, canonical_key
+from web.backend.static_api import accepted_encodings
+from web.backend.export import (CHUNK_ROWS, FORMATS, MEDIA_TYPES, chunk_frame, content_disposition,
+                                export_filename, stream_export)
+
 router = APIRouter()
+logger = logging.getLogger("tgir.api")
 
 # Define paths
 # We need to be careful with paths. 
@@ -62,6 +91,351 @@ def get_input_file(year: Optional[str] = None, month: Optional[str] = None) -> P
 
     raise HTTPException(status_code=404, detail="No input Excel file found")
 
+def records_for_json(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Convert a DataFrame to records with NaN/NaT replaced by None.
+
+    Casting to object first matters: on float columns `where(..., None)` keeps NaN,
+    which the JSON encoder rejects.
+    """
+    return df.astype(object).where(pd.notnull(df), None).to_dict(orient='records')
+
+def json_response(payload: Dict[str, Any]) -> JSONResponse:
+    """
+    Serialize a payload inside a span so JSON encoding shows up in Server-Timing.
+    """
+    with span("serialize"):
+        return JSONResponse(jsonable_encoder(payload))
+
+# Parsed months, reused across requests until the workbook changes on disk, loaded from
+# build-time snapshots when TGIR_SNAPSHOT_DIR holds them (src/ingest.py) or rebuilt from
+# the delta history in TGIR_HISTORY_DIR (src/history_store.py), and shared between
+# worker processes when TGIR_SHARED_CACHE_DIR is set.
+# The loader looks up extract_large_gen_data at call time so it can be swapped (benchmarks).
+MONTH_CACHE = MonthDatasetCache(loader=lambda path: extract_large_gen_data(path), shared=default_shared_store(),
+                                snapshots=default_snapshot_store(), history=default_history_store())
+
+def get_month_dataset(year: Optional[str] = None, month: Optional[str] = None) -> MonthDataset:
+    """
+    Resolve a report month and return its cached, normalized dataset.
+    """
+    with span("get_input_file"):
+        input_file = get_input_file(year, month)
+
+    with span("extract"):
+        dataset, hit = MONTH_CACHE.get(input_file)
+    record_cache_access('month_dataset', hit)
+    return dataset
+
+async def get_month_dataset_async(year: Optional[str] = None, month: Optional[str] = None) -> MonthDataset:
+    """
+    get_month_dataset for async routes: a cold load runs in the threadpool, so it never
+    blocks the event loop (inline while profiling, so the profile shows it).
+    """
+    if profiling():
+        return get_month_dataset(year, month)
+    return await run_in_threadpool(get_month_dataset, year, month)
+
+# Rendered charts, named by (workbook hash, report, parameters) and served from /outputs/artifacts
+ARTIFACT_STORE = ArtifactStore(OUTPUTS_DIR / "artifacts")
+
+# Serialized responses of the Quarter Report endpoints, keyed on the workbook's content hash
+RESULT_CACHE = ResultCache()
+
+# Every report month in SQLite for /api/query; synced with inputs/ before each query
+QUERY_ENGINE = QueryEngine()
+
+def run_sql(sql: str, max_rows: int) -> Dict[str, Any]:
+    """
+    Bring QUERY_ENGINE up to date with the workbooks under INPUTS_DIR, then run a query.
+
+    Only months whose workbook hash differs from the loaded one go through MONTH_CACHE,
+    so queries do not reload months the cache has evicted.
+    """
+    loaded = QUERY_ENGINE.months
+    stale, unchanged = [], []
+    for period, path in input_files(INPUTS_DIR):
+        if loaded.get(period) == file_fingerprint(path):
+            unchanged.append(period)
+        else:
+            stale.append(path)
+
+    def datasets():
+        for path in stale:
+            dataset, hit = MONTH_CACHE.get(path)
+            record_cache_access('month_dataset', hit)
+            yield dataset
+
+    with span("sync"):
+        QUERY_ENGINE.sync(datasets(), unchanged=unchanged)
+    with span("query"):
+        return QUERY_ENGINE.query(sql, max_rows=max_rows)
+
+def sorted_unique(values: Optional[List[str]]) -> Optional[List[str]]:
+    """
+    Canonical order for multi-valued query parameters whose order has no meaning.
+    """
+    return sorted(set(values)) if values else values
+
+async def cached_json_response(dataset: MonthDataset, endpoint: str, params: Dict[str, Any],
+                               build: Callable[[], Dict[str, Any]]) -> Response:
+    """
+    Serve a JSON payload from RESULT_CACHE, building and serializing it on a miss.
+
+    The build runs in the threadpool, so identical requests arriving meanwhile wait
+    for it instead of repeating the work. params must already be in canonical order
+    (see sorted_unique) because the first request's body is served to all of them.
+    Profiled requests (`?profile=1`) skip the cache and build inline, so the profile
+    shows the build.
+    """
+    return await cached_fingerprint_response(dataset.fingerprint, endpoint, params, build)
+
+async def cached_fingerprint_response(fingerprint: str, endpoint: str, params: Dict[str, Any],
+                                      build: Callable[[], Dict[str, Any]]) -> Response:
+    """
+    cached_json_response for payloads built from several months, keyed on a combined fingerprint.
+    """
+    key = canonical_key(fingerprint, endpoint, params)
+
+    def compute() -> bytes:
+        payload = build()
+        with span("serialize"):
+            return JSONResponse(jsonable_encoder(payload)).body
+
+    if profiling():
+        return Response(compute(), media_type="application/json", headers={"X-Cache": "BYPASS"})
+    body, outcome = await run_in_threadpool(RESULT_CACHE.get_or_compute, key, compute)
+    return Response(body, media_type="application/json", headers={"X-Cache": outcome.upper()})
+
+def check_change_types(types: Optional[List[str]]) -> None:
+    unknown = [t for t in (types or []) if t not in CHANGE_TYPES]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown change types: {', '.join(unknown)}. Valid: {', '.join(CHANGE_TYPES)}"
+        )
+
+def facet_filters(quarters: Optional[List[str]] = None, county: Optional[str] = None,
+                  **facets: Optional[List[str]]) -> Dict[str, List[str]]:
+    """
+    Collect quarter, county and facet query parameters into FacetIndex filters.
+    """
+    filters = {name: values for name, values in facets.items() if values}
+    if quarters:
+        filters['quarter'] = quarters
+    if county is not None:
+        filters['county'] = [county]
+    return filters
+
+def cod_window(dataset: MonthDataset, start: Optional[str], end: Optional[str],
+               months: Optional[int]) -> tuple:
+    """
+    Resolve start/end/months query parameters into a [start, end) COD window.
+
+    start defaults to the first day of the report month; end defaults to start + months,
+    or open-ended when neither end nor months is given.
+
+    Raises:
+        HTTPException: 400 for an unparseable date or an end not after start
+    """
+    try:
+        window_start = pd.Timestamp(start) if start else dataset.report_date
+        window_end = pd.Timestamp(end) if end else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid date: {e}")
+    if window_end is None and months is not None:
+        window_end = window_start + pd.DateOffset(months=months)
+    if window_end is not None and window_end <= window_start:
+        raise HTTPException(status_code=400, detail=f"end ({window_end.date()}) must be after start "
+                                                    f"({window_start.date()})")
+    return window_start, window_end
+
+def select_quarter_rows(dataset: MonthDataset, quarters: Optional[List[str]], county: Optional[str] = None,
+                        facets: Optional[Dict[str, List[str]]] = None) -> pd.DataFrame:
+    """
+    Select the rows in the chosen quarters, county and facets from a cached month.
+
+    Args:
+        dataset: Month from get_month_dataset
+        quarters: Quarters such as '2026Q1'; all quarters when empty
+        county: Optional county to restrict to
+        facets: Optional extra facet filters, e.g. {'phase': [...], 'fuel': ['Solar']}
+
+    Returns:
+        Filtered copy with parsed 'Projected COD', 'Quarter', 'Fuel_Normalized' and
+        'Technology_Normalized' columns
+    """
+    with span("filter"):
+        index = dataset.facets
+        rows = index.rows(index.select(facet_filters(quarters, county, **(facets or {}))))
+        df_filtered = dataset.take(rows)
+        df_filtered['Projected COD'] = df_filtered.pop('COD Date')
+
+    return df_filtered
+
+def build_quarter_summary(df: pd.DataFrame, county_mw: pd.Series) -> Dict[str, Any]:
+    """
+    Total MW, project count and top 5 counties by MW.
+    """
+    top_counties = county_mw.sort_values(ascending=False, kind='stable').head(5)
+    return {
+        "total_mw": df['Capacity (MW)'].sum(),
+        "total_projects": len(df),
+        "top_counties": [{"county": c, "mw": mw} for c, mw in top_counties.items()]
+    }
+
+def build_fuel_chart(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    MW by refined fuel type, largest first, with chart colors.
+    """
+    fuel_mw = df.groupby('Fuel_Normalized')['Capacity (MW)'].sum().sort_values(ascending=False, kind='stable')
+    return {
+        "labels": fuel_mw.index.tolist(),
+        "data": fuel_mw.values.tolist(),
+        "colors": [FUEL_COLORS.get(f, '#D3D3D3') for f in fuel_mw.index]
+    }
+
+def county_fuel_breakdown(df: pd.DataFrame) -> Dict[str, List[tuple]]:
+    """
+    Per county, (fuel, MW) pairs sorted by MW descending, from a single groupby.
+    """
+    county_fuel_mw = df.groupby(['County', 'Fuel_Normalized'])['Capacity (MW)'].sum()
+    county_fuel_mw = county_fuel_mw.sort_values(ascending=False, kind='stable').sort_index(level=0, sort_remaining=False, kind='stable')
+    breakdown: Dict[str, List[tuple]] = {}
+    for (county, fuel), mw in county_fuel_mw.items():
+        breakdown.setdefault(county, []).append((fuel, mw))
+    return breakdown
+
+def build_county_table(county_mw: pd.Series, county_counts: pd.Series,
+                       breakdown: Dict[str, List[tuple]]) -> List[Dict[str, Any]]:
+    """
+    Every county with total MW, project count and a fuel breakdown string, largest first.
+    """
+    county_data = [
+        {
+            "county": county,
+            "total_mw": total_mw,
+            "project_count": int(county_counts[county]),
+            "fuel_breakdown": ", ".join([f"{f}: {mw:.1f} MW" for f, mw in breakdown[county]])
+        }
+        for county, total_mw in county_mw.items()
+    ]
+    county_data.sort(key=lambda x: x['total_mw'], reverse=True)
+    return county_data
+
+def build_county_map(county_mw: pd.Series, county_counts: pd.Series,
+                     breakdown: Dict[str, List[tuple]]) -> List[Dict[str, Any]]:
+    """
+    Per-county totals and a top-2 fuel summary for the map.
+    """
+    return [
+        {
+            "county": county,
+            "total_mw": total_mw,
+            "project_count": int(county_counts[county]),
+            "fuel_summary": ", ".join([f"{f}: {mw:.0f}MW" for f, mw in breakdown[county][:2]])
+        }
+        for county, total_mw in county_mw.round(1).items()
+    ]
+
+def build_county_map_payload(county_mw: pd.Series, county_counts: pd.Series,
+                             breakdown: Dict[str, List[tuple]]) -> Dict[str, Any]:
+    """
+    The map joined to county FIPS ids and binned (see county_geo.county_map_payload),
+    with the URL of the geometry to draw it on.
+    """
+    geometry = get_county_geometry()
+    fuel_summary = {row['county']: row['fuel_summary']
+                    for row in build_county_map(county_mw, county_counts, breakdown)}
+    return {
+        "geometry_url": f"/api/county-geometry?v={geometry.version}",
+        **county_map_payload(geometry, county_mw, county_counts, fuel_summary)
+    }
+
+def build_county_details(df: pd.DataFrame, county: str, quarters: Optional[List[str]]) -> Optional[Dict[str, Any]]:
+    """
+    Summary cards and the project list for one county; None when it has no projects.
+    """
+    df_county = df[df['County'] == county]
+    if len(df_county) == 0:
+        return None
+
+    # Storage comes from the technology (e.g. 'BA' Battery Energy Storage, 'EN' Energy Storage)
+    technology = df_county['Technology_Normalized']
+    is_storage = (technology.str.contains('Storage', case=False, na=False) |
+                  technology.str.contains('Battery', case=False, na=False))
+
+    summary_cards = {
+        "solar_mw": df_county.loc[df_county['Fuel_Normalized'] == 'Solar', 'Capacity (MW)'].sum(),
+        "wind_mw": df_county.loc[df_county['Fuel_Normalized'] == 'Wind', 'Capacity (MW)'].sum(),
+        "storage_mw": df_county.loc[is_storage, 'Capacity (MW)'].sum(),
+        "total_mw": df_county['Capacity (MW)'].sum(),
+        "project_count": len(df_county)
+    }
+
+    return {
+        "county": county,
+        "quarters": quarters,
+        "summary": summary_cards,
+        "projects": records_for_json(df_county.drop(columns=CHANGE_FLAGS_COLUMN, errors='ignore'))
+    }
+
+QUARTER_REPORT_SECTIONS = ['summary', 'fuel_chart', 'county_data', 'county_map', 'county_details']
+DEFAULT_QUARTER_REPORT_SECTIONS = ['summary', 'fuel_chart', 'county_data', 'county_map']
+
+def build_quarter_report(df: pd.DataFrame, sections: List[str], quarters: Optional[List[str]] = None,
+                         county: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Build the requested Quarter Report panels from one filtered working set.
+
+    County totals and the county x fuel breakdown are aggregated once and shared
+    by the summary, county table and map sections.
+
+    Args:
+        df: Working set from select_quarter_rows
+        sections: Subset of QUARTER_REPORT_SECTIONS
+        quarters: Selected quarters (echoed in county_details)
+        county: County for the 'county_details' section
+
+    Returns:
+        Dictionary keyed by section name
+    """
+    report: Dict[str, Any] = {}
+    with span("aggregate"):
+        if {'summary', 'county_data', 'county_map'} & set(sections):
+            county_mw = df.groupby('County')['Capacity (MW)'].sum()
+            county_counts = df.groupby('County').size()
+        if {'county_data', 'county_map'} & set(sections):
+            breakdown = county_fuel_breakdown(df)
+
+        if 'summary' in sections:
+            report['summary'] = build_quarter_summary(df, county_mw)
+        if 'fuel_chart' in sections:
+            report['fuel_chart'] = build_fuel_chart(df)
+        if 'county_data' in sections:
+            report['county_data'] = build_county_table(county_mw, county_counts, breakdown)
+        if 'county_map' in sections:
+            report['county_map'] = build_county_map_payload(county_mw, county_counts, breakdown)
+        if 'county_details' in sections:
+            report['county_details'] = build_county_details(df, county, quarters) if county else None
+    return report
+
+def parse_sections(sections: Optional[List[str]]) -> List[str]:
+    """
+    Accept repeated (?sections=a&sections=b) or comma-separated (?sections=a,b) section names.
+    """
+    if not sections:
+        return list(DEFAULT_QUARTER_REPORT_SECTIONS)
+    requested = [s.strip() for value in sections for s in value.split(',') if s.strip()]
+    unknown = [s for s in requested if s not in QUARTER_REPORT_SECTIONS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown sections: {', '.join(unknown)}. Valid: {', '.join(QUARTER_REPORT_SECTIONS)}"
+        )
+    # Canonical order, so equivalent requests share a cached response
+    return [s for s in QUARTER_REPORT_SECTIONS if s in requested]
+
 @router.get("/years")
 async def get_years():
     """
@@ -145,16 +519,13 @@ async def get_quarters(year: Optional[str] = Query(None), month: Optional[str] =
     Returns a list of available quarters from the dataset.
     """
     try:
-        # Find input file
-        input_file = get_input_file(year, month)
-        print(f"Using input file: {input_file}")
-
-        df = extract_large_gen_data(input_file)
+        dataset = await get_month_dataset_async(year, month)
+        input_file = dataset.source
+        logger.info("Using input file: %s", input_file)
         
-        # Extract quarters
-        df['Projected COD'] = pd.to_datetime(df['Projected COD'], errors='coerce')
-        df = df[df['Projected COD'].notna()]
-        quarters = sorted(df['Projected COD'].dt.to_period('Q').astype(str).unique())
+        # Quarters with at least one project (facet values of the quarter index)
+        with span("aggregate"):
+            quarters = sorted(dataset.facets.values.get('quarter', []))
         
         # Determine report period based on file path (folder name)
         report_period = "Report"
@@ -168,8 +539,65 @@ async def get_quarters(year: Optional[str] = Query(None), month: Optional[str] =
         except:
             pass
 
-        return {"quarters": quarters, "report_period": report_period}
+        return json_response({"quarters": quarters, "report_period": report_period})
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/data-quality")
+async def get_data_quality(year: Optional[str] = Query(None), month: Optional[str] = Query(None)):
+    """
+    Returns the data-quality report for a report month.
+    """
+    try:
+        dataset = await get_month_dataset_async(year, month)
+        report = dataset.frame.attrs.get('quality_report', {})
+
+        return json_response({
+            "source": dataset.period,
+            **{k: v for k, v in report.items() if k != 'issues_csv'}
+        })
+    except HTTPException as he:
+        raise he
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/flagged-changes")
+async def get_flagged_changes(
+    year: Optional[str] = Query(None),
+    month: Optional[str] = Query(None),
+    types: List[str] = Query(None)
+):
+    """
+    Returns projects flagged in a month's change-indicator column.
+
+    - types: change types to keep (any of them), e.g. ?types=cod for every COD change;
+      one of cod, mw_size, proj_name, sfs_ntp, fis_request, status_change
+    """
+    try:
+        check_change_types(types)
+        dataset = await get_month_dataset_async(year, month)
+        df = dataset.frame
+
+        with span("filter"):
+            changes = flagged_changes(df, types)
+            changes.sort(key=lambda x: str(x.get('County', '') or ''))
+
+        with span("aggregate"):
+            flags = df[CHANGE_FLAGS_COLUMN].to_numpy()
+            counts = {name: int(((flags & change.bit) != 0).sum()) for name, change in CHANGE_TYPES.items()}
+
+        return json_response({
+            "source": dataset.period,
+            "types": types or [],
+            "counts": counts,
+            "flagged_changes": changes
+        })
+    except HTTPException as he:
+        raise he
     except Exception as e:
+        logger.exception("Request failed")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -179,88 +607,298 @@ async def get_quarter_data(quarters: List[str] = Query(None), year: Optional[str
     Returns aggregated data for the Quarter Report dashboard.
     """
     try:
-        # Find input file
-        input_file = get_input_file(year, month)
+        dataset = await get_month_dataset_async(year, month)
+        quarters = sorted_unique(quarters)
 
-        df = extract_large_gen_data(input_file)
-        
-        # Filter by quarters
-        df['Projected COD'] = pd.to_datetime(df['Projected COD'], errors='coerce')
-        df['Quarter'] = df['Projected COD'].dt.to_period('Q').astype(str)
-        
-        if quarters:
-            df_filtered = df[df['Quarter'].isin(quarters)].copy()
-        else:
-            df_filtered = df.copy()
-        
-        if len(df_filtered) == 0:
+        def build() -> Dict[str, Any]:
+            df_filtered = select_quarter_rows(dataset, quarters)
+            if len(df_filtered) == 0:
+                return {
+                    "summary": {"total_mw": 0, "total_projects": 0, "top_counties": []},
+                    "fuel_chart": {"labels": [], "data": [], "colors": []},
+                    "county_data": []
+                }
+            return build_quarter_report(df_filtered, ['summary', 'fuel_chart', 'county_data'])
+
+        return await cached_json_response(dataset, 'quarter-data', {'quarters': quarters}, build)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Request failed")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/quarter-report")
+async def get_quarter_report(
+    quarters: List[str] = Query(None),
+    year: Optional[str] = Query(None),
+    month: Optional[str] = Query(None),
+    sections: List[str] = Query(None),
+    county: Optional[str] = Query(None),
+    phase: List[str] = Query(None),
+    fuel: List[str] = Query(None),
+    technology: List[str] = Query(None),
+    zone: List[str] = Query(None),
+    change: List[str] = Query(None)
+):
+    """
+    Returns every Quarter Report panel from one load, filter and aggregation pass.
+
+    - sections: any of summary, fuel_chart, county_data, county_map, county_details
+      (repeated or comma-separated; defaults to everything except county_details)
+    - county: county for the county_details section (null when it has no projects)
+    - phase, fuel, technology, zone, change: facet filters (values OR'ed within a
+      facet, facets AND'ed); see /api/facets for the values and their counts
+    """
+    try:
+        requested = parse_sections(sections)
+        if county and 'county_details' not in requested:
+            requested.append('county_details')
+        check_change_types(change)
+
+        dataset = await get_month_dataset_async(year, month)
+        quarters = sorted_unique(quarters)
+        facets = {'phase': phase, 'fuel': fuel, 'technology': technology, 'zone': zone, 'change': change}
+        facets = {name: sorted_unique(values) for name, values in facets.items() if values}
+
+        def build() -> Dict[str, Any]:
+            df_filtered = select_quarter_rows(dataset, quarters, facets=facets)
+            report = build_quarter_report(df_filtered, requested, quarters=quarters, county=county)
             return {
-                "summary": {"total_mw": 0, "total_projects": 0, "top_counties": []},
-                "fuel_chart": {"labels": [], "data": [], "colors": []},
-                "county_data": []
+                "quarters": quarters or [],
+                "sections": requested,
+                "filters": facets,
+                **report
             }
 
-        # Summary Stats
-        total_mw = df_filtered['Capacity (MW)'].sum()
-        total_projects = len(df_filtered)
-        
-        # Top Counties by MW
-        top_counties = df_filtered.groupby('County')['Capacity (MW)'].sum().sort_values(ascending=False).head(5)
-        top_counties_list = [{"county": c, "mw": mw} for c, mw in top_counties.items()]
-        
-        # Fuel Chart Data
-        # Refine Fuel Type: If 'Other' or 'Unknown', try Technology
-        def refine_fuel(row):
-            fuel = normalize_fuel_type(row['Fuel'])
-            if fuel in ['Other', 'Unknown']:
-                tech = normalize_technology_type(row['Technology'])
-                if tech != 'Unknown':
-                    return tech
-            return fuel
-
-        df_filtered['Fuel_Normalized'] = df_filtered.apply(refine_fuel, axis=1)
-        fuel_mw = df_filtered.groupby('Fuel_Normalized')['Capacity (MW)'].sum().sort_values(ascending=False)
-        
-        fuel_chart = {
-            "labels": fuel_mw.index.tolist(),
-            "data": fuel_mw.values.tolist(),
-            "colors": [FUEL_COLORS.get(f, '#D3D3D3') for f in fuel_mw.index]
-        }
-        
-        # Main Table Data (All Counties)
-        # We want: County, Total MW, Fuel Breakdown (string or object)
-        county_groups = df_filtered.groupby('County')
-        county_data = []
-        
-        for county, group in county_groups:
-            c_total_mw = group['Capacity (MW)'].sum()
-            # Fuel breakdown for this county
-            c_fuel_mw = group.groupby('Fuel_Normalized')['Capacity (MW)'].sum().sort_values(ascending=False)
-            c_fuel_str = ", ".join([f"{f}: {mw:.1f} MW" for f, mw in c_fuel_mw.items()])
-            
-            county_data.append({
-                "county": county,
-                "total_mw": c_total_mw,
-                "project_count": len(group),
-                "fuel_breakdown": c_fuel_str
-            })
-            
-        # Sort by Total MW desc
-        county_data.sort(key=lambda x: x['total_mw'], reverse=True)
-        
-        return {
-            "summary": {
-                "total_mw": total_mw,
-                "total_projects": total_projects,
-                "top_counties": top_counties_list
-            },
-            "fuel_chart": fuel_chart,
-            "county_data": county_data
-        }
-        
+        params = {'quarters': quarters, 'sections': requested, 'county': county, **facets}
+        return await cached_json_response(dataset, 'quarter-report', params, build)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Request failed")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/query")
+async def query_sql(
+    sql: str = Query(..., description="One SELECT statement"),
+    max_rows: int = Query(QUERY_DEFAULT_ROWS, ge=1, le=QUERY_MAX_ROWS)
+):
+    """
+    Runs a read-only SQL query over every report month.
+
+    Tables: projects (one row per project per report_month), months, change_types;
+    views: flags (flagged change types) and changes (fields that differ from the
+    previous month). Writes, PRAGMAs and ATTACH are refused; queries are stopped at the
+    time limit (TGIR_QUERY_TIMEOUT, default 5s) and results cut at max_rows.
+
+    e.g. /api/query?sql=SELECT report_month, zone, SUM(capacity_mw) FROM projects GROUP BY 1, 2
+    """
+    try:
+        result = await run_in_threadpool(run_sql, sql, max_rows)
+        return json_response({"sql": sql, **result})
+    except QueryError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Request failed")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/facets")
+async def get_facets(
+    year: Optional[str] = Query(None),
+    month: Optional[str] = Query(None),
+    quarters: List[str] = Query(None),
+    county: List[str] = Query(None),
+    phase: List[str] = Query(None),
+    fuel: List[str] = Query(None),
+    technology: List[str] = Query(None),
+    zone: List[str] = Query(None),
+    change: List[str] = Query(None)
+):
+    """
+    Returns project counts per facet value under the given filters.
+
+    Each facet is counted against the other facets' filters, so the counts show what
+    picking another value of that facet would return. Facets: quarter, county, zone,
+    phase, fuel, technology and change (change-indicator types).
+    """
+    try:
+        check_change_types(change)
+        dataset = await get_month_dataset_async(year, month)
+
+        with span("filter"):
+            index = dataset.facets
+            filters = facet_filters(quarters, phase=phase, fuel=fuel, technology=technology, zone=zone, change=change)
+            if county:
+                filters['county'] = county
+            matching = index.count(index.select(filters))
+
+        with span("aggregate"):
+            counts = index.facet_counts(filters)
+
+        return json_response({
+            "source": dataset.period,
+            "total_projects": index.n_rows,
+            "matching_projects": matching,
+            "filters": filters,
+            "facets": counts
+        })
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Request failed")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# Columns returned per search result
+SEARCH_RESULT_COLUMNS = ['INR', 'Project Name', 'County', 'CDR Reporting Zone', 'GIM Study Phase',
+                         'Fuel_Normalized', 'Technology_Normalized', 'Capacity (MW)', 'Projected COD', 'Quarter']
+
+
+@router.get("/search")
+async def search_projects(
+    q: str = Query(..., description="Project name, INR or county words; the last may be partial"),
+    year: Optional[str] = Query(None),
+    month: Optional[str] = Query(None),
+    limit: int = Query(SEARCH_DEFAULT_LIMIT, ge=1, le=100)
+):
+    """
+    Returns the projects best matching a search-as-you-type query.
+
+    Every word must match a word of the project's name, INR or county exactly, as a
+    prefix, or with a typo or two (words of 4+ letters without digits). Results are
+    ranked by match quality, INR matches first. The month's index is built once.
+
+    e.g. /api/search?q=longfelow sol
+    """
+    try:
+        dataset = await get_month_dataset_async(year, month)
+
+        with span("filter"):
+            hits = dataset.search.search(q, limit=None)
+
+        with span("aggregate"):
+            shown = hits[:limit]
+            columns = [c for c in SEARCH_RESULT_COLUMNS if c in dataset.frame.columns]
+            records = records_for_json(dataset.frame[columns].iloc[[hit.row for hit in shown]])
+            results = [{**record, "score": hit.score, "matched": hit.fields} for record, hit in zip(records, shown)]
+
+        return json_response({
+            "source": dataset.period,
+            "query": q,
+            "total_matches": len(hits),
+            "results": results
+        })
+    except HTTPException:
+        raise
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("Request failed")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/cod-window")
+async def get_cod_window(
+    year: Optional[str] = Query(None),
+    month: Optional[str] = Query(None),
+    start: Optional[str] = Query(None),
+    end: Optional[str] = Query(None),
+    months: Optional[int] = Query(None, ge=1),
+    freq: Optional[str] = Query(None)
+):
+    """
+    Returns MW and project counts by fuel for projects with Projected COD in [start, end).
+
+    Answered from the month's COD index (binary search plus prefix-sum subtraction),
+    e.g. ?months=18 for "the next 18 months" from the report month. With freq=M, Q
+    or Y the window is also broken down per period.
+    """
+    try:
+        dataset = await get_month_dataset_async(year, month)
+        if freq is not None and freq not in COD_FREQUENCIES:
+            raise HTTPException(status_code=400,
+                                detail=f"Unknown freq '{freq}'. Valid: {', '.join(COD_FREQUENCIES)}")
+        window_start, window_end = cod_window(dataset, start, end, months)
+
+        with span("aggregate"):
+            index = dataset.cod
+            totals = index.range_totals(window_start, window_end)
+            by_fuel = sorted(totals['by_fuel'].items(), key=lambda item: -item[1]['mw'])
+            payload = {
+                "source": dataset.period,
+                "start": window_start.strftime('%Y-%m-%d'),
+                "end": window_end.strftime('%Y-%m-%d') if window_end is not None else None,
+                "total_mw": round(totals['total_mw'], 3),
+                "project_count": totals['project_count'],
+                "by_fuel": [{"fuel": fuel, "mw": round(values['mw'], 3), "count": values['count'],
+                             "color": FUEL_COLORS.get(fuel, '#D3D3D3')} for fuel, values in by_fuel]
+            }
+            if freq:
+                last = window_end - pd.Timedelta(days=1) if window_end is not None else None
+                buckets = index.buckets(freq, window_start, last)
+                payload["buckets"] = [
+                    {"period": str(period),
+                     "mw": round(float(buckets['mw'].loc[period].sum()), 3),
+                     "count": int(buckets['count'].loc[period].sum())}
+                    for period in buckets['mw'].index
+                ]
+
+        return json_response(payload)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Request failed")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/capacity-curve")
+async def get_capacity_curve(
+    year: Optional[str] = Query(None),
+    month: Optional[str] = Query(None),
+    start: Optional[str] = Query(None),
+    end: Optional[str] = Query(None),
+    months: Optional[int] = Query(None, ge=1),
+    freq: str = Query('Q'),
+    include_earlier: bool = Query(False)
+):
+    """
+    Returns cumulative MW reaching Projected COD by the end of each period, per fuel.
+
+    The curve starts at the report month unless start is given; include_earlier also
+    counts projects with a COD before the first period.
+    """
+    try:
+        dataset = await get_month_dataset_async(year, month)
+        if freq not in COD_FREQUENCIES:
+            raise HTTPException(status_code=400,
+                                detail=f"Unknown freq '{freq}'. Valid: {', '.join(COD_FREQUENCIES)}")
+        window_start, window_end = cod_window(dataset, start, end, months)
+
+        with span("aggregate"):
+            last = window_end - pd.Timedelta(days=1) if window_end is not None else None
+            curve = dataset.cod.cumulative_curve(freq, window_start, last, include_before_start=include_earlier)
+            if len(curve):
+                # Fuels with capacity in the window, largest final total first
+                final = curve.iloc[-1]
+                curve = curve[final[final > 0].sort_values(ascending=False, kind='stable').index]
+
+        return json_response({
+            "source": dataset.period,
+            "freq": freq,
+            "periods": [str(period) for period in curve.index],
+            "total": curve.sum(axis=1).round(3).tolist(),
+            "series": [{"fuel": fuel, "color": FUEL_COLORS.get(fuel, '#D3D3D3'),
+                        "cumulative_mw": curve[fuel].round(3).tolist()} for fuel in curve.columns]
+        })
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Request failed")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -270,77 +908,23 @@ async def get_county_details(county: str, quarters: List[str] = Query(None), yea
     Returns detailed data for a specific county and quarters.
     """
     try:
-        # Find input file
-        input_file = get_input_file(year, month)
+        dataset = await get_month_dataset_async(year, month)
+        quarters = sorted_unique(quarters)
 
-        df = extract_large_gen_data(input_file)
-        
-        # Filter by quarters and county
-        df['Projected COD'] = pd.to_datetime(df['Projected COD'], errors='coerce')
-        df['Quarter'] = df['Projected COD'].dt.to_period('Q').astype(str)
-        
-        # Refine Fuel Type logic (same as above)
-        def refine_fuel(row):
-            fuel = normalize_fuel_type(row['Fuel'])
-            if fuel in ['Other', 'Unknown']:
-                tech = normalize_technology_type(row['Technology'])
-                if tech != 'Unknown':
-                    return tech
-            return fuel
-
-        df['Fuel_Normalized'] = df.apply(refine_fuel, axis=1)
-        
-        if quarters:
-            df_filtered = df[(df['Quarter'].isin(quarters)) & (df['County'] == county)].copy()
-        else:
-            df_filtered = df[df['County'] == county].copy()
-        
-        if len(df_filtered) == 0:
-             raise HTTPException(status_code=404, detail="No data found for this county and quarter")
-
-        # Summary Cards Logic
-        # Sum of Solar, Wind, Storage (Battery)
-        # We need to check normalized fuel types
-        solar_mw = df_filtered[df_filtered['Fuel_Normalized'] == 'Solar']['Capacity (MW)'].sum()
-        wind_mw = df_filtered[df_filtered['Fuel_Normalized'] == 'Wind']['Capacity (MW)'].sum()
-        
-        # Storage is tricky, it might be 'Other' or have specific tech. 
-        # Let's check Technology column for 'Battery' or 'Storage'
-        # Or use Fuel='Storage' if it exists? 
-        # Looking at constants.py, 'BA' is Battery Energy Storage, 'EN' is Energy Storage.
-        # Let's use Technology column for storage check.
-        # Let's use Technology column for storage check.
-        df_filtered['Technology_Normalized'] = df_filtered['Technology'].apply(normalize_technology_type)
-        
-        storage_mw = df_filtered[
-            df_filtered['Technology_Normalized'].str.contains('Storage', case=False, na=False) |
-            df_filtered['Technology_Normalized'].str.contains('Battery', case=False, na=False)
-        ]['Capacity (MW)'].sum()
-        
-        summary_cards = {
-            "solar_mw": solar_mw,
-            "wind_mw": wind_mw,
-            "storage_mw": storage_mw,
-            "total_mw": df_filtered['Capacity (MW)'].sum(),
-            "project_count": len(df_filtered)
-        }
-        
-        # Detailed Project List
-        # Convert NaN to None for JSON serialization
-        projects = df_filtered.where(pd.notnull(df_filtered), None).to_dict(orient='records')
-        
-        return {
-            "county": county,
-            "quarters": quarters,
-            "summary": summary_cards,
-            "projects": projects
-        }
+        def build() -> Dict[str, Any]:
+            df_filtered = select_quarter_rows(dataset, quarters, county=county)
+            with span("aggregate"):
+                details = build_county_details(df_filtered, county, quarters)
+            if details is None:
+                raise HTTPException(status_code=404, detail="No data found for this county and quarter")
+            return details
+
+        return await cached_json_response(dataset, 'county-details', {'county': county, 'quarters': quarters}, build)
 
     except HTTPException as he:
         raise he
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("Request failed")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/county-map-data")
@@ -349,237 +933,300 @@ async def get_county_map_data(quarters: List[str] = Query(None), year: Optional[
     Returns county-level data optimized for map visualization.
     """
     try:
-        # Find input file
-        input_file = get_input_file(year, month)
+        dataset = await get_month_dataset_async(year, month)
+        quarters = sorted_unique(quarters)
 
-        df = extract_large_gen_data(input_file)
-        
-        # Filter by quarters
-        df['Projected COD'] = pd.to_datetime(df['Projected COD'], errors='coerce')
-        df['Quarter'] = df['Projected COD'].dt.to_period('Q').astype(str)
-        
-        if quarters:
-            df_filtered = df[df['Quarter'].isin(quarters)].copy()
-        else:
-            df_filtered = df.copy()
-        
-        if len(df_filtered) == 0:
-            return {"counties": []}
-
-        # Refine Fuel Type logic
-        def refine_fuel(row):
-            fuel = normalize_fuel_type(row['Fuel'])
-            if fuel in ['Other', 'Unknown']:
-                tech = normalize_technology_type(row['Technology'])
-                if tech != 'Unknown':
-                    return tech
-            return fuel
-
-        df_filtered['Fuel_Normalized'] = df_filtered.apply(refine_fuel, axis=1)
-        
-        # Aggregate by county
-        county_groups = df_filtered.groupby('County')
-        county_map_data = []
-        
-        for county, group in county_groups:
-            total_mw = group['Capacity (MW)'].sum()
-            project_count = len(group)
-            
-            # Get top 2 fuel types for brief summary
-            fuel_mw = group.groupby('Fuel_Normalized')['Capacity (MW)'].sum().sort_values(ascending=False)
-            top_fuels = fuel_mw.head(2)
-            fuel_summary = ", ".join([f"{f}: {mw:.0f}MW" for f, mw in top_fuels.items()])
-            
-            county_map_data.append({
-                "county": county,
-                "total_mw": round(total_mw, 1),
-                "project_count": project_count,
-                "fuel_summary": fuel_summary
-            })
-        
-        return {"counties": county_map_data}
-        
+        def build() -> Dict[str, Any]:
+            df_filtered = select_quarter_rows(dataset, quarters)
+            if len(df_filtered) == 0:
+                return {"counties": []}
+            with span("aggregate"):
+                county_mw = df_filtered.groupby('County')['Capacity (MW)'].sum()
+                county_counts = df_filtered.groupby('County').size()
+                return {"counties": build_county_map(county_mw, county_counts, county_fuel_breakdown(df_filtered))}
+
+        return await cached_json_response(dataset, 'county-map-data', {'quarters': quarters}, build)
+
+    except HTTPException:
+        raise
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("Request failed")
         raise HTTPException(status_code=500, detail=str(e))
 
+# Texas county TopoJSON, cut from the US file and simplified on first use (src/county_geo.py)
+_county_geometry: Optional[CountyGeometry] = None
+_county_geometry_lock = threading.Lock()
 
-@router.get("/comparison-data")
-async def get_comparison_data(
-    base_year: str, 
-    base_month: str, 
-    target_year: str, 
-    target_month: str
+# Geometry requested with its current ?v= version never changes, so browsers keep it for a year
+GEOMETRY_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+def get_county_geometry() -> CountyGeometry:
+    """
+    The process-wide county geometry, built once.
+    """
+    global _county_geometry
+    if _county_geometry is None:
+        with _county_geometry_lock:
+            if _county_geometry is None:
+                _county_geometry = CountyGeometry.from_file()
+    return _county_geometry
+
+@router.get("/county-geometry")
+async def get_county_geometry_topology(request: Request, v: Optional[str] = Query(None)):
+    """
+    Returns the simplified Texas county TopoJSON (object 'counties', ids are FIPS codes).
+
+    Request it as /api/county-geometry?v=<geometry_version from /api/county-map>: that
+    URL is immutable and cached for a year. Responses carry an ETag and are gzipped
+    when the client accepts it.
+    """
+    try:
+        geometry = await run_in_threadpool(get_county_geometry)
+        etag = f'"{geometry.version}"'
+        headers = {
+            "ETag": etag,
+            "Vary": "Accept-Encoding",
+            "Cache-Control": GEOMETRY_CACHE_CONTROL if v == geometry.version else "no-cache",
+        }
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        if 'gzip' in accepted_encodings(request.headers.get("accept-encoding", "")):
+            return Response(geometry.gzipped, media_type="application/json",
+                            headers={**headers, "Content-Encoding": "gzip"})
+        return Response(geometry.body, media_type="application/json", headers=headers)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Request failed")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/county-map")
+async def get_county_map(quarters: List[str] = Query(None), year: Optional[str] = Query(None), month: Optional[str] = Query(None)):
+    """
+    Returns the county map pre-joined and pre-binned: per-county FIPS id, color bin,
+    whole-MW total, project count and fuel summary (columnar lists), the legend's bin
+    edges and colors, and the geometry URL to draw them on. The same payload is the
+    county_map section of /api/quarter-report, which is what the Quarter Report page uses.
+
+    Counties that match no Texas county are listed under 'unmatched'.
+    """
+    try:
+        dataset = await get_month_dataset_async(year, month)
+        quarters = sorted_unique(quarters)
+
+        def build() -> Dict[str, Any]:
+            df_filtered = select_quarter_rows(dataset, quarters)
+            report = build_quarter_report(df_filtered, ['county_map'])
+            return {
+                "source": dataset.period,
+                "quarters": quarters,
+                **report['county_map']
+            }
+
+        return await cached_json_response(dataset, 'county-map', {'quarters': quarters}, build)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Request failed")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/chart-spec")
+async def get_chart_spec(
+    report: List[str] = Query(None),
+    quarters: List[str] = Query(None),
+    year: Optional[str] = Query(None),
+    month: Optional[str] = Query(None)
 ):
     """
-    Compares two report months and returns added projects and updates.
+    Aggregated series, labels and colors of report charts, for drawing them client-side.
+
+    - report: county, cod, fuel, technology and/or county-fuel (default: all)
+    - quarters: quarter filter (county-fuel only)
     """
     try:
-        base_file = get_input_file(base_year, base_month)
-        target_file = get_input_file(target_year, target_month)
-        
-        df_base = extract_large_gen_data(base_file)
-        df_target = extract_large_gen_data(target_file)
-        
-        # Identify projects by INR (Interconnection Request)
-        # Use 'INR' column as unique identifier
-        if 'INR' not in df_base.columns or 'INR' not in df_target.columns:
-             raise HTTPException(status_code=400, detail="INR column missing in one or both files")
-             
+        unknown = [r for r in report or [] if r not in CHART_SPECS]
+        if unknown:
+            raise HTTPException(status_code=400,
+                                detail=f"Unknown report '{unknown[0]}'. Valid: {', '.join(CHART_SPECS)}")
+        dataset = await get_month_dataset_async(year, month)
+        reports = [r for r in CHART_SPECS if not report or r in report]
+        quarters = sorted_unique(quarters) if QUARTER_FILTERED_REPORTS.intersection(reports) else None
+
+        def build() -> Dict[str, Any]:
+            df = dataset.frame[dataset.raw_columns]
+            with span("aggregate"):
+                charts = {r: build_chart_spec(r, df, quarters=quarters, cod_index=dataset.cod) for r in reports}
+            return {"source": dataset.period, "quarters": quarters or [], "charts": charts}
+
+        return await cached_json_response(dataset, "chart-spec", {"report": reports, "quarters": quarters}, build)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Request failed")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/report-chart")
+async def get_report_chart(
+    report: str,
+    background_tasks: BackgroundTasks,
+    quarters: List[str] = Query(None),
+    tier: str = Query('print'),
+    format: str = Query('png'),
+    year: Optional[str] = Query(None),
+    month: Optional[str] = Query(None)
+):
+    """
+    Renders a report chart, or reuses an identical earlier render, and returns its URL.
+
+    After responding, the month's other reports are rendered at the cheap tiers
+    (thumbnail, screen) in the same format, so previews are ready before they are asked for.
+
+    - report: county, cod, fuel, technology or county-fuel
+    - quarters: quarter filter (county-fuel only)
+    - tier: thumbnail, screen or print (default, 300 dpi)
+    - format: png, svg or webp
+    """
+    try:
+        if report not in REPORT_RENDERERS:
+            raise HTTPException(status_code=400,
+                                detail=f"Unknown report '{report}'. Valid: {', '.join(REPORT_RENDERERS)}")
+        if tier not in RENDER_TIERS:
+            raise HTTPException(status_code=400,
+                                detail=f"Unknown tier '{tier}'. Valid: {', '.join(RENDER_TIERS)}")
+        if format not in CHART_FORMATS:
+            raise HTTPException(status_code=400,
+                                detail=f"Unknown format '{format}'. Valid: {', '.join(CHART_FORMATS)}")
+        dataset = await get_month_dataset_async(year, month)
+        quarters = sorted_unique(quarters) if report in QUARTER_FILTERED_REPORTS else None
+
+        with span("render"):
+            try:
+                path, cached = await run_in_threadpool(render_report_artifact, ARTIFACT_STORE, dataset, report,
+                                                       quarters, tier, format)
+            except EmptyChartError:
+                detail = "No data for the selected quarters" if quarters else f"No data for report '{report}'"
+                raise HTTPException(status_code=404, detail=detail)
+        record_cache_access('artifact', cached)
+        background_tasks.add_task(render_eager_tiers, ARTIFACT_STORE, dataset, quarters=quarters, fmt=format)
+
+        return json_response({
+            "report": report,
+            "source": dataset.period,
+            "quarters": quarters or [],
+            "tier": tier,
+            "format": format,
+            "url": f"/outputs/{path.relative_to(OUTPUTS_DIR).as_posix()}",
+            "cached": cached
+        })
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Request failed")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def compare_months(base: MonthDataset, target: MonthDataset) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Projects added in target, target's flagged changes, and every changed field of the
+    projects in both months.
+
+    Args:
+        base: Earlier month
+        target: Later month
+
+    Returns:
+        {'added_projects', 'flagged_changes', 'full_comparison'} record lists
+
+    Raises:
+        HTTPException: 400 if either month has no INR column
+    """
+    # Compare the columns ERCOT published, not the derived ones
+    df_base = base.frame[base.raw_columns]
+    df_target = target.frame[target.raw_columns]
+    
+    # Identify projects by INR (Interconnection Request)
+    # Use 'INR' column as unique identifier
+    if 'INR' not in df_base.columns or 'INR' not in df_target.columns:
+         raise HTTPException(status_code=400, detail="INR column missing in one or both files")
+         
+    with span("added_projects"):
         # 1. Added Projects
         # Projects in target but not in base
         base_inrs = set(df_base['INR'].dropna())
         target_inrs = set(df_target['INR'].dropna())
-        
+    
         added_inrs = target_inrs - base_inrs
-        added_projects = df_target[df_target['INR'].isin(added_inrs)].copy()
-        
-        # Normalize Fuel Type
-        def refine_fuel(row):
-            fuel = normalize_fuel_type(row['Fuel'])
-            if fuel in ['Other', 'Unknown']:
-                tech = normalize_technology_type(row['Technology'])
-                if tech != 'Unknown':
-                    return tech
-            return fuel
-
-        added_projects['Fuel_Normalized'] = added_projects.apply(refine_fuel, axis=1)
-        
+        added_mask = df_target['INR'].isin(added_inrs)
+        added_projects = df_target[added_mask].copy()
+    
+        # Normalized Fuel Type (computed once per month at load)
+        added_projects['Fuel_Normalized'] = target.frame.loc[added_mask, 'Fuel_Normalized']
+    
         # Format added projects
         # Include Fuel_Normalized as 'Fuel Type'
         added_projects['Fuel Type'] = added_projects['Fuel_Normalized']
-        
-        added_projects_list = added_projects.where(pd.notnull(added_projects), None).to_dict(orient='records')
-        
+    
+        # The change-flags bitmask is internal (it is surfaced through flagged_changes)
+        added_projects_list = records_for_json(added_projects.drop(columns=CHANGE_FLAGS_COLUMN, errors='ignore'))
+    
+    with span("flagged_changes"):
         # 2. Flagged Changes from Target Report
-        # Look for the "Change indicators" column in the TARGET report and list any projects
-        # that have a non-empty value. This column flags what changed in that specific report month.
-        
-        flagged_changes_list = []
-        
-        # Helper to check if a value is valid (not NaN, not empty string, not 'nan' string)
-        def is_valid_value(v):
-            if pd.isna(v): return False
-            if str(v).lower() == 'nan': return False
-            if str(v).strip() == '': return False
-            return True
-        
-        # Let's check available columns in df_target
-        available_columns = df_target.columns.tolist()
-        
-        # Find the "Change indicators" column (it has a long name with various change types)
-        change_indicator_col = next(
-            (c for c in available_columns if 'Change indicator' in c or 'Change Indicator' in c),
-            None
-        )
-        
-        if change_indicator_col:
-            # Iterate through all target projects and find ones with flagged changes
-            for _, row in df_target.iterrows():
-                change_value = row.get(change_indicator_col)
-                if is_valid_value(change_value):
-                    flag_str = str(change_value).strip()
-                    
-                    # Build a list of new values based on what's flagged
-                    new_values = []
-                    
-                    # Map flag types to their corresponding column values
-                    if 'COD' in flag_str:
-                        cod_val = row.get('Projected COD')
-                        if is_valid_value(cod_val):
-                            # Format datetime nicely
-                            try:
-                                cod_formatted = pd.to_datetime(cod_val).strftime('%Y-%m-%d')
-                            except:
-                                cod_formatted = str(cod_val)
-                            new_values.append(f"New COD: {cod_formatted}")
-                    
-                    if 'MW' in flag_str:
-                        mw_val = row.get('Capacity (MW)')
-                        if is_valid_value(mw_val):
-                            new_values.append(f"New MW: {mw_val}")
-                    
-                    if 'Proj Name' in flag_str:
-                        name_val = row.get('Project Name')
-                        if is_valid_value(name_val):
-                            new_values.append(f"New Name: {name_val}")
-                    
-                    if 'SFS' in flag_str or 'NtP' in flag_str:
-                        # Try to find SFS/NtP related columns
-                        sfs_val = row.get('SFS') or row.get('NtP') or row.get('SFS/NtP')
-                        if is_valid_value(sfs_val):
-                            new_values.append(f"SFS/NtP: {sfs_val}")
-                    
-                    if 'FIS Request' in flag_str:
-                        fis_val = row.get('FIS Requested')
-                        if is_valid_value(fis_val):
-                            try:
-                                fis_formatted = pd.to_datetime(fis_val).strftime('%Y-%m-%d')
-                            except:
-                                fis_formatted = str(fis_val)
-                            new_values.append(f"FIS Requested: {fis_formatted}")
-                    
-                    if 'INA-to-PLN' in flag_str or 'Status' in flag_str:
-                        # Look for status column
-                        status_col = next((c for c in available_columns if 'GIM Study Phase' in c or 'Status' in c), None)
-                        if status_col:
-                            status_val = row.get(status_col)
-                            if is_valid_value(status_val):
-                                new_values.append(f"Status: {status_val}")
-                    
-                    flagged_changes_list.append({
-                        "INR": row.get('INR', 'N/A'),
-                        "Project Name": row.get('Project Name', 'N/A'),
-                        "County": row.get('County', 'N/A'),
-                        "change_flag": flag_str,
-                        "new_values": new_values
-                    })
-        
-        # Sort Added Projects: 1. COD (Earliest first), 2. County
-        # Ensure COD is datetime for sorting
-        def get_cod_date(x):
-            try:
-                return pd.to_datetime(x.get('Projected COD'), errors='coerce')
-            except:
-                return pd.NaT
+        # The change-indicator column flags what changed in that report month; it is
+        # parsed into a bitmask at ingestion, so this is a mask filter
+        flagged_changes_list = flagged_changes(df_target)
+    
+    # Sort Added Projects: 1. COD (Earliest first), 2. County
+    # Ensure COD is datetime for sorting
+    def get_cod_date(x):
+        try:
+            return pd.to_datetime(x.get('Projected COD'), errors='coerce')
+        except:
+            return pd.NaT
 
-        added_projects_list.sort(key=lambda x: (get_cod_date(x) or pd.Timestamp.max, str(x.get('County', '') or '')))
-        
-        # Sort Flagged Changes: County
-        flagged_changes_list.sort(key=lambda x: str(x.get('County', '') or ''))
-        
+    added_projects_list.sort(key=lambda x: (get_cod_date(x) or pd.Timestamp.max, str(x.get('County', '') or '')))
+    
+    # Sort Flagged Changes: County
+    flagged_changes_list.sort(key=lambda x: str(x.get('County', '') or ''))
+    
+    with span("full_comparison"):
         # 3. Full Comparison - Compare ALL columns for common projects
         full_comparison_list = []
-        
-        # Projects in both base and target
-        common_inrs = base_inrs.intersection(target_inrs)
-        
+    
+        # Projects in both base and target whose row hashes differ, with the column
+        # groups that changed; identical projects are never looked at
+        changed = changed_groups(base.row_hashes, target.row_hashes)
+        group_of = {col: group for group, cols in target.row_hashes.groups.items() for col in cols}
+    
         # Create indexed dataframes for faster lookup
         df_base_indexed = df_base.set_index('INR')
         df_target_indexed = df_target.set_index('INR')
-        
+    
         # Columns to skip in comparison (identifiers, metadata, already shown in Tab 2)
-        skip_columns = {'INR', 'County'}
+        skip_columns = {'INR', 'County', CHANGE_FLAGS_COLUMN}
         # Also skip any column containing "Change indicator" as it's shown in Tab 2
-        
+    
         # Get all columns from target (use as reference)
         all_columns = [c for c in df_target.columns if c not in skip_columns and 'Change indicator' not in c]
-        
-        for inr in common_inrs:
+        group_pos = {col: changed.columns.get_loc(group_of[col]) for col in all_columns}
+    
+        for inr, flags in zip(changed.index, changed.to_numpy()):
+            changed_columns = [col for col in all_columns if flags[group_pos[col]]]
             try:
                 base_row = df_base_indexed.loc[inr]
                 target_row = df_target_indexed.loc[inr]
             except KeyError:
                 continue
-            
+        
             changes = []
-            
-            for col in all_columns:
+        
+            for col in changed_columns:
                 # Get values from both rows
                 val_base = base_row.get(col) if col in base_row.index else None
                 val_target = target_row.get(col) if col in target_row.index else None
-                
+            
                 # Normalize values for comparison
                 def normalize_val(v):
                     if pd.isna(v):
@@ -588,14 +1235,14 @@ async def get_comparison_data(
                     if s.lower() == 'nan' or s == '':
                         return None
                     return s
-                
+            
                 norm_base = normalize_val(val_base)
                 norm_target = normalize_val(val_target)
-                
+            
                 # Skip if both are None/empty
                 if norm_base is None and norm_target is None:
                     continue
-                
+            
                 # Check if values differ
                 if norm_base != norm_target:
                     # Format datetime values nicely
@@ -607,13 +1254,13 @@ async def get_comparison_data(
                             return dt.strftime('%Y-%m-%d')
                         except:
                             return str(v)
-                    
+                
                     changes.append({
                         "column": col,
                         "old_value": format_val(norm_base),
                         "new_value": format_val(norm_target)
                     })
-            
+        
             # Only include projects with at least one change
             if changes:
                 full_comparison_list.append({
@@ -623,19 +1270,287 @@ async def get_comparison_data(
                     "change_count": len(changes),
                     "changes": changes
                 })
-        
-        # Sort by County first, then by change count descending
-        full_comparison_list.sort(key=lambda x: (str(x.get('County', '') or ''), -x['change_count']))
-                
-        return {
-            "added_projects": added_projects_list,
-            "flagged_changes": flagged_changes_list,
-            "full_comparison": full_comparison_list,
-            "base_period": f"{base_month}/{base_year}",
-            "target_period": f"{target_month}/{target_year}"
-        }
+    
+    # Sort by County first, then by change count descending
+    full_comparison_list.sort(key=lambda x: (str(x.get('County', '') or ''), -x['change_count']))
+
+    return {
+        "added_projects": added_projects_list,
+        "flagged_changes": flagged_changes_list,
+        "full_comparison": full_comparison_list,
+    }
+
+
+@router.get("/comparison-data")
+async def get_comparison_data(
+    base_year: str, 
+    base_month: str, 
+    target_year: str, 
+    target_month: str
+):
+    """
+    Compares two report months and returns added projects and updates.
+    """
+    try:
+        base = await get_month_dataset_async(base_year, base_month)
+        target = await get_month_dataset_async(target_year, target_month)
+
+        def build() -> Dict[str, Any]:
+            # 'MM/YYYY' from the resolved months, so every request sharing the cached body agrees
+            return {
+                **compare_months(base, target),
+                "base_period": '/'.join(reversed(base.period.split('/'))),
+                "target_period": '/'.join(reversed(target.period.split('/')))
+            }
+
+        # Built in the threadpool and cached on both workbooks' hashes
+        return await cached_fingerprint_response(f"{base.fingerprint}:{target.fingerprint}", "comparison-data",
+                                                 {"base": base.period, "target": target.period}, build)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Request failed")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/comparison-matrix")
+async def get_comparison_matrix(
+    start: Optional[str] = Query(None),
+    end: Optional[str] = Query(None),
+    changed_only: bool = Query(True)
+):
+    """
+    Aligns every report month from start to end (YYYY-MM, inclusive; default all) on INR
+    in one pass and returns per-month totals plus per-project added/removed months and
+    COD-shift (days) and MW-delta series between consecutive months.
+
+    - changed_only: list only projects that were added, removed, re-dated or resized
+    """
+    try:
+        months = months_in_range(start, end)
+        # Keyed on the workbooks' hashes, so a cached matrix is served without loading any month
+        with span("get_input_file"):
+            fingerprints = [f"{period}:{file_fingerprint(path)}" for period, path in months]
+        fingerprint = hashlib.sha256('|'.join(fingerprints).encode('utf-8')).hexdigest()[:20]
+
+        def datasets() -> Iterator[MonthDataset]:
+            for _, path in months:
+                dataset, hit = MONTH_CACHE.get(path)
+                record_cache_access('month_dataset', hit)
+                yield dataset
+
+        def build() -> Dict[str, Any]:
+            with span("align"):
+                matrix = MonthMatrix.align(datasets())
+            with span("aggregate"):
+                return matrix_payload(matrix, changed_only=changed_only)
+
+        return await cached_fingerprint_response(fingerprint, "comparison-matrix",
+                                                 {"changed_only": changed_only}, build)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Request failed")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# Columns of exported project rows: the published sheet (minus the parsed change-flag
+# bitmask) plus the quarter and refined fuel the dashboard filters and charts by
+EXPORT_DERIVED_COLUMNS = {'Quarter': 'Quarter', 'Fuel_Normalized': 'Fuel Type'}
+COMPARISON_TABLES = ['added', 'flagged', 'changes']
+
+def check_export_format(fmt: str) -> None:
+    if fmt not in FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unknown format '{fmt}'. Valid: {', '.join(FORMATS)}")
+
+def export_response(chunks: Iterator[pd.DataFrame], fmt: str, filename: str) -> StreamingResponse:
+    """
+    Stream chunks as a file download; bytes are sent as each chunk is written.
+    """
+    return StreamingResponse(stream_export(chunks, fmt), media_type=MEDIA_TYPES[fmt],
+                             headers=content_disposition(filename))
+
+def project_chunks(dataset: MonthDataset, rows: np.ndarray, report_month: bool = False) -> Iterator[pd.DataFrame]:
+    """
+    Export rows of a month, CHUNK_ROWS at a time (only one chunk is copied at once).
+    """
+    columns = [c for c in dataset.raw_columns if c != CHANGE_FLAGS_COLUMN] + list(EXPORT_DERIVED_COLUMNS)
+    positions = [dataset.frame.columns.get_loc(c) for c in columns]
+    for start in range(0, len(rows), CHUNK_ROWS):
+        chunk = dataset.frame.iloc[rows[start:start + CHUNK_ROWS], positions].rename(columns=EXPORT_DERIVED_COLUMNS)
+        if report_month:
+            chunk.insert(0, 'Report Month', dataset.period)
+        yield chunk
+
+EXPORT_FACETS = ['phase', 'fuel', 'technology', 'zone', 'change']
+
+def filter_parts(quarters: Optional[List[str]], county: Optional[str],
+                 facets: Dict[str, List[str]]) -> List[tuple]:
+    """Filename parts for the dashboard filters, in a fixed order."""
+    return [('quarters', quarters), ('county', county)] + [(name, facets.get(name)) for name in EXPORT_FACETS]
+
+
+@router.get("/export/projects")
+async def export_projects(
+    format: str = Query('csv'),
+    year: Optional[str] = Query(None),
+    month: Optional[str] = Query(None),
+    quarters: List[str] = Query(None),
+    county: Optional[str] = Query(None),
+    phase: List[str] = Query(None),
+    fuel: List[str] = Query(None),
+    technology: List[str] = Query(None),
+    zone: List[str] = Query(None),
+    change: List[str] = Query(None)
+):
+    """
+    Downloads a month's projects under the Quarter Report filters as CSV, XLSX or Parquet.
+
+    Same filters as /api/quarter-report; the file name encodes the month and filters,
+    e.g. tgir_projects_2026-01_quarters-2026Q1_fuel-Solar.csv.
+    """
+    try:
+        check_export_format(format)
+        check_change_types(change)
+        dataset = await get_month_dataset_async(year, month)
+        quarters = sorted_unique(quarters)
+        facets = {'phase': phase, 'fuel': fuel, 'technology': technology, 'zone': zone, 'change': change}
+        facets = {name: sorted_unique(values) for name, values in facets.items() if values}
+
+        with span("filter"):
+            index = dataset.facets
+            rows = index.rows(index.select(facet_filters(quarters, county, **facets)))
+
+        filename = export_filename('projects', [('', dataset.period.replace('/', '-'))]
+                                   + filter_parts(quarters, county, facets), format)
+        return export_response(project_chunks(dataset, rows), format, filename)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Request failed")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def month_bound(value: Optional[str], name: str) -> Optional[str]:
+    """
+    Parse a YYYY-MM range bound into a zero-padded 'YYYY/MM' period (None when not given).
+
+    Raises:
+        HTTPException: 400 if the value is not a valid year and month
+    """
+    if not value:
+        return None
+    year, _, month = value.partition('-')
+    if not (len(year) == 4 and year.isdigit() and month.isdigit() and 1 <= int(month) <= 12):
+        raise HTTPException(status_code=400, detail=f"Invalid {name} '{value}'. Expected YYYY-MM")
+    return f"{year}/{int(month):02d}"
+
+def months_in_range(start: Optional[str], end: Optional[str]) -> List[tuple]:
+    """
+    ('YYYY/MM', path) of the report months from start to end (YYYY-MM, inclusive; default all).
+
+    Raises:
+        HTTPException: 400 for a malformed bound, 404 if no month is in the range
+    """
+    first, last = month_bound(start, 'start'), month_bound(end, 'end')
+    months = [(period, path) for period, path in input_files(INPUTS_DIR)
+              if (not first or period >= first) and (not last or period <= last)]
+    if not months:
+        raise HTTPException(status_code=404, detail="No report months in the requested range")
+    return months
+
+
+@router.get("/export/history")
+async def export_history(
+    format: str = Query('csv'),
+    start: Optional[str] = Query(None),
+    end: Optional[str] = Query(None),
+    quarters: List[str] = Query(None),
+    county: Optional[str] = Query(None),
+    phase: List[str] = Query(None),
+    fuel: List[str] = Query(None),
+    technology: List[str] = Query(None),
+    zone: List[str] = Query(None),
+    change: List[str] = Query(None)
+):
+    """
+    Downloads the filtered projects of every report month from start to end (YYYY-MM,
+    inclusive; default all), oldest first, with a leading 'Report Month' column.
+
+    Months are loaded one at a time while the file streams, so memory does not grow
+    with the number of months.
+    """
+    try:
+        check_export_format(format)
+        check_change_types(change)
+        months = months_in_range(start, end)
+        quarters = sorted_unique(quarters)
+        facets = {'phase': phase, 'fuel': fuel, 'technology': technology, 'zone': zone, 'change': change}
+        facets = {name: sorted_unique(values) for name, values in facets.items() if values}
+        filters = facet_filters(quarters, county, **facets)
+
+        def chunks() -> Iterator[pd.DataFrame]:
+            for _, path in months:
+                dataset, hit = MONTH_CACHE.get(path)
+                record_cache_access('month_dataset', hit)
+                index = dataset.facets
+                yield from project_chunks(dataset, index.rows(index.select(filters)), report_month=True)
+
+        span_label = f"{months[0][0]}-to-{months[-1][0]}".replace('/', '-')
+        filename = export_filename('history', [('', span_label)] + filter_parts(quarters, county, facets), format)
+        return export_response(chunks(), format, filename)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Request failed")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/export/comparison")
+async def export_comparison(
+    base_year: str,
+    base_month: str,
+    target_year: str,
+    target_month: str,
+    table: str = Query('added'),
+    format: str = Query('csv')
+):
+    """
+    Downloads one table of the month comparison as CSV, XLSX or Parquet.
+
+    - table: added (projects new in the target month), flagged (the target month's
+      change indicators) or changes (one row per changed field of projects in both months)
+    """
+    try:
+        check_export_format(format)
+        if table not in COMPARISON_TABLES:
+            raise HTTPException(status_code=400,
+                                detail=f"Unknown table '{table}'. Valid: {', '.join(COMPARISON_TABLES)}")
+        base = await get_month_dataset_async(base_year, base_month)
+        target = await get_month_dataset_async(target_year, target_month)
+        comparison = await run_in_threadpool(compare_months, base, target)
+
+        if table == 'added':
+            df = pd.DataFrame(comparison['added_projects'])
+            df = df.drop(columns=[c for c in (CHANGE_FLAGS_COLUMN, 'Fuel_Normalized') if c in df.columns])
+        elif table == 'flagged':
+            df = pd.DataFrame(comparison['flagged_changes'])
+            for column in ('change_types', 'new_values'):
+                if column in df.columns:
+                    df[column] = df[column].map(lambda values: '; '.join(values) if isinstance(values, list) else values)
+        else:
+            df = pd.DataFrame([
+                {"INR": project['INR'], "Project Name": project['Project Name'], "County": project['County'],
+                 "Column": change['column'], "Old Value": change['old_value'], "New Value": change['new_value']}
+                for project in comparison['full_comparison'] for change in project['changes']
+            ], columns=["INR", "Project Name", "County", "Column", "Old Value", "New Value"])
 
+        filename = export_filename(f"comparison-{table}", [('', f"{base.period}-to-{target.period}".replace('/', '-'))],
+                                   format)
+        return export_response(chunk_frame(df), format, filename)
+    except HTTPException:
+        raise
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("Request failed")
         raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,247 @@
+"""
+Streaming table exports.
+
+Each writer takes an iterator of DataFrame chunks and yields the file's bytes as the
+chunks arrive, so an export's memory is bounded by one chunk (plus, for XLSX, the
+writer's temporary files) no matter how many months it spans:
+
+- CSV: one text block per chunk, header first.
+- Parquet: one row group per chunk; the footer follows the last chunk.
+- XLSX: rows are appended in openpyxl's write-only mode, which spools worksheets to
+  disk; the zip container can only be finished once every row is written, so the
+  file is streamed after the last chunk.
+
+Every chunk is laid out with the first chunk's columns (missing columns are left
+empty, extra ones dropped), so multi-month exports keep one header.
+"""
+
+import datetime
+import hashlib
+import io
+import os
+import re
+import tempfile
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from openpyxl import Workbook
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+# Rows per chunk handed to the writers
+CHUNK_ROWS = 5000
+
+# Bytes per read when streaming a finished file
+FILE_CHUNK_BYTES = 64 * 1024
+
+# Rows per worksheet, header included (Excel's limit); longer exports continue on a new sheet
+XLSX_MAX_ROWS = 1_048_576
+
+MEDIA_TYPES = {
+    'csv': 'text/csv; charset=utf-8',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'parquet': 'application/vnd.apache.parquet',
+}
+FORMATS = list(MEDIA_TYPES)
+
+MAX_FILENAME = 150
+
+
+def chunk_frame(df: pd.DataFrame, rows: int = CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """Consecutive row slices of a DataFrame (views, not copies)."""
+    for start in range(0, len(df), rows):
+        yield df.iloc[start:start + rows]
+
+
+def export_filename(kind: str, parts: Sequence[Tuple[str, Any]], fmt: str) -> str:
+    """
+    Download name encoding an export's filters.
+
+    e.g. ('projects', [('', '2026-01'), ('quarters', ['2026Q1', '2026Q2']), ('fuel', ['Solar'])], 'csv')
+    -> 'tgir_projects_2026-01_quarters-2026Q1+2026Q2_fuel-Solar.csv'. Empty parts are
+    skipped; names over MAX_FILENAME characters are shortened and end in a hash of the full name.
+
+    Args:
+        kind: Export name (e.g. 'projects')
+        parts: (label, value or list of values) pairs in display order
+        fmt: File extension
+
+    Returns:
+        File name safe for Content-Disposition
+    """
+    def slug(value: Any) -> str:
+        return re.sub(r'[^A-Za-z0-9.]+', '-', str(value)).strip('-')
+
+    pieces = ['tgir', slug(kind)]
+    for label, value in parts:
+        if value is None or (isinstance(value, (list, tuple)) and not value):
+            continue
+        values = '+'.join(slug(v) for v in value) if isinstance(value, (list, tuple)) else slug(value)
+        pieces.append(f"{slug(label)}-{values}" if label else values)
+    stem = '_'.join(pieces)
+    if len(stem) > MAX_FILENAME:
+        stem = f"{stem[:MAX_FILENAME - 13]}_{hashlib.sha256(stem.encode('utf-8')).hexdigest()[:12]}"
+    return f"{stem}.{fmt}"
+
+
+def _conform(chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    columns: Optional[List[str]] = None
+    for chunk in chunks:
+        if columns is None:
+            columns = list(chunk.columns)
+        elif list(chunk.columns) != columns:
+            chunk = chunk.reindex(columns=columns)
+        yield chunk
+
+
+def iter_csv(chunks: Iterable[pd.DataFrame]) -> Iterator[bytes]:
+    """CSV bytes, one block per chunk."""
+    header = True
+    for chunk in _conform(chunks):
+        yield chunk.to_csv(index=False, header=header).encode('utf-8')
+        header = False
+
+
+def _arrow_column(series: pd.Series) -> pa.Array:
+    # Numbers, datetimes and text keep their type; mixed Excel columns (dates, text, blanks) become text
+    if pd.api.types.is_bool_dtype(series) or pd.api.types.is_integer_dtype(series):
+        return pa.array(series, from_pandas=True).cast(pa.int64())
+    if pd.api.types.is_float_dtype(series):
+        return pa.array(series, type=pa.float64(), from_pandas=True)
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return pa.array(series, from_pandas=True).cast(pa.timestamp('us'))
+    if series.dtype != object and pd.api.types.is_string_dtype(series):
+        return pa.array(series, type=pa.string(), from_pandas=True)
+    return pa.array([_text(v) for v in series], type=pa.string())
+
+
+def _text(value: Any) -> Optional[str]:
+    if value is None or value is pd.NaT or (isinstance(value, float) and np.isnan(value)):
+        return None
+    if isinstance(value, (datetime.date, np.datetime64)):
+        stamp = pd.Timestamp(value)
+        return stamp.strftime('%Y-%m-%d') if stamp == stamp.normalize() else stamp.isoformat()
+    return str(value)
+
+
+def _fit(array: pa.Array, field: pa.Field, series: pd.Series) -> pa.Array:
+    # A later month may type a column differently than the first chunk did
+    if array.type == field.type:
+        return array
+    try:
+        return array.cast(field.type)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        if field.type == pa.string():
+            return pa.array([_text(v) for v in series], type=pa.string())
+        raise
+
+
+class _Sink(io.RawIOBase):
+    """Write-only file that hands back what was written since the last drain()."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_parquet(chunks: Iterable[pd.DataFrame]) -> Iterator[bytes]:
+    """Parquet bytes, one row group per chunk; column types are fixed by the first chunk."""
+    sink = _Sink()
+    writer = None
+    schema = None
+    for chunk in _conform(chunks):
+        arrays = [_arrow_column(chunk[name]) for name in chunk.columns]
+        if writer is None:
+            schema = pa.schema([pa.field(str(name), array.type) for name, array in zip(chunk.columns, arrays)])
+            writer = pq.ParquetWriter(sink, schema, compression='zstd')
+        table = pa.Table.from_arrays([_fit(array, field, chunk[name])
+                                      for array, field, name in zip(arrays, schema, chunk.columns)], schema=schema)
+        writer.write_table(table)
+        yield sink.drain()
+    if writer is None:
+        writer = pq.ParquetWriter(sink, pa.schema([]))
+    writer.close()
+    yield sink.drain()
+
+
+def _cell(value: Any) -> Any:
+    if isinstance(value, np.datetime64):
+        value = pd.Timestamp(value)
+    if value is None or value is pd.NaT or (isinstance(value, float) and np.isnan(value)):
+        return None
+    if isinstance(value, str):
+        return ILLEGAL_CHARACTERS_RE.sub('', value)
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    return value
+
+
+def iter_xlsx(chunks: Iterable[pd.DataFrame], sheet_title: str = 'Data') -> Iterator[bytes]:
+    """XLSX bytes, written with openpyxl's write-only (constant-memory) worksheets."""
+    workbook = Workbook(write_only=True)
+    sheet = None
+    header: List[str] = []
+    rows_in_sheet = 0
+    for chunk in _conform(chunks):
+        if sheet is None:
+            header = [str(name) for name in chunk.columns]
+        for row in chunk.itertuples(index=False, name=None):
+            if sheet is None or rows_in_sheet >= XLSX_MAX_ROWS:
+                sheet = workbook.create_sheet(sheet_title if sheet is None else f"{sheet_title} ({len(workbook.worksheets) + 1})")
+                sheet.append(header)
+                rows_in_sheet = 1
+            sheet.append([_cell(value) for value in row])
+            rows_in_sheet += 1
+    if sheet is None:
+        workbook.create_sheet(sheet_title).append(header)
+
+    fd, path = tempfile.mkstemp(suffix='.xlsx')
+    os.close(fd)
+    try:
+        workbook.save(path)
+        with open(path, 'rb') as handle:
+            for block in iter(lambda: handle.read(FILE_CHUNK_BYTES), b''):
+                yield block
+    finally:
+        os.unlink(path)
+
+
+WRITERS = {'csv': iter_csv, 'xlsx': iter_xlsx, 'parquet': iter_parquet}
+
+
+def stream_export(chunks: Iterable[pd.DataFrame], fmt: str) -> Iterator[bytes]:
+    """
+    File bytes for a chunk iterator in one of FORMATS.
+
+    Raises:
+        ValueError: If fmt is not one of FORMATS
+    """
+    if fmt not in WRITERS:
+        raise ValueError(f"Unknown format '{fmt}'. Valid: {', '.join(FORMATS)}")
+    return WRITERS[fmt](chunks)
+
+
+def content_disposition(filename: str) -> Dict[str, str]:
+    """Attachment header for a download name from export_filename()."""
+    return {'Content-Disposition': f'attachment; filename="{filename}"'}
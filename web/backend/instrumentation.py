@@ -0,0 +1,358 @@
+"""
+Request timing, metrics and profiling for the FastAPI backend.
+
+- `span(name)` times a named stage of the current request (file lookup, Excel
+  parse, normalization, aggregation, serialization, ...).
+- `InstrumentationMiddleware` collects those spans per request, adds a
+  `Server-Timing` header, writes one structured (JSON) log line per request and
+  records Prometheus-style latency histograms.
+- `?profile=1` on any request returns a cProfile summary of that request instead
+  of its normal body, when enabled with TGIR_PROFILING=1 (off by default: a profile
+  is expensive and shows server paths, so only dev and staging should allow it).
+- `metrics_router` serves the registry at `/metrics` in the Prometheus text format.
+"""
+
+import bisect
+import contextvars
+import cProfile
+import io
+import json
+import logging
+import os
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+logger = logging.getLogger("tgir.request")
+
+# Seconds; covers cached hits (sub-ms) through cold Excel parses (seconds)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+PROFILE_TOP_N = 40
+
+
+class Counter:
+    """Monotonic counter with labels."""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str]):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = tuple(str(labels.get(n, '')) for n in self.label_names)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        key = tuple(str(labels.get(n, '')) for n in self.label_names)
+        return self._values.get(key, 0.0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_labels(self.label_names, key)} {value:g}")
+        return lines
+
+
+class Gauge:
+    """Point-in-time value with labels (e.g. bytes held by a cache)."""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str]):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def set(self, value: float, **labels: str) -> None:
+        key = tuple(str(labels.get(n, '')) for n in self.label_names)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels: str) -> float:
+        key = tuple(str(labels.get(n, '')) for n in self.label_names)
+        return self._values.get(key, 0.0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} gauge"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_labels(self.label_names, key)} {value:g}")
+        return lines
+
+
+class Histogram:
+    """Cumulative-bucket histogram with labels, rendered the way Prometheus expects."""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str],
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(str(labels.get(n, '')) for n in self.label_names)
+        # Layout: [count per bucket..., +Inf count, sum]
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.setdefault(key, [0.0] * (len(self.buckets) + 2))
+            series[idx] += 1
+            series[-1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, series in sorted(self._series.items()):
+                cumulative = 0.0
+                for bound, count in zip(self.buckets + (float('inf'),), series[:-1]):
+                    cumulative += count
+                    le = '+Inf' if bound == float('inf') else f"{bound:g}"
+                    lines.append(f"{self.name}_bucket{_labels(self.label_names + ('le',), key + (le,))} "
+                                 f"{cumulative:g}")
+                lines.append(f"{self.name}_sum{_labels(self.label_names, key)} {series[-1]:.6f}")
+                lines.append(f"{self.name}_count{_labels(self.label_names, key)} {cumulative:g}")
+        return lines
+
+
+def _labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ''
+    escaped = (str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for v in values)
+    return '{' + ','.join(f'{n}="{v}"' for n, v in zip(names, escaped)) + '}'
+
+
+REQUEST_LATENCY = Histogram('tgir_request_duration_seconds', 'HTTP request latency.', ['method', 'route', 'status'])
+SPAN_LATENCY = Histogram('tgir_span_duration_seconds', 'Latency of named request stages.', ['span'])
+REQUESTS_TOTAL = Counter('tgir_requests_total', 'HTTP requests served.', ['method', 'route', 'status'])
+CACHE_REQUESTS = Counter('tgir_cache_requests_total', 'Cache lookups by outcome.', ['cache', 'result'])
+CACHE_BYTES = Gauge('tgir_cache_bytes', 'Bytes held by a cache.', ['cache'])
+CACHE_ENTRIES = Gauge('tgir_cache_entries', 'Entries held by a cache.', ['cache'])
+
+
+def record_cache_access(cache: str, hit: bool) -> None:
+    """
+    Count a cache lookup so hit rates show up on /metrics.
+
+    Args:
+        cache: Cache name (e.g. 'month_dataset')
+        hit: Whether the lookup was served from the cache
+    """
+    CACHE_REQUESTS.inc(cache=cache, result='hit' if hit else 'miss')
+
+
+def record_cache_size(cache: str, entries: int, nbytes: int) -> None:
+    """
+    Publish a cache's current size on /metrics.
+
+    Args:
+        cache: Cache name (e.g. 'result')
+        entries: Number of entries held
+        nbytes: Bytes held
+    """
+    CACHE_ENTRIES.set(entries, cache=cache)
+    CACHE_BYTES.set(nbytes, cache=cache)
+
+
+def render_metrics() -> str:
+    """Render every metric in the Prometheus text exposition format."""
+    lines: List[str] = []
+    for metric in (REQUESTS_TOTAL, REQUEST_LATENCY, SPAN_LATENCY, CACHE_REQUESTS, CACHE_ENTRIES, CACHE_BYTES):
+        lines.extend(metric.render())
+
+    # Hit ratio per cache, derived from the counters for quick dashboards
+    caches = sorted({key[0] for key in CACHE_REQUESTS._values})
+    if caches:
+        lines.append("# HELP tgir_cache_hit_ratio Fraction of cache lookups served from the cache.")
+        lines.append("# TYPE tgir_cache_hit_ratio gauge")
+        for cache in caches:
+            hits = CACHE_REQUESTS.value(cache=cache, result='hit')
+            total = hits + CACHE_REQUESTS.value(cache=cache, result='miss')
+            lines.append(f'tgir_cache_hit_ratio{{cache="{cache}"}} {hits / total if total else 0:.6f}')
+    return '\n'.join(lines) + '\n'
+
+
+class RequestTimings:
+    """Span durations collected while serving one request, in insertion order."""
+
+    def __init__(self):
+        self.spans: Dict[str, float] = {}
+        self.start = time.perf_counter()
+
+    def add(self, name: str, duration: float) -> None:
+        self.spans[name] = self.spans.get(name, 0.0) + duration
+
+    def server_timing(self, total: float) -> str:
+        entries = [f"{name};dur={duration * 1000:.2f}" for name, duration in self.spans.items()]
+        entries.append(f"total;dur={total * 1000:.2f}")
+        return ', '.join(entries)
+
+
+_current_timings: contextvars.ContextVar[Optional[RequestTimings]] = contextvars.ContextVar(
+    'tgir_request_timings', default=None)
+_current_profiling: contextvars.ContextVar[bool] = contextvars.ContextVar('tgir_request_profiling', default=False)
+
+
+def profiling() -> bool:
+    """
+    Whether the current request runs under `?profile=1`.
+
+    cProfile only sees the thread that enabled it, so handlers should do their work
+    inline (not in the threadpool, not from a cache) while this is True.
+    """
+    return _current_profiling.get()
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """
+    Time a named stage of the current request.
+
+    Works outside a request too (e.g. in CLI scripts); the duration is then only
+    recorded in the span histogram.
+
+    Args:
+        name: Stage name, used as the Server-Timing metric name (no spaces)
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start
+        SPAN_LATENCY.observe(duration, span=name)
+        timings = _current_timings.get()
+        if timings is not None:
+            timings.add(name, duration)
+
+
+def _profiling_enabled() -> bool:
+    return os.environ.get('TGIR_PROFILING', '0').lower() in ('1', 'true', 'yes')
+
+
+class InstrumentationMiddleware:
+    """
+    ASGI middleware adding Server-Timing headers, structured logs, latency
+    histograms and the opt-in `?profile=1` mode.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        query = parse_qs(scope.get('query_string', b'').decode('latin-1'))
+        profile = _profiling_enabled() and query.get('profile', ['0'])[-1] in ('1', 'true')
+
+        profiler = None
+        if profile:
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:
+                # Another profiled request is in flight; serve this one normally
+                profiler, profile = None, False
+
+        timings = RequestTimings()
+        token = _current_timings.set(timings)
+        profiling_token = _current_profiling.set(profile)
+        status = {'code': 500}
+
+        async def send_wrapper(message):
+            if message['type'] == 'http.response.start':
+                status['code'] = message['status']
+                if not profile:
+                    total = time.perf_counter() - timings.start
+                    headers = list(message.get('headers', []))
+                    headers.append((b'server-timing', timings.server_timing(total).encode('latin-1')))
+                    message = {**message, 'headers': headers}
+            if profile:
+                # The profile summary replaces the normal body
+                return
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            _current_timings.reset(token)
+            _current_profiling.reset(profiling_token)
+            total = time.perf_counter() - timings.start
+            self._record(scope, status['code'], total, timings)
+
+        if profiler is not None:
+            await self._send_profile(send, profiler, status['code'], total, timings)
+
+    @staticmethod
+    def _route(scope) -> str:
+        # Keep labels low-cardinality: matched routes without path params are
+        # their own template; otherwise fall back to the route's template path
+        route = scope.get('route')
+        if route is None:
+            # Answered before routing (the static API tier records its path here)
+            return scope.get('tgir.route', 'unmatched')
+        if scope.get('path_params'):
+            return getattr(route, 'path', None) or 'unmatched'
+        return scope.get('path', '')
+
+    def _record(self, scope, status_code: int, total: float, timings: RequestTimings) -> None:
+        route = self._route(scope)
+        labels = {'method': scope.get('method', ''), 'route': route, 'status': str(status_code)}
+        REQUEST_LATENCY.observe(total, **labels)
+        REQUESTS_TOTAL.inc(**labels)
+        logger.info(json.dumps({
+            'event': 'request',
+            'method': scope.get('method'),
+            'path': scope.get('path'),
+            'route': route,
+            'query': scope.get('query_string', b'').decode('latin-1'),
+            'status': status_code,
+            'duration_ms': round(total * 1000, 2),
+            'spans_ms': {name: round(d * 1000, 2) for name, d in timings.spans.items()},
+        }))
+
+    @staticmethod
+    async def _send_profile(send, profiler: cProfile.Profile, status_code: int, total: float,
+                            timings: RequestTimings) -> None:
+        out = io.StringIO()
+        out.write(f"status: {status_code}\n")
+        out.write(f"server-timing: {timings.server_timing(total)}\n\n")
+        stats = pstats.Stats(profiler, stream=out)
+        stats.sort_stats('cumulative').print_stats(PROFILE_TOP_N)
+        body = out.getvalue().encode('utf-8')
+        await send({
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [
+                (b'content-type', b'text/plain; charset=utf-8'),
+                (b'content-length', str(len(body)).encode('latin-1')),
+                (b'server-timing', timings.server_timing(total).encode('latin-1')),
+            ],
+        })
+        await send({'type': 'http.response.body', 'body': body})
+
+
+metrics_router = APIRouter()
+
+
+@metrics_router.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """
+    Prometheus scrape endpoint.
+    """
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
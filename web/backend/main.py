@@ -1,4 +1,5 @@
 import sys
+import logging
 from pathlib import Path
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import FileResponse
@@ -10,10 +11,31 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.append(str(project_root))
 sys.path.append(str(project_root / "src"))
 
-from web.backend.api import router
+from ingest import check_snapshots_at_startup
+from web.backend.api import INPUTS_DIR, MONTH_CACHE, router
+from web.backend.instrumentation import InstrumentationMiddleware, metrics_router
+from web.backend.static_api import StaticApiMiddleware, load_static_tree
+
+# One structured JSON line per request is logged to 'tgir.request'
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
 
 app = FastAPI(title="Texas Grid Interconnect Reporter")
 
+# Build-time snapshots and delta history (scripts/ingest.sh) are only used for months whose
+# workbook hash still matches; log which months will be parsed instead (or refuse to start if required)
+check_snapshots_at_startup(MONTH_CACHE.snapshots, INPUTS_DIR, MONTH_CACHE.history)
+
+# Pre-rendered responses (web/backend/prerender.py) answer matching API requests before
+# any endpoint runs; added first so the instrumentation below still times them
+static_tree = load_static_tree(INPUTS_DIR)
+if static_tree is not None:
+    static_tree.is_current()  # logs a warning now if the tree no longer matches inputs/
+    app.add_middleware(StaticApiMiddleware, tree=static_tree)
+
+# Server-Timing headers, request logs, /metrics histograms and ?profile=1
+app.add_middleware(InstrumentationMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -32,6 +54,9 @@ app.mount("/outputs", StaticFiles(directory=str(outputs_dir)), name="outputs")
 # Include API router
 app.include_router(router, prefix="/api")
 
+# Prometheus metrics (registered before the SPA catch-all below)
+app.include_router(metrics_router)
+
 # Serve React Frontend
 # We assume the frontend is built to web/frontend/dist
 frontend_dir = project_root / "web" / "frontend" / "dist"
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Texas Grid Interconnect Reporter - Static API Pre-render
+Materializes the API responses the dashboard requests for every month (quarter
+reports for single quarters and common quarter sets, county details, consecutive
+month comparisons, ...) into a static tree of gzip/brotli-compressed JSON files that
+a CDN can host or the backend can serve ahead of the live endpoints (see static_api.py).
+"""
+
+import argparse
+import datetime
+import gzip
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Add project root and src to path (same layout main.py expects)
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.append(str(PROJECT_ROOT))
+sys.path.append(str(PROJECT_ROOT / "src"))
+
+from dataset import input_files, input_fingerprints
+from web.backend.static_api import (MANIFEST_NAME, MANIFEST_VERSION, STATIC_DIR_ENV,
+                                    canonical_query, static_relpath)
+
+try:
+    import brotli
+except ImportError:  # optional: without it only .gz variants are written
+    brotli = None
+
+INPUTS_DIR = PROJECT_ROOT / "inputs"
+
+# Endpoints rendered once per month with their default parameters
+MONTH_ENDPOINTS = ['quarters', 'data-quality', 'flagged-changes', 'facets', 'cod-window', 'capacity-curve',
+                   'chart-spec']
+
+Request = Tuple[str, List[Tuple[str, str]]]
+
+
+def quarter_sets(quarters: Sequence[str], report_quarter: str) -> List[List[str]]:
+    """
+    Quarter selections to pre-render for a month.
+
+    Every single quarter, each calendar year's quarters, the four quarters starting
+    at the report quarter, and all quarters.
+
+    Args:
+        quarters: Quarters with projects, e.g. ['2026Q1', '2026Q2', ...]
+        report_quarter: Quarter of the report month, e.g. '2026Q1'
+
+    Returns:
+        Sorted, de-duplicated quarter lists
+    """
+    ordered = sorted(set(quarters))
+    sets = [[q] for q in ordered]
+    for year in sorted({q[:4] for q in ordered}):
+        sets.append([q for q in ordered if q[:4] == year])
+    sets.append([q for q in ordered if q >= report_quarter][:4])
+    sets.append(ordered)
+
+    unique: List[List[str]] = []
+    for selection in sets:
+        if selection and selection not in unique:
+            unique.append(selection)
+    return unique
+
+
+# Worker state: one TestClient per process, created by _init_worker
+_client = None
+_out_dir: Optional[Path] = None
+
+
+def _init_worker(out_dir: str, inputs_dir: str, shared_dir: str) -> None:
+    global _client, _out_dir
+    # Render from the live endpoints, never from a previously built tree
+    os.environ.pop(STATIC_DIR_ENV, None)
+    from fastapi.testclient import TestClient
+    from shared_store import SharedMonthStore
+    from web.backend.main import app
+    import web.backend.api as api
+
+    logging.getLogger().setLevel(logging.WARNING)
+    api.INPUTS_DIR = Path(inputs_dir)
+    # Workers publish parsed months to one shared store, so each month is parsed once
+    api.MONTH_CACHE.shared = api.MONTH_CACHE.shared or SharedMonthStore(Path(shared_dir))
+    # Every body is requested once; holding them would only cost memory
+    api.RESULT_CACHE.max_bytes = 0
+    _client = TestClient(app)
+    _out_dir = Path(out_dir)
+
+
+def _render(route: str, params: List[Tuple[str, str]]) -> Tuple[Optional[Dict[str, Any]], Any]:
+    """Request one response and write its variants; returns (manifest entry, parsed JSON)."""
+    query = canonical_query(route, params)
+    response = _client.get(f"/api/{route}" + (f"?{query}" if query else ''))
+    if response.status_code != 200:
+        return None, None
+
+    body = response.content
+    relpath = static_relpath(route, params)
+    variants = {'': body, '.gz': gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants['.br'] = brotli.compress(body, quality=11)
+
+    path = _out_dir / relpath
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for suffix, data in variants.items():
+        Path(str(path) + suffix).write_bytes(data)
+
+    entry = {
+        'route': route,
+        'query': query,
+        'bytes': len(body),
+        'encodings': {('gzip' if suffix == '.gz' else 'br'): len(data)
+                      for suffix, data in variants.items() if suffix},
+    }
+    return {relpath: entry}, response.json()
+
+
+def render_requests(requests: List[Request]) -> Tuple[Dict[str, Any], List[str], List[Any]]:
+    """
+    Render a batch of requests in a worker.
+
+    Returns:
+        (manifest entries, failed request URLs, parsed payloads in request order)
+    """
+    entries: Dict[str, Any] = {}
+    failed: List[str] = []
+    payloads: List[Any] = []
+    for route, params in requests:
+        entry, payload = _render(route, params)
+        if entry is None:
+            failed.append(f"/api/{route}?{canonical_query(route, params)}")
+        else:
+            entries.update(entry)
+        payloads.append(payload)
+    return entries, failed, payloads
+
+
+def render_quarter_set(year: str, month: str, quarters: List[str],
+                       county_details: bool) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Render the Quarter Report for one quarter selection, then each county's details.
+    """
+    month_params = [('year', year), ('month', month)]
+    quarter_params = [('quarters', q) for q in quarters]
+    entries, failed, payloads = render_requests([('quarter-report', month_params + quarter_params)])
+    report = payloads[0]
+    if county_details and report is not None:
+        counties = [row['county'] for row in report.get('county_data', [])]
+        detail_requests = [('quarter-report', month_params + quarter_params +
+                            [('sections', 'county_details'), ('county', county)]) for county in counties]
+        more, more_failed, _ = render_requests(detail_requests)
+        entries.update(more)
+        failed.extend(more_failed)
+    return entries, failed
+
+
+def _publish(staging: Path, out_dir: Path) -> None:
+    """Swap a finished tree into place; the previous tree is removed afterwards."""
+    if not out_dir.exists():
+        os.replace(staging, out_dir)
+        return
+    old = out_dir.with_name(f".{out_dir.name}.old-{os.getpid()}")
+    os.replace(out_dir, old)
+    os.replace(staging, out_dir)
+    shutil.rmtree(old, ignore_errors=True)
+
+
+def build_static_tree(out_dir: Path, inputs_dir: Path = INPUTS_DIR, jobs: Optional[int] = None,
+                      county_details: bool = True) -> Dict[str, Any]:
+    """
+    Render every pre-rendered request into out_dir and write its manifest.
+
+    The tree is built in a sibling temporary directory and swapped in when complete,
+    so a server reading out_dir never sees a half-written tree.
+
+    Args:
+        out_dir: Tree root (replaced if it holds an earlier tree)
+        inputs_dir: Directory holding inputs/<year>/<month>/file.xlsx
+        jobs: Worker processes (default: one per CPU)
+        county_details: Also render each county's details for every quarter selection
+
+    Returns:
+        The manifest
+
+    Raises:
+        ValueError: If there are no workbooks, or out_dir exists and is not a static tree
+    """
+    out_dir = Path(out_dir)
+    months = [tuple(period.split('/')) for period, _ in input_files(inputs_dir)]
+    if not months:
+        raise ValueError(f"No workbooks under {inputs_dir}")
+    if out_dir.exists() and any(out_dir.iterdir()) and not (out_dir / MANIFEST_NAME).exists():
+        raise ValueError(f"{out_dir} exists and is not a static API tree; refusing to replace it")
+    fingerprints = input_fingerprints(inputs_dir)
+
+    out_dir.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f".{out_dir.name}.tmp-", dir=out_dir.parent))
+    shared_dir = tempfile.mkdtemp(prefix='tgir-prerender-')
+    try:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                 initargs=(str(staging), str(inputs_dir), shared_dir)) as pool:
+            # 1. Month lists, each month's endpoints (the latest also without year/month,
+            #    as the dashboard first asks), consecutive-month comparisons and the
+            #    all-months comparison matrix
+            years = sorted({year for year, _ in months}, reverse=True)
+            batches: List[List[Request]] = [
+                [('years', []), ('months', [])] + [('months', [('year', y)]) for y in years]
+                + [(route, []) for route in MONTH_ENDPOINTS]
+            ]
+            batches += [[(route, [('year', y), ('month', m)]) for route in MONTH_ENDPOINTS] for y, m in months]
+            batches += [[('comparison-data', [('base_year', by), ('base_month', bm),
+                                              ('target_year', ty), ('target_month', tm)])]
+                        for (by, bm), (ty, tm) in zip(months, months[1:])]
+            batches.append([('comparison-matrix', [])])
+            results = list(pool.map(render_requests, batches))
+
+            # 2. Quarter Report selections of every month, from the quarters rendered above
+            futures = []
+            for (year, month), (_, _, payloads) in zip(months, results[1:1 + len(months)]):
+                quarters = payloads[0]['quarters'] if payloads[0] else []
+                report_quarter = f"{year}Q{(int(month) - 1) // 3 + 1}"
+                for selection in quarter_sets(quarters, report_quarter):
+                    futures.append(pool.submit(render_quarter_set, year, month, selection, county_details))
+            results += [future.result() + ([],) for future in futures]
+
+        files: Dict[str, Any] = {}
+        failed: List[str] = []
+        for entries, batch_failed, _ in results:
+            files.update(entries)
+            failed.extend(batch_failed)
+
+        manifest = {
+            'version': MANIFEST_VERSION,
+            'created': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+            'inputs': fingerprints,
+            'latest': '/'.join(months[-1]),
+            'encodings': ['gzip'] + (['br'] if brotli is not None else []),
+            'files': dict(sorted(files.items())),
+            'failed': sorted(failed),
+        }
+        (staging / MANIFEST_NAME).write_text(json.dumps(manifest, indent=1))
+        staging.chmod(0o755)
+        _publish(staging, out_dir)
+        return manifest
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+        shutil.rmtree(shared_dir, ignore_errors=True)
+
+
+def main():
+    """
+    Build the static API tree.
+    """
+    parser = argparse.ArgumentParser(
+        description='Pre-render API responses into a static tree of compressed JSON files',
+        epilog='Example: python web/backend/prerender.py --out outputs/static_api --jobs 4'
+    )
+    parser.add_argument('--out', default=os.environ.get(STATIC_DIR_ENV, str(PROJECT_ROOT / 'outputs' / 'static_api')),
+                        help=f'Tree root (default: ${STATIC_DIR_ENV} or outputs/static_api)')
+    parser.add_argument('--inputs', default=str(INPUTS_DIR), help='Input workbooks directory (default: inputs/)')
+    parser.add_argument('--jobs', type=int, default=None, help='Worker processes (default: one per CPU)')
+    parser.add_argument('--no-county-details', action='store_true',
+                        help='Skip per-county details (far fewer files)')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        manifest = build_static_tree(Path(args.out), Path(args.inputs), args.jobs,
+                                     county_details=not args.no_county_details)
+    except ValueError as e:
+        parser.error(str(e))
+    elapsed = time.perf_counter() - start
+
+    files = manifest['files'].values()
+    raw = sum(entry['bytes'] for entry in files)
+    print("=" * 80)
+    print(f"STATIC API TREE: {args.out}")
+    print("=" * 80)
+    print(f"  months:    {', '.join(sorted(manifest['inputs']))}")
+    print(f"  responses: {len(manifest['files'])}  ({raw / (1024 * 1024):.1f} MiB JSON)")
+    for coding in manifest['encodings']:
+        size = sum(entry['encodings'][coding] for entry in files)
+        print(f"  {coding + ':':<10} {size / (1024 * 1024):.1f} MiB")
+    if manifest['failed']:
+        print(f"  failed:    {len(manifest['failed'])} (not rendered; served live)")
+        for url in manifest['failed'][:10]:
+            print(f"    {url}")
+    print(f"\n✓ Rendered in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Memoized API responses.
+
+`ResultCache` keeps serialized JSON bodies keyed on (dataset fingerprint, endpoint,
+canonical query parameters). Entries expire after a TTL and are evicted least
+recently used first once the byte budget is exceeded. Concurrent requests for a key
+that is still being computed wait for that computation instead of repeating it.
+
+Because the key starts with the workbook's content hash, a replaced workbook never
+serves stale results; its old entries simply age out.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Optional, Tuple
+
+from artifact_store import canonical_params
+from web.backend.instrumentation import record_cache_access, record_cache_size
+
+DEFAULT_MAX_BYTES = int(os.environ.get('TGIR_RESULT_CACHE_BYTES', str(64 * 1024 * 1024)))
+DEFAULT_TTL_SECONDS = float(os.environ.get('TGIR_RESULT_CACHE_TTL', '600'))
+
+
+class CachedResult(NamedTuple):
+    body: bytes
+    created: float
+
+
+class _Pending:
+    """A computation in flight; followers wait on `done`."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.body: Optional[bytes] = None
+        self.error: Optional[BaseException] = None
+
+
+def canonical_key(fingerprint: str, endpoint: str, params: Mapping[str, Any]) -> str:
+    """
+    Cache key for one request.
+
+    Parameters are normalized with artifact_store.canonical_params (None and empty
+    values dropped, lists de-duplicated and sorted), so ?quarters=2026Q2&quarters=2026Q1
+    and ?quarters=2026Q1&quarters=2026Q2 share an entry. Only use it for parameters whose order does not change the response.
+
+    Args:
+        fingerprint: Dataset content hash (MonthDataset.fingerprint)
+        endpoint: Endpoint name
+        params: Query parameters
+
+    Returns:
+        Key string
+    """
+    canonical = canonical_params(params)
+    return f"{fingerprint}:{endpoint}:{json.dumps(canonical, sort_keys=True, separators=(',', ':'))}"
+
+
+class ResultCache:
+    """
+    Byte-bounded LRU of response bodies with a TTL and in-flight request coalescing.
+    """
+
+    def __init__(self, name: str = 'result', max_bytes: int = DEFAULT_MAX_BYTES,
+                 ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        """
+        Args:
+            name: Cache name used on /metrics
+            max_bytes: Budget for stored bodies and keys (0 disables caching)
+            ttl_seconds: Seconds an entry stays valid
+        """
+        self.name = name
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: 'OrderedDict[str, CachedResult]' = OrderedDict()
+        self._inflight: Dict[str, _Pending] = {}
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    def get_or_compute(self, key: str, compute: Callable[[], bytes]) -> Tuple[bytes, str]:
+        """
+        Return the cached body for a key, computing it once on a miss.
+
+        Exceptions from compute() propagate to the caller and to every request that
+        was waiting on it; nothing is cached for them.
+
+        Args:
+            key: Key from canonical_key()
+            compute: Function producing the response body
+
+        Returns:
+            (body, outcome) where outcome is 'hit', 'coalesced' or 'miss'
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if time.monotonic() - entry.created <= self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    record_cache_access(self.name, True)
+                    return entry.body, 'hit'
+                self._drop(key)
+            pending = self._inflight.get(key)
+            leader = pending is None
+            if leader:
+                pending = self._inflight[key] = _Pending()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+        record_cache_access(self.name, not leader)
+
+        if not leader:
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.body, 'coalesced'
+
+        try:
+            body = compute()
+            pending.body = body
+            self._store(key, body)
+            return body, 'miss'
+        except BaseException as e:
+            pending.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            pending.done.set()
+
+    def _store(self, key: str, body: bytes) -> None:
+        size = len(body) + len(key)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = CachedResult(body, time.monotonic())
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.evictions += 1
+            record_cache_size(self.name, len(self._entries), self.nbytes)
+
+    def _drop(self, key: str) -> None:
+        # Caller holds the lock
+        entry = self._entries.pop(key)
+        self.nbytes -= len(entry.body) + len(key)
+        record_cache_size(self.name, len(self._entries), self.nbytes)
+
+    def clear(self) -> None:
+        """Drop every cached body."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+            record_cache_size(self.name, 0, 0)
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, bytes held, hit/miss/coalesced counters and hit rate."""
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                'entries': len(self._entries),
+                'bytes': self.nbytes,
+                'max_bytes': self.max_bytes,
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'evictions': self.evictions,
+                'hit_rate': (self.hits + self.coalesced) / lookups if lookups else 0.0,
+            }
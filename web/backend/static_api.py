@@ -0,0 +1,269 @@
+"""
+Pre-rendered API responses.
+
+`web/backend/prerender.py` writes JSON bodies (plus .gz and, when the `brotli` package
+is installed, .br siblings) into a tree that mirrors the API routes:
+
+    <root>/manifest.json
+    <root>/api/<route>/<canonical query>.json[.gz|.br]
+
+`static_relpath()` maps a request to its file, so a CDN-hosted frontend and the backend
+agree on names. `StaticApiMiddleware` serves matching requests straight from the tree,
+ahead of every computed endpoint, while the workbooks under inputs/ are still the ones
+the tree was built from; anything else falls through to the live API.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, quote, urlencode
+
+from dataset import input_files, input_fingerprints
+from web.backend.instrumentation import record_cache_access, span
+
+logger = logging.getLogger("tgir.static_api")
+
+# Directory written by prerender.py; unset disables the static tier
+STATIC_DIR_ENV = 'TGIR_STATIC_API_DIR'
+
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+
+# Multi-valued parameters an endpoint sorts and de-duplicates itself, so any order of
+# them gets the same response. Other parameters must match the rendered request exactly.
+UNORDERED_PARAMS: Dict[str, frozenset] = {
+    'quarter-report': frozenset({'quarters', 'phase', 'fuel', 'technology', 'zone', 'change'}),
+    'quarter-data': frozenset({'quarters'}),
+    'county-details': frozenset({'quarters'}),
+    'county-map-data': frozenset({'quarters'}),
+    'county-map': frozenset({'quarters'}),
+    'chart-spec': frozenset({'report', 'quarters'}),
+}
+
+# Query strings longer than this are stored under a hash (file names are capped at 255 bytes)
+MAX_QUERY_NAME = 160
+
+# Content-Encoding -> file suffix, in order of preference
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+
+def canonical_query(route: str, params: Iterable[Tuple[str, str]]) -> str:
+    """
+    Query string identifying a request's response.
+
+    Parameters are ordered by name; values keep their order except for the route's
+    UNORDERED_PARAMS, which are sorted and de-duplicated.
+
+    Args:
+        route: Route below /api (e.g. 'quarter-report')
+        params: (name, value) pairs as they appear in the query string
+
+    Returns:
+        Percent-encoded query string ('' when there are no parameters)
+    """
+    grouped: Dict[str, List[str]] = {}
+    for name, value in params:
+        grouped.setdefault(name, []).append(value)
+    unordered = UNORDERED_PARAMS.get(route, frozenset())
+    pairs = []
+    for name in sorted(grouped):
+        values = sorted(set(grouped[name])) if name in unordered else grouped[name]
+        pairs.extend((name, value) for value in values)
+    return urlencode(pairs, quote_via=quote, safe='')
+
+
+def static_relpath(route: str, params: Iterable[Tuple[str, str]]) -> str:
+    """
+    Location of a request's pre-rendered body, relative to the tree root.
+
+    e.g. ('quarter-report', [('year', '2026'), ('month', '01'), ('quarters', '2026Q1')])
+    -> 'api/quarter-report/month=01&quarters=2026Q1&year=2026.json'. A request without
+    parameters maps to 'index.json'; very long queries to 'q-<sha256 prefix>.json'.
+
+    Args:
+        route: Route below /api
+        params: Query parameters
+
+    Returns:
+        POSIX relative path of the .json file
+    """
+    query = canonical_query(route, params)
+    if not query:
+        name = 'index'
+    elif len(query) > MAX_QUERY_NAME:
+        name = 'q-' + hashlib.sha256(query.encode('utf-8')).hexdigest()[:24]
+    else:
+        name = query
+    return f"api/{route}/{name}.json"
+
+
+def accepted_encodings(header: str) -> set:
+    """Codings the client accepts (q=0 excluded), from an Accept-Encoding header."""
+    accepted = set()
+    for part in header.split(','):
+        coding, _, rest = part.strip().partition(';')
+        q = rest.strip()
+        if q.startswith('q='):
+            try:
+                if float(q[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        if coding:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+class StaticApiTree:
+    """
+    A built tree plus the input workbooks it was rendered from.
+
+    The tree is only used while inputs/ holds exactly those workbooks. The check is
+    a directory scan (size and mtime) at most every `check_interval` seconds; the
+    workbooks are re-hashed only when that scan changes.
+    """
+
+    def __init__(self, root: Path, inputs_dir: Path, check_interval: float = 10.0):
+        """
+        Args:
+            root: Tree written by prerender.py (must contain manifest.json)
+            inputs_dir: Directory the API reads workbooks from
+            check_interval: Seconds between scans of inputs_dir
+
+        Raises:
+            FileNotFoundError: If the manifest is missing
+            ValueError: If the manifest has an unsupported version
+        """
+        self.root = Path(root)
+        self.inputs_dir = Path(inputs_dir)
+        self.check_interval = check_interval
+        self.manifest = json.loads((self.root / MANIFEST_NAME).read_text())
+        if self.manifest.get('version') != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported static tree version {self.manifest.get('version')!r}")
+        self.files = self.manifest['files']
+        self.routes = {relpath.split('/')[1] for relpath in self.files}
+        self._lock = threading.Lock()
+        self._checked = 0.0
+        self._signature: Optional[Tuple] = None
+        self._valid = False
+
+    def _scan(self) -> Tuple:
+        signature = []
+        for period, path in input_files(self.inputs_dir):
+            stat = path.stat()
+            signature.append((period, stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def is_current(self) -> bool:
+        """True while inputs/ holds the workbooks the tree was built from."""
+        now = time.monotonic()
+        if now - self._checked < self.check_interval:
+            return self._valid
+        with self._lock:
+            if now - self._checked < self.check_interval:
+                return self._valid
+            signature = self._scan()
+            if signature != self._signature:
+                valid = input_fingerprints(self.inputs_dir) == self.manifest['inputs']
+                if not valid:
+                    logger.warning("Static API tree %s is stale (inputs changed since %s); serving live responses",
+                                   self.root, self.manifest.get('created'))
+                self._signature, self._valid = signature, valid
+            self._checked = now
+            return self._valid
+
+    def lookup(self, route: str, params: Sequence[Tuple[str, str]],
+               accept_encoding: str = '') -> Optional[Tuple[Path, Optional[str]]]:
+        """
+        Pre-rendered file for a request.
+
+        Args:
+            route: Route below /api
+            params: Query parameters
+            accept_encoding: The request's Accept-Encoding header
+
+        Returns:
+            (path, content_encoding) of the best variant the client accepts, or None
+            when the request was not rendered
+        """
+        relpath = static_relpath(route, params)
+        entry = self.files.get(relpath)
+        if entry is None:
+            return None
+        accepted = accepted_encodings(accept_encoding)
+        for coding, suffix in ENCODINGS:
+            if coding in accepted and coding in entry['encodings']:
+                return self.root / (relpath + suffix), coding
+        return self.root / relpath, None
+
+
+class StaticApiMiddleware:
+    """
+    ASGI middleware answering GET/HEAD /api/... requests from a StaticApiTree.
+
+    Responses carry `X-Cache: STATIC`; cache lookups are counted as 'static_api' on
+    /metrics for the routes the tree covers.
+    """
+
+    def __init__(self, app, tree: StaticApiTree):
+        self.app = app
+        self.tree = tree
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope['method'] not in ('GET', 'HEAD') or not scope['path'].startswith('/api/'):
+            await self.app(scope, receive, send)
+            return
+
+        route = scope['path'][len('/api/'):]
+        if route not in self.tree.routes or not self.tree.is_current():
+            await self.app(scope, receive, send)
+            return
+
+        params = parse_qsl(scope.get('query_string', b'').decode('latin-1'), keep_blank_values=True)
+        headers = dict(scope.get('headers', []))
+        found = self.tree.lookup(route, params, headers.get(b'accept-encoding', b'').decode('latin-1'))
+        record_cache_access('static_api', found is not None)
+        if found is None:
+            await self.app(scope, receive, send)
+            return
+
+        path, coding = found
+        try:
+            with span("static"):
+                body = path.read_bytes()
+        except FileNotFoundError:
+            await self.app(scope, receive, send)
+            return
+        scope['tgir.route'] = scope['path']
+        response_headers = [
+            (b'content-type', b'application/json'),
+            (b'content-length', str(len(body)).encode('latin-1')),
+            (b'vary', b'Accept-Encoding'),
+            (b'x-cache', b'STATIC'),
+        ]
+        if coding:
+            response_headers.append((b'content-encoding', coding.encode('latin-1')))
+        await send({'type': 'http.response.start', 'status': 200, 'headers': response_headers})
+        await send({'type': 'http.response.body', 'body': b'' if scope['method'] == 'HEAD' else body})
+
+
+def load_static_tree(inputs_dir: Path) -> Optional[StaticApiTree]:
+    """
+    Tree configured by TGIR_STATIC_API_DIR, or None when unset or unusable.
+    """
+    root = os.environ.get(STATIC_DIR_ENV)
+    if not root:
+        return None
+    try:
+        tree = StaticApiTree(Path(root), inputs_dir)
+    except (FileNotFoundError, ValueError, KeyError, json.JSONDecodeError) as e:
+        logger.warning("Static API tree %s not loaded: %s", root, e)
+        return None
+    logger.info("Serving %d pre-rendered responses from %s", len(tree.files), tree.root)
+    return tree
+
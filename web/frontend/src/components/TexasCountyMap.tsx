@@ -1,9 +1,29 @@
-import React, { useState } from 'react';
+import React, { useMemo, useState } from 'react';
 import { ComposableMap, Geographies, Geography, ZoomableGroup } from 'react-simple-maps';
-import { scaleLinear } from 'd3-scale';
 import { motion, AnimatePresence } from 'framer-motion';
 
-interface CountyData {
+// Pre-joined, pre-binned map payload: the county_map section of /api/quarter-report
+// (columnar: one entry per county)
+export interface CountyMapPayload {
+    geometry_url: string;
+    geometry_version: string;
+    // null when every selected county has 0 MW (nothing to scale)
+    legend: {
+        edges: number[];
+        colors: string[];
+    } | null;
+    counties: {
+        fips: string[];
+        name: string[];
+        bin: number[];
+        mw: number[];
+        projects: number[];
+        fuels: string[];
+    };
+    unmatched: string[];
+}
+
+interface HoveredCounty {
     county: string;
     total_mw: number;
     project_count: number;
@@ -11,39 +31,46 @@ interface CountyData {
 }
 
 interface TexasCountyMapProps {
-    data: CountyData[];
+    map: CountyMapPayload;
     onCountyClick: (county: string) => void;
 }
 
-const TexasCountyMap: React.FC<TexasCountyMapProps> = ({ data, onCountyClick }) => {
-    const [hoveredCounty, setHoveredCounty] = useState<CountyData | null>(null);
+const NO_DATA_COLOR = '#374151'; // gray-700
+
+const TexasCountyMap: React.FC<TexasCountyMapProps> = ({ map, onCountyClick }) => {
+    const [hoveredCounty, setHoveredCounty] = useState<HoveredCounty | null>(null);
     const [tooltipPos, setTooltipPos] = useState({ x: 0, y: 0 });
 
-    // Use URL directly - react-simple-maps handles TopoJSON conversion
-    const geoUrl = "/data/counties-10m.json";
+    // Texas-only TopoJSON keyed by FIPS id; the versioned URL is cached by the browser
+    const geoUrl = map.geometry_url;
 
-    // Create a map of county name to data
-    const countyDataMap = new Map(
-        data.map(d => [d.county.toUpperCase().replace(' COUNTY', ''), d])
+    // FIPS id -> position in the columnar county lists
+    const countyIndex = useMemo(
+        () => new Map(map.counties.fips.map((fips, i) => [fips, i])),
+        [map]
     );
 
-    // Calculate color scale
-    const maxMW = Math.max(...data.map(d => d.total_mw), 1);
-    const colorScale = scaleLinear<string>()
-        .domain([0, maxMW / 2, maxMW])
-        .range(['#10b981', '#fbbf24', '#ef4444']); // green -> yellow -> red
-
+    const legend = map.legend;
 
     const getCountyColor = (geo: any): string => {
-        const countyName = geo.properties.name?.toUpperCase();
-        const countyData = countyDataMap.get(countyName);
-        if (!countyData) return '#374151'; // gray-700 for no data
-        return colorScale(countyData.total_mw);
+        const i = countyIndex.get(String(geo.id));
+        if (i === undefined || !legend) return NO_DATA_COLOR;
+        return legend.colors[map.counties.bin[i]];
+    };
+
+    const countyAt = (geo: any): HoveredCounty | null => {
+        const i = countyIndex.get(String(geo.id));
+        if (i === undefined) return null;
+        return {
+            county: map.counties.name[i],
+            total_mw: map.counties.mw[i],
+            project_count: map.counties.projects[i],
+            fuel_summary: map.counties.fuels[i],
+        };
     };
 
     const handleCountyMouseEnter = (geo: any, event: React.MouseEvent) => {
-        const countyName = geo.properties.name?.toUpperCase();
-        const countyData = countyDataMap.get(countyName);
+        const countyData = countyAt(geo);
         if (countyData) {
             setHoveredCounty(countyData);
             setTooltipPos({
@@ -65,8 +92,7 @@ const TexasCountyMap: React.FC<TexasCountyMapProps> = ({ data, onCountyClick })
     };
 
     const handleCountyClick = (geo: any) => {
-        const countyName = geo.properties.name?.toUpperCase();
-        const countyData = countyDataMap.get(countyName);
+        const countyData = countyAt(geo);
         if (countyData) {
             onCountyClick(countyData.county);
         }
@@ -90,9 +116,7 @@ const TexasCountyMap: React.FC<TexasCountyMapProps> = ({ data, onCountyClick })
                         geography={geoUrl}
                     >
                         {({ geographies }: { geographies: any[] }) => {
-                            // Filter for Texas counties (FIPS code starts with 48)
-                            const texasGeos = geographies.filter((geo: any) => geo.id && geo.id.toString().startsWith('48'));
-                            return texasGeos.map((geo: any) => (
+                            return geographies.map((geo: any) => (
                                 <Geography
                                     key={geo.rsmKey}
                                     geography={geo}
@@ -148,16 +172,25 @@ const TexasCountyMap: React.FC<TexasCountyMapProps> = ({ data, onCountyClick })
                 )}
             </AnimatePresence>
 
-            {/* Legend */}
-            <div className="absolute bottom-4 left-0 right-0 flex items-center justify-center gap-4 pointer-events-none">
-                <div className="bg-gray-900/80 backdrop-blur-sm p-2 rounded-full flex items-center gap-4 border border-gray-700">
-                    <span className="text-xs text-gray-400">Low MW</span>
-                    <div className="flex h-2 w-32 rounded-full overflow-hidden">
-                        <div className="flex-1" style={{ background: 'linear-gradient(to right, #10b981, #fbbf24, #ef4444)' }} />
+            {/* Legend: the server's MW bins and their colors */}
+            {legend && (
+                <div className="absolute bottom-4 left-0 right-0 flex items-center justify-center gap-4 pointer-events-none">
+                    <div className="bg-gray-900/80 backdrop-blur-sm p-2 rounded-full flex items-center gap-4 border border-gray-700">
+                        <span className="text-xs text-gray-400">{legend.edges[0]} MW</span>
+                        <div className="flex h-2 w-32 rounded-full overflow-hidden">
+                            {legend.colors.map((color, i) => (
+                                <div
+                                    key={color}
+                                    className="flex-1"
+                                    style={{ background: color }}
+                                    title={`${legend.edges[i]}-${legend.edges[i + 1]} MW`}
+                                />
+                            ))}
+                        </div>
+                        <span className="text-xs text-gray-400">{legend.edges[legend.edges.length - 1]} MW</span>
                     </div>
-                    <span className="text-xs text-gray-400">High MW</span>
                 </div>
-            </div>
+            )}
         </div>
     );
 };
@@ -5,7 +5,7 @@ import { motion, AnimatePresence } from 'framer-motion';
 import { Chart as ChartJS, ArcElement, Tooltip, Legend, CategoryScale, LinearScale, BarElement, Title } from 'chart.js';
 import { Pie } from 'react-chartjs-2';
 import axios from 'axios';
-import TexasCountyMap from '../components/TexasCountyMap';
+import TexasCountyMap, { type CountyMapPayload } from '../components/TexasCountyMap';
 import { trackEvent } from '../lib/analytics';
 
 // Register ChartJS components
@@ -30,13 +30,6 @@ interface QuarterData {
     }[];
 }
 
-interface CountyMapData {
-    county: string;
-    total_mw: number;
-    project_count: number;
-    fuel_summary: string;
-}
-
 interface CountyDetails {
     county: string;
     quarters: string[];
@@ -50,6 +43,13 @@ interface CountyDetails {
     projects: any[];
 }
 
+interface QuarterReportResponse extends QuarterData {
+    quarters: string[];
+    sections: string[];
+    county_map: CountyMapPayload;
+    county_details?: CountyDetails | null;
+}
+
 interface MonthOption {
     value: string;
     label: string;
@@ -74,7 +74,7 @@ const QuarterReport: React.FC = () => {
     const [selectedCounty, setSelectedCounty] = useState<string | null>(null);
     const [countyDetails, setCountyDetails] = useState<CountyDetails | null>(null);
     const [loadingDetails, setLoadingDetails] = useState<boolean>(false);
-    const [mapData, setMapData] = useState<CountyMapData[]>([]);
+    const [mapData, setMapData] = useState<CountyMapPayload | null>(null);
     const [reportPeriod, setReportPeriod] = useState<string>("");
     const [months, setMonths] = useState<MonthOption[]>([]);
     const [selectedMonth, setSelectedMonth] = useState<string>("");
@@ -125,7 +125,7 @@ const QuarterReport: React.FC = () => {
     useEffect(() => {
         if (selectedQuarters.length === 0) {
             setData(null);
-            setMapData([]);
+            setMapData(null);
             return;
         }
 
@@ -141,14 +141,12 @@ const QuarterReport: React.FC = () => {
                         if (month) params.append('month', month);
                     }
 
-                    // Fetch both quarter data and map data
-                    const [quarterResponse, mapResponse] = await Promise.all([
-                        axios.get(`/api/quarter-data?${params.toString()}`),
-                        axios.get(`/api/county-map-data?${params.toString()}`)
-                    ]);
+                    // Summary, fuel chart, county table and map in one pass; the map comes
+                    // pre-joined to county FIPS ids and pre-binned
+                    const response = await axios.get<QuarterReportResponse>(`/api/quarter-report?${params.toString()}`);
 
-                    setData(quarterResponse.data);
-                    setMapData(mapResponse.data.counties);
+                    setData(response.data);
+                    setMapData(response.data.county_map);
                 } catch (error) {
                     console.error("Error fetching quarter data:", error);
                 } finally {
@@ -170,14 +168,15 @@ const QuarterReport: React.FC = () => {
             try {
                 const params = new URLSearchParams();
                 params.append('county', selectedCounty);
+                params.append('sections', 'county_details');
                 selectedQuarters.forEach(q => params.append('quarters', q));
                 if (selectedMonth) {
                     const { year, month } = parseMonthValue(selectedMonth);
                     if (year) params.append('year', year);
                     if (month) params.append('month', month);
                 }
-                const response = await axios.get(`/api/county-details?${params.toString()}`);
-                setCountyDetails(response.data);
+                const response = await axios.get<QuarterReportResponse>(`/api/quarter-report?${params.toString()}`);
+                setCountyDetails(response.data.county_details ?? null);
             } catch (error) {
                 console.error("Error fetching county details:", error);
             } finally {
@@ -459,7 +458,7 @@ const QuarterReport: React.FC = () => {
 
 
                         {/* Interactive Texas County Map */}
-                        {mapData.length > 0 && (
+                        {mapData && mapData.counties.fips.length > 0 && (
                             <motion.div
                                 initial={{ opacity: 0, y: 20 }}
                                 animate={{ opacity: 1, y: 0 }}
@@ -468,7 +467,7 @@ const QuarterReport: React.FC = () => {
                             >
                                 <h3 className="text-lg font-semibold mb-6">Geographic Distribution</h3>
                                 <TexasCountyMap
-                                    data={mapData}
+                                    map={mapData}
                                     onCountyClick={(county) => handleSelectCounty(county, 'map')}
                                 />
                             </motion.div>